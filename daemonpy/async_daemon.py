@@ -0,0 +1,260 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    async_daemon.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class AsyncDaemon with attribute(s) and method(s).
+    Creates a daemon base class with coroutine run() on event loop.
+'''
+
+import sys
+from typing import Any, List, Optional
+from abc import abstractmethod
+from asyncio import (
+    AbstractEventLoop, Event, Task, new_event_loop, set_event_loop,
+    wait, wait_for, FIRST_COMPLETED, TimeoutError as AsyncTimeoutError
+)
+from signal import SIGINT, SIGTERM
+
+try:
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon import Daemon
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None  # pylint: disable=invalid-name
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class AsyncDaemon(Daemon):
+    '''
+        Defines class AsyncDaemon with attribute(s) and method(s).
+        Creates a daemon base class with coroutine run() on event loop.
+
+        The event loop (uvloop if installed and enabled) runs coroutine
+        run(). Signals of lifecycle are routed on the loop, default
+        SIGTERM/SIGINT handler (after drain when it is added) sets
+        shutdown event, on_shutdown() hook is awaited and run() gets up
+        to shutdown_timeout seconds to return before it is cancelled.
+        SIGHUP (or reload command) is routed on the loop to reload
+        component, reload() reopens log files and schedules on_reload()
+        hook.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _use_uvloop - Use uvloop event loop if installed.
+                | _shutdown_timeout - Time for run() to finish on shutdown.
+                | _loop - Daemon event loop | None.
+                | _shutdown - Shutdown requested event | None.
+                | _verbose - Enable/Disable verbose option.
+            :methods:
+                | __init__ - Initials AsyncDaemon constructor.
+                | loop - Property method for getting event loop.
+                | shutting_down - Property method for shutdown status.
+                | new_loop - Creates event loop for daemon.
+                | run_daemon - Runs coroutine run() on event loop.
+                | request_shutdown - Requests graceful shutdown.
+                | on_shutdown - Graceful shutdown hook (coroutine).
+                | on_reload - Reload hook on SIGHUP (coroutine).
+                | reload - Reopens logs, schedules on_reload() hook.
+                | run - Runs daemon process (abstract coroutine).
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::ASYNC_DAEMON'
+
+    def __init__(
+        self,
+        pid: str,
+        use_uvloop: bool = True,
+        shutdown_timeout: float = 10.0,
+        verbose: bool = False
+    ) -> None:
+        '''
+            Initials AsyncDaemon constructor.
+
+            :param pid: PID file path
+            :type pid: <str>
+            :param use_uvloop: Use uvloop event loop if installed
+            :type use_uvloop: <bool>
+            :param shutdown_timeout: Time for run() to finish on shutdown
+            :type shutdown_timeout: <float>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__(pid, verbose)
+        if shutdown_timeout < 0:
+            raise ATSValueError('shutdown timeout must be positive')
+        self._use_uvloop: bool = use_uvloop
+        self._shutdown_timeout: float = shutdown_timeout
+        self._loop: Optional[AbstractEventLoop] = None
+        self._shutdown: Optional[Event] = None
+        self._verbose: bool = verbose
+        for signal_num in (SIGTERM, SIGINT):
+            self._lifecycle.handle(
+                signal_num, self.request_shutdown, default=True
+            )
+
+    @property
+    def loop(self) -> Optional[AbstractEventLoop]:
+        '''
+            Property method for getting daemon event loop.
+
+            :return: Event loop | None (not running)
+            :rtype: <Optional[AbstractEventLoop]>
+            :exceptions: None
+        '''
+        return self._loop
+
+    @property
+    def shutting_down(self) -> bool:
+        '''
+            Property method for getting shutdown status.
+
+            :return: True (shutdown requested) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._shutdown is not None and self._shutdown.is_set()
+
+    def new_loop(self) -> AbstractEventLoop:
+        '''
+            Creates event loop for daemon (uvloop if available).
+
+            :return: Event loop
+            :rtype: <AbstractEventLoop>
+            :exceptions: None
+        '''
+        if self._use_uvloop and uvloop is not None:
+            return uvloop.new_event_loop()
+        return new_event_loop()
+
+    def run_daemon(self) -> None:
+        '''
+            Runs coroutine run() on event loop until it returns
+            or graceful shutdown completes.
+
+            :exceptions: None
+        '''
+        self._loop = self.new_loop()
+        set_event_loop(self._loop)
+        self._lifecycle.use_loop(self._loop)
+        self.open_channels()
+        try:
+            self._loop.run_until_complete(self._main())
+            self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+        finally:
+            self.close_channels()
+            self._loop.close()
+            set_event_loop(None)
+            self._lifecycle.use_loop(None)
+            self._loop = None
+
+    def request_shutdown(self, signal_num: int = SIGTERM) -> None:
+        '''
+            Requests graceful shutdown (called on loop for SIGTERM/SIGINT).
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :exceptions: None
+        '''
+        verbose_message(
+            self._verbose, [f'{self._P_VERBOSE} shutdown on', signal_num]
+        )
+        if self._shutdown is not None:
+            self._shutdown.set()
+
+    async def on_shutdown(self) -> None:
+        '''
+            Graceful shutdown hook, awaited once shutdown is requested.
+            Override this method to stop servers and accepting new work.
+
+            :exceptions: None
+        '''
+
+    async def on_reload(self) -> None:
+        '''
+            Reload hook, scheduled on loop when SIGHUP is received.
+            Override this method to reload configuration.
+
+            :exceptions: None
+        '''
+
+    def reload(self) -> Any:
+        '''
+            Reopens log files and schedules on_reload() hook (SIGHUP or
+            reload command, called on loop).
+
+            :return: Reply result
+            :rtype: <Any>
+            :exceptions: None
+        '''
+        loop: Optional[AbstractEventLoop] = self._loop
+        if loop is None:
+            return super().reload()
+        self.reopen_logs()
+        loop.create_task(self.on_reload())
+        return 'reloading'
+
+    @abstractmethod
+    async def run(self) -> None:  # type: ignore[override]
+        '''
+            Run daemon process (coroutine).
+            Override this method when subclass self.
+
+            :exceptions: None
+        '''
+
+    async def _main(self) -> None:
+        '''
+            Runs run() task until it returns or shutdown is requested.
+
+            :exceptions: Exception raised by run()
+        '''
+        loop: Any = self._loop
+        self._shutdown = Event()
+        main_task: Task[None] = loop.create_task(self.run())
+        stop_task: Task[Any] = loop.create_task(self._shutdown.wait())
+        try:
+            await wait({main_task, stop_task}, return_when=FIRST_COMPLETED)
+            stop_task.cancel()
+            if self._shutdown.is_set():
+                await self.on_shutdown()
+                try:
+                    await wait_for(main_task, self._shutdown_timeout)
+                except AsyncTimeoutError:
+                    verbose_message(
+                        self._verbose, [f'{self._P_VERBOSE} run cancelled']
+                    )
+            else:
+                main_task.result()
+        finally:
+            stop_task.cancel()
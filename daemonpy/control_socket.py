@@ -0,0 +1,300 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    control_socket.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ControlSocket with attribute(s) and method(s).
+    Creates a Unix domain socket for commands to running daemon.
+'''
+
+import sys
+from typing import Any, Callable, Dict, List, Optional
+from contextlib import suppress
+from json import dumps, loads
+from os import stat, umask, unlink
+from socket import socket, AF_UNIX, SHUT_RDWR, SOCK_STREAM
+from threading import Thread, local
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+Handler = Callable[[List[str]], Any]
+
+
+class ControlSocket:
+    '''
+        Defines class ControlSocket with attribute(s) and method(s).
+        Creates a Unix domain socket for commands to running daemon.
+
+        Request is one line 'command arg ...', reply is one JSON line
+        {"ok": true, "result": ...} | {"ok": false, "error": "..."}.
+        Several requests may be sent over one connection. Each
+        connection is served by its own short-lived thread, so handlers
+        must be short and thread safe (schedule work, do not do it).
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | COMMANDS - Built-in daemon commands.
+                | _TIMEOUT - Client connection idle timeout (seconds).
+                | _path - Socket file path.
+                | _handlers - Command handlers.
+                | _local - Per connection callbacks run after reply.
+                | _listener - Listening socket | None.
+                | _inode - Inode of bound socket file.
+                | _verbose - Enable/Disable verbose option.
+            :methods:
+                | __init__ - Initials ControlSocket constructor.
+                | path - Property method for getting socket file path.
+                | commands - Property method for getting commands.
+                | register - Registers command handler.
+                | defer - Runs callback after current reply is sent.
+                | start - Binds socket and starts serving thread.
+                | close - Stops serving and removes socket file.
+                | request - Sends command to daemon (client side).
+                | _serve - Accepts and serves connections.
+                | _handle - Serves requests of one connection.
+                | _dispatch - Runs command handler.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::CONTROL_SOCKET'
+    COMMANDS: List[str] = ['ping', 'stats', 'reload', 'drain', 'stop']
+    _TIMEOUT: float = 5.0
+
+    def __init__(self, path: str, verbose: bool = False) -> None:
+        '''
+            Initials ControlSocket constructor (ping is built in).
+
+            :param path: Socket file path
+            :type path: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSValueError
+        '''
+        if not bool(path):
+            raise ATSValueError('missing control socket path')
+        self._path: str = path
+        self._handlers: Dict[str, Handler] = {'ping': lambda _: 'pong'}
+        self._local: local = local()
+        self._listener: Optional[socket] = None
+        self._inode: int = 0
+        self._verbose: bool = verbose
+
+    @property
+    def path(self) -> str:
+        '''
+            Property method for getting socket file path.
+
+            :return: Socket file path
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return self._path
+
+    @property
+    def commands(self) -> List[str]:
+        '''
+            Property method for getting registered commands.
+
+            :return: Command names
+            :rtype: <List[str]>
+            :exceptions: None
+        '''
+        return list(self._handlers)
+
+    def register(self, command: str, handler: Handler) -> None:
+        '''
+            Registers (or replaces) command handler.
+            Handler gets command arguments and returns JSON-able result.
+
+            :param command: Command name (one word)
+            :type command: <str>
+            :param handler: Command handler
+            :type handler: <Handler>
+            :exceptions: ATSValueError
+        '''
+        if not command or len(command.split()) != 1:
+            raise ATSValueError(f'wrong control command {command}')
+        self._handlers[command] = handler
+
+    def defer(self, callback: Callable[[], None]) -> None:
+        '''
+            Runs callback after reply to current request is sent
+            (stop must not kill daemon before client gets reply).
+
+            :param callback: Callback to run
+            :type callback: <Callable[[], None]>
+            :exceptions: None
+        '''
+        self._local.deferred.append(callback)
+
+    def start(self) -> None:
+        '''
+            Binds socket (replaces file of previous generation) under
+            owner-only umask, so it is never reachable by other users
+            (daemonize clears umask), and starts serving thread.
+
+            :exceptions: OSError
+        '''
+        listener: socket = socket(AF_UNIX, SOCK_STREAM)
+        try:
+            with suppress(FileNotFoundError):
+                unlink(self._path)
+            mask: int = umask(0o177)
+            try:
+                listener.bind(self._path)
+            finally:
+                umask(mask)
+            self._inode = stat(self._path).st_ino
+            listener.listen(16)
+        except OSError:
+            listener.close()
+            raise
+        self._listener = listener
+        Thread(target=self._serve, args=(listener,), daemon=True).start()
+        verbose_message(
+            self._verbose, [f'{self._P_VERBOSE} serving', self._path]
+        )
+
+    def close(self) -> None:
+        '''
+            Stops serving, removes socket file unless it was replaced.
+
+            :exceptions: None
+        '''
+        listener: Optional[socket] = self._listener
+        self._listener = None
+        if listener is None:
+            return
+        with suppress(OSError):
+            listener.shutdown(SHUT_RDWR)
+        listener.close()
+        with suppress(OSError):
+            if stat(self._path).st_ino == self._inode:
+                unlink(self._path)
+
+    @staticmethod
+    def request(
+        path: str,
+        command: str,
+        args: Optional[List[str]] = None,
+        timeout: float = 5.0
+    ) -> Dict[str, Any]:
+        '''
+            Sends command to daemon and reads reply (client side).
+
+            :param path: Socket file path
+            :type path: <str>
+            :param command: Command name
+            :type command: <str>
+            :param args: Command arguments | None
+            :type args: <Optional[List[str]]>
+            :param timeout: Connect and reply timeout (seconds)
+            :type timeout: <float>
+            :return: Reply {"ok": bool, "result"|"error": ...}
+            :rtype: <Dict[str, Any]>
+            :exceptions: OSError | ValueError
+        '''
+        with socket(AF_UNIX, SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(path)
+            line: str = ' '.join([command] + (args or []))
+            client.sendall(f'{line}\n'.encode('utf-8'))
+            with client.makefile('rb') as reply:
+                data: bytes = reply.readline()
+        if not data:
+            raise ConnectionError('control socket closed without reply')
+        return dict(loads(data))
+
+    def _serve(self, listener: socket) -> None:
+        '''
+            Accepts connections until socket is closed and serves each
+            in its own thread (slow client does not block others).
+
+            :param listener: Listening socket
+            :type listener: <socket>
+            :exceptions: None
+        '''
+        while True:
+            try:
+                connection, _ = listener.accept()
+            except OSError:
+                return
+            Thread(
+                target=self._handle, args=(connection,), daemon=True
+            ).start()
+
+    def _handle(self, connection: socket) -> None:
+        '''
+            Serves requests of one connection until client closes it.
+
+            :param connection: Client connection
+            :type connection: <socket>
+            :exceptions: None
+        '''
+        connection.settimeout(self._TIMEOUT)
+        try:
+            with connection, connection.makefile('rb') as requests:
+                for line in requests:
+                    self._local.deferred = []
+                    words: List[str] = line.decode('utf-8', 'replace').split()
+                    if not words:
+                        continue
+                    reply: Dict[str, Any] = self._dispatch(
+                        words[0], words[1:]
+                    )
+                    connection.sendall(
+                        f'{dumps(reply, default=str)}\n'.encode('utf-8')
+                    )
+                    for callback in self._local.deferred:
+                        callback()
+        except OSError as os_error:
+            error_message([f'{self._P_VERBOSE} {os_error}'])
+
+    def _dispatch(self, command: str, args: List[str]) -> Dict[str, Any]:
+        '''
+            Runs command handler and builds reply.
+
+            :param command: Command name
+            :type command: <str>
+            :param args: Command arguments
+            :type args: <List[str]>
+            :return: Reply {"ok": bool, "result"|"error": ...}
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        handler: Optional[Handler] = self._handlers.get(command)
+        if handler is None:
+            return {'ok': False, 'error': f'unknown command {command}'}
+        try:
+            return {'ok': True, 'result': handler(args)}
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return {'ok': False, 'error': f'{type(error).__name__}: {error}'}
@@ -0,0 +1,115 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    counter.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Counter with attribute(s) and method(s).
+    Creates an API for monotonically increasing counter.
+'''
+
+import sys
+from typing import Callable, List, Optional
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.metric import Metric, Sample
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class Counter(Metric):
+    '''
+        Defines class Counter with attribute(s) and method(s).
+        Creates an API for monotonically increasing counter.
+
+        Counter is incremented by inc (per-thread shards) or computed
+        by function when read (monotonic source such as CPU time).
+
+        It defines:
+
+            :attributes:
+                | KIND - Metric type in text exposition format.
+                | _function - Value function | None.
+            :methods:
+                | set_function - Computes counter when read.
+                | inc - Increments counter (no lock).
+                | value - Property method for getting counter value.
+                | _own_samples - Collects sample of counter itself.
+    '''
+
+    KIND: str = 'counter'
+    _function: Optional[Callable[[], float]] = None
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        '''
+            Computes counter by function when read.
+
+            :param function: Value function (must not decrease)
+            :type function: <Callable[[], float]>
+            :exceptions: None
+        '''
+        self._function = function
+
+    def inc(self, amount: float = 1.0) -> None:
+        '''
+            Increments counter in shard of current thread.
+
+            :param amount: Non-negative increment
+            :type amount: <float>
+            :exceptions: ATSValueError
+        '''
+        if amount < 0:
+            raise ATSValueError(f'{self._name} can only increase')
+        self._shard()[0] += amount
+
+    @property
+    def value(self) -> float:
+        '''
+            Property method for getting counter value.
+
+            :return: Sum of all threads (nan when function failed)
+            :rtype: <float>
+            :exceptions: None
+        '''
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except (OSError, TypeError, ValueError):
+                return float('nan')
+        return self._totals()[0]
+
+    def _own_samples(self) -> List[Sample]:
+        '''
+            Collects sample of counter itself.
+
+            :return: List of (name, labels, value)
+            :rtype: <List[Sample]>
+            :exceptions: None
+        '''
+        return [(
+            self._name, tuple(zip(self._label_names, self._label_values)),
+            self.value
+        )]
@@ -0,0 +1,217 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    cron.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class CronSchedule with attribute(s) and method(s).
+    Creates an API for cron-like schedule expressions.
+'''
+
+import sys
+from typing import Dict, FrozenSet, List, Tuple
+from datetime import datetime, timedelta
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class CronSchedule:
+    '''
+        Defines class CronSchedule with attribute(s) and method(s).
+        Creates an API for cron-like schedule expressions.
+
+        Expression has five fields (minute, hour, day of month, month,
+        day of week, Sunday is 0 or 7) with *, values, ranges a-b,
+        lists a,b and steps */n or a-b/n, or one of @hourly, @daily,
+        @weekly, @monthly, @yearly. As in cron, when both day fields
+        are restricted a day matching either of them matches. Times
+        are local wall clock times.
+
+        It defines:
+
+            :attributes:
+                | ALIASES - Expressions by alias name.
+                | _BOUNDS - Value range of each field.
+                | _MAX_DAYS - Search horizon of next match (days).
+                | _expression - Cron expression.
+                | _fields - Allowed values of each field.
+                | _any_day - Day of month field is not restricted.
+                | _any_weekday - Day of week field is not restricted.
+            :methods:
+                | __init__ - Initials CronSchedule constructor.
+                | expression - Property method for getting expression.
+                | matches - Checks if minute matches schedule.
+                | next - Finds next matching minute.
+                | _parse_field - Parses one field of expression.
+                | _day_matches - Checks day fields.
+    '''
+
+    ALIASES: Dict[str, str] = {
+        '@hourly': '0 * * * *',
+        '@daily': '0 0 * * *',
+        '@weekly': '0 0 * * 0',
+        '@monthly': '0 0 1 * *',
+        '@yearly': '0 0 1 1 *'
+    }
+    _BOUNDS: List[Tuple[int, int]] = [
+        (0, 59), (0, 23), (1, 31), (1, 12), (0, 7)
+    ]
+    _MAX_DAYS: int = 366 * 5
+
+    def __init__(self, expression: str) -> None:
+        '''
+            Initials CronSchedule constructor.
+
+            :param expression: Cron expression (5 fields) | alias
+            :type expression: <str>
+            :exceptions: ATSValueError
+        '''
+        fields: List[str] = self.ALIASES.get(
+            expression.strip(), expression
+        ).split()
+        if len(fields) != len(self._BOUNDS):
+            raise ATSValueError(f'cron expression needs 5 fields {expression}')
+        self._expression: str = expression
+        self._fields: List[FrozenSet[int]] = [
+            self._parse_field(field, low, high)
+            for field, (low, high) in zip(fields, self._BOUNDS)
+        ]
+        if 7 in self._fields[4]:
+            self._fields[4] = self._fields[4] | {0}
+        self._any_day: bool = fields[2] == '*'
+        self._any_weekday: bool = fields[4] == '*'
+
+    @property
+    def expression(self) -> str:
+        '''
+            Property method for getting cron expression.
+
+            :return: Cron expression
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return self._expression
+
+    def matches(self, moment: datetime) -> bool:
+        '''
+            Checks if minute of moment matches schedule.
+
+            :param moment: Checked time
+            :type moment: <datetime>
+            :return: True (matches) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return (
+            moment.minute in self._fields[0]
+            and moment.hour in self._fields[1]
+            and moment.month in self._fields[3]
+            and self._day_matches(moment)
+        )
+
+    def next(self, after: datetime) -> datetime:
+        '''
+            Finds next matching minute after moment, skipping whole
+            months, days and hours which do not match.
+
+            :param after: Start time (excluded)
+            :type after: <datetime>
+            :return: Next matching time
+            :rtype: <datetime>
+            :exceptions: ATSValueError (expression never matches)
+        '''
+        moment: datetime = after.replace(
+            second=0, microsecond=0
+        ) + timedelta(minutes=1)
+        limit: datetime = moment + timedelta(days=self._MAX_DAYS)
+        while moment < limit:
+            if moment.month not in self._fields[3]:
+                moment = (
+                    moment.replace(day=1, hour=0, minute=0)
+                    + timedelta(days=32)
+                ).replace(day=1)
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self._fields[1]:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self._fields[0]:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+        raise ATSValueError(f'cron never matches {self._expression}')
+
+    def _parse_field(self, field: str, low: int, high: int) -> FrozenSet[int]:
+        '''
+            Parses one field of expression.
+
+            :param field: Field (*, values, ranges, lists, steps)
+            :type field: <str>
+            :param low: Min value of field
+            :type low: <int>
+            :param high: Max value of field
+            :type high: <int>
+            :return: Allowed values
+            :rtype: <FrozenSet[int]>
+            :exceptions: ATSValueError
+        '''
+        values: List[int] = []
+        try:
+            for part in field.split(','):
+                span, _, step = part.partition('/')
+                first, last = low, high
+                if span != '*':
+                    first_text, _, last_text = span.partition('-')
+                    first = int(first_text)
+                    last = int(last_text) if last_text else (
+                        high if step else first
+                    )
+                increment: int = int(step or 1)
+                if not low <= first <= last <= high or increment < 1:
+                    raise ValueError(part)
+                values.extend(range(first, last + 1, increment))
+        except ValueError as value_error:
+            raise ATSValueError(
+                f'wrong cron field {field}: {value_error}'
+            ) from value_error
+        return frozenset(values)
+
+    def _day_matches(self, moment: datetime) -> bool:
+        '''
+            Checks day of month and day of week fields.
+
+            :param moment: Checked time
+            :type moment: <datetime>
+            :return: True (day matches) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        day: bool = moment.day in self._fields[2]
+        weekday: bool = (moment.weekday() + 1) % 7 in self._fields[4]
+        if self._any_day or self._any_weekday:
+            return day and weekday
+        return day or weekday
@@ -0,0 +1,285 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Daemon with attribute(s) and method(s).
+    Creates a base class with backend API.
+'''
+
+import sys
+from typing import Any, Callable, List, Optional
+from abc import abstractmethod
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon_usage import DaemonUsage
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.daemon_profiler import DaemonProfiler
+    from daemonpy.daemon_reload import DaemonReload
+    from daemonpy.daemon_resources import DaemonResources
+    from daemonpy.stop_policy import StopPolicy
+    from daemonpy.supervisor import Supervisor
+    from daemonpy.watchdog import Watchdog
+    from daemonpy.param_check import ParamCheck
+    from daemonpy.sd_notify import SdNotify
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class Daemon(DaemonResources):
+    '''
+        Defines class Daemon with attribute(s) and method(s).
+        Creates a base class with backend API.
+
+        Features are components composed by lifecycle: reload and
+        profiler are added to every daemon, drain, pools, metrics and
+        status page are added by daemon.lifecycle.add before start.
+
+        It defines:
+
+            :attributes:
+                | _PKG_VERBOSE - Console text indicator for process-phase.
+                | _daemon_usage - Daemon usage.
+                | _supervisor - Crash restart supervisor | None.
+                | _watchdog - Heartbeat watchdog | None.
+            :methods:
+                | __init__ - Initials Daemon constructor.
+                | supervisor - Property methods for set/get supervisor.
+                | watchdog - Property methods for set/get watchdog.
+                | heartbeat - Signals that run() is alive (cheap).
+                | usage - Runs daemon operation.
+                | start - Starts daemon process.
+                | restart - Restarts daemon process.
+                | run_daemon - Runs daemon process entry point.
+                | run - Runs daemon process (abstract method).
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY'
+
+    def __init__(self, pid: str, verbose: bool = False) -> None:
+        '''
+            Initials Daemon constructor.
+
+            :param pid: PID file path
+            :type pid: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__(pid, verbose)
+        self._daemon_usage: Optional[DaemonUsage] = None
+        if self.unix_status:
+            self._daemon_usage = DaemonUsage()
+        self._supervisor: Optional[Supervisor] = None
+        self._watchdog: Optional[Watchdog] = None
+        self._lifecycle.add(DaemonReload())
+        self._lifecycle.add(DaemonProfiler())
+
+    @property
+    def supervisor(self) -> Optional[Supervisor]:
+        '''
+            Property method for getting crash restart supervisor.
+
+            :return: Supervisor | None (run() is not restarted)
+            :rtype: <Optional[Supervisor]>
+            :exceptions: None
+        '''
+        return self._supervisor
+
+    @supervisor.setter
+    def supervisor(self, supervisor: Optional[Supervisor]) -> None:
+        '''
+            Property method for setting crash restart supervisor.
+
+            :param supervisor: Supervisor | None
+            :type supervisor: <Optional[Supervisor]>
+            :exceptions: None
+        '''
+        self._supervisor = supervisor
+
+    @property
+    def watchdog(self) -> Optional[Watchdog]:
+        '''
+            Property method for getting heartbeat watchdog.
+
+            :return: Watchdog | None (heartbeat is not checked)
+            :rtype: <Optional[Watchdog]>
+            :exceptions: None
+        '''
+        return self._watchdog
+
+    @watchdog.setter
+    def watchdog(self, watchdog: Optional[Watchdog]) -> None:
+        '''
+            Property method for setting heartbeat watchdog.
+            Hung run() is restarted by supervisor (default one is used
+            when not set) or by systemd (WATCHDOG_USEC).
+
+            :param watchdog: Watchdog | None
+            :type watchdog: <Optional[Watchdog]>
+            :exceptions: None
+        '''
+        self._watchdog = watchdog
+        if all([
+            watchdog is not None, self._supervisor is None,
+            SdNotify.watchdog_usec() is None
+        ]):
+            self._supervisor = Supervisor()
+
+    def heartbeat(self) -> None:
+        '''
+            Signals that run() is alive, call it from request loop
+            (watchdog and components, such as status page, see it).
+
+            :exceptions: None
+        '''
+        if self._watchdog is not None:
+            self._watchdog.heartbeat()
+        self._lifecycle.heartbeat()
+
+    @ParamCheck('str:operation')
+    def usage(
+        self, operation: str, verbose: bool = False, json_output: bool = False
+    ) -> None:
+        '''
+            Runs daemon operation.
+
+            :param operation: Daemon operation
+            :type operation: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param json_output: Print status (or reply) as JSON document
+            :type json_output: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        if not bool(operation):
+            raise ATSValueError('missing daemon operation')
+        verbose_message(verbose, [f'{self._P_VERBOSE} daemon', operation])
+        if self.unix_status and bool(self._daemon_usage):
+            self._daemon_usage.check(operation, verbose)
+            operations: List[Callable[[bool], Any]] = [
+                self.start, self.stop, self.restart, self.hot_restart,
+                self.reload_daemon
+            ]
+            if self._daemon_usage.usage_status == 127:
+                sys.exit(127)
+            elif self._daemon_usage.usage_status < len(operations):
+                operations[self._daemon_usage.usage_status](verbose)
+            elif operation == 'status':
+                sys.exit(self.status(verbose, json_output))
+            elif operation in DaemonUsage.CONTROL_OPERATIONS:
+                sys.exit(self.control(operation, verbose, json_output))
+            else:
+                error_message([f'{self._P_VERBOSE} wrong option code'])
+                sys.exit(128)
+
+    def start(self, verbose: bool = False) -> bool:
+        '''
+            Start daemon process.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: True (success operation) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        status: bool = False
+        verbose_message(verbose, [f'{self._P_VERBOSE} start daemon'])
+        if self.unix_status:
+            if all([
+                self._hot_restart.old_pid is None,
+                FileProcessId.is_running(str(self._pid))
+            ]):
+                error_message([
+                    f'{self._P_VERBOSE} file', self._pid,
+                    'is locked, daemon already running'
+                ])
+                return status
+            self.daemonize(verbose)
+            if self._supervisor is not None:
+                status = self._supervisor.supervise(
+                    self.run_daemon,
+                    FileProcessId.sibling_path(str(self._pid), '.stats'),
+                    self._watchdog
+                ) == 0
+            else:
+                self.run_daemon()
+                status = True
+            if self._watchdog is not None:
+                self._watchdog.close()
+        return status
+
+    def restart(
+        self, verbose: bool = False, policy: Optional[StopPolicy] = None
+    ) -> bool:
+        '''
+            Restart daemon process.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param policy: Stop policy | None (SIGTERM, 10s, SIGKILL)
+            :type policy: <Optional[StopPolicy]>
+            :return: True (success operation) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        status: bool = False
+        verbose_message(verbose, [f'{self._P_VERBOSE} restart daemon'])
+        if self.unix_status:
+            if bool(self.stop(verbose, policy)) and self.start(verbose):
+                status = True
+            else:
+                error_message([f'{self._P_VERBOSE} faled to restart daemon'])
+        else:
+            error_message([f'{self._P_VERBOSE} daemon is active?'])
+        return status
+
+    def run_daemon(self) -> None:
+        '''
+            Runs daemon process entry point after daemonize.
+            Override this method to change how run() is executed.
+
+            :exceptions: None
+        '''
+        self.open_channels()
+        try:
+            self.run()
+        finally:
+            self.close_channels()
+
+    @abstractmethod
+    def run(self) -> None:
+        '''
+            Run daemon process.
+            Override this method when subclass self.
+            It will be called after the process has been
+            daemonized by start() or restart().
+
+            :exceptions: None
+        '''
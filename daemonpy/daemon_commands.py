@@ -0,0 +1,298 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_commands.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonCommands with attribute(s) and method(s).
+    Creates an API for serving commands and status inside running daemon.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from os import getpid, kill
+from signal import SIGTERM, SIGUSR2
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from daemonpy.control_socket import ControlSocket, Handler
+    from daemonpy.daemon_process import DaemonProcess
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.lifecycle import Lifecycle
+    from daemonpy.process_status import ProcessStatus
+    from daemonpy.stop_policy import StopPolicy, StopResult
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonCommands(DaemonProcess):
+    '''
+        Defines class DaemonCommands with attribute(s) and method(s).
+        Creates an API for serving commands and status inside running daemon.
+
+        Control socket (PID file path with .sock extension) is opened
+        in process running run() and serves built-in commands ping,
+        stats, drain, stop, commands of components and commands added
+        by add_command. Components (drain, reload, pools, metrics,
+        profiler, status page) are composed by lifecycle, which opens
+        them with channels and routes their signals. SIGUSR2 starts
+        new generation (hot restart), SIGTERM without other handler
+        drains daemon and exits.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _lifecycle - Components and signal routing.
+                | _control - Control socket | None (disabled).
+                | _draining - Drain requested status.
+            :methods:
+                | __init__ - Initials DaemonCommands constructor.
+                | lifecycle - Property method for getting lifecycle.
+                | control_socket - Property method for getting socket.
+                | draining - Property method for getting drain status.
+                | enable_control - Enables control socket.
+                | add_command - Adds user-defined command.
+                | open_channels - Opens components and control socket.
+                | close_channels - Closes control socket and components.
+                | control_stats - Builds reply to stats command.
+                | reload - Reloads configuration, reopens log files.
+                | drain - Handles drain command, drains components.
+                | on_drain - Drain hook (stop accepting new work).
+                | stop - Stops daemon, waits stop time of components.
+                | _stop_command - Handles stop command.
+                | _exit_signal - Drains and exits on SIGTERM (default).
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY'
+
+    def __init__(self, pid: str, verbose: bool = False) -> None:
+        '''
+            Initials DaemonCommands constructor.
+
+            :param pid: PID file path
+            :type pid: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__(pid, verbose)
+        self._lifecycle: Lifecycle = Lifecycle(self)
+        self._control: Optional[ControlSocket] = None
+        self._draining: bool = False
+        self._lifecycle.handle(SIGUSR2, lambda _: self._hot_restart.spawn())
+
+    @property
+    def lifecycle(self) -> Lifecycle:
+        '''
+            Property method for getting components and signal routing.
+
+            :return: Lifecycle of daemon
+            :rtype: <Lifecycle>
+            :exceptions: None
+        '''
+        return self._lifecycle
+
+    @property
+    def control_socket(self) -> Optional[ControlSocket]:
+        '''
+            Property method for getting control socket.
+
+            :return: Control socket | None (disabled)
+            :rtype: <Optional[ControlSocket]>
+            :exceptions: None
+        '''
+        return self._control
+
+    @property
+    def draining(self) -> bool:
+        '''
+            Property method for getting drain requested status.
+
+            :return: True (drain requested) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._draining
+
+    def enable_control(self, verbose: bool = False) -> ControlSocket:
+        '''
+            Enables control socket with built-in commands.
+            Call before start, socket is opened in daemon process.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: Control socket
+            :rtype: <ControlSocket>
+            :exceptions: ATSValueError
+        '''
+        if self._control is None:
+            self._control = ControlSocket(self.sibling_path('.sock'), verbose)
+            self._control.register('stats', lambda _: self.control_stats())
+            self._control.register('drain', lambda _: self.drain())
+            self._control.register('stop', self._stop_command)
+        return self._control
+
+    def add_command(self, command: str, handler: Handler) -> None:
+        '''
+            Adds user-defined command (enables control socket).
+
+            :param command: Command name (one word)
+            :type command: <str>
+            :param handler: Handler called with command arguments
+            :type handler: <Handler>
+            :exceptions: ATSValueError
+        '''
+        self.enable_control().register(command, handler)
+
+    def open_channels(self) -> None:
+        '''
+            Opens components, then starts serving control socket
+            (with commands of components) when it is enabled. Previous
+            generation (hot restart) is retired once this one is ready.
+
+            :exceptions: None
+        '''
+        self._lifecycle.handle(SIGTERM, self._exit_signal, default=True)
+        self._lifecycle.open()
+        if self._control is not None:
+            for command, handler in self._lifecycle.commands().items():
+                self._control.register(command, handler)
+            try:
+                self._control.start()
+            except OSError as os_error:
+                error_message([f'{self._P_VERBOSE} {os_error}'])
+        self._hot_restart.retire_old()
+
+    def close_channels(self) -> None:
+        '''
+            Stops serving control socket, then closes components.
+
+            :exceptions: None
+        '''
+        if self._control is not None:
+            self._control.close()
+        self._lifecycle.close()
+
+    def control_stats(self) -> Dict[str, Any]:
+        '''
+            Builds reply to stats command (process metrics).
+            Override this method to add application statistics.
+
+            :return: Statistics
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        status: ProcessStatus = ProcessStatus(ProcessStatus.RUNNING, getpid())
+        status.read_proc()
+        stats: Dict[str, Any] = status.to_dict()
+        stats['draining'] = self._draining
+        stats.update(self._lifecycle.stats())
+        return stats
+
+    def reload(self) -> Any:
+        '''
+            Reloads configuration, reopens log files (SIGHUP, reload
+            operation or command, called on main thread). Override this
+            method to reload configuration, call it to reopen logs.
+
+            :return: Reply result
+            :rtype: <Any>
+            :exceptions: None
+        '''
+        self.reopen_logs()
+        return 'reloading'
+
+    def drain(self) -> Any:
+        '''
+            Handles drain command (or drain on stop), sets drain status
+            and drains components once, then calls on_drain().
+
+            :return: Reply result
+            :rtype: <Any>
+            :exceptions: None
+        '''
+        if not self._draining:
+            self._draining = True
+            self._lifecycle.drain()
+            self.on_drain()
+        return 'draining'
+
+    def on_drain(self) -> None:
+        '''
+            Drain hook, called once when draining starts.
+            Override this method to stop accepting new work
+            (close listening sockets, stop consumers).
+
+            :exceptions: None
+        '''
+
+    def stop(
+        self, verbose: bool = False, policy: Optional[StopPolicy] = None
+    ) -> Optional[StopResult]:
+        '''
+            Stop daemon process, waits stop time of components (drain)
+            before SIGKILL.
+
+            :param verbose: Enable/Disable verbose option.
+            :type verbose: <bool>
+            :param policy: Stop policy | None (SIGTERM, wait, SIGKILL)
+            :type policy: <Optional[StopPolicy]>
+            :return: Stop result with phase durations | None
+            :rtype: <Optional[StopResult]>
+            :exceptions: None
+        '''
+        timeout: Optional[float] = self._lifecycle.stop_timeout()
+        if policy is None and timeout is not None:
+            policy = StopPolicy(timeout=timeout)
+        return super().stop(verbose, policy)
+
+    def _stop_command(self, args: List[str]) -> str:
+        '''
+            Handles stop command, daemon main process gets SIGTERM
+            after reply is sent (supervisor forwards it to child).
+
+            :param args: Command arguments (not used)
+            :type args: <List[str]>
+            :return: Reply result
+            :rtype: <str>
+            :exceptions: None
+        '''
+        pid: int = FileProcessId.read_pid(str(self._pid)) or getpid()
+        if self._control is not None:
+            self._control.defer(lambda: kill(pid, SIGTERM))
+        return 'stopping'
+
+    def _exit_signal(self, signal_num: int) -> None:
+        '''
+            Drains daemon and exits on SIGTERM (default handler, added
+            last), so channels are closed and PID file is removed.
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :exceptions: SystemExit
+        '''
+        self.drain()
+        sys.exit(0)
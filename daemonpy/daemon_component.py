@@ -0,0 +1,154 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_component.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonComponent with attribute(s) and method(s).
+    Creates a base class for feature composed into daemon lifecycle.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+
+try:
+    from daemonpy.control_socket import Handler
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonComponent:
+    '''
+        Defines class DaemonComponent with attribute(s) and method(s).
+        Creates a base class for feature composed into daemon lifecycle.
+
+        Component is added to lifecycle of daemon before start
+        (daemon.lifecycle.add) and attached to daemon at once, where
+        it adds its signal handlers. It is opened, drained and closed
+        with control channels, in the process which runs run(), and
+        sees heartbeats of run(). Hooks do nothing by default.
+
+        It defines:
+
+            :attributes:
+                | _daemon - Daemon owning component | None (not attached).
+            :methods:
+                | __init__ - Initials DaemonComponent constructor.
+                | attach - Attaches component to daemon.
+                | commands - Gets control commands of component.
+                | stats - Gets statistics for stats command.
+                | stop_timeout - Gets stop time needed by component.
+                | open - Opens component (daemon process).
+                | drain - Starts draining of component.
+                | heartbeat - Sees heartbeat of run().
+                | stopping - Notifies that run() returned.
+                | close - Closes component (daemon process).
+    '''
+
+    def __init__(self) -> None:
+        '''
+            Initials DaemonComponent constructor.
+
+            :exceptions: None
+        '''
+        self._daemon: Any = None
+
+    def attach(self, daemon: Any) -> None:
+        '''
+            Attaches component to daemon (called by lifecycle add).
+            Override this method to add signal handlers.
+
+            :param daemon: Daemon owning component
+            :type daemon: <Any>
+            :exceptions: ATSValueError
+        '''
+        self._daemon = daemon
+
+    def commands(self) -> Dict[str, Handler]:
+        '''
+            Gets control commands of component (served by control
+            socket when it is enabled).
+
+            :return: Handlers by command name
+            :rtype: <Dict[str, Handler]>
+            :exceptions: None
+        '''
+        return {}
+
+    def stats(self) -> Dict[str, Any]:
+        '''
+            Gets statistics added to reply of stats command.
+
+            :return: Statistics
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        return {}
+
+    def stop_timeout(self) -> Optional[float]:
+        '''
+            Gets time which daemon needs to stop with component
+            (controller waits it before SIGKILL).
+
+            :return: Stop time (seconds) | None (default stop timeout)
+            :rtype: <Optional[float]>
+            :exceptions: None
+        '''
+        return None
+
+    def open(self) -> None:
+        '''
+            Opens component in process which runs run().
+
+            :exceptions: OSError
+        '''
+
+    def drain(self) -> None:
+        '''
+            Starts draining of component (drain command or stop).
+
+            :exceptions: None
+        '''
+
+    def heartbeat(self) -> None:
+        '''
+            Sees heartbeat of run() (daemon heartbeat, keep it cheap).
+
+            :exceptions: None
+        '''
+
+    def stopping(self) -> None:
+        '''
+            Notifies that run() returned, before components are closed.
+
+            :exceptions: None
+        '''
+
+    def close(self) -> None:
+        '''
+            Closes component after run() ends.
+
+            :exceptions: None
+        '''
@@ -0,0 +1,260 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_control.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonControl with attribute(s) and method(s).
+    Creates an API for controlling running daemon through PID file.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from json import dumps
+from os import kill
+from signal import SIGHUP, SIGUSR2
+from time import monotonic, sleep
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.control_socket import ControlSocket
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.process_status import ProcessStatus
+    from daemonpy.unix_operations import UnixOperations
+    from daemonpy.stop_policy import StopPolicy, StopResult
+    from daemonpy.param_check import ParamCheck
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonControl(UnixOperations):
+    '''
+        Defines class DaemonControl with attribute(s) and method(s).
+        Creates an API for controlling running daemon through PID file.
+
+        It defines:
+
+            :attributes:
+                | _PKG_VERBOSE - Console text indicator for process-phase.
+                | _TAKEOVER - Wait for new generation on hot restart.
+                | _pid - PID file path.
+            :methods:
+                | __init__ - Initials DaemonControl constructor.
+                | sibling_path - Gets path of file next to PID file.
+                | stop - Stops daemon process.
+                | hot_restart - Restarts daemon keeping listening sockets.
+                | reload_daemon - Reloads configuration of running daemon.
+                | status - Reports daemon status (LSB exit code).
+                | control - Sends command to daemon control socket.
+                | _signal_daemon - Sends signal to daemon from PID file.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY'
+    _TAKEOVER: float = 10.0
+
+    @ParamCheck('str:pid')
+    def __init__(self, pid: str, verbose: bool = False) -> None:
+        '''
+            Initials DaemonControl constructor.
+
+            :param pid: PID file path
+            :type pid: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__()
+        if not bool(pid):
+            raise ATSValueError('missing PID file')
+        verbose_message(verbose, [f'{self._P_VERBOSE} init daemon'])
+        self._pid: Optional[str] = pid if self.unix_status else None
+
+    def sibling_path(self, extension: str) -> str:
+        '''
+            Gets path of file next to PID file (channels of daemon).
+
+            :param extension: Extension which replaces .pid
+            :type extension: <str>
+            :return: File path
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return FileProcessId.sibling_path(str(self._pid), extension)
+
+    def stop(
+        self, verbose: bool = False, policy: Optional[StopPolicy] = None
+    ) -> Optional[StopResult]:
+        '''
+            Stop daemon process.
+
+            :param verbose: Enable/Disable verbose option.
+            :type verbose: <bool>
+            :param policy: Stop policy | None (SIGTERM, 10s, SIGKILL)
+            :type policy: <Optional[StopPolicy]>
+            :return: Stop result with phase durations | None
+            :rtype: <Optional[StopResult]>
+            :exceptions: None
+        '''
+        result: Optional[StopResult] = None
+        verbose_message(verbose, [f'{self._P_VERBOSE} stop daemon'])
+        if self.unix_status and bool(self._pid):
+            pid: Optional[int] = FileProcessId.read_pid(self._pid)
+            if pid is None:
+                error_message([f'{self._P_VERBOSE} daemon running?'])
+            else:
+                result = self.unix_kill(pid, self._pid, verbose, policy)
+        return result
+
+    def hot_restart(self, verbose: bool = False) -> bool:
+        '''
+            Restart daemon without closing its listening sockets.
+            Running daemon starts new generation which inherits sockets,
+            takes over PID file and retires the old generation when it
+            is ready. Waits until PID file names running new generation.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: True (new generation took over) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        verbose_message(verbose, [f'{self._P_VERBOSE} hot restart daemon'])
+        old_pid: Optional[int] = FileProcessId.read_pid(str(self._pid))
+        if not self._signal_daemon(SIGUSR2):
+            return False
+        deadline: float = monotonic() + self._TAKEOVER
+        while monotonic() < deadline:
+            pid: Optional[int] = FileProcessId.read_pid(str(self._pid))
+            if pid not in (None, old_pid) and FileProcessId.is_running(
+                str(self._pid)
+            ):
+                return True
+            sleep(0.05)
+        error_message([f'{self._P_VERBOSE} no takeover of', self._pid])
+        return False
+
+    def reload_daemon(self, verbose: bool = False) -> bool:
+        '''
+            Reload configuration of running daemon (SIGHUP).
+            Daemon keeps running with its caches and connections,
+            reload() is called in daemon process.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: True (success operation) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        verbose_message(verbose, [f'{self._P_VERBOSE} reload daemon'])
+        return self._signal_daemon(SIGHUP)
+
+    def status(self, verbose: bool = False, json_output: bool = False) -> int:
+        '''
+            Reports daemon status read from PID file lock and /proc.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param json_output: Print status as JSON document
+            :type json_output: <bool>
+            :return: 0 (running) | 1 (dead, PID file exists) | 3 (stopped)
+            :rtype: <int>
+            :exceptions: None
+        '''
+        verbose_message(verbose, [f'{self._P_VERBOSE} status daemon'])
+        if not self.unix_status or not bool(self._pid):
+            return ProcessStatus.NOT_RUNNING
+        status: ProcessStatus = ProcessStatus.probe(self._pid)
+        print(status.to_json() if json_output else status)
+        return status.exit_code
+
+    def control(
+        self,
+        command: str,
+        verbose: bool = False,
+        json_output: bool = False,
+        args: Optional[List[str]] = None
+    ) -> int:
+        '''
+            Sends command to control socket of running daemon
+            and prints reply.
+
+            :param command: Command (ping, stats, reload, drain, ...)
+            :type command: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param json_output: Print reply as JSON document
+            :type json_output: <bool>
+            :param args: Command arguments | None
+            :type args: <Optional[List[str]]>
+            :return: 0 (command done) | 1 (failed or no control socket)
+            :rtype: <int>
+            :exceptions: None
+        '''
+        verbose_message(verbose, [f'{self._P_VERBOSE} control', command])
+        if not self.unix_status or not bool(self._pid):
+            return 1
+        try:
+            reply: Dict[str, Any] = ControlSocket.request(
+                FileProcessId.sibling_path(self._pid, '.sock'), command, args
+            )
+        except (OSError, ValueError) as error:
+            error_message([f'{self._P_VERBOSE} control socket: {error}'])
+            return 1
+        if not reply.get('ok'):
+            error_message([f'{self._P_VERBOSE} {reply.get("error")}'])
+            return 1
+        result: Any = reply.get('result')
+        if json_output:
+            print(dumps(result, separators=(',', ':')))
+        elif isinstance(result, dict):
+            print('\n'.join(f'{key}: {val}' for key, val in result.items()))
+        elif result is not None:
+            print(result)
+        return 0
+
+    def _signal_daemon(self, signal_num: int) -> bool:
+        '''
+            Sends signal to daemon process read from PID file.
+
+            :param signal_num: Signal number
+            :type signal_num: <int>
+            :return: True (signal sent) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        status: bool = False
+        if self.unix_status and bool(self._pid):
+            pid: Optional[int] = FileProcessId.read_pid(self._pid)
+            try:
+                if pid is not None:
+                    kill(pid, signal_num)
+                    status = True
+            except OSError as os_error:
+                error_message([f'{self._P_VERBOSE} {os_error}'])
+            if not status:
+                error_message([f'{self._P_VERBOSE} daemon running?'])
+        return status
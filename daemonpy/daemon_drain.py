@@ -0,0 +1,182 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_drain.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonDrain with attribute(s) and method(s).
+    Creates an API for graceful drain of daemon on stop.
+'''
+
+import sys
+from typing import Any, List, Optional
+from signal import SIGTERM
+from threading import Thread
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from daemonpy.daemon_component import DaemonComponent
+    from daemonpy.drain import Drain
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonDrain(DaemonComponent):
+    '''
+        Defines class DaemonDrain with attribute(s) and method(s).
+        Creates an API for graceful drain of daemon on stop.
+
+        With drain component first SIGTERM (stop, restart, hot restart,
+        stop command) starts draining: daemon drain() sets drain event,
+        calls on_drain() hook and new work is refused. When in-flight
+        work reaches zero or drain timeout expires, SIGTERM is routed
+        once more to main thread (or event loop) and daemon stops as
+        without drain: default SIGTERM handler of daemon (shutdown of
+        AsyncDaemon, PreforkDaemon) or SystemExit. run() may also poll
+        state and return when it is drained. Repeated SIGTERM does not
+        cut the drain short. Controller (stop, restart) waits drain
+        timeout plus grace before SIGKILL instead of stop timeout.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _GRACE - Controller wait over drain timeout (seconds).
+                | _state - In-flight work tracking.
+                | _stopping - Stop requested, drain is awaited.
+                | _drained - Drain finished, next SIGTERM stops daemon.
+                | _exiting - Daemon is stopping (or closed).
+            :methods:
+                | __init__ - Initials DaemonDrain constructor.
+                | state - Property method for getting drain state.
+                | attach - Attaches component, handles SIGTERM.
+                | stop_timeout - Gets drain timeout plus grace.
+                | drain - Starts draining (drain command).
+                | close - Ignores signals of ended drain.
+                | _stop_signal - Starts drain or stops daemon on SIGTERM.
+                | _await_drain - Waits for drain, then routes SIGTERM.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::DRAIN'
+    _GRACE: float = 5.0
+
+    def __init__(self, timeout: float = 30.0) -> None:
+        '''
+            Initials DaemonDrain constructor.
+
+            :param timeout: Max drain time (seconds)
+            :type timeout: <float>
+            :exceptions: ATSValueError
+        '''
+        super().__init__()
+        self._state: Drain = Drain(timeout)
+        self._stopping: bool = False
+        self._drained: bool = False
+        self._exiting: bool = False
+
+    @property
+    def state(self) -> Drain:
+        '''
+            Property method for getting in-flight work tracking, run()
+            admits work with it (acquire/release or with statement).
+
+            :return: Drain state
+            :rtype: <Drain>
+            :exceptions: None
+        '''
+        return self._state
+
+    def attach(self, daemon: Any) -> None:
+        '''
+            Attaches component to daemon, handles SIGTERM with drain.
+
+            :param daemon: Daemon owning component
+            :type daemon: <Any>
+            :exceptions: None
+        '''
+        super().attach(daemon)
+        daemon.lifecycle.handle(SIGTERM, self._stop_signal)
+
+    def stop_timeout(self) -> Optional[float]:
+        '''
+            Gets time controller waits before SIGKILL.
+
+            :return: Drain timeout plus grace (seconds)
+            :rtype: <Optional[float]>
+            :exceptions: None
+        '''
+        return self._state.timeout + self._GRACE
+
+    def drain(self) -> None:
+        '''
+            Starts draining, new work is refused (without exit).
+
+            :exceptions: None
+        '''
+        self._state.start()
+
+    def close(self) -> None:
+        '''
+            Ignores SIGTERM routed by drain after run() returned.
+
+            :exceptions: None
+        '''
+        self._exiting = True
+
+    def _stop_signal(self, signal_num: int) -> None:
+        '''
+            Starts drain on first SIGTERM, stops daemon when drain
+            finished (default SIGTERM handler, else SystemExit).
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :exceptions: SystemExit (drain finished)
+        '''
+        if self._drained:
+            if not self._exiting:
+                self._exiting = True
+                if not self._daemon.lifecycle.fallback(signal_num):
+                    sys.exit(0)
+        elif not self._stopping:
+            self._stopping = True
+            if self._daemon is not None:
+                self._daemon.drain()
+            Thread(target=self._await_drain, daemon=True).start()
+
+    def _await_drain(self) -> None:
+        '''
+            Waits for in-flight work, then routes SIGTERM once to main
+            thread (interrupts blocking call) or event loop.
+
+            :exceptions: None
+        '''
+        if not self._state.wait():
+            error_message([
+                f'{self._P_VERBOSE} drain timeout,',
+                self._state.in_flight, 'works cut off'
+            ])
+        self._drained = True
+        if not self._exiting:
+            self._daemon.lifecycle.wake(SIGTERM)
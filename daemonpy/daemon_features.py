@@ -0,0 +1,197 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_features.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonFeatures with attribute(s) and method(s).
+    Creates shortcuts for optional lifecycle components of daemon.
+'''
+
+import sys
+from typing import TYPE_CHECKING, List, Optional
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon_systemd import DaemonSystemd
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+if TYPE_CHECKING:  # components are imported on first use
+    from daemonpy.drain import Drain
+    from daemonpy.managed_pool import ManagedPool
+    from daemonpy.metrics_server import Address, MetricsServer
+    from daemonpy.status_page import StatusPage
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonFeatures(DaemonSystemd):
+    '''
+        Defines class DaemonFeatures with attribute(s) and method(s).
+        Creates shortcuts for optional lifecycle components of daemon.
+
+        Each shortcut adds its component to lifecycle once (call before
+        start) and returns what run() works with. Component modules are
+        imported on first use, so importing daemon stays cheap.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | drain_state - Property method for getting drain state.
+                | enable_drain - Enables drain on stop (DaemonDrain).
+                | add_pool - Configures managed pool (DaemonPools).
+                | pool - Gets managed pool by name.
+                | enable_metrics - Enables metrics endpoint (DaemonMetrics).
+                | status_page - Property method for getting status page.
+                | enable_status_page - Enables status page.
+    '''
+
+    @property
+    def drain_state(self) -> Optional['Drain']:
+        '''
+            Property method for getting in-flight work tracking.
+
+            :return: Drain state | None (drain disabled)
+            :rtype: <Optional[Drain]>
+            :exceptions: None
+        '''
+        from daemonpy.daemon_drain import DaemonDrain
+        drain: Optional[DaemonDrain] = self._lifecycle.get(DaemonDrain)
+        return drain.state if drain is not None else None
+
+    def enable_drain(self, timeout: float = 30.0) -> 'Drain':
+        '''
+            Enables drain on stop, run() admits work with returned
+            state (acquire/release or with statement).
+
+            :param timeout: Max drain time (seconds, first call sets it)
+            :type timeout: <float>
+            :return: Drain state
+            :rtype: <Drain>
+            :exceptions: ATSValueError
+        '''
+        from daemonpy.daemon_drain import DaemonDrain
+        drain: Optional[DaemonDrain] = self._lifecycle.get(DaemonDrain)
+        if drain is None:
+            drain = self._lifecycle.add(DaemonDrain(timeout))
+        return drain.state
+
+    def add_pool(
+        self, name: str, kind: str = 'thread',
+        workers: Optional[int] = None, context: Optional[str] = None
+    ) -> 'ManagedPool':
+        '''
+            Configures managed pool, call before start.
+
+            :param name: Pool name
+            :type name: <str>
+            :param kind: Executor kind (thread | process)
+            :type kind: <str>
+            :param workers: Number of workers | None (CPU affinity)
+            :type workers: <Optional[int]>
+            :param context: Start method (process pool) | None (forkserver)
+            :type context: <Optional[str]>
+            :return: Managed pool
+            :rtype: <ManagedPool>
+            :exceptions: ATSValueError
+        '''
+        from daemonpy.daemon_pools import DaemonPools
+        pools: Optional[DaemonPools] = self._lifecycle.get(DaemonPools)
+        if pools is None:
+            pools = self._lifecycle.add(DaemonPools())
+        return pools.add(name, kind, workers, context)
+
+    def pool(self, name: str) -> 'ManagedPool':
+        '''
+            Gets managed pool by name (submit tasks in run()).
+
+            :param name: Pool name
+            :type name: <str>
+            :return: Managed pool
+            :rtype: <ManagedPool>
+            :exceptions: ATSValueError
+        '''
+        from daemonpy.daemon_pools import DaemonPools
+        pools: Optional[DaemonPools] = self._lifecycle.get(DaemonPools)
+        if pools is None:
+            raise ATSValueError(f'missing pool {name}')
+        return pools.get(name)
+
+    def enable_metrics(
+        self, address: Optional['Address'] = None, verbose: bool = False
+    ) -> 'MetricsServer':
+        '''
+            Enables metrics endpoint, call before start (registry is
+            registry property of DaemonMetrics in lifecycle).
+
+            :param address: Port | (host, port) | socket path | None
+                            (socket file next to PID file)
+            :type address: <Optional[Address]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: Metrics endpoint (started with channels)
+            :rtype: <MetricsServer>
+            :exceptions: None
+        '''
+        from daemonpy.daemon_metrics import DaemonMetrics
+        metrics: Optional[DaemonMetrics] = self._lifecycle.get(DaemonMetrics)
+        if metrics is None:
+            metrics = self._lifecycle.add(DaemonMetrics(address, verbose))
+        return metrics.server  # type: ignore[return-value]
+
+    @property
+    def status_page(self) -> Optional['StatusPage']:
+        '''
+            Property method for getting shared memory status page.
+
+            :return: Status page | None (disabled)
+            :rtype: <Optional[StatusPage]>
+            :exceptions: None
+        '''
+        from daemonpy.daemon_status_page import DaemonStatusPage
+        status: Optional[DaemonStatusPage] = self._lifecycle.get(
+            DaemonStatusPage
+        )
+        return status.page if status is not None else None
+
+    def enable_status_page(self, counters: List[str]) -> 'StatusPage':
+        '''
+            Enables shared memory status page with counters (added
+            once). Call before start, page is created in daemon process.
+
+            :param counters: Counter names (up to 32 bytes each)
+            :type counters: <List[str]>
+            :return: Status page
+            :rtype: <StatusPage>
+            :exceptions: ATSValueError
+        '''
+        from daemonpy.daemon_status_page import DaemonStatusPage
+        status: Optional[DaemonStatusPage] = self._lifecycle.get(
+            DaemonStatusPage
+        )
+        if status is None:
+            status = self._lifecycle.add(DaemonStatusPage(counters))
+        return status.page  # type: ignore[return-value]
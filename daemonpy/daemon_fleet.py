@@ -0,0 +1,250 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_fleet.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonFleet with attribute(s) and method(s).
+    Creates an API for controlling many daemons concurrently.
+'''
+
+import sys
+from typing import Dict, List, Optional, Union
+from glob import glob
+from os import remove
+from os.path import isdir, join
+from subprocess import Popen, DEVNULL, TimeoutExpired
+from time import monotonic, sleep
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.process_status import ProcessStatus
+    from daemonpy.stop_policy import StopPolicy, StopResult
+    from daemonpy.unix_operations import UnixOperations
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonFleet(UnixOperations):
+    '''
+        Defines class DaemonFleet with attribute(s) and method(s).
+        Creates an API for controlling many daemons concurrently.
+
+        Each stop step signals all remaining daemons first and then waits
+        for all of them at once (one epoll set of pidfds), so fleet stop
+        time is bounded by the slowest daemon instead of the sum.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _PID_PATTERN - PID file pattern used for directories.
+                | _pids - PID file paths of fleet daemons.
+            :methods:
+                | __init__ - Initials DaemonFleet constructor.
+                | pids - Property method for getting PID file paths.
+                | stop - Stops all daemons concurrently.
+                | status - Reports status of all daemons.
+                | start - Starts daemons and waits until they are running.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::DAEMON_FLEET'
+    _PID_PATTERN: str = '*.pid'
+
+    def __init__(
+        self, pids: Union[str, List[str]], verbose: bool = False
+    ) -> None:
+        '''
+            Initials DaemonFleet constructor.
+
+            :param pids: PID file paths | directory | glob pattern
+            :type pids: <Union[str, List[str]]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__(verbose)
+        if isinstance(pids, str):
+            pattern: str = pids
+            if isdir(pids):
+                pattern = join(pids, self._PID_PATTERN)
+            pids = sorted(glob(pattern))
+        if not isinstance(pids, list):
+            raise ATSTypeError('expected PID file paths')
+        if not all(isinstance(pid, str) and bool(pid) for pid in pids):
+            raise ATSValueError('missing PID file')
+        self._pids: List[str] = list(dict.fromkeys(pids))
+        verbose_message(
+            verbose, [f'{self._P_VERBOSE} fleet of', len(self._pids)]
+        )
+
+    @property
+    def pids(self) -> List[str]:
+        '''
+            Property method for getting PID file paths.
+
+            :return: PID file paths of fleet daemons
+            :rtype: <List[str]>
+            :exceptions: None
+        '''
+        return self._pids
+
+    def stop(
+        self, verbose: bool = False, policy: Optional[StopPolicy] = None
+    ) -> Dict[str, Optional[StopResult]]:
+        '''
+            Stops all daemons concurrently by escalating stop policy.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param policy: Stop policy | None (SIGTERM, 10s, SIGKILL)
+            :type policy: <Optional[StopPolicy]>
+            :return: Stop result per PID file | None (not running)
+            :rtype: <Dict[str, Optional[StopResult]]>
+            :exceptions: None
+        '''
+        results: Dict[str, Optional[StopResult]] = dict.fromkeys(self._pids)
+        if not self.unix_status:
+            return results
+        if policy is None:
+            policy = StopPolicy()
+        pending: Dict[int, StopResult] = {}
+        for pid_path in self._pids:
+            if not FileProcessId.is_running(pid_path):
+                continue
+            pid: Optional[int] = FileProcessId.read_pid(pid_path)
+            if pid is not None:  # PID files naming same PID share result
+                results[pid_path] = pending.setdefault(pid, StopResult(pid))
+        verbose_message(
+            verbose, [f'{self._P_VERBOSE} stop daemons', len(pending)]
+        )
+        for signal_num, timeout in policy.steps():
+            if not pending:
+                break
+            start: float = monotonic()
+            for pid in list(pending):
+                try:
+                    self._send_signal(pid, signal_num, policy.process_group)
+                except ProcessLookupError:
+                    pending.pop(pid).add_phase(signal_num, 0.0, True)
+                except OSError as os_error:
+                    error_message([f'{self._P_VERBOSE} {pid} {os_error}'])
+                    pending.pop(pid)
+            exited: Dict[int, float] = self._waiter.wait_all(
+                list(pending), timeout
+            )
+            for pid, result in list(pending.items()):
+                if pid in exited:
+                    result.add_phase(signal_num, exited[pid] - start, True)
+                    del pending[pid]
+                else:
+                    result.add_phase(signal_num, monotonic() - start, False)
+        for pid_path, result in results.items():
+            if result is None:
+                continue
+            if result.stopped and FileProcessId.read_pid(
+                pid_path
+            ) == result.pid:  # not replaced by other daemon meanwhile
+                try:
+                    remove(pid_path)
+                except FileNotFoundError:
+                    pass
+            elif not result.stopped:
+                error_message([
+                    f'{self._P_VERBOSE} failed to stop {result.pid}'
+                ])
+        return results
+
+    def status(self) -> Dict[str, ProcessStatus]:
+        '''
+            Reports status of all daemons.
+
+            :return: Process status per PID file
+            :rtype: <Dict[str, ProcessStatus]>
+            :exceptions: None
+        '''
+        return {
+            pid_path: ProcessStatus.probe(pid_path) for pid_path in self._pids
+        }
+
+    def start(
+        self,
+        commands: Dict[str, List[str]],
+        timeout: float = 10.0,
+        verbose: bool = False
+    ) -> Dict[str, bool]:
+        '''
+            Starts daemons concurrently and waits until each of them
+            holds lock on its PID file, launchers are reaped (bounded
+            by the same deadline).
+
+            :param commands: Start command line per PID file
+            :type commands: <Dict[str, List[str]]>
+            :param timeout: Max time to wait for all daemons (seconds)
+            :type timeout: <float>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :return: Running status per PID file
+            :rtype: <Dict[str, bool]>
+            :exceptions: None
+        '''
+        results: Dict[str, bool] = {}
+        launchers: List[Popen[bytes]] = []
+        for pid_path in self._pids:
+            results[pid_path] = FileProcessId.is_running(pid_path)
+            if results[pid_path] or pid_path not in commands:
+                continue
+            verbose_message(verbose, [f'{self._P_VERBOSE} start', pid_path])
+            try:
+                launchers.append(Popen(
+                    commands[pid_path], stdin=DEVNULL, close_fds=True
+                ))
+            except OSError as os_error:
+                error_message([f'{self._P_VERBOSE} {pid_path} {os_error}'])
+        deadline: float = monotonic() + max(timeout, 0.0)
+        delay: float = 0.001
+        starting: List[str] = [
+            pid_path for pid_path, running in results.items()
+            if not running and pid_path in commands
+        ]
+        while starting and monotonic() < deadline:
+            sleep(min(delay, max(deadline - monotonic(), 0.0)))
+            delay = min(delay * 2.0, 0.1)
+            for pid_path in list(starting):
+                if FileProcessId.is_running(pid_path):
+                    results[pid_path] = True
+                    starting.remove(pid_path)
+        for launcher in launchers:
+            try:
+                launcher.wait(max(deadline - monotonic(), 0.0))
+            except TimeoutExpired:
+                pass  # daemon running in foreground (launcher itself)
+        for pid_path in starting:
+            error_message([f'{self._P_VERBOSE} failed to start {pid_path}'])
+        return results
@@ -0,0 +1,249 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_metrics.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonMetrics with attribute(s) and method(s).
+    Creates an API for metrics endpoint of daemon.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from os import getpid
+from signal import Signals, SIGHUP, SIGINT, SIGTERM, SIGUSR2
+from time import monotonic
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from daemonpy.control_socket import Handler
+    from daemonpy.counter import Counter
+    from daemonpy.daemon_component import DaemonComponent
+    from daemonpy.daemon_reload import DaemonReload
+    from daemonpy.metrics_registry import MetricsRegistry
+    from daemonpy.metrics_server import Address, MetricsServer
+    from daemonpy.process_status import ProcessStatus
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonMetrics(DaemonComponent):
+    '''
+        Defines class DaemonMetrics with attribute(s) and method(s).
+        Creates an API for metrics endpoint of daemon.
+
+        Registry holds daemon metrics, run() adds application metrics
+        by registry counter/gauge/histogram. Endpoint serves GET
+        /metrics (TCP port or Unix socket) from the process which runs
+        run(), and metrics command replies with the same document.
+        Built-in metrics (prefix daemonpy_) are uptime, supervisor
+        restarts, reloads, signals routed by lifecycle, RSS, CPU time,
+        threads and open descriptors (read from /proc per scrape).
+        Counters end with _total. Stop latency is not exported, daemon
+        can not observe its own exit, controller gets it from stop()
+        as StopResult.duration.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | SIGNALS - Signals routed (and counted) by lifecycle.
+                | _registry - Metrics registry.
+                | _address - Endpoint address | None (next to PID file).
+                | _verbose - Enable/Disable verbose option of endpoint.
+                | _server - Metrics endpoint | None (not attached).
+                | _signals - Counter of routed signals.
+                | _started - Time of component open (monotonic).
+            :methods:
+                | __init__ - Initials DaemonMetrics constructor.
+                | registry - Property method for getting registry.
+                | server - Property method for getting endpoint.
+                | attach - Attaches component, counts signals.
+                | commands - Gets metrics command.
+                | open - Registers built-in metrics, starts endpoint.
+                | close - Closes endpoint.
+                | _builtin_metrics - Registers built-in metrics.
+                | _count - Counts routed signal.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::METRICS'
+    SIGNALS: List[Signals] = [SIGTERM, SIGINT, SIGHUP, SIGUSR2]
+
+    def __init__(
+        self, address: Optional[Address] = None, verbose: bool = False
+    ) -> None:
+        '''
+            Initials DaemonMetrics constructor.
+
+            :param address: Port | (host, port) | socket path | None
+                            (socket file next to PID file)
+            :type address: <Optional[Address]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: None
+        '''
+        super().__init__()
+        self._registry: MetricsRegistry = MetricsRegistry()
+        self._address: Optional[Address] = address
+        self._verbose: bool = verbose
+        self._server: Optional[MetricsServer] = None
+        self._signals: Counter = self._registry.counter(
+            'daemonpy_signals_total', 'Number of handled signals.',
+            labels=('signal',)
+        )
+        self._started: float = monotonic()
+
+    @property
+    def registry(self) -> MetricsRegistry:
+        '''
+            Property method for getting metrics registry.
+
+            :return: Metrics registry
+            :rtype: <MetricsRegistry>
+            :exceptions: None
+        '''
+        return self._registry
+
+    @property
+    def server(self) -> Optional[MetricsServer]:
+        '''
+            Property method for getting metrics endpoint.
+
+            :return: Metrics endpoint | None (not attached)
+            :rtype: <Optional[MetricsServer]>
+            :exceptions: None
+        '''
+        return self._server
+
+    def attach(self, daemon: Any) -> None:
+        '''
+            Attaches component to daemon, counts routed signals.
+
+            :param daemon: Daemon owning component
+            :type daemon: <Any>
+            :exceptions: None
+        '''
+        super().attach(daemon)
+        self._server = MetricsServer(
+            self._registry, self._address if self._address is not None
+            else daemon.sibling_path('.metrics'), self._verbose
+        )
+        daemon.lifecycle.listen(self._count, self.SIGNALS)
+
+    def commands(self) -> Dict[str, Handler]:
+        '''
+            Gets metrics command (replies with metrics document).
+
+            :return: Handlers by command name
+            :rtype: <Dict[str, Handler]>
+            :exceptions: None
+        '''
+        return {'metrics': lambda _: self._registry.expose()}
+
+    def open(self) -> None:
+        '''
+            Registers built-in metrics, starts endpoint.
+
+            :exceptions: None
+        '''
+        self._started = monotonic()
+        self._builtin_metrics()
+        if self._server is not None:
+            try:
+                self._server.start()
+            except OSError as os_error:
+                error_message([f'{self._P_VERBOSE} {os_error}'])
+
+    def close(self) -> None:
+        '''
+            Closes metrics endpoint.
+
+            :exceptions: None
+        '''
+        if self._server is not None:
+            self._server.close()
+
+    def _builtin_metrics(self) -> None:
+        '''
+            Registers built-in metrics of daemon process.
+
+            :exceptions: None
+        '''
+        registry: MetricsRegistry = self._registry
+        reload: Optional[DaemonReload] = self._daemon.lifecycle.get(
+            DaemonReload
+        )
+        registry.gauge(
+            'daemonpy_uptime_seconds', 'Time since daemon started.'
+        ).set_function(lambda: monotonic() - self._started)
+        registry.counter(
+            'daemonpy_reloads_total', 'Number of handled reloads.'
+        ).set_function(lambda: reload.reloads if reload else 0)
+        proc: Dict[str, float] = {}
+        for kind, name, help_text in (
+            (registry.counter, 'daemonpy_restarts_total',
+             'Number of supervisor restarts.'),
+            (registry.counter, 'daemonpy_cpu_seconds_total',
+             'User and system CPU time.'),
+            (registry.gauge, 'daemonpy_resident_memory_bytes',
+             'Resident set size.'),
+            (registry.gauge, 'daemonpy_threads', 'Number of threads.'),
+            (registry.gauge, 'daemonpy_open_fds',
+             'Number of open file descriptors.')
+        ):
+            kind(name, help_text).set_function(
+                lambda name=name: proc.get(name, float('nan'))
+            )
+        stats_path: str = self._daemon.sibling_path('.stats')
+
+        def collect() -> None:
+            status: ProcessStatus = ProcessStatus(
+                ProcessStatus.RUNNING, getpid()
+            )
+            proc['daemonpy_restarts_total'] = 0
+            if status.read_proc():
+                for name, value in (
+                    ('daemonpy_cpu_seconds_total', status.cpu_time),
+                    ('daemonpy_resident_memory_bytes', status.rss),
+                    ('daemonpy_threads', status.threads),
+                    ('daemonpy_open_fds', status.open_fds)
+                ):
+                    proc[name] = float('nan') if value is None else value
+            if status.read_stats(stats_path) and status.supervisor:
+                proc['daemonpy_restarts_total'] = status.supervisor.get(
+                    'restarts', 0
+                )
+
+        registry.add_collector(collect)
+
+    def _count(self, signal_num: int) -> None:
+        '''
+            Counts signal routed by lifecycle (main thread).
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :exceptions: None
+        '''
+        self._signals.labels(Signals(signal_num).name).inc()
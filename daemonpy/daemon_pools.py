@@ -0,0 +1,227 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_pools.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonPools with attribute(s) and method(s).
+    Creates an API for executors owned by daemon lifecycle.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from signal import SIGTERM
+from time import monotonic
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon_component import DaemonComponent
+    from daemonpy.managed_pool import ManagedPool
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonPools(DaemonComponent):
+    '''
+        Defines class DaemonPools with attribute(s) and method(s).
+        Creates an API for executors owned by daemon lifecycle.
+
+        Pools are configured before start and created when channels
+        open, in the process which runs run() (after forks and
+        placement). When run() ends (return, SystemExit from SIGTERM,
+        stop command) pools are shut down in order of creation within
+        common deadline, before PID file is removed at exit. SIGTERM
+        exits (default handler), so shutdown runs. Stats command
+        reports queue depth and utilization of pools.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _pools - Managed pools by name (creation order).
+                | _timeout - Shutdown deadline of all pools.
+            :methods:
+                | __init__ - Initials DaemonPools constructor.
+                | timeout - Property methods for set/get deadline.
+                | add - Configures managed pool.
+                | get - Gets managed pool by name.
+                | attach - Attaches component, exits on SIGTERM.
+                | stats - Gets pool metrics for stats command.
+                | open - Creates pools.
+                | close - Shuts pools down.
+                | shutdown - Shuts pools down within deadline.
+                | _exit - Exits on SIGTERM (default handler).
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::POOLS'
+
+    def __init__(self, timeout: float = 5.0) -> None:
+        '''
+            Initials DaemonPools constructor.
+
+            :param timeout: Max shutdown time of all pools (seconds)
+            :type timeout: <float>
+            :exceptions: ATSValueError
+        '''
+        super().__init__()
+        self._pools: Dict[str, ManagedPool] = {}
+        self._timeout: float = 5.0
+        self.timeout = timeout
+
+    @property
+    def timeout(self) -> float:
+        '''
+            Property method for getting shutdown deadline of pools.
+
+            :return: Max shutdown time of all pools (seconds)
+            :rtype: <float>
+            :exceptions: None
+        '''
+        return self._timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float) -> None:
+        '''
+            Property method for setting shutdown deadline of pools
+            (keep it below stop timeout of controller).
+
+            :param timeout: Max shutdown time of all pools (seconds)
+            :type timeout: <float>
+            :exceptions: ATSValueError
+        '''
+        if timeout < 0:
+            raise ATSValueError('pools timeout must be non-negative')
+        self._timeout = timeout
+
+    def add(
+        self, name: str, kind: str = 'thread',
+        workers: Optional[int] = None, context: Optional[str] = None
+    ) -> ManagedPool:
+        '''
+            Configures managed pool, call before start.
+
+            :param name: Pool name
+            :type name: <str>
+            :param kind: Executor kind (thread | process)
+            :type kind: <str>
+            :param workers: Number of workers | None (CPU affinity)
+            :type workers: <Optional[int]>
+            :param context: Start method (process pool) | None (forkserver)
+            :type context: <Optional[str]>
+            :return: Managed pool
+            :rtype: <ManagedPool>
+            :exceptions: ATSValueError
+        '''
+        if name in self._pools:
+            raise ATSValueError(f'pool {name} already exists')
+        self._pools[name] = ManagedPool(name, kind, workers, context)
+        return self._pools[name]
+
+    def get(self, name: str) -> ManagedPool:
+        '''
+            Gets managed pool by name (submit tasks in run()).
+
+            :param name: Pool name
+            :type name: <str>
+            :return: Managed pool
+            :rtype: <ManagedPool>
+            :exceptions: ATSValueError
+        '''
+        if name not in self._pools:
+            raise ATSValueError(f'missing pool {name}')
+        return self._pools[name]
+
+    def attach(self, daemon: Any) -> None:
+        '''
+            Attaches component to daemon, exits on SIGTERM when signal
+            has no other handler.
+
+            :param daemon: Daemon owning component
+            :type daemon: <Any>
+            :exceptions: None
+        '''
+        super().attach(daemon)
+        daemon.lifecycle.handle(SIGTERM, self._exit, default=True)
+
+    def stats(self) -> Dict[str, Any]:
+        '''
+            Gets pool metrics for stats command.
+
+            :return: Statistics
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        if not self._pools:
+            return {}
+        return {'pools': {
+            name: pool.metrics() for name, pool in self._pools.items()
+        }}
+
+    def open(self) -> None:
+        '''
+            Creates pools (before control socket serves, so daemon is
+            ready after pools).
+
+            :exceptions: None
+        '''
+        for pool in self._pools.values():
+            try:
+                pool.open()
+            except (OSError, ValueError) as pool_error:
+                error_message([f'{self._P_VERBOSE} {pool_error}'])
+
+    def close(self) -> None:
+        '''
+            Shuts pools down after run() ends.
+
+            :exceptions: None
+        '''
+        self.shutdown()
+
+    def shutdown(self) -> bool:
+        '''
+            Shuts pools down in order of creation within deadline.
+
+            :return: True (all tasks finished) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        deadline: float = monotonic() + self._timeout
+        status: bool = True
+        for pool in self._pools.values():
+            status = pool.shutdown(deadline - monotonic()) and status
+        return status
+
+    @staticmethod
+    def _exit(signal_num: int) -> None:
+        '''
+            Exits on SIGTERM, so pools are shut down.
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :exceptions: SystemExit
+        '''
+        sys.exit(0)
@@ -0,0 +1,280 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_process.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonProcess with attribute(s) and method(s).
+    Creates an API for detaching and running daemon process.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional, Union
+from atexit import register
+from os.path import exists
+from os import close, getpid, remove
+from signal import signal, SIGHUP, SIGUSR2, SIG_IGN
+from socket import socket, AF_INET
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.console_io.verbose import verbose_message
+    from daemonpy.daemon_usage import DaemonUsage
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.file_descriptor import FileDescriptor
+    from daemonpy.hot_restart import HotRestart
+    from daemonpy.log_sink import LogSink
+    from daemonpy.daemon_control import DaemonControl
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonProcess(DaemonControl):
+    '''
+        Defines class DaemonProcess with attribute(s) and method(s).
+        Creates an API for detaching and running daemon process.
+
+        It defines:
+
+            :attributes:
+                | _PKG_VERBOSE - Console text indicator for process-phase.
+                | _hot_restart - Listening sockets hand over.
+                | _pid_lock - Locked PID file descriptor | None.
+                | _log_targets - Log targets for stdout and stderr.
+                | _log_sinks - Opened log sinks.
+            :methods:
+                | __init__ - Initials DaemonProcess constructor.
+                | listen_sockets - Property method for getting sockets.
+                | listen - Opens (or adopts inherited) listening socket.
+                | log_to - Sets log targets for stdout and stderr.
+                | reopen_logs - Requests reopen of log files.
+                | daemonize - Creates daemon process.
+                | write_pid_file - Publishes PID file and keeps it locked.
+                | exit_handler - At exit delete PID file.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY'
+
+    def __init__(self, pid: str, verbose: bool = False) -> None:
+        '''
+            Initials DaemonProcess constructor.
+
+            :param pid: PID file path
+            :type pid: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__(pid, verbose)
+        self._hot_restart: HotRestart = HotRestart(
+            DaemonUsage.DAEMON_OPERATIONS
+        )
+        self._pid_lock: Optional[int] = None
+        self._log_targets: List[Union[str, LogSink, None]] = [None, None]
+        self._log_sinks: List[LogSink] = []
+
+    @property
+    def listen_sockets(self) -> List[socket]:
+        '''
+            Property method for getting listening sockets.
+
+            :return: Listening sockets (opened and inherited)
+            :rtype: <List[socket]>
+            :exceptions: None
+        '''
+        return self._hot_restart.sockets
+
+    def listen(
+        self, address: Any, family: int = AF_INET, backlog: int = 1024
+    ) -> socket:
+        '''
+            Opens listening socket handed over on hot restart.
+            Socket inherited from previous generation is reused.
+
+            :param address: Socket address (host, port) | path
+            :type address: <Any>
+            :param family: Socket address family
+            :type family: <int>
+            :param backlog: Listen queue length
+            :type backlog: <int>
+            :return: Listening socket
+            :rtype: <socket>
+            :exceptions: OSError
+        '''
+        return self._hot_restart.listen(address, family, backlog)
+
+    def log_to(
+        self,
+        stdout: Union[str, LogSink, None],
+        stderr: Union[str, LogSink, None] = None
+    ) -> None:
+        '''
+            Sets log targets used by daemonize for stdout and stderr.
+
+            :param stdout: Log file path | log sink | None (/dev/null)
+            :type stdout: <Union[str, LogSink, None]>
+            :param stderr: Log file path | log sink | None (as stdout)
+            :type stderr: <Union[str, LogSink, None]>
+            :exceptions: None
+        '''
+        self._log_targets = [stdout, stderr]
+
+    def reopen_logs(self) -> None:
+        '''
+            Requests reopen of log files on next flush (signal safe).
+
+            :exceptions: None
+        '''
+        for sink in self._log_sinks:
+            sink.request_reopen()
+
+    def daemonize(
+        self,
+        verbose: bool = False,
+        stdout: Union[str, LogSink, None] = None,
+        stderr: Union[str, LogSink, None] = None
+    ) -> None:
+        '''
+            Creates daemon process.
+            Output goes to log sinks if targets are given (or set by
+            log_to), otherwise to /dev/null. SIGHUP reopens log files,
+            SIGUSR2 (hot restart) is ignored until channels are opened.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param stdout: Log file path | log sink | None
+            :type stdout: <Union[str, LogSink, None]>
+            :param stderr: Log file path | log sink | None (as stdout)
+            :type stderr: <Union[str, LogSink, None]>
+            :exceptions: None
+        '''
+        verbose_message(verbose, [f'{self._P_VERBOSE} create daemon'])
+        if self.unix_status:
+            self.detach(verbose)
+            self._open_logs(stdout, stderr)
+            if not self.write_pid_file([getpid()]):
+                error_message([
+                    f'{self._P_VERBOSE} file', self._pid,
+                    'is locked, daemon already running'
+                ])
+                sys.exit(1)
+            register(self.exit_handler)
+            signal(SIGUSR2, SIG_IGN)
+            if self._log_sinks:
+                signal(SIGHUP, lambda *_: self.reopen_logs())
+
+    def _open_logs(
+        self,
+        stdout: Union[str, LogSink, None],
+        stderr: Union[str, LogSink, None]
+    ) -> None:
+        '''
+            Opens log sinks and points stdout and stderr to them.
+            stdout is buffered by its sink, stderr is line buffered and
+            written straight to its (sink attached) descriptor.
+
+            :param stdout: Log file path | log sink | None
+            :type stdout: <Union[str, LogSink, None]>
+            :param stderr: Log file path | log sink | None (as stdout)
+            :type stderr: <Union[str, LogSink, None]>
+            :exceptions: None
+        '''
+        targets: List[Union[str, LogSink, None]] = [
+            stdout or self._log_targets[0], stderr or self._log_targets[1]
+        ]
+        targets[1] = targets[1] or targets[0]
+        sinks: Dict[Union[str, LogSink], LogSink] = {}
+        for fd, target in enumerate(targets, FileDescriptor.STDOUT):
+            if target is None:
+                continue
+            if target not in sinks:
+                sinks[target] = LogSink(target) if isinstance(
+                    target, str
+                ) else target
+            try:
+                sinks[target].attach(fd)
+            except OSError as os_error:
+                error_message([f'{self._P_VERBOSE} {os_error}'])
+                continue
+            if fd == FileDescriptor.STDOUT:
+                sys.stdout = sinks[target]
+            else:
+                sys.stderr = open(
+                    fd, 'w', buffering=1, encoding='utf-8',
+                    errors='backslashreplace', closefd=False
+                )
+        self._log_sinks = list(sinks.values())
+
+    def write_pid_file(self, pids: List[int]) -> bool:
+        '''
+            Publishes PID file atomically and keeps it locked while
+            daemon runs. Once published, the file is replaced on update.
+
+            :param pids: Main process ID followed by other process IDs
+            :type pids: <List[int]>
+            :return: True (PID file published) | False (locked by other)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if not bool(self._pid):
+            return False
+        takeover: bool = any([
+            self._pid_lock is not None, self._hot_restart.old_pid is not None
+        ])
+        try:
+            pid_lock: Optional[int] = FileProcessId.lock_write(
+                self._pid, ''.join(f'{pid}\n' for pid in pids), takeover
+            )
+        except OSError as os_error:
+            error_message([f'{self._P_VERBOSE} {os_error}'])
+            return False
+        if pid_lock is None:
+            return False
+        if self._pid_lock is not None:
+            close(self._pid_lock)
+        self._pid_lock = pid_lock
+        return True
+
+    def exit_handler(self, verbose: bool = False) -> None:
+        '''
+            Remove PID file at exit (unless taken over by new generation).
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: None
+        '''
+        if self.unix_status:
+            if not bool(self._pid):
+                error_message([f'{self._P_VERBOSE} check PID', self._pid])
+            else:
+                if exists(self._pid):
+                    if FileProcessId.read_pid(self._pid) == getpid():
+                        verbose_message(
+                            verbose,
+                            [f'{self._P_VERBOSE} removing PID', self._pid]
+                        )
+                        remove(self._pid)
+                else:
+                    error_message([f'{self._P_VERBOSE} check PID', self._pid])
@@ -0,0 +1,226 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_profiler.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonProfiler with attribute(s) and method(s).
+    Creates an API for sampling profiler of running daemon.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from signal import SIGUSR1
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.control_socket import Handler
+    from daemonpy.daemon_component import DaemonComponent
+    from daemonpy.sampling_profiler import SamplingProfiler
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonProfiler(DaemonComponent):
+    '''
+        Defines class DaemonProfiler with attribute(s) and method(s).
+        Creates an API for sampling profiler of running daemon.
+
+        SIGUSR1 (when not handled by other code) or profile command
+        (profile [seconds] [all]) toggles sampling profiler: it starts
+        for profile duration, or stops early when already profiling.
+        Collapsed stacks are written to file next to PID file (.folded,
+        input of flamegraph tools) when profiling ends, also when
+        daemon exits. Profiler costs nothing when off (no timer, idle
+        SIGPROF handler). Component is added to every daemon.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _profiler - Sampling profiler.
+                | _duration - Default profiling time.
+            :methods:
+                | __init__ - Initials DaemonProfiler constructor.
+                | profiler - Property method for getting profiler.
+                | duration - Property methods for set/get time.
+                | path - Property method for getting output path.
+                | attach - Attaches component, handles SIGUSR1.
+                | commands - Gets profile command.
+                | stats - Gets profiling status for stats command.
+                | open - Installs SIGPROF handler.
+                | close - Ends profiling, writes stacks.
+                | toggle - Starts or stops profiling.
+                | _profile_signal - Toggles profiling on SIGUSR1.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::PROFILER'
+
+    def __init__(self, duration: float = 30.0) -> None:
+        '''
+            Initials DaemonProfiler constructor.
+
+            :param duration: Default profiling time (seconds)
+            :type duration: <float>
+            :exceptions: ATSValueError
+        '''
+        super().__init__()
+        self._profiler: SamplingProfiler = SamplingProfiler()
+        self._duration: float = 30.0
+        self.duration = duration
+
+    @property
+    def profiler(self) -> SamplingProfiler:
+        '''
+            Property method for getting sampling profiler.
+
+            :return: Sampling profiler
+            :rtype: <SamplingProfiler>
+            :exceptions: None
+        '''
+        return self._profiler
+
+    @property
+    def duration(self) -> float:
+        '''
+            Property method for getting default profiling time.
+
+            :return: Profiling time (seconds)
+            :rtype: <float>
+            :exceptions: None
+        '''
+        return self._duration
+
+    @duration.setter
+    def duration(self, duration: float) -> None:
+        '''
+            Property method for setting default profiling time.
+
+            :param duration: Profiling time (seconds)
+            :type duration: <float>
+            :exceptions: ATSValueError
+        '''
+        if duration <= 0:
+            raise ATSValueError('profile duration must be positive')
+        self._duration = duration
+
+    @property
+    def path(self) -> str:
+        '''
+            Property method for getting collapsed stacks file path.
+
+            :return: File next to PID file (.folded)
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return str(self._daemon.sibling_path('.folded'))
+
+    def attach(self, daemon: Any) -> None:
+        '''
+            Attaches component to daemon, toggles profiler on SIGUSR1
+            (default handler).
+
+            :param daemon: Daemon owning component
+            :type daemon: <Any>
+            :exceptions: None
+        '''
+        super().attach(daemon)
+        daemon.lifecycle.handle(SIGUSR1, self._profile_signal, default=True)
+
+    def commands(self) -> Dict[str, Handler]:
+        '''
+            Gets profile command (toggles profiler).
+
+            :return: Handlers by command name
+            :rtype: <Dict[str, Handler]>
+            :exceptions: None
+        '''
+        return {'profile': lambda args: self.toggle(
+            float(args[0]) if args else None, 'all' in args[1:]
+        )}
+
+    def stats(self) -> Dict[str, Any]:
+        '''
+            Gets profiling status for stats command.
+
+            :return: Statistics
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        return {'profiling': self._profiler.active}
+
+    def open(self) -> None:
+        '''
+            Installs SIGPROF handler (idle when not profiling).
+
+            :exceptions: None
+        '''
+        self._profiler.install()
+
+    def close(self) -> None:
+        '''
+            Writes stacks of unfinished profiling.
+
+            :exceptions: None
+        '''
+        try:
+            self._profiler.stop()
+        except OSError as os_error:
+            error_message([f'{self._P_VERBOSE} {os_error}'])
+
+    def toggle(
+        self, duration: Optional[float] = None, all_threads: bool = False
+    ) -> str:
+        '''
+            Starts profiling, or stops it when already profiling.
+
+            :param duration: Profiling time | None (profile duration)
+            :type duration: <Optional[float]>
+            :param all_threads: Sample all threads (else main thread)
+            :type all_threads: <bool>
+            :return: Profiling | Output file path
+            :rtype: <str>
+            :exceptions: ATSValueError | OSError
+        '''
+        if self._profiler.stop() is not None:
+            return self.path
+        self._profiler.start(
+            duration or self._duration, self.path, all_threads
+        )
+        return 'profiling'
+
+    def _profile_signal(self, signal_num: int) -> None:
+        '''
+            Toggles profiling on SIGUSR1 (main thread).
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :exceptions: None
+        '''
+        try:
+            self.toggle()
+        except OSError as os_error:
+            error_message([f'{self._P_VERBOSE} {os_error}'])
@@ -0,0 +1,143 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_reload.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonReload with attribute(s) and method(s).
+    Creates an API for live configuration reload of daemon.
+'''
+
+import sys
+from typing import Any, Dict, List
+from signal import SIGHUP
+
+try:
+    from daemonpy.control_socket import Handler
+    from daemonpy.daemon_component import DaemonComponent
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonReload(DaemonComponent):
+    '''
+        Defines class DaemonReload with attribute(s) and method(s).
+        Creates an API for live configuration reload of daemon.
+
+        SIGHUP (reload operation, reload command, systemctl reload)
+        calls reload() of daemon on main thread, process keeps its
+        caches and connections. Reload command is served by control
+        socket thread, so it routes SIGHUP to main thread instead of
+        calling reload() itself. Component is added to every daemon.
+
+        It defines:
+
+            :attributes:
+                | _reloads - Number of handled reloads.
+            :methods:
+                | __init__ - Initials DaemonReload constructor.
+                | reloads - Property method for getting reload count.
+                | attach - Attaches component, handles SIGHUP.
+                | commands - Gets reload command.
+                | stats - Gets reload count for stats command.
+                | request - Requests reload on main thread.
+                | _reload_signal - Calls reload() of daemon on SIGHUP.
+    '''
+
+    def __init__(self) -> None:
+        '''
+            Initials DaemonReload constructor.
+
+            :exceptions: None
+        '''
+        super().__init__()
+        self._reloads: int = 0
+
+    @property
+    def reloads(self) -> int:
+        '''
+            Property method for getting number of handled reloads.
+
+            :return: Reload count
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._reloads
+
+    def attach(self, daemon: Any) -> None:
+        '''
+            Attaches component to daemon, handles SIGHUP with reload().
+
+            :param daemon: Daemon owning component
+            :type daemon: <Any>
+            :exceptions: None
+        '''
+        super().attach(daemon)
+        daemon.lifecycle.handle(SIGHUP, self._reload_signal)
+
+    def commands(self) -> Dict[str, Handler]:
+        '''
+            Gets reload command (requests reload on main thread).
+
+            :return: Handlers by command name
+            :rtype: <Dict[str, Handler]>
+            :exceptions: None
+        '''
+        return {'reload': lambda _: self.request()}
+
+    def stats(self) -> Dict[str, Any]:
+        '''
+            Gets reload count for stats command.
+
+            :return: Statistics
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        return {'reloads': self._reloads}
+
+    def request(self) -> str:
+        '''
+            Requests reload on main thread (SIGHUP is routed by
+            lifecycle of daemon).
+
+            :return: Reply result
+            :rtype: <str>
+            :exceptions: None
+        '''
+        if self._daemon is not None:
+            self._daemon.lifecycle.wake(SIGHUP)
+        return 'reloading'
+
+    def _reload_signal(self, signal_num: int) -> None:
+        '''
+            Calls reload() of daemon on SIGHUP (main thread).
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :exceptions: None
+        '''
+        self._reloads += 1
+        if self._daemon is not None:
+            self._daemon.reload()
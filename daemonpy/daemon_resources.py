@@ -0,0 +1,147 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_resources.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonResources with attribute(s) and method(s).
+    Creates an API for resource boundaries and placement of daemon.
+'''
+
+import sys
+from typing import List, Optional, Union
+
+try:
+    from daemonpy.daemon_features import DaemonFeatures
+    from daemonpy.log_sink import LogSink
+    from daemonpy.placement import Placement
+    from daemonpy.resource_limits import ResourceLimits
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonResources(DaemonFeatures):
+    '''
+        Defines class DaemonResources with attribute(s) and method(s).
+        Creates an API for resource boundaries and placement of daemon.
+
+        Resource limits (and cgroup) and placement are applied by
+        daemonize (after second fork), so supervised and worker
+        processes inherit them.
+
+        It defines:
+
+            :attributes:
+                | _limits - Resource limits | None.
+                | _placement - CPU and scheduling placement | None.
+            :methods:
+                | __init__ - Initials DaemonResources constructor.
+                | limits - Property methods for set/get resource limits.
+                | placement - Property methods for set/get placement.
+                | daemonize - Creates daemon process, applies boundaries.
+    '''
+
+    def __init__(self, pid: str, verbose: bool = False) -> None:
+        '''
+            Initials DaemonResources constructor.
+
+            :param pid: PID file path
+            :type pid: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__(pid, verbose)
+        self._limits: Optional[ResourceLimits] = None
+        self._placement: Optional[Placement] = None
+
+    @property
+    def limits(self) -> Optional[ResourceLimits]:
+        '''
+            Property method for getting resource limits.
+
+            :return: Resource limits | None (inherited from launcher)
+            :rtype: <Optional[ResourceLimits]>
+            :exceptions: None
+        '''
+        return self._limits
+
+    @limits.setter
+    def limits(self, limits: Optional[ResourceLimits]) -> None:
+        '''
+            Property method for setting resource limits.
+
+            :param limits: Resource limits | None
+            :type limits: <Optional[ResourceLimits]>
+            :exceptions: None
+        '''
+        self._limits = limits
+
+    @property
+    def placement(self) -> Optional[Placement]:
+        '''
+            Property method for getting CPU and scheduling placement.
+
+            :return: Placement | None (inherited from launcher)
+            :rtype: <Optional[Placement]>
+            :exceptions: None
+        '''
+        return self._placement
+
+    @placement.setter
+    def placement(self, placement: Optional[Placement]) -> None:
+        '''
+            Property method for setting CPU and scheduling placement.
+
+            :param placement: Placement | None
+            :type placement: <Optional[Placement]>
+            :exceptions: None
+        '''
+        self._placement = placement
+
+    def daemonize(
+        self,
+        verbose: bool = False,
+        stdout: Union[str, LogSink, None] = None,
+        stderr: Union[str, LogSink, None] = None
+    ) -> None:
+        '''
+            Creates daemon process, applies resource limits, cgroup
+            and placement.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param stdout: Log file path | log sink | None
+            :type stdout: <Union[str, LogSink, None]>
+            :param stderr: Log file path | log sink | None (as stdout)
+            :type stderr: <Union[str, LogSink, None]>
+            :exceptions: None
+        '''
+        super().daemonize(verbose, stdout, stderr)
+        if self.unix_status:
+            if self._limits is not None:
+                self._limits.apply()
+            if self._placement is not None:
+                self._placement.apply()
@@ -0,0 +1,159 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_status_page.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonStatusPage with attribute(s) and method(s).
+    Creates an API for shared memory status page of daemon.
+'''
+
+import sys
+from typing import Any, List, Optional
+from time import monotonic
+
+try:
+    from daemonpy.daemon_component import DaemonComponent
+    from daemonpy.status_page import StatusPage
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonStatusPage(DaemonComponent):
+    '''
+        Defines class DaemonStatusPage with attribute(s) and method(s).
+        Creates an API for shared memory status page of daemon.
+
+        Status page (PID file path with .status extension) is created
+        in process which runs run(), run() updates its counters,
+        daemon heartbeat() updates its heartbeat (at most once per
+        _BEAT seconds, other calls only read monotonic clock) and state
+        follows lifecycle of daemon (running, draining, stopping,
+        stopped). Page is removed when daemon stops, readers which
+        mapped it see stopped state.
+
+        It defines:
+
+            :attributes:
+                | _BEAT - Min interval of page heartbeat (seconds).
+                | _counters - Counter names.
+                | _page - Status page | None (not attached).
+                | _next_beat - Monotonic time of next page heartbeat.
+            :methods:
+                | __init__ - Initials DaemonStatusPage constructor.
+                | page - Property method for getting status page.
+                | attach - Attaches component, prepares page.
+                | open - Creates page (running state).
+                | drain - Sets draining state.
+                | heartbeat - Updates heartbeat of page.
+                | stopping - Sets stopping state.
+                | close - Sets stopped state, removes page.
+    '''
+
+    _BEAT: float = 0.1
+
+    def __init__(self, counters: List[str]) -> None:
+        '''
+            Initials DaemonStatusPage constructor.
+
+            :param counters: Counter names (up to 32 bytes each)
+            :type counters: <List[str]>
+            :exceptions: None
+        '''
+        super().__init__()
+        self._counters: List[str] = list(counters)
+        self._page: Optional[StatusPage] = None
+        self._next_beat: float = 0.0
+
+    @property
+    def page(self) -> Optional[StatusPage]:
+        '''
+            Property method for getting shared memory status page.
+
+            :return: Status page | None (not attached)
+            :rtype: <Optional[StatusPage]>
+            :exceptions: None
+        '''
+        return self._page
+
+    def attach(self, daemon: Any) -> None:
+        '''
+            Attaches component to daemon, page is next to PID file.
+
+            :param daemon: Daemon owning component
+            :type daemon: <Any>
+            :exceptions: ATSValueError
+        '''
+        super().attach(daemon)
+        self._page = StatusPage(daemon.sibling_path('.status'), self._counters)
+
+    def open(self) -> None:
+        '''
+            Creates status page in running state.
+
+            :exceptions: OSError
+        '''
+        if self._page is not None:
+            self._page.create()
+            self._page.set_state('running')
+
+    def drain(self) -> None:
+        '''
+            Sets draining state of status page.
+
+            :exceptions: None
+        '''
+        if self._page is not None:
+            self._page.set_state('draining')
+
+    def heartbeat(self) -> None:
+        '''
+            Updates heartbeat timestamp of status page (rate limited).
+
+            :exceptions: None
+        '''
+        now: float = monotonic()
+        if now >= self._next_beat and self._page is not None:
+            self._next_beat = now + self._BEAT
+            self._page.heartbeat()
+
+    def stopping(self) -> None:
+        '''
+            Sets stopping state of status page.
+
+            :exceptions: None
+        '''
+        if self._page is not None:
+            self._page.set_state('stopping')
+
+    def close(self) -> None:
+        '''
+            Sets stopped state, removes status page.
+
+            :exceptions: None
+        '''
+        if self._page is not None:
+            self._page.set_state('stopped')
+            self._page.close()
@@ -0,0 +1,207 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_systemd.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonSystemd with attribute(s) and method(s).
+    Creates an API for running daemon as systemd service.
+'''
+
+import sys
+from typing import Any, List, Union
+from os import getpid
+
+try:
+    from ats_utilities.console_io.verbose import verbose_message
+    from daemonpy.daemon_commands import DaemonCommands
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.log_sink import LogSink
+    from daemonpy.sd_notify import SdNotify
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class DaemonSystemd(DaemonCommands):
+    '''
+        Defines class DaemonSystemd with attribute(s) and method(s).
+        Creates an API for running daemon as systemd service.
+
+        In foreground mode (default when started with NOTIFY_SOCKET)
+        daemonize skips double fork, setsid and /dev/null redirection,
+        so systemd tracks the process and journal gets its output.
+        READY=1 (with MAINPID) is sent when control channels are open,
+        STOPPING=1 when they are closed and STATUS= on drain. Sockets
+        passed by socket activation (LISTEN_FDS) are in listen_sockets
+        and adopted by listen() for the same address. Use
+        NotifyAccess=all when supervisor or hot restart is used.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _notify - Systemd notification.
+                | _foreground - Foreground (no fork) mode.
+            :methods:
+                | __init__ - Initials DaemonSystemd constructor.
+                | foreground - Property methods for set/get mode.
+                | notify - Sends state lines to systemd.
+                | notify_status - Sends status text to systemd.
+                | detach - Detaches process (skipped in foreground).
+                | daemonize - Creates daemon process, sends MAINPID.
+                | open_channels - Opens channels, sends READY=1.
+                | close_channels - Sends STOPPING=1, closes channels.
+                | drain - Handles drain command, sends status.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY'
+
+    def __init__(self, pid: str, verbose: bool = False) -> None:
+        '''
+            Initials DaemonSystemd constructor.
+
+            :param pid: PID file path
+            :type pid: <str>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__(pid, verbose)
+        self._notify: SdNotify = SdNotify()
+        self._foreground: bool = self._notify.enabled
+
+    @property
+    def foreground(self) -> bool:
+        '''
+            Property method for getting foreground (no fork) mode.
+
+            :return: True (process is not detached) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._foreground
+
+    @foreground.setter
+    def foreground(self, foreground: bool) -> None:
+        '''
+            Property method for setting foreground (no fork) mode.
+
+            :param foreground: Process is not detached
+            :type foreground: <bool>
+            :exceptions: None
+        '''
+        self._foreground = foreground
+
+    def notify(self, *states: str) -> bool:
+        '''
+            Sends state lines to systemd (no-op without NOTIFY_SOCKET).
+
+            :param states: State lines ('READY=1', 'STATUS=...')
+            :type states: <str>
+            :return: True (sent) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._notify.notify(*states)
+
+    def notify_status(self, status: str) -> bool:
+        '''
+            Sends status text shown by systemctl status.
+
+            :param status: Status text (one line)
+            :type status: <str>
+            :return: True (sent) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._notify.notify(f'STATUS={status}')
+
+    def detach(self, verbose: bool = False) -> None:
+        '''
+            Detaches process from terminal and session, skipped in
+            foreground mode (output stays on inherited streams).
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: None
+        '''
+        if self._foreground:
+            verbose_message(verbose, [f'{self._P_VERBOSE} foreground mode'])
+            sys.stdout.flush()
+            sys.stderr.flush()
+        else:
+            super().detach(verbose)
+
+    def daemonize(
+        self,
+        verbose: bool = False,
+        stdout: Union[str, LogSink, None] = None,
+        stderr: Union[str, LogSink, None] = None
+    ) -> None:
+        '''
+            Creates daemon process and reports its PID to systemd.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :param stdout: Log file path | log sink | None
+            :type stdout: <Union[str, LogSink, None]>
+            :param stderr: Log file path | log sink | None (as stdout)
+            :type stderr: <Union[str, LogSink, None]>
+            :exceptions: None
+        '''
+        super().daemonize(verbose, stdout, stderr)
+        if self.unix_status:
+            self._notify.notify(f'MAINPID={getpid()}')
+
+    def open_channels(self) -> None:
+        '''
+            Opens control socket and status page, reports readiness.
+
+            :exceptions: None
+        '''
+        super().open_channels()
+        main_pid: int = FileProcessId.read_pid(str(self._pid)) or getpid()
+        self._notify.notify('READY=1', 'STATUS=running', f'MAINPID={main_pid}')
+
+    def close_channels(self) -> None:
+        '''
+            Reports stopping, closes control socket and status page.
+
+            :exceptions: None
+        '''
+        self._notify.notify('STOPPING=1', 'STATUS=stopping')
+        super().close_channels()
+
+    def drain(self) -> Any:
+        '''
+            Handles drain command, reports status to systemd.
+
+            :return: Reply result
+            :rtype: <Any>
+            :exceptions: None
+        '''
+        result: Any = super().drain()
+        self.notify_status('draining')
+        return result
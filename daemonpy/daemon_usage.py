@@ -21,14 +21,13 @@ Info
 '''
 
 import sys
-from typing import List, Optional
+from typing import List
 
 try:
-    from ats_utilities.checker import ATSChecker
     from ats_utilities.console_io.error import error_message
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
     from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.param_check import ParamCheck
 except ImportError as ats_error_message:  # pragma: no cover
     # Force exit python #######################################################
     sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
@@ -52,6 +51,7 @@ class DaemonUsage:
 
             :attributes:
                 | _PKG_VERBOSE - Console text indicator for process-phase.
+                | CONTROL_OPERATIONS - Operations sent to control socket.
                 | DAEMON_OPERATIONS - List of supported operations.
                 | _usage_status - Daemon usage status.
             :methods:
@@ -61,7 +61,10 @@ class DaemonUsage:
     '''
 
     _P_VERBOSE: str = 'DAEMONPY::DAEMON_USAGE'
-    DAEMON_OPERATIONS: List[str] = ['start', 'stop', 'restart']
+    CONTROL_OPERATIONS: List[str] = ['ping', 'stats', 'drain', 'profile']
+    DAEMON_OPERATIONS: List[str] = [
+        'start', 'stop', 'restart', 'hot-restart', 'reload', 'status'
+    ] + CONTROL_OPERATIONS
 
     def __init__(self, verbose: bool = False) -> None:
         '''
@@ -96,6 +99,7 @@ class DaemonUsage:
         '''
         self._usage_status = usage_status
 
+    @ParamCheck('str:daemon_operation')
     def check(self, daemon_operation: str, verbose: bool = False) -> None:
         '''
             Checks usage of Daemon process.
@@ -106,14 +110,6 @@ class DaemonUsage:
             :type verbose: <bool>
             :exceptions: ATSTypeError | ATSValueError
         '''
-        error_msg: Optional[str] = None
-        error_id: Optional[int] = None
-        checker: ATSChecker = ATSChecker()
-        error_msg, error_id = checker.check_params([
-            ('str:daemon_operation', daemon_operation)
-        ])
-        if error_id == checker.TYPE_ERROR:
-            raise ATSTypeError(error_msg)
         if not bool(daemon_operation):
             raise ATSValueError('missing daemon operation')
         verbose_message(verbose, [f'{self._P_VERBOSE} checking usage'])
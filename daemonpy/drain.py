@@ -0,0 +1,210 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    drain.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Drain with attribute(s) and method(s).
+    Creates an API for tracking in-flight work during graceful stop.
+'''
+
+import sys
+from typing import Any, List, Optional
+from threading import Condition, Event
+from time import monotonic
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class Drain:
+    '''
+        Defines class Drain with attribute(s) and method(s).
+        Creates an API for tracking in-flight work during graceful stop.
+
+        Work is admitted by acquire() (refused once draining started)
+        and finished by release(); used as context manager it tracks
+        one unit of work and raises ATSValueError when refused. After
+        start() wait() blocks until in-flight counter reaches zero or
+        drain timeout expires.
+
+        It defines:
+
+            :attributes:
+                | _timeout - Max drain time (seconds).
+                | _in_flight - Number of admitted unfinished works.
+                | _condition - Guards counter, signals zero in-flight.
+                | _event - Set when draining started.
+                | _deadline - End of drain (monotonic) | None.
+            :methods:
+                | __init__ - Initials Drain constructor.
+                | __enter__ - Admits work (context manager).
+                | __exit__ - Finishes work.
+                | timeout - Property method for getting drain timeout.
+                | in_flight - Property method for getting in-flight.
+                | event - Property method for getting drain event.
+                | draining - Property method for getting drain status.
+                | acquire - Admits unit of work.
+                | release - Finishes unit of work.
+                | start - Starts draining.
+                | wait - Waits for in-flight work to finish.
+    '''
+
+    def __init__(self, timeout: float = 30.0) -> None:
+        '''
+            Initials Drain constructor.
+
+            :param timeout: Max drain time (seconds)
+            :type timeout: <float>
+            :exceptions: ATSValueError
+        '''
+        if timeout < 0:
+            raise ATSValueError('drain timeout must be positive')
+        self._timeout: float = timeout
+        self._in_flight: int = 0
+        self._condition: Condition = Condition()
+        self._event: Event = Event()
+        self._deadline: Optional[float] = None
+
+    def __enter__(self) -> 'Drain':
+        '''
+            Admits unit of work (context manager).
+
+            :return: Drain
+            :rtype: <Drain>
+            :exceptions: ATSValueError (draining, work refused)
+        '''
+        if not self.acquire():
+            raise ATSValueError('daemon is draining, work refused')
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        '''
+            Finishes unit of work.
+
+            :exceptions: None
+        '''
+        self.release()
+
+    @property
+    def timeout(self) -> float:
+        '''
+            Property method for getting drain timeout.
+
+            :return: Max drain time (seconds)
+            :rtype: <float>
+            :exceptions: None
+        '''
+        return self._timeout
+
+    @property
+    def in_flight(self) -> int:
+        '''
+            Property method for getting number of in-flight works.
+
+            :return: Admitted unfinished works
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._in_flight
+
+    @property
+    def event(self) -> Event:
+        '''
+            Property method for getting drain event (set on start).
+
+            :return: Drain event
+            :rtype: <Event>
+            :exceptions: None
+        '''
+        return self._event
+
+    @property
+    def draining(self) -> bool:
+        '''
+            Property method for getting drain status.
+
+            :return: True (draining started) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._event.is_set()
+
+    def acquire(self) -> bool:
+        '''
+            Admits unit of work.
+
+            :return: True (admitted, call release) | False (draining)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        with self._condition:
+            if self._event.is_set():
+                return False
+            self._in_flight += 1
+            return True
+
+    def release(self) -> None:
+        '''
+            Finishes unit of work admitted by acquire.
+
+            :exceptions: None
+        '''
+        with self._condition:
+            self._in_flight -= 1
+            if self._in_flight <= 0:
+                self._condition.notify_all()
+
+    def start(self) -> bool:
+        '''
+            Starts draining, new work is refused from now on.
+
+            :return: True (started now) | False (already draining)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        with self._condition:
+            if self._event.is_set():
+                return False
+            self._deadline = monotonic() + self._timeout
+            self._event.set()
+            return True
+
+    def wait(self) -> bool:
+        '''
+            Waits for in-flight work to finish (up to drain deadline).
+
+            :return: True (drained) | False (deadline expired)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        with self._condition:
+            deadline: float = self._deadline or monotonic() + self._timeout
+            return self._condition.wait_for(
+                lambda: self._in_flight <= 0,
+                max(deadline - monotonic(), 0.0)
+            )
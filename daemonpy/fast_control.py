@@ -0,0 +1,251 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    fast_control.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class FastControl with attribute(s) and method(s).
+    Creates a lightweight stop/status control path for daemon.
+Execute
+    python3 -m daemonpy.fast_control stop|status /run/name.pid
+'''
+
+import sys
+from typing import List, Optional
+from fcntl import flock, LOCK_NB, LOCK_SH
+from os import close, kill, open as open_fd, remove, O_RDONLY
+from select import poll, POLLIN
+from signal import SIGKILL, SIGTERM
+from time import monotonic, sleep
+
+try:
+    from os import pidfd_open
+except ImportError:  # pragma: no cover
+    pidfd_open = None  # pylint: disable=invalid-name
+
+# Only standard library modules are imported (no ats_utilities), so that
+# CLI stop/status calls from cron or init scripts start in few milliseconds.
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class FastControl:
+    '''
+        Defines class FastControl with attribute(s) and method(s).
+        Creates a lightweight stop/status control path for daemon.
+
+        Same PID file protocol as FileProcessId (daemon holds flock on
+        PID file), same LSB exit codes as ProcessStatus, but without
+        loading the rest of the package.
+
+        It defines:
+
+            :attributes:
+                | RUNNING - LSB status: program is running.
+                | DEAD - LSB status: dead and PID file exists.
+                | NOT_RUNNING - LSB status: program is not running.
+                | FAILED - LSB stop: generic failure.
+                | _PROBE - Exit probe delay without pidfd (seconds).
+            :methods:
+                | read_pid - Reads first (main process) PID from PID file.
+                | is_running - Checks is daemon owning PID file running.
+                | status - Gets LSB status code of daemon.
+                | stop - Stops daemon and waits for its exit.
+                | main - Runs stop/status from command line.
+                | _wait - Waits for process exit.
+                | _remove_pid - Removes PID file left by killed daemon.
+    '''
+
+    RUNNING: int = 0
+    DEAD: int = 1
+    NOT_RUNNING: int = 3
+    FAILED: int = 1
+    _PROBE: float = 0.01
+
+    @staticmethod
+    def read_pid(pid_path: str) -> Optional[int]:
+        '''
+            Reads first (main process) PID from PID file.
+
+            :param pid_path: PID file path
+            :type pid_path: <str>
+            :return: Process ID | None (missing or empty PID file)
+            :rtype: <Optional[int]>
+            :exceptions: None
+        '''
+        try:
+            with open(pid_path, 'rb') as pid_file:
+                content: List[bytes] = pid_file.read().split()
+            return int(content[0]) if content else None
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def is_running(pid_path: str) -> bool:
+        '''
+            Checks is daemon owning PID file running (file is locked).
+
+            :param pid_path: PID file path
+            :type pid_path: <str>
+            :return: True (daemon holds PID file lock) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        try:
+            fd: int = open_fd(pid_path, O_RDONLY)
+        except OSError:
+            return False
+        try:
+            flock(fd, LOCK_SH | LOCK_NB)
+            return False
+        except BlockingIOError:
+            return True
+        finally:
+            close(fd)
+
+    @classmethod
+    def status(cls, pid_path: str) -> int:
+        '''
+            Gets LSB status code of daemon owning PID file.
+
+            :param pid_path: PID file path
+            :type pid_path: <str>
+            :return: RUNNING | DEAD | NOT_RUNNING
+            :rtype: <int>
+            :exceptions: None
+        '''
+        if cls.is_running(pid_path):
+            return cls.RUNNING
+        try:
+            close(open_fd(pid_path, O_RDONLY))
+            return cls.DEAD
+        except OSError:
+            return cls.NOT_RUNNING
+
+    @classmethod
+    def stop(
+        cls, pid_path: str, timeout: float = 10.0, force: bool = True
+    ) -> int:
+        '''
+            Sends SIGTERM to daemon and waits for its exit,
+            SIGKILL is sent when timeout expires and force is set
+            (killed daemon can not remove its PID file, so it is removed).
+
+            :param pid_path: PID file path
+            :type pid_path: <str>
+            :param timeout: Graceful stop timeout (seconds)
+            :type timeout: <float>
+            :param force: Send SIGKILL after timeout
+            :type force: <bool>
+            :return: 0 (stopped or not running) | FAILED
+            :rtype: <int>
+            :exceptions: None
+        '''
+        pid: Optional[int] = cls.read_pid(pid_path)
+        if pid is None or not cls.is_running(pid_path):
+            return 0
+        pidfd: Optional[int] = None
+        try:
+            if pidfd_open is not None:
+                pidfd = pidfd_open(pid)
+            kill(pid, SIGTERM)
+            if cls._wait(pid, pidfd, timeout):
+                return 0
+            if force:
+                kill(pid, SIGKILL)
+                if cls._wait(pid, pidfd, timeout):
+                    cls._remove_pid(pid_path, pid)
+                    return 0
+        except ProcessLookupError:
+            return 0
+        except OSError:
+            pass
+        finally:
+            if pidfd is not None:
+                close(pidfd)
+        return cls.FAILED
+
+    @classmethod
+    def _wait(cls, pid: int, pidfd: Optional[int], timeout: float) -> bool:
+        '''
+            Waits for process exit (pidfd readable or probe fails).
+
+            :param pid: Process ID
+            :type pid: <int>
+            :param pidfd: Process file descriptor | None
+            :type pidfd: <Optional[int]>
+            :param timeout: Wait timeout (seconds)
+            :type timeout: <float>
+            :return: True (process exited) | False (timeout)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if pidfd is not None:
+            poller = poll()
+            poller.register(pidfd, POLLIN)
+            return bool(poller.poll(int(timeout * 1000)))
+        deadline: float = monotonic() + timeout
+        while monotonic() < deadline:
+            try:
+                kill(pid, 0)
+            except ProcessLookupError:
+                return True
+            sleep(cls._PROBE)
+        return False
+
+    @classmethod
+    def _remove_pid(cls, pid_path: str, pid: int) -> None:
+        '''
+            Removes PID file left by killed daemon (if it still names it).
+
+            :param pid_path: PID file path
+            :type pid_path: <str>
+            :param pid: Killed process ID
+            :type pid: <int>
+            :exceptions: None
+        '''
+        if cls.read_pid(pid_path) == pid and not cls.is_running(pid_path):
+            try:
+                remove(pid_path)
+            except OSError:
+                pass
+
+    @classmethod
+    def main(cls, argv: List[str]) -> int:
+        '''
+            Runs stop/status from command line.
+
+            :param argv: Arguments (operation, PID file path)
+            :type argv: <List[str]>
+            :return: LSB exit code
+            :rtype: <int>
+            :exceptions: None
+        '''
+        if len(argv) != 2 or argv[0] not in ('stop', 'status'):
+            sys.stderr.write('usage: fast_control stop|status PID_PATH\n')
+            return 2
+        if argv[0] == 'stop':
+            return cls.stop(argv[1])
+        return cls.status(argv[1])
+
+
+if __name__ == '__main__':
+    sys.exit(FastControl.main(sys.argv[1:]))
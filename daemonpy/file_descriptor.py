@@ -24,9 +24,8 @@ import sys
 from typing import Any, List, Dict, IO, Optional
 
 try:
-    from ats_utilities.checker import ATSChecker
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
     from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.param_check import ParamCheck
 except ImportError as ats_error_message:  # pragma: no cover
     # Force exit python #######################################################
     sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
@@ -68,9 +67,10 @@ class FileDescriptor:
     STDOUT: int = 1
     STDERR: int = 2
     FORMAT: Dict[int, Any] = {
-        STDIN: 'r', STDOUT: 'a+', STDERR: ['a+', 0]
+        STDIN: 'r', STDOUT: 'a+', STDERR: ['a+', 1]
     }
 
+    @ParamCheck('str:desc_path')
     def __init__(self, desc_path: str, desc_type: Any) -> None:
         '''
             Initials FileDescriptor constructor.
@@ -81,14 +81,6 @@ class FileDescriptor:
             :type desc_type: <int>
             :exceptions: ATSTypeError | ATSValueError
         '''
-        error_msg: Optional[str] = None
-        error_id: Optional[int] = None
-        checker: ATSChecker = ATSChecker()
-        error_msg, error_id = checker.check_params([
-            ('str:desc_path', desc_path)
-        ])
-        if error_id == checker.TYPE_ERROR:
-            raise ATSTypeError(error_msg)
         if not bool(desc_path):
             raise ATSValueError('missing device path file')
         if any([not bool(desc_type), desc_type not in self.FORMAT.values()]):
@@ -113,13 +105,12 @@ class FileDescriptor:
             else:
                 if isinstance(self._desc_type[0], str):
                     if isinstance(self._desc_type[1], int):
-                        if self._desc_type[1] == 0:
-                            self._desc_file = open(
-                                self._desc_path,
-                                self._desc_type[0],
-                                self._desc_type[1],
-                                encoding='utf-8'
-                            )
+                        self._desc_file = open(
+                            self._desc_path,
+                            self._desc_type[0],
+                            self._desc_type[1],
+                            encoding='utf-8'
+                        )
         return self._desc_file
 
     def __exit__(self, *args: Any) -> None:
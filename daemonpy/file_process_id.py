@@ -22,11 +22,18 @@ Info
 
 import sys
 from typing import Any, List, IO, Optional
+from os import (
+    close, fchmod, fstat, link, replace, stat, unlink, write, O_RDONLY,
+    open as open_fd
+)
+from os.path import abspath, dirname, exists, splitext
+from fcntl import flock, LOCK_EX, LOCK_NB
+from tempfile import mkstemp
 
 try:
-    from ats_utilities.checker import ATSChecker
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
     from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.fast_control import FastControl
+    from daemonpy.param_check import ParamCheck
 except ImportError as ats_error_message:  # pragma: no cover
     # Force exit python #######################################################
     sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
@@ -58,11 +65,17 @@ class FileProcessId:
                 | __init__ - Initials FileProcessId constructor.
                 | __enter__ - Opens PID file.
                 | __exit__ - Closes PID file.
+                | lock_write - Publishes and locks PID file atomically.
+                | _remove_stale - Removes PID file of dead daemon.
+                | is_running - Checks is PID file locked by running daemon.
+                | read_pid - Reads first (main) PID from PID file.
+                | sibling_path - Path of file kept next to PID file.
     '''
 
     _P_VERBOSE: str = 'DAEMONPY::FILE_PROCESS_ID'
     _MODE: List[str] = ['w+', 'r']
 
+    @ParamCheck('str:pid_path', 'str:pid_mode')
     def __init__(
         self, pid_path: Optional[str], pid_mode: Optional[str]
     ) -> None:
@@ -75,14 +88,6 @@ class FileProcessId:
             :type pid_mode: <Optional[str]>
             :exceptions: ATSTypeError | ATSValueError
         '''
-        error_msg: Optional[str] = None
-        error_id: Optional[int] = None
-        checker: ATSChecker = ATSChecker()
-        error_msg, error_id = checker.check_params([
-            ('str:pid_path', pid_path), ('str:pid_mode', pid_mode)
-        ])
-        if error_id == checker.TYPE_ERROR:
-            raise ATSTypeError(error_msg)
         if not bool(pid_path):
             raise ATSValueError('missing PID path file')
         if any([not bool(pid_mode), pid_mode not in self._MODE]):
@@ -114,3 +119,120 @@ class FileProcessId:
         if bool(self._pid):
             if not self._pid.closed:
                 self._pid.close()
+
+    @staticmethod
+    def lock_write(
+        pid_path: str, content: str, takeover: bool = False
+    ) -> Optional[int]:
+        '''
+            Publishes PID file atomically and locks it (flock) for lifetime
+            of returned descriptor. Content is written to temp file in the
+            same directory, locked, then linked (fails if running daemon
+            holds the PID file) or renamed over it (takeover).
+
+            :param pid_path: file process id path
+            :type pid_path: <str>
+            :param content: file process id content
+            :type content: <str>
+            :param takeover: Replace PID file even if it is locked
+            :type takeover: <bool>
+            :return: Locked descriptor (keep open) | None (already locked)
+            :rtype: <Optional[int]>
+            :exceptions: OSError
+        '''
+        fd, temp_path = mkstemp(
+            prefix='.pid-', dir=dirname(abspath(pid_path))
+        )
+        try:
+            fchmod(fd, 0o644)
+            write(fd, content.encode('utf-8'))
+            flock(fd, LOCK_EX | LOCK_NB)
+            if takeover:
+                replace(temp_path, pid_path)
+                return fd
+            for _ in range(2):
+                try:
+                    link(temp_path, pid_path)
+                    return fd
+                except FileExistsError:
+                    if not FileProcessId._remove_stale(pid_path):
+                        break
+            close(fd)
+            return None
+        except OSError:
+            close(fd)
+            raise
+        finally:
+            if exists(temp_path):
+                unlink(temp_path)
+
+    @staticmethod
+    def _remove_stale(pid_path: str) -> bool:
+        '''
+            Removes PID file which is not locked by running daemon.
+
+            :param pid_path: file process id path
+            :type pid_path: <str>
+            :return: True (removed or missing) | False (locked)
+            :rtype: <bool>
+            :exceptions: OSError
+        '''
+        try:
+            fd: int = open_fd(pid_path, O_RDONLY)
+        except FileNotFoundError:
+            return True
+        try:
+            flock(fd, LOCK_EX | LOCK_NB)
+            if fstat(fd).st_ino == stat(pid_path).st_ino:
+                unlink(pid_path)
+            return True
+        except BlockingIOError:
+            return False
+        except FileNotFoundError:
+            return True
+        finally:
+            close(fd)
+
+    @staticmethod
+    def is_running(pid_path: str) -> bool:
+        '''
+            Checks is daemon owning PID file running (file is locked).
+            Lock dies with its process, so stale files and reused PIDs
+            are never reported as running, and content is not parsed.
+
+            :param pid_path: file process id path
+            :type pid_path: <str>
+            :return: True (daemon holds PID file lock) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return FastControl.is_running(pid_path)
+
+    @staticmethod
+    def read_pid(pid_path: str) -> Optional[int]:
+        '''
+            Reads first (main process) PID from PID file.
+
+            :param pid_path: file process id path
+            :type pid_path: <str>
+            :return: Process ID | None (missing or empty PID file)
+            :rtype: <Optional[int]>
+            :exceptions: None
+        '''
+        return FastControl.read_pid(pid_path)
+
+    @staticmethod
+    def sibling_path(pid_path: str, extension: str) -> str:
+        '''
+            Path of daemon file kept next to PID file
+            (/run/name.pid with .stats gives /run/name.stats).
+
+            :param pid_path: file process id path
+            :type pid_path: <str>
+            :param extension: Extension of sibling file
+            :type extension: <str>
+            :return: Sibling file path
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return f'{splitext(pid_path)[0]}{extension}'
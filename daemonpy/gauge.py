@@ -0,0 +1,149 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    gauge.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Gauge with attribute(s) and method(s).
+    Creates an API for gauge which goes up and down.
+'''
+
+import sys
+from typing import Any, Callable, List, Optional
+
+try:
+    from daemonpy.metric import Metric, Sample
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class Gauge(Metric):
+    '''
+        Defines class Gauge with attribute(s) and method(s).
+        Creates an API for gauge which goes up and down.
+
+        Gauge is set (plain store, no lock), changed by inc/dec
+        (per-thread shards added to set value) or computed by function
+        when read (process metrics).
+
+        It defines:
+
+            :attributes:
+                | KIND - Metric type in text exposition format.
+                | _base - Last set value.
+                | _function - Value function | None.
+            :methods:
+                | __init__ - Initials Gauge constructor.
+                | set - Sets gauge value.
+                | set_function - Computes gauge when read.
+                | inc - Increments gauge.
+                | dec - Decrements gauge.
+                | value - Property method for getting gauge value.
+    '''
+
+    KIND: str = 'gauge'
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        '''
+            Initials Gauge constructor (arguments as Metric).
+
+            :exceptions: ATSValueError
+        '''
+        super().__init__(*args, **kwargs)
+        self._base: float = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        '''
+            Sets gauge value (drops inc/dec changes).
+
+            :param value: Gauge value
+            :type value: <float>
+            :exceptions: None
+        '''
+        with self._lock:
+            for shard in self._shards:
+                shard[0] = 0.0
+            self._retired = [0.0]
+        self._base = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        '''
+            Computes gauge by function when read.
+
+            :param function: Value function
+            :type function: <Callable[[], float]>
+            :exceptions: None
+        '''
+        self._function = function
+
+    def inc(self, amount: float = 1.0) -> None:
+        '''
+            Increments gauge in shard of current thread.
+
+            :param amount: Increment
+            :type amount: <float>
+            :exceptions: None
+        '''
+        self._shard()[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        '''
+            Decrements gauge in shard of current thread.
+
+            :param amount: Decrement
+            :type amount: <float>
+            :exceptions: None
+        '''
+        self._shard()[0] -= amount
+
+    @property
+    def value(self) -> float:
+        '''
+            Property method for getting gauge value.
+
+            :return: Gauge value (nan when function failed)
+            :rtype: <float>
+            :exceptions: None
+        '''
+        if self._function is not None:
+            try:
+                return float(self._function())
+            except (OSError, TypeError, ValueError):
+                return float('nan')
+        return self._base + self._totals()[0]
+
+    def _own_samples(self) -> List[Sample]:
+        '''
+            Collects sample of gauge itself.
+
+            :return: List of (name, labels, value)
+            :rtype: <List[Sample]>
+            :exceptions: None
+        '''
+        return [(
+            self._name, tuple(zip(self._label_names, self._label_values)),
+            self.value
+        )]
@@ -0,0 +1,175 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    histogram.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Histogram with attribute(s) and method(s).
+    Creates an API for histogram with fixed buckets.
+'''
+
+import sys
+from typing import Any, List, Sequence, Tuple
+from bisect import bisect_left
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.metric import Metric, Sample
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+
+class Histogram(Metric):
+    '''
+        Defines class Histogram with attribute(s) and method(s).
+        Creates an API for histogram with fixed buckets.
+
+        Shard of each thread is preallocated list of bucket counts
+        (upper bounds, then +Inf) followed by sum of observed values,
+        observe() increments one bucket and sum without lock.
+
+        It defines:
+
+            :attributes:
+                | KIND - Metric type in text exposition format.
+                | DEFAULT_BUCKETS - Default upper bounds (seconds).
+                | _bounds - Bucket upper bounds (sorted).
+            :methods:
+                | __init__ - Initials Histogram constructor.
+                | bounds - Property method for getting bucket bounds.
+                | observe - Records observed value (no lock).
+                | count - Property method for getting observations.
+                | _child - Creates labelled child (same buckets).
+                | _own_samples - Collects cumulative bucket samples.
+    '''
+
+    KIND: str = 'histogram'
+    DEFAULT_BUCKETS: Tuple[float, ...] = (
+        0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+    )
+
+    def __init__(
+        self, name: str, help_text: str = '',
+        label_names: Tuple[str, ...] = (),
+        label_values: Tuple[str, ...] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> None:
+        '''
+            Initials Histogram constructor.
+
+            :param name: Metric name
+            :type name: <str>
+            :param help_text: Metric description
+            :type help_text: <str>
+            :param label_names: Label names
+            :type label_names: <Tuple[str, ...]>
+            :param label_values: Label values (child metric)
+            :type label_values: <Tuple[str, ...]>
+            :param buckets: Bucket upper bounds (+Inf is added)
+            :type buckets: <Sequence[float]>
+            :exceptions: ATSValueError
+        '''
+        bounds: Tuple[float, ...] = tuple(sorted(
+            float(bound) for bound in buckets if bound != float('inf')
+        ))
+        if not bounds or len(set(bounds)) != len(bounds):
+            raise ATSValueError(f'wrong buckets of histogram {name}')
+        super().__init__(
+            name, help_text, label_names, label_values, len(bounds) + 2
+        )
+        self._bounds: Tuple[float, ...] = bounds
+
+    @property
+    def bounds(self) -> Tuple[float, ...]:
+        '''
+            Property method for getting bucket upper bounds.
+
+            :return: Bucket upper bounds (without +Inf)
+            :rtype: <Tuple[float, ...]>
+            :exceptions: None
+        '''
+        return self._bounds
+
+    def observe(self, value: float) -> None:
+        '''
+            Records observed value in shard of current thread.
+
+            :param value: Observed value (duration, size, ...)
+            :type value: <float>
+            :exceptions: None
+        '''
+        shard: List[float] = self._shard()
+        shard[bisect_left(self._bounds, value)] += 1
+        shard[-1] += value
+
+    @property
+    def count(self) -> int:
+        '''
+            Property method for getting number of observations.
+
+            :return: Number of observations
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return int(sum(self._totals()[:-1]))
+
+    def _child(self, key: Tuple[str, ...]) -> Any:
+        '''
+            Creates labelled child with the same buckets.
+
+            :param key: Label values
+            :type key: <Tuple[str, ...]>
+            :return: Child histogram
+            :rtype: <Histogram>
+            :exceptions: None
+        '''
+        return Histogram(
+            self._name, self._help, self._label_names, key, self._bounds
+        )
+
+    def _own_samples(self) -> List[Sample]:
+        '''
+            Collects cumulative bucket samples, sum and count.
+
+            :return: List of (name, labels, value)
+            :rtype: <List[Sample]>
+            :exceptions: None
+        '''
+        labels: Tuple[Tuple[str, str], ...] = tuple(
+            zip(self._label_names, self._label_values)
+        )
+        totals: List[float] = self._totals()
+        samples: List[Sample] = []
+        cumulative: float = 0.0
+        for bound, count in zip(self._bounds + (float('inf'),), totals):
+            cumulative += count
+            le: str = '+Inf' if bound == float('inf') else repr(bound)
+            samples.append(
+                (f'{self._name}_bucket', labels + (('le', le),), cumulative)
+            )
+        samples.append((f'{self._name}_sum', labels, totals[-1]))
+        samples.append((f'{self._name}_count', labels, cumulative))
+        return samples
@@ -0,0 +1,233 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    hot_restart.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class HotRestart with attribute(s) and method(s).
+    Creates an API for handing listening sockets to new daemon generation.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from os import environ, getpid, kill
+from os.path import abspath
+from signal import SIGTERM
+from socket import (
+    socket, AF_INET, AF_INET6, SOCK_STREAM, SOL_SOCKET, SO_REUSEADDR
+)
+from subprocess import Popen
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from daemonpy.sd_notify import SdNotify
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class HotRestart:
+    '''
+        Defines class HotRestart with attribute(s) and method(s).
+        Creates an API for handing listening sockets to new daemon generation.
+
+        Running generation re-executes its own command line with listening
+        sockets inherited (file descriptor numbers passed in environment).
+        New generation adopts the sockets, swaps the PID file atomically
+        and, once it is ready (channels opened), sends SIGTERM to the old
+        generation, whose lifecycle drains and exits. One generation is
+        spawned per process, unless its launcher failed.
+        Sockets passed by systemd socket activation are adopted as well.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | ENV_FDS - Environment variable with inherited fds.
+                | ENV_OLD_PID - Environment variable with old generation PID.
+                | _argv - Absolute command line of daemon process.
+                | _sockets - Listening sockets handed over on restart.
+                | _inherited - Inherited sockets not yet adopted.
+                | _old_pid - PID of previous generation | None.
+                | _spawned - New generation was started.
+            :methods:
+                | __init__ - Initials HotRestart constructor.
+                | old_pid - Property method for getting old generation PID.
+                | sockets - Property method for getting listening sockets.
+                | listen - Adopts inherited or opens new listening socket.
+                | _same_address - Checks is listening socket bound to address.
+                | add_socket - Registers listening socket for hand over.
+                | spawn - Starts new generation with inherited sockets.
+                | retire_old - Stops previous generation.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::HOT_RESTART'
+    ENV_FDS: str = 'DAEMONPY_LISTEN_FDS'
+    ENV_OLD_PID: str = 'DAEMONPY_OLD_PID'
+
+    def __init__(self, operations: List[str]) -> None:
+        '''
+            Initials HotRestart constructor.
+
+            :param operations: Daemon operations replaced by start on exec
+            :type operations: <List[str]>
+            :exceptions: None
+        '''
+        argv: List[str] = [abspath(sys.argv[0])] + sys.argv[1:]
+        if len(argv) > 1 and argv[-1] in operations:
+            argv[-1] = 'start'
+        self._argv: List[str] = [sys.executable] + argv
+        self._sockets: List[socket] = []
+        self._inherited: List[socket] = []
+        fds: str = environ.pop(self.ENV_FDS, '')
+        for fd in filter(None, fds.split(',')):
+            self._inherited.append(socket(fileno=int(fd)))
+        self._inherited.extend(SdNotify.listen_fds())
+        old_pid: str = environ.pop(self.ENV_OLD_PID, '')
+        self._old_pid: Optional[int] = int(old_pid) if old_pid else None
+        self._spawned: bool = False
+
+    @property
+    def old_pid(self) -> Optional[int]:
+        '''
+            Property method for getting old generation PID.
+
+            :return: PID of previous generation | None (cold start)
+            :rtype: <Optional[int]>
+            :exceptions: None
+        '''
+        return self._old_pid
+
+    @property
+    def sockets(self) -> List[socket]:
+        '''
+            Property method for getting listening sockets.
+
+            :return: Listening sockets (registered and inherited)
+            :rtype: <List[socket]>
+            :exceptions: None
+        '''
+        return self._sockets + self._inherited
+
+    def listen(
+        self, address: Any, family: int = AF_INET, backlog: int = 1024
+    ) -> socket:
+        '''
+            Adopts inherited socket bound to address or opens new one.
+
+            :param address: Socket address (host, port) | path
+            :type address: <Any>
+            :param family: Socket address family
+            :type family: <int>
+            :param backlog: Listen queue length
+            :type backlog: <int>
+            :return: Listening socket
+            :rtype: <socket>
+            :exceptions: OSError
+        '''
+        for inherited in self._inherited:
+            if self._same_address(inherited, family, address):
+                self._inherited.remove(inherited)
+                self._sockets.append(inherited)
+                return inherited
+        listener: socket = socket(family, SOCK_STREAM)
+        listener.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+        listener.bind(address)
+        listener.listen(backlog)
+        self._sockets.append(listener)
+        return listener
+
+    @staticmethod
+    def _same_address(listener: socket, family: int, address: Any) -> bool:
+        '''
+            Checks is listening socket bound to address.
+
+            :param listener: Listening socket
+            :type listener: <socket>
+            :param family: Socket address family
+            :type family: <int>
+            :param address: Socket address (host, port) | path
+            :type address: <Any>
+            :return: True (same address) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if listener.family != family:
+            return False
+        bound: Any = listener.getsockname()
+        if isinstance(address, tuple) and isinstance(bound, tuple):
+            host: str = address[0] or (
+                '::' if family == AF_INET6 else '0.0.0.0'
+            )
+            return (host, address[1]) == tuple(bound[:2])
+        return bool(bound == address)
+
+    def add_socket(self, listener: socket) -> None:
+        '''
+            Registers listening socket for hand over on hot restart.
+
+            :param listener: Bound listening socket
+            :type listener: <socket>
+            :exceptions: None
+        '''
+        if listener not in self._sockets:
+            self._sockets.append(listener)
+
+    def spawn(self) -> Optional[int]:
+        '''
+            Starts new generation with inherited listening sockets
+            (SIGUSR2 routed on main thread), waits for its launcher.
+
+            :return: PID of spawned launcher | None (failed or spawned)
+            :rtype: <Optional[int]>
+            :exceptions: None
+        '''
+        if self._spawned:
+            return None
+        fds: List[int] = [listener.fileno() for listener in self.sockets]
+        env: Dict[str, str] = dict(environ)
+        env[self.ENV_FDS] = ','.join(str(fd) for fd in fds)
+        env[self.ENV_OLD_PID] = str(getpid())
+        try:
+            with Popen(self._argv, env=env, pass_fds=fds) as launcher:
+                pass
+        except OSError as os_error:
+            error_message([f'{self._P_VERBOSE} {os_error}'])
+            return None
+        self._spawned = launcher.returncode == 0
+        return launcher.pid if self._spawned else None
+
+    def retire_old(self) -> None:
+        '''
+            Retires previous generation after new one is ready
+            (SIGTERM, routed by its lifecycle to drain and exit).
+
+            :exceptions: None
+        '''
+        if self._old_pid is not None:
+            try:
+                kill(self._old_pid, SIGTERM)
+            except ProcessLookupError:
+                pass
+            self._old_pid = None
@@ -0,0 +1,220 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    lifecycle.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Lifecycle with attribute(s) and method(s).
+    Creates an API for components and signal routing of daemon.
+'''
+
+import sys
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from daemonpy.control_socket import Handler
+    from daemonpy.daemon_component import DaemonComponent
+    from daemonpy.signal_router import SignalRouter
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+ComponentType = TypeVar('ComponentType', bound=DaemonComponent)
+
+
+class Lifecycle(SignalRouter):
+    '''
+        Defines class Lifecycle with attribute(s) and method(s).
+        Creates an API for components and signal routing of daemon.
+
+        Components are opened with control channels (in process which
+        runs run()) in order of adding and closed in reverse order,
+        after all of them were notified about stopping.
+        Components add their signal handlers when attached, signals
+        are routed on main thread (or event loop) by signal router.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _daemon - Daemon owning lifecycle.
+                | _components - Components in order of adding.
+                | _beats - Heartbeat hooks of components overriding it.
+            :methods:
+                | __init__ - Initials Lifecycle constructor.
+                | add - Adds component to daemon.
+                | get - Gets component by type.
+                | open - Opens components, installs dispatchers.
+                | drain - Drains components.
+                | heartbeat - Passes heartbeat of run() to components.
+                | close - Closes components, removes dispatchers.
+                | after_fork - Drops components in forked worker.
+                | commands - Gets control commands of components.
+                | stats - Gets statistics of components.
+                | stop_timeout - Gets stop time of components.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::LIFECYCLE'
+
+    def __init__(self, daemon: Any) -> None:
+        '''
+            Initials Lifecycle constructor.
+
+            :param daemon: Daemon owning lifecycle
+            :type daemon: <Any>
+            :exceptions: None
+        '''
+        super().__init__()
+        self._daemon: Any = daemon
+        self._components: List[DaemonComponent] = []
+        self._beats: List[Callable[[], None]] = []
+
+    def add(self, component: ComponentType) -> ComponentType:
+        '''
+            Adds component to daemon, call before start.
+
+            :param component: Component (attached once)
+            :type component: <ComponentType>
+            :return: Added component
+            :rtype: <ComponentType>
+            :exceptions: ATSValueError
+        '''
+        component.attach(self._daemon)
+        self._components.append(component)
+        if type(component).heartbeat is not DaemonComponent.heartbeat:
+            self._beats.append(component.heartbeat)
+        if self._opened:
+            component.open()
+        return component
+
+    def get(self, kind: Type[ComponentType]) -> Optional[ComponentType]:
+        '''
+            Gets first component of type.
+
+            :param kind: Component class
+            :type kind: <Type[ComponentType]>
+            :return: Component | None (not added)
+            :rtype: <Optional[ComponentType]>
+            :exceptions: None
+        '''
+        for component in self._components:
+            if isinstance(component, kind):
+                return component
+        return None
+
+    def open(self) -> None:
+        '''
+            Opens components in order of adding, installs dispatchers
+            (call on main thread).
+
+            :exceptions: None
+        '''
+        for component in self._components:
+            try:
+                component.open()
+            except OSError as os_error:
+                error_message([f'{self._P_VERBOSE} {os_error}'])
+        super().open()
+
+    def drain(self) -> None:
+        '''
+            Starts draining of components.
+
+            :exceptions: None
+        '''
+        for component in self._components:
+            component.drain()
+
+    def heartbeat(self) -> None:
+        '''
+            Passes heartbeat of run() to components which see it.
+
+            :exceptions: None
+        '''
+        for beat in self._beats:
+            beat()
+
+    def close(self) -> None:
+        '''
+            Notifies components about stopping, closes them in reverse
+            order of adding, removes dispatchers of event loop.
+
+            :exceptions: None
+        '''
+        for component in self._components:
+            component.stopping()
+        for component in reversed(self._components):
+            component.close()
+        super().close()
+
+    def after_fork(self) -> None:
+        '''
+            Drops components in forked worker process (their threads,
+            locks and sockets belong to parent), signal routing stays.
+
+            :exceptions: None
+        '''
+        self._components, self._beats = [], []
+
+    def commands(self) -> Dict[str, Handler]:
+        '''
+            Gets control commands of components.
+
+            :return: Handlers by command name
+            :rtype: <Dict[str, Handler]>
+            :exceptions: None
+        '''
+        commands: Dict[str, Handler] = {}
+        for component in self._components:
+            commands.update(component.commands())
+        return commands
+
+    def stats(self) -> Dict[str, Any]:
+        '''
+            Gets statistics of components for stats command.
+
+            :return: Statistics
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        stats: Dict[str, Any] = {}
+        for component in self._components:
+            stats.update(component.stats())
+        return stats
+
+    def stop_timeout(self) -> Optional[float]:
+        '''
+            Gets longest stop time needed by components.
+
+            :return: Stop time (seconds) | None (default stop timeout)
+            :rtype: <Optional[float]>
+            :exceptions: None
+        '''
+        timeouts: List[float] = [
+            timeout for timeout in (
+                component.stop_timeout() for component in self._components
+            ) if timeout is not None
+        ]
+        return max(timeouts, default=None)
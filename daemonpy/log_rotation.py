@@ -0,0 +1,126 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    log_rotation.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class LogRotation with attribute(s) and method(s).
+    Creates a size and time based rotation policy for log files.
+'''
+
+import sys
+from typing import List
+from os import remove, rename
+from os.path import exists
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class LogRotation:
+    '''
+        Defines class LogRotation with attribute(s) and method(s).
+        Creates a size and time based rotation policy for log files.
+
+        It defines:
+
+            :attributes:
+                | _max_bytes - Rotate when file size reaches it | 0.
+                | _interval - Rotate when file is older (seconds) | 0.
+                | _backup_count - Number of rotated files to keep.
+            :methods:
+                | __init__ - Initials LogRotation constructor.
+                | backup_count - Property method for getting backup count.
+                | due - Checks is rotation due.
+                | rotate - Shifts rotated files (path.1 ... path.N).
+    '''
+
+    def __init__(
+        self,
+        max_bytes: int = 0,
+        interval: float = 0.0,
+        backup_count: int = 5
+    ) -> None:
+        '''
+            Initials LogRotation constructor.
+
+            :param max_bytes: Rotate at file size in bytes | 0 (never)
+            :type max_bytes: <int>
+            :param interval: Rotate at file age in seconds | 0 (never)
+            :type interval: <float>
+            :param backup_count: Number of rotated files to keep
+            :type backup_count: <int>
+            :exceptions: ATSValueError
+        '''
+        if min(max_bytes, interval, backup_count) < 0:
+            raise ATSValueError('log rotation limits must be positive')
+        self._max_bytes: int = max_bytes
+        self._interval: float = interval
+        self._backup_count: int = backup_count
+
+    @property
+    def backup_count(self) -> int:
+        '''
+            Property method for getting number of rotated files.
+
+            :return: Number of rotated files to keep
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._backup_count
+
+    def due(self, size: int, age: float) -> bool:
+        '''
+            Checks is rotation due.
+
+            :param size: Current log file size in bytes
+            :type size: <int>
+            :param age: Current log file age in seconds
+            :type age: <float>
+            :return: True (rotate now) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return any([
+            0 < self._max_bytes <= size, 0 < self._interval <= age
+        ])
+
+    def rotate(self, path: str) -> None:
+        '''
+            Shifts rotated files (path.1 ... path.N), oldest is dropped.
+
+            :param path: Log file path
+            :type path: <str>
+            :exceptions: OSError
+        '''
+        for index in range(self._backup_count - 1, 0, -1):
+            if exists(f'{path}.{index}'):
+                rename(f'{path}.{index}', f'{path}.{index + 1}')
+        if self._backup_count > 0:
+            rename(path, f'{path}.1')
+        elif exists(path):
+            remove(path)
@@ -0,0 +1,300 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    log_sink.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class LogSink with attribute(s) and method(s).
+    Creates a buffered, rotating log stream for daemon output.
+'''
+
+import sys
+from typing import List, Optional
+from atexit import register
+from io import TextIOBase
+from os import (
+    close, dup2, fstat, open as os_open, register_at_fork, write,
+    O_APPEND, O_CLOEXEC, O_CREAT, O_WRONLY
+)
+from threading import Event, RLock, Thread
+from time import monotonic, time
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.log_rotation import LogRotation
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class LogSink(TextIOBase):
+    '''
+        Defines class LogSink with attribute(s) and method(s).
+        Creates a buffered, rotating log stream for daemon output.
+
+        Writes are collected in memory and reach the file in one write()
+        call when buffer is full or flush interval expired. Reopen asked
+        from a signal handler (logrotate SIGHUP) and rotation happen on
+        flush; descriptors from attach() follow the reopened file.
+
+        It defines:
+
+            :attributes:
+                | _MODE - Log file open flags.
+                | _path - Log file path.
+                | _buffer_size - Flush threshold in bytes.
+                | _rotation - Log rotation policy | None.
+                | _flush_interval - Max age of buffered data (seconds).
+                | _flush_thread - Flush from background thread.
+                | _fd - Log file descriptor | None.
+                | _targets - Descriptors re-pointed to log file.
+                | _chunks - Buffered encoded data.
+                | _size - Buffered data size in bytes.
+                | _written - Current log file size in bytes.
+                | _opened - Time when current log file was opened.
+                | _flushed - Time of last flush (monotonic).
+                | _reopen - Reopen requested status.
+                | _lock - Buffer and file lock (reentrant for signals).
+                | _stop - Background flush thread stop event.
+            :methods:
+                | __init__ - Initials LogSink constructor.
+                | open - Opens log file and starts flush thread.
+                | attach - Re-points descriptor to log file.
+                | fileno - Gets log file descriptor.
+                | write - Buffers text.
+                | flush - Writes buffered data to log file.
+                | request_reopen - Requests reopen (signal safe).
+                | close - Flushes and closes log file.
+    '''
+
+    _MODE: int = O_WRONLY | O_APPEND | O_CREAT | O_CLOEXEC
+
+    def __init__(
+        self,
+        path: str,
+        buffer_size: int = 256 * 1024,
+        rotation: Optional[LogRotation] = None,
+        flush_interval: float = 1.0,
+        flush_thread: bool = False
+    ) -> None:
+        '''
+            Initials LogSink constructor (file is opened on first use).
+
+            :param path: Log file path
+            :type path: <str>
+            :param buffer_size: Flush threshold in bytes
+            :type buffer_size: <int>
+            :param rotation: Log rotation policy | None (no rotation)
+            :type rotation: <Optional[LogRotation]>
+            :param flush_interval: Max age of buffered data (seconds)
+            :type flush_interval: <float>
+            :param flush_thread: Flush from background thread
+            :type flush_thread: <bool>
+            :exceptions: ATSValueError
+        '''
+        super().__init__()
+        if not bool(path):
+            raise ATSValueError('missing log file path')
+        if buffer_size < 0:
+            raise ATSValueError('log buffer size must be positive')
+        self._path: str = path
+        self._buffer_size: int = buffer_size
+        self._rotation: Optional[LogRotation] = rotation
+        self._flush_interval: float = flush_interval
+        self._flush_thread: bool = flush_thread
+        self._fd: Optional[int] = None
+        self._targets: List[int] = []
+        self._chunks: List[bytes] = []
+        self._size: int = 0
+        self._written: int = 0
+        self._opened: float = 0.0
+        self._flushed: float = monotonic()
+        self._reopen: bool = False
+        self._lock: RLock = RLock()
+        self._stop: Event = Event()
+
+    def open(self) -> None:
+        '''
+            Opens log file and starts flush thread (call after fork).
+
+            :exceptions: OSError | ValueError (closed)
+        '''
+        with self._lock:
+            if self.closed:
+                raise ValueError('I/O operation on closed log sink')
+            if self._fd is not None:
+                return
+            self._open_locked()
+            register(self.flush)
+            register_at_fork(after_in_child=self._after_fork_child)
+        self._start_thread()
+
+    def attach(self, fd: int) -> None:
+        '''
+            Re-points descriptor (stdout/stderr) to log file.
+
+            :param fd: File descriptor to replace
+            :type fd: <int>
+            :exceptions: OSError
+        '''
+        dup2(self.fileno(), fd)
+        if fd not in self._targets:
+            self._targets.append(fd)
+
+    def fileno(self) -> int:
+        '''
+            Gets log file descriptor (opens log file if needed).
+
+            :return: Log file descriptor
+            :rtype: <int>
+            :exceptions: OSError | ValueError (closed)
+        '''
+        self.open()
+        return int(self._fd)  # type: ignore[arg-type]
+
+    def write(self, text: str) -> int:  # type: ignore[override]
+        '''
+            Buffers text, writes buffer when it is full or expired.
+
+            :param text: Text to log
+            :type text: <str>
+            :return: Number of characters written
+            :rtype: <int>
+            :exceptions: OSError | ValueError (closed)
+        '''
+        data: bytes = text.encode('utf-8', 'backslashreplace')
+        with self._lock:
+            if self._fd is None:
+                self.open()
+            self._chunks.append(data)
+            self._size += len(data)
+            if self._reopen or self._size >= self._buffer_size or (
+                monotonic() - self._flushed >= self._flush_interval
+            ):
+                self._flush_locked()
+        return len(text)
+
+    def flush(self) -> None:
+        '''
+            Writes buffered data to log file.
+
+            :exceptions: OSError
+        '''
+        with self._lock:
+            self._flush_locked()
+
+    def request_reopen(self) -> None:
+        '''
+            Requests reopen of log file on next flush (signal safe).
+
+            :exceptions: None
+        '''
+        self._reopen = True
+
+    def close(self) -> None:
+        '''
+            Stops flush thread, flushes and closes log file.
+
+            :exceptions: None
+        '''
+        self._stop.set()
+        with self._lock:
+            if self._fd is not None:
+                self._flush_locked()
+                close(self._fd)
+                self._fd = None
+            super().close()
+
+    def _open_locked(self) -> None:
+        '''
+            Opens log file and re-points attached descriptors.
+
+            :exceptions: OSError
+        '''
+        old_fd: Optional[int] = self._fd
+        self._fd = os_open(self._path, self._MODE, 0o644)
+        if old_fd is not None:
+            close(old_fd)
+        for target in self._targets:
+            dup2(self._fd, target)
+        self._written = fstat(self._fd).st_size
+        self._opened = time()
+
+    def _flush_locked(self) -> None:
+        '''
+            Writes buffered data, handles reopen and rotation.
+
+            :exceptions: OSError
+        '''
+        if self._fd is None:
+            return
+        if self._reopen:
+            self._reopen = False
+            self._open_locked()
+        if self._chunks:
+            chunks, self._chunks, self._size = self._chunks, [], 0
+            data: memoryview = memoryview(b''.join(chunks))
+            while data:
+                written: int = write(int(self._fd), data)
+                self._written += written
+                data = data[written:]
+        self._flushed = monotonic()
+        if self._rotation is not None and self._rotation.due(
+            self._written, time() - self._opened
+        ):
+            self._rotation.rotate(self._path)
+            self._open_locked()
+
+    def _start_thread(self) -> None:
+        '''
+            Starts background flush thread if enabled.
+
+            :exceptions: None
+        '''
+        if self._flush_thread and self._flush_interval > 0:
+            Thread(target=self._flush_loop, daemon=True).start()
+
+    def _flush_loop(self) -> None:
+        '''
+            Flushes buffered data every flush interval.
+
+            :exceptions: None
+        '''
+        while not self._stop.wait(self._flush_interval):
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def _after_fork_child(self) -> None:
+        '''
+            Resets lock and drops parent buffer in child after fork.
+
+            :exceptions: None
+        '''
+        self._lock = RLock()
+        self._chunks, self._size = [], 0
+        self._stop = Event()
+        if self._fd is not None:
+            self._start_thread()
@@ -0,0 +1,284 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    managed_pool.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ManagedPool with attribute(s) and method(s).
+    Creates an API for executor owned by daemon lifecycle.
+'''
+
+import sys
+from typing import Any, Callable, Dict, List, Optional, Set
+from copy import copy
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+from multiprocessing import get_context
+from os import sched_getaffinity
+from threading import Lock
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ManagedPool:
+    '''
+        Defines class ManagedPool with attribute(s) and method(s).
+        Creates an API for executor owned by daemon lifecycle.
+
+        Executor (thread or process pool) is created by open() in the
+        process which runs run(), so no locks or threads are inherited
+        through fork; worker processes are started by forkserver by
+        default (fork of a threaded daemon could copy held locks).
+        Default size follows CPU affinity of process
+        (placement is applied before). Unfinished futures are tracked
+        for queue depth and utilization (busy workers) metrics and for
+        shutdown, which waits until deadline and then terminates
+        remaining worker processes (threads can not be stopped).
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | KINDS - Supported executor kinds.
+                | START_METHOD - Default start method (process pool).
+                | _name - Pool name.
+                | _kind - Executor kind (thread | process).
+                | _workers - Number of workers | None (CPU affinity).
+                | _context - Multiprocessing start method.
+                | _executor - Executor | None (not opened or closed).
+                | _processes - Worker processes started by executor.
+                | _pending - Unfinished futures.
+                | _lock - Guards futures and counters.
+                | _counters - Task counters by outcome.
+            :methods:
+                | __init__ - Initials ManagedPool constructor.
+                | name - Property method for getting pool name.
+                | workers - Property method for getting pool size.
+                | executor - Property method for getting executor.
+                | open - Creates executor.
+                | submit - Submits task to executor.
+                | metrics - Collects queue depth and utilization.
+                | shutdown - Shuts executor down within deadline.
+                | _done - Records finished task.
+                | _process - Creates and records worker process.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::MANAGED_POOL'
+    KINDS: List[str] = ['thread', 'process']
+    START_METHOD: str = 'forkserver'
+
+    def __init__(
+        self, name: str, kind: str = 'thread',
+        workers: Optional[int] = None, context: Optional[str] = None
+    ) -> None:
+        '''
+            Initials ManagedPool constructor.
+
+            :param name: Pool name
+            :type name: <str>
+            :param kind: Executor kind (thread | process)
+            :type kind: <str>
+            :param workers: Number of workers | None (CPU affinity)
+            :type workers: <Optional[int]>
+            :param context: Start method (process pool) | None (forkserver)
+            :type context: <Optional[str]>
+            :exceptions: ATSValueError
+        '''
+        if kind not in self.KINDS:
+            raise ATSValueError(f'wrong pool kind {kind}')
+        if workers is not None and workers < 1:
+            raise ATSValueError('pool needs at least one worker')
+        self._name: str = name
+        self._kind: str = kind
+        self._workers: Optional[int] = workers
+        self._context: str = context or self.START_METHOD
+        self._executor: Optional[Executor] = None
+        self._processes: List[Any] = []
+        self._pending: Set[Future[Any]] = set()
+        self._lock: Lock = Lock()
+        self._counters: Dict[str, int] = {
+            'submitted': 0, 'completed': 0, 'failed': 0, 'cancelled': 0
+        }
+
+    @property
+    def name(self) -> str:
+        '''
+            Property method for getting pool name.
+
+            :return: Pool name
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return self._name
+
+    @property
+    def workers(self) -> int:
+        '''
+            Property method for getting pool size.
+
+            :return: Number of workers (CPU affinity based by default)
+            :rtype: <int>
+            :exceptions: None
+        '''
+        if self._workers is not None:
+            return self._workers
+        cpus: int = len(sched_getaffinity(0))
+        return min(32, cpus + 4) if self._kind == 'thread' else cpus
+
+    @property
+    def executor(self) -> Optional[Executor]:
+        '''
+            Property method for getting executor.
+
+            :return: Executor | None (not opened or shut down)
+            :rtype: <Optional[Executor]>
+            :exceptions: None
+        '''
+        return self._executor
+
+    def open(self) -> Executor:
+        '''
+            Creates executor (in process running run()).
+
+            :return: Executor
+            :rtype: <Executor>
+            :exceptions: ValueError (wrong start method)
+        '''
+        if self._executor is None:
+            if self._kind == 'thread':
+                self._executor = ThreadPoolExecutor(
+                    self.workers, thread_name_prefix=f'daemonpy-{self._name}'
+                )
+            else:
+                context: Any = copy(get_context(self._context))
+                context.Process = self._process
+                self._executor = ProcessPoolExecutor(
+                    self.workers, mp_context=context
+                )
+        return self._executor
+
+    def submit(
+        self, func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> Future[Any]:
+        '''
+            Submits task to executor.
+
+            :param func: Task callable (picklable for process pool)
+            :type func: <Callable[..., Any]>
+            :return: Future of task
+            :rtype: <Future[Any]>
+            :exceptions: ATSValueError (pool is not open)
+        '''
+        if self._executor is None:
+            raise ATSValueError(f'pool {self._name} is not open')
+        future: Future[Any] = self._executor.submit(func, *args, **kwargs)
+        with self._lock:
+            self._counters['submitted'] += 1
+            self._pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def metrics(self) -> Dict[str, Any]:
+        '''
+            Collects queue depth and utilization (busy workers share).
+
+            :return: Pool metrics
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        workers: int = self.workers
+        with self._lock:
+            metrics: Dict[str, Any] = dict(self._counters)
+            pending: int = len(self._pending)
+        metrics.update({
+            'kind': self._kind, 'workers': workers,
+            'queue_depth': max(pending - workers, 0),
+            'utilization': round(min(pending, workers) / workers, 3)
+        })
+        return metrics
+
+    def shutdown(self, timeout: float) -> bool:
+        '''
+            Shuts executor down, drops queued tasks and waits for
+            running ones up to timeout, then terminates worker
+            processes (process pool).
+
+            :param timeout: Max wait (seconds)
+            :type timeout: <float>
+            :return: True (all tasks finished) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        executor: Optional[Executor] = self._executor
+        if executor is None:
+            return True
+        self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            pending: Set[Future[Any]] = set(self._pending)
+        unfinished: int = len(wait(pending, max(timeout, 0.0)).not_done)
+        if unfinished:
+            error_message([
+                f'{self._P_VERBOSE} {self._name}:', unfinished,
+                'tasks not finished at deadline'
+            ])
+            for process in self._processes:
+                if process.is_alive():
+                    process.terminate()
+        return not unfinished
+
+    def _done(self, future: Future[Any]) -> None:
+        '''
+            Records finished task.
+
+            :param future: Finished future
+            :type future: <Future[Any]>
+            :exceptions: None
+        '''
+        with self._lock:
+            self._pending.discard(future)
+            if future.cancelled():
+                self._counters['cancelled'] += 1
+            elif future.exception() is not None:
+                self._counters['failed'] += 1
+            else:
+                self._counters['completed'] += 1
+
+    def _process(self, *args: Any, **kwargs: Any) -> Any:
+        '''
+            Creates and records worker process (executor start hook).
+
+            :return: Worker process (not started)
+            :rtype: <Any>
+            :exceptions: None
+        '''
+        process: Any = get_context(self._context).Process(*args, **kwargs)
+        self._processes.append(process)
+        return process
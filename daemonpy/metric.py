@@ -0,0 +1,265 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    metric.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Metric with attribute(s) and method(s).
+    Creates an API for metric with per-thread shards and labels.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+from re import compile as re_compile, Pattern
+from threading import local, Lock
+from weakref import finalize
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+Sample = Tuple[str, Tuple[Tuple[str, str], ...], float]
+
+
+class ShardOwner:
+    '''
+        Defines class ShardOwner with attribute(s) and method(s).
+        Marks thread owning shard (collected when thread ends).
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | None
+    '''
+
+    __slots__ = ('__weakref__',)
+
+
+class Metric:
+    '''
+        Defines class Metric with attribute(s) and method(s).
+        Creates an API for metric with per-thread shards and labels.
+
+        Each thread updates its own preallocated shard (list of
+        values), so updates take no lock, shards are summed when
+        metric is read. Lock is taken only when thread creates its
+        shard or labelled child is created. Shard of ended thread is
+        folded into retired values (finalizer of its thread-local
+        owner), so shards do not pile up with short-lived threads.
+
+        It defines:
+
+            :attributes:
+                | KIND - Metric type in text exposition format.
+                | NAME - Pattern of metric and label names.
+                | _name - Metric name.
+                | _help - Metric description.
+                | _label_names - Label names.
+                | _label_values - Label values of child.
+                | _children - Labelled children by label values.
+                | _width - Number of values in shard.
+                | _shards - Shards of live threads.
+                | _retired - Folded values of ended threads.
+                | _local - Shard of current thread.
+                | _lock - Guards shards and children.
+            :methods:
+                | __init__ - Initials Metric constructor.
+                | name - Property method for getting metric name.
+                | help - Property method for getting description.
+                | labels - Gets child with label values.
+                | samples - Collects samples of metric and children.
+                | _own_samples - Collects samples of metric itself.
+                | _shard - Gets shard of current thread.
+                | _retire - Folds shard of ended thread.
+                | _totals - Sums shards of all threads.
+    '''
+
+    KIND: str = 'untyped'
+    NAME: Pattern[str] = re_compile(r'[a-zA-Z_:][a-zA-Z0-9_:]*')
+
+    def __init__(
+        self, name: str, help_text: str = '',
+        label_names: Tuple[str, ...] = (),
+        label_values: Tuple[str, ...] = (), width: int = 1
+    ) -> None:
+        '''
+            Initials Metric constructor.
+
+            :param name: Metric name ([a-zA-Z_:][a-zA-Z0-9_:]*)
+            :type name: <str>
+            :param help_text: Metric description
+            :type help_text: <str>
+            :param label_names: Label names
+            :type label_names: <Tuple[str, ...]>
+            :param label_values: Label values (child metric)
+            :type label_values: <Tuple[str, ...]>
+            :param width: Number of values in shard
+            :type width: <int>
+            :exceptions: ATSValueError
+        '''
+        if not all(
+            self.NAME.fullmatch(text) for text in (name, *label_names)
+        ):
+            raise ATSValueError(f'wrong metric or label name {name}')
+        self._name: str = name
+        self._help: str = help_text
+        self._label_names: Tuple[str, ...] = tuple(label_names)
+        self._label_values: Tuple[str, ...] = label_values
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._width: int = width
+        self._shards: List[List[float]] = []
+        self._retired: List[float] = [0.0] * width
+        self._local: local = local()
+        self._lock: Lock = Lock()
+
+    @property
+    def name(self) -> str:
+        '''
+            Property method for getting metric name.
+
+            :return: Metric name
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return self._name
+
+    @property
+    def help(self) -> str:
+        '''
+            Property method for getting metric description.
+
+            :return: Metric description
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return self._help
+
+    def labels(self, *values: Any) -> Any:
+        '''
+            Gets child with label values (created once, keep it for
+            hot loops).
+
+            :param values: Label values (in order of label names)
+            :type values: <Any>
+            :return: Child metric
+            :rtype: <Any>
+            :exceptions: ATSValueError
+        '''
+        key: Tuple[str, ...] = tuple(str(value) for value in values)
+        child: Optional[Any] = self._children.get(key)
+        if child is None:
+            if len(key) != len(self._label_names) or not key:
+                raise ATSValueError(f'{self._name} needs labels')
+            with self._lock:
+                child = self._children.setdefault(key, self._child(key))
+        return child
+
+    def samples(self) -> List[Sample]:
+        '''
+            Collects samples of metric (unlabelled) and children.
+
+            :return: List of (name, labels, value)
+            :rtype: <List[Sample]>
+            :exceptions: None
+        '''
+        samples: List[Sample] = [] if self._label_names and not (
+            self._label_values
+        ) else self._own_samples()
+        for child in list(self._children.values()):
+            samples.extend(child.samples())
+        return samples
+
+    def _child(self, key: Tuple[str, ...]) -> Any:
+        '''
+            Creates labelled child.
+
+            :param key: Label values
+            :type key: <Tuple[str, ...]>
+            :return: Child metric
+            :rtype: <Any>
+            :exceptions: None
+        '''
+        return type(self)(self._name, self._help, self._label_names, key)
+
+    def _own_samples(self) -> List[Sample]:
+        '''
+            Collects samples of metric itself.
+
+            :return: List of (name, labels, value)
+            :rtype: <List[Sample]>
+            :exceptions: None
+        '''
+        labels: Tuple[Tuple[str, str], ...] = tuple(
+            zip(self._label_names, self._label_values)
+        )
+        return [(self._name, labels, self._totals()[0])]
+
+    def _shard(self) -> List[float]:
+        '''
+            Gets shard of current thread (created on first update).
+
+            :return: Shard values
+            :rtype: <List[float]>
+            :exceptions: None
+        '''
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard: List[float] = [0.0] * self._width
+            owner: ShardOwner = ShardOwner()
+            with self._lock:
+                self._shards.append(shard)
+            finalize(owner, self._retire, shard)
+            self._local.shard, self._local.owner = shard, owner
+            return shard
+
+    def _retire(self, shard: List[float]) -> None:
+        '''
+            Folds shard of ended thread into retired values.
+
+            :param shard: Shard values
+            :type shard: <List[float]>
+            :exceptions: None
+        '''
+        with self._lock:
+            self._shards = [item for item in self._shards if item is not shard]
+            self._retired = [
+                retired + value for retired, value in zip(self._retired, shard)
+            ]
+
+    def _totals(self) -> List[float]:
+        '''
+            Sums shards of all threads.
+
+            :return: Summed values
+            :rtype: <List[float]>
+            :exceptions: None
+        '''
+        with self._lock:
+            shards: List[List[float]] = [self._retired, *self._shards]
+        return [sum(column) for column in zip(*shards)]
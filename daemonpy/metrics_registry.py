@@ -0,0 +1,251 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    metrics_registry.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MetricsRegistry with attribute(s) and method(s).
+    Creates an API for registry of metrics in text exposition format.
+'''
+
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
+from math import isinf, isnan
+from threading import Lock
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.counter import Counter
+    from daemonpy.gauge import Gauge
+    from daemonpy.histogram import Histogram
+    from daemonpy.metric import Metric
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class MetricsRegistry:
+    '''
+        Defines class MetricsRegistry with attribute(s) and method(s).
+        Creates an API for registry of metrics in text exposition format.
+
+        Metrics are created once by name (repeated call returns the
+        same metric, so modules can share them) and exposed in
+        Prometheus text format 0.0.4 in order of registration.
+        Collectors are called before each exposition to refresh
+        gauges which are read from elsewhere (for example /proc).
+
+        It defines:
+
+            :attributes:
+                | CONTENT_TYPE - Content type of text exposition format.
+                | _metrics - Metrics by name.
+                | _collectors - Callables run before exposition.
+                | _lock - Guards metrics.
+            :methods:
+                | __init__ - Initials MetricsRegistry constructor.
+                | counter - Gets or creates counter.
+                | gauge - Gets or creates gauge.
+                | histogram - Gets or creates histogram.
+                | metrics - Property method for getting metrics.
+                | add_collector - Adds callable run before exposition.
+                | expose - Formats metrics in text exposition format.
+                | _register - Gets or creates metric of type.
+                | _format - Formats sample value.
+    '''
+
+    CONTENT_TYPE: str = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def __init__(self) -> None:
+        '''
+            Initials MetricsRegistry constructor.
+
+            :exceptions: None
+        '''
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: List[Callable[[], None]] = []
+        self._lock: Lock = Lock()
+
+    def counter(
+        self, name: str, help_text: str = '', labels: Sequence[str] = ()
+    ) -> Counter:
+        '''
+            Gets or creates counter.
+
+            :param name: Metric name (suffix _total by convention)
+            :type name: <str>
+            :param help_text: Metric description
+            :type help_text: <str>
+            :param labels: Label names
+            :type labels: <Sequence[str]>
+            :return: Counter
+            :rtype: <Counter>
+            :exceptions: ATSValueError
+        '''
+        return self._register(Counter, name, help_text, tuple(labels))
+
+    def gauge(
+        self, name: str, help_text: str = '', labels: Sequence[str] = ()
+    ) -> Gauge:
+        '''
+            Gets or creates gauge.
+
+            :param name: Metric name
+            :type name: <str>
+            :param help_text: Metric description
+            :type help_text: <str>
+            :param labels: Label names
+            :type labels: <Sequence[str]>
+            :return: Gauge
+            :rtype: <Gauge>
+            :exceptions: ATSValueError
+        '''
+        return self._register(Gauge, name, help_text, tuple(labels))
+
+    def histogram(
+        self, name: str, help_text: str = '', labels: Sequence[str] = (),
+        buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS
+    ) -> Histogram:
+        '''
+            Gets or creates histogram.
+
+            :param name: Metric name
+            :type name: <str>
+            :param help_text: Metric description
+            :type help_text: <str>
+            :param labels: Label names
+            :type labels: <Sequence[str]>
+            :param buckets: Bucket upper bounds
+            :type buckets: <Sequence[float]>
+            :return: Histogram
+            :rtype: <Histogram>
+            :exceptions: ATSValueError
+        '''
+        return self._register(
+            Histogram, name, help_text, tuple(labels), buckets=buckets
+        )
+
+    @property
+    def metrics(self) -> List[Metric]:
+        '''
+            Property method for getting registered metrics.
+
+            :return: Metrics in order of registration
+            :rtype: <List[Metric]>
+            :exceptions: None
+        '''
+        with self._lock:
+            return list(self._metrics.values())
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        '''
+            Adds callable run before each exposition.
+
+            :param collector: Updates metrics (errors are ignored)
+            :type collector: <Callable[[], None]>
+            :exceptions: None
+        '''
+        with self._lock:
+            self._collectors.append(collector)
+
+    def expose(self) -> str:
+        '''
+            Formats metrics in text exposition format.
+
+            :return: Metrics document
+            :rtype: <str>
+            :exceptions: None
+        '''
+        with self._lock:
+            collectors: List[Callable[[], None]] = list(self._collectors)
+        for collector in collectors:
+            try:
+                collector()
+            except Exception:  # pylint: disable=broad-exception-caught
+                pass
+        lines: List[str] = []
+        for metric in self.metrics:
+            help_text: str = metric.help.replace('\\', '\\\\').replace(
+                '\n', '\\n'
+            )
+            lines.append(f'# HELP {metric.name} {help_text}')
+            lines.append(f'# TYPE {metric.name} {metric.KIND}')
+            for name, labels, value in metric.samples():
+                label_text: str = ','.join(
+                    '{0}="{1}"'.format(label, str(text).replace(
+                        '\\', '\\\\'
+                    ).replace('"', '\\"').replace('\n', '\\n'))
+                    for label, text in labels
+                )
+                lines.append(
+                    f'{name}{{{label_text}}} {self._format(value)}'
+                    if label_text else f'{name} {self._format(value)}'
+                )
+        return '\n'.join(lines) + '\n'
+
+    def _register(
+        self, kind: Type[Any], name: str, help_text: str,
+        labels: Tuple[str, ...], **kwargs: Any
+    ) -> Any:
+        '''
+            Gets or creates metric of type.
+
+            :param kind: Metric class
+            :type kind: <Type[Any]>
+            :param name: Metric name
+            :type name: <str>
+            :param help_text: Metric description
+            :type help_text: <str>
+            :param labels: Label names
+            :type labels: <Tuple[str, ...]>
+            :return: Metric
+            :rtype: <Any>
+            :exceptions: ATSValueError (name used by other type)
+        '''
+        with self._lock:
+            metric: Any = self._metrics.get(name)
+            if metric is None:
+                metric = kind(name, help_text, labels, **kwargs)
+                self._metrics[name] = metric
+            elif type(metric) is not kind:
+                raise ATSValueError(f'metric {name} is {metric.KIND}')
+        return metric
+
+    @staticmethod
+    def _format(value: float) -> str:
+        '''
+            Formats sample value.
+
+            :param value: Sample value
+            :type value: <float>
+            :return: Value text (+Inf, -Inf, NaN or number)
+            :rtype: <str>
+            :exceptions: None
+        '''
+        value = float(value)
+        if isnan(value):
+            return 'NaN'
+        if isinf(value):
+            return '+Inf' if value > 0 else '-Inf'
+        return str(int(value)) if value.is_integer() else repr(value)
@@ -0,0 +1,208 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    metrics_server.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MetricsServer with attribute(s) and method(s).
+    Creates an API for serving metrics over local HTTP or Unix socket.
+'''
+
+import sys
+from typing import Any, List, Optional, Tuple, Type, Union
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import chmod, stat, unlink
+from socketserver import BaseServer, ThreadingMixIn, UnixStreamServer
+from threading import Thread
+
+try:
+    from ats_utilities.console_io.verbose import verbose_message
+    from daemonpy.metrics_registry import MetricsRegistry
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+Address = Union[int, str, Tuple[str, int]]
+
+
+class UnixHTTPServer(ThreadingMixIn, UnixStreamServer):
+    '''
+        Defines class UnixHTTPServer with attribute(s) and method(s).
+        Creates an API for HTTP server on Unix socket.
+
+        It defines:
+
+            :attributes:
+                | daemon_threads - Request threads do not block exit.
+            :methods:
+                | None
+    '''
+
+    daemon_threads: bool = True
+
+
+class MetricsServer:
+    '''
+        Defines class MetricsServer with attribute(s) and method(s).
+        Creates an API for serving metrics over local HTTP or Unix socket.
+
+        GET /metrics returns registry in text exposition format. TCP
+        port listens on loopback unless host is given, Unix socket
+        (HTTP over stream socket, owner access only) is used when
+        address is path.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | PATH - Metrics endpoint path.
+                | _registry - Exposed metrics registry.
+                | _address - Port | (host, port) | Unix socket path.
+                | _verbose - Enable/Disable verbose option.
+                | _server - HTTP server | None (not serving).
+                | _inode - Inode of bound socket file.
+            :methods:
+                | __init__ - Initials MetricsServer constructor.
+                | address - Property method for getting bound address.
+                | start - Binds socket and starts serving thread.
+                | close - Stops serving, removes socket file.
+                | _handler - Creates request handler class.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::METRICS_SERVER'
+    PATH: str = '/metrics'
+
+    def __init__(
+        self, registry: MetricsRegistry, address: Address,
+        verbose: bool = False
+    ) -> None:
+        '''
+            Initials MetricsServer constructor.
+
+            :param registry: Exposed metrics registry
+            :type registry: <MetricsRegistry>
+            :param address: Port | (host, port) | Unix socket path
+            :type address: <Address>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: None
+        '''
+        self._registry: MetricsRegistry = registry
+        self._address: Address = address
+        self._verbose: bool = verbose
+        self._server: Optional[BaseServer] = None
+        self._inode: int = 0
+
+    @property
+    def address(self) -> Address:
+        '''
+            Property method for getting bound address.
+
+            :return: (host, port) (port 0 is resolved) | socket path
+            :rtype: <Address>
+            :exceptions: None
+        '''
+        if isinstance(self._server, ThreadingHTTPServer):
+            return self._server.server_address[:2]
+        return self._address
+
+    def start(self) -> None:
+        '''
+            Binds socket and starts serving thread.
+
+            :exceptions: OSError
+        '''
+        handler: Type[BaseHTTPRequestHandler] = self._handler()
+        if isinstance(self._address, str):
+            try:
+                unlink(self._address)
+            except FileNotFoundError:
+                pass
+            self._server = UnixHTTPServer(self._address, handler)
+            chmod(self._address, 0o600)
+            self._inode = stat(self._address).st_ino
+        else:
+            address: Tuple[str, int] = ('127.0.0.1', self._address) if (
+                isinstance(self._address, int)
+            ) else self._address
+            self._server = ThreadingHTTPServer(address, handler)
+            self._server.daemon_threads = True
+        Thread(target=self._server.serve_forever, daemon=True).start()
+        verbose_message(
+            self._verbose, [f'{self._P_VERBOSE} serving', self.address]
+        )
+
+    def close(self) -> None:
+        '''
+            Stops serving, removes socket file (unless replaced by
+            other process).
+
+            :exceptions: None
+        '''
+        server: Optional[BaseServer] = self._server
+        self._server = None
+        if server is None:
+            return
+        server.shutdown()
+        server.server_close()
+        if isinstance(self._address, str):
+            try:
+                if stat(self._address).st_ino == self._inode:
+                    unlink(self._address)
+            except OSError:
+                pass
+
+    def _handler(self) -> Type[BaseHTTPRequestHandler]:
+        '''
+            Creates request handler class bound to registry.
+
+            :return: Request handler class
+            :rtype: <Type[BaseHTTPRequestHandler]>
+            :exceptions: None
+        '''
+        registry: MetricsRegistry = self._registry
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            '''Serves GET /metrics (text exposition format).'''
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                '''Sends metrics document or 404.'''
+                if self.path.split('?')[0] != MetricsServer.PATH:
+                    self.send_error(404)
+                    return
+                body: bytes = registry.expose().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', registry.CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def address_string(self) -> str:
+                '''Client address (empty on Unix socket).'''
+                return str(self.client_address or 'unix')
+
+            def log_message(self, *args: Any) -> None:
+                '''Drops access log (console is /dev/null).'''
+
+        return MetricsHandler
@@ -0,0 +1,148 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    param_check.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ParamCheck with attribute(s) and method(s).
+    Creates a decorator for checking parameter types of methods.
+'''
+
+import sys
+import builtins
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
+from functools import wraps
+from inspect import Parameter, signature
+from os import environ
+
+try:
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+Function = TypeVar('Function', bound=Callable[..., Any])
+
+
+class ParamCheck:
+    '''
+        Defines class ParamCheck with attribute(s) and method(s).
+        Creates a decorator for checking parameter types of methods.
+
+        Specs use ATSChecker format ('str:pid', exact type name match)
+        but are parsed and bound to argument positions once, when the
+        method is decorated, so a call costs only a few type() checks.
+        With python -O or DAEMONPY_CHECK_PARAMS=0 in environment the
+        method is returned undecorated (no checking, no overhead).
+
+        It defines:
+
+            :attributes:
+                | ENV_CHECK - Environment variable to disable checking.
+                | ENABLED - Parameter checking status.
+                | _specs - Parsed specs as (name, type name) pairs.
+            :methods:
+                | __init__ - Initials ParamCheck constructor.
+                | __call__ - Decorates method with compiled checks.
+                | _compile - Binds specs to argument positions.
+    '''
+
+    ENV_CHECK: str = 'DAEMONPY_CHECK_PARAMS'
+    ENABLED: bool = __debug__ and environ.get(ENV_CHECK, '1') != '0'
+
+    def __init__(self, *specs: str) -> None:
+        '''
+            Initials ParamCheck constructor.
+
+            :param specs: Parameter specs ('type:name')
+            :type specs: <str>
+            :exceptions: ATSValueError
+        '''
+        self._specs: List[Tuple[str, str]] = []
+        for spec in specs:
+            type_name, _, name = spec.partition(':')
+            if not type_name or not name:
+                raise ATSValueError(f'wrong param spec {spec}')
+            self._specs.append((name, type_name))
+
+    def __call__(self, func: Function) -> Function:
+        '''
+            Decorates method with compiled parameter checks.
+
+            :param func: Method or function to check
+            :type func: <Function>
+            :return: Checking wrapper | func (checking disabled)
+            :rtype: <Function>
+            :exceptions: ATSValueError
+        '''
+        if not self.ENABLED:
+            return func
+        checks: Tuple[Tuple[str, int, Any, str, Any], ...] = self._compile(
+            func
+        )
+        where: str = f'\nmod: {func.__module__}\n  def: {func.__qualname__}()'
+        empty: Any = Parameter.empty
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for name, index, default, type_name, expected in checks:
+                value: Any = args[index] if index < len(args) else kwargs.get(
+                    name, default
+                )
+                if type(value) is not expected and value is not empty:
+                    if type(value).__name__ != type_name:
+                        raise ATSTypeError(
+                            f'{where}\n    expected {name} <{type_name}> '
+                            f'object at {hex(id(value))} wrong type'
+                        )
+            return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+
+    def _compile(
+        self, func: Callable[..., Any]
+    ) -> Tuple[Tuple[str, int, Any, str, Any], ...]:
+        '''
+            Binds specs to argument positions and expected types.
+
+            :param func: Method or function to check
+            :type func: <Callable[..., Any]>
+            :return: Checks (name, index, default, type name, type)
+            :rtype: <Tuple[Tuple[str, int, Any, str, Any], ...]>
+            :exceptions: ATSValueError
+        '''
+        parameters: Dict[str, Parameter] = dict(
+            signature(func).parameters
+        )
+        names: List[str] = list(parameters)
+        checks: List[Tuple[str, int, Any, str, Any]] = []
+        for name, type_name in self._specs:
+            if name not in parameters:
+                raise ATSValueError(f'missing param {name} in {func}')
+            expected: Any = getattr(builtins, type_name, None)
+            checks.append((
+                name, names.index(name), parameters[name].default, type_name,
+                expected if isinstance(expected, type) else None
+            ))
+        return tuple(checks)
@@ -0,0 +1,257 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    placement.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Placement with attribute(s) and method(s).
+    Creates an API for CPU, NUMA and scheduling placement of process.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from glob import glob
+from os import (
+    sched_getaffinity, sched_param, sched_setaffinity, sched_setscheduler,
+    setpriority, PRIO_PROCESS, SCHED_BATCH, SCHED_FIFO, SCHED_IDLE,
+    SCHED_OTHER, SCHED_RR
+)
+from os.path import basename, dirname, join
+from platform import machine
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+try:
+    from ctypes import CDLL, get_errno
+except ImportError:  # pragma: no cover
+    CDLL = None  # pylint: disable=invalid-name
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class Placement:
+    '''
+        Defines class Placement with attribute(s) and method(s).
+        Creates an API for CPU, NUMA and scheduling placement of process.
+
+        CPU set is given explicitly, taken from NUMA node (sysfs) or
+        left as inherited. With per_worker each pre-forked worker is
+        pinned to one CPU of the set (round-robin by worker index).
+        Memory is allocated on the node of pinned CPUs (first touch).
+        Failed steps (EPERM for SCHED_FIFO, ...) are reported and the
+        remaining ones are still applied.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | NODE_PATH - Sysfs NUMA topology directory.
+                | POLICIES - Scheduling policy names.
+                | IO_CLASSES - I/O scheduling class names.
+                | _IOPRIO_SET - ioprio_set system call numbers.
+                | _cpus - CPU set | None (from NUMA node or inherited).
+                | _numa_node - NUMA node | None.
+                | _per_worker - Pin each worker to one CPU.
+                | _policy - Scheduling policy name | None.
+                | _priority - Real-time priority (fifo, rr).
+                | _nice - Nice value | None.
+                | _io_class - I/O scheduling class name | None.
+                | _io_level - I/O priority level (0 highest, 7 lowest).
+            :methods:
+                | __init__ - Initials Placement constructor.
+                | parse_cpulist - Parses kernel CPU list (0-3,8).
+                | numa_nodes - Reads NUMA topology from sysfs.
+                | cpus_for - Gets CPU set for process (or worker).
+                | apply - Applies placement to current process.
+                | _set_ioprio - Sets I/O scheduling class and level.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::PLACEMENT'
+    NODE_PATH: str = '/sys/devices/system/node'
+    POLICIES: Dict[str, int] = {
+        'other': SCHED_OTHER, 'batch': SCHED_BATCH, 'idle': SCHED_IDLE,
+        'fifo': SCHED_FIFO, 'rr': SCHED_RR
+    }
+    IO_CLASSES: Dict[str, int] = {'rt': 1, 'be': 2, 'idle': 3}
+    _IOPRIO_SET: Dict[str, int] = {
+        'x86_64': 251, 'i686': 289, 'aarch64': 30, 'armv7l': 314
+    }
+
+    def __init__(
+        self, cpus: Optional[List[int]] = None,
+        numa_node: Optional[int] = None, per_worker: bool = False,
+        policy: Optional[str] = None, priority: int = 0,
+        nice: Optional[int] = None, io_class: Optional[str] = None,
+        io_level: int = 4
+    ) -> None:
+        '''
+            Initials Placement constructor.
+
+            :param cpus: CPU set | None
+            :type cpus: <Optional[List[int]]>
+            :param numa_node: NUMA node (used without cpus) | None
+            :type numa_node: <Optional[int]>
+            :param per_worker: Pin each worker to one CPU of set
+            :type per_worker: <bool>
+            :param policy: other | batch | idle | fifo | rr | None
+            :type policy: <Optional[str]>
+            :param priority: Real-time priority 1-99 (fifo, rr)
+            :type priority: <int>
+            :param nice: Nice value -20-19 | None
+            :type nice: <Optional[int]>
+            :param io_class: rt | be | idle | None
+            :type io_class: <Optional[str]>
+            :param io_level: I/O priority level 0-7
+            :type io_level: <int>
+            :exceptions: ATSValueError
+        '''
+        if cpus is not None and (not cpus or min(cpus) < 0):
+            raise ATSValueError('cpus must be non-empty and non-negative')
+        if policy is not None and policy not in self.POLICIES:
+            raise ATSValueError(f'unknown scheduling policy {policy}')
+        if (policy in ('fifo', 'rr')) != (1 <= priority <= 99):
+            raise ATSValueError('priority 1-99 is used by fifo and rr only')
+        if nice is not None and not -20 <= nice <= 19:
+            raise ATSValueError('nice must be in range -20-19')
+        if io_class is not None and io_class not in self.IO_CLASSES:
+            raise ATSValueError(f'unknown I/O class {io_class}')
+        if not 0 <= io_level <= 7:
+            raise ATSValueError('I/O level must be in range 0-7')
+        self._cpus: Optional[List[int]] = sorted(set(cpus)) if cpus else None
+        self._numa_node: Optional[int] = numa_node
+        self._per_worker: bool = per_worker
+        self._policy: Optional[str] = policy
+        self._priority: int = priority
+        self._nice: Optional[int] = nice
+        self._io_class: Optional[str] = io_class
+        self._io_level: int = io_level
+
+    @staticmethod
+    def parse_cpulist(cpulist: str) -> List[int]:
+        '''
+            Parses kernel CPU list format (0-3,8,10-11).
+
+            :param cpulist: CPU list
+            :type cpulist: <str>
+            :return: CPU numbers
+            :rtype: <List[int]>
+            :exceptions: ValueError
+        '''
+        cpus: List[int] = []
+        for part in filter(None, cpulist.strip().split(',')):
+            first, _, last = part.partition('-')
+            cpus.extend(range(int(first), int(last or first) + 1))
+        return cpus
+
+    @classmethod
+    def numa_nodes(cls) -> Dict[int, List[int]]:
+        '''
+            Reads NUMA topology from sysfs.
+
+            :return: CPU numbers per NUMA node | empty (not available)
+            :rtype: <Dict[int, List[int]]>
+            :exceptions: None
+        '''
+        nodes: Dict[int, List[int]] = {}
+        for path in glob(join(cls.NODE_PATH, 'node*', 'cpulist')):
+            try:
+                with open(path, encoding='utf-8') as cpulist:
+                    nodes[int(basename(dirname(path))[4:])] = (
+                        cls.parse_cpulist(cpulist.read())
+                    )
+            except (OSError, ValueError):
+                continue
+        return dict(sorted(nodes.items()))
+
+    def cpus_for(self, worker: Optional[int] = None) -> List[int]:
+        '''
+            Gets CPU set for process or worker.
+
+            :param worker: Worker index | None (whole set)
+            :type worker: <Optional[int]>
+            :return: CPU numbers
+            :rtype: <List[int]>
+            :exceptions: ATSValueError (unknown NUMA node)
+        '''
+        cpus: Optional[List[int]] = self._cpus
+        if cpus is None and self._numa_node is not None:
+            cpus = self.numa_nodes().get(self._numa_node)
+            if not cpus:
+                raise ATSValueError(f'unknown NUMA node {self._numa_node}')
+        if cpus is None:
+            cpus = sorted(sched_getaffinity(0))
+        if self._per_worker and worker is not None:
+            return [cpus[worker % len(cpus)]]
+        return cpus
+
+    def apply(self, worker: Optional[int] = None) -> bool:
+        '''
+            Applies placement to current process.
+
+            :param worker: Worker index | None (daemon process)
+            :type worker: <Optional[int]>
+            :return: True (all steps applied) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        status: bool = True
+        steps: List[Any] = []
+        if self._cpus is not None or self._numa_node is not None or all([
+            self._per_worker, worker is not None
+        ]):
+            steps.append(lambda: sched_setaffinity(0, self.cpus_for(worker)))
+        if self._policy is not None:
+            steps.append(lambda: sched_setscheduler(
+                0, self.POLICIES[str(self._policy)],
+                sched_param(self._priority)
+            ))
+        if self._nice is not None:
+            steps.append(lambda: setpriority(PRIO_PROCESS, 0, self._nice))
+        if self._io_class is not None:
+            steps.append(self._set_ioprio)
+        for step in steps:
+            try:
+                step()
+            except (OSError, ATSValueError) as placement_error:
+                error_message([f'{self._P_VERBOSE} {placement_error}'])
+                status = False
+        return status
+
+    def _set_ioprio(self) -> None:
+        '''
+            Sets I/O scheduling class and level (ioprio_set).
+
+            :exceptions: OSError
+        '''
+        number: Optional[int] = self._IOPRIO_SET.get(machine())
+        if CDLL is None or number is None:
+            raise OSError(f'ioprio_set is not supported on {machine()}')
+        ioprio: int = self.IO_CLASSES[str(self._io_class)] << 13
+        ioprio |= self._io_level if self._io_class != 'idle' else 0
+        libc: Any = CDLL(None, use_errno=True)
+        if libc.syscall(number, 1, 0, ioprio) != 0:
+            raise OSError(get_errno(), 'ioprio_set failed')
@@ -0,0 +1,278 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    prefork_daemon.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class PreforkDaemon with attribute(s) and method(s).
+    Creates a daemon with supervised pool of pre-forked workers.
+'''
+
+import sys
+from typing import Dict, List, Optional, Tuple
+from abc import abstractmethod
+from os import close, cpu_count, fork, getpid, kill, wait, _exit
+from signal import signal, SIGHUP, SIGINT, SIGTERM, SIGUSR2, SIG_DFL
+from time import monotonic, sleep
+from traceback import print_exc
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon import Daemon
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class PreforkDaemon(Daemon):
+    '''
+        Defines class PreforkDaemon with attribute(s) and method(s).
+        Creates a daemon with supervised pool of pre-forked workers.
+
+        After daemonizing, the master opens listening sockets (bind_sockets
+        hook), forks workers which inherit them and accept in parallel,
+        and respawns workers which exit while the master is running.
+        Workers are forked before channels (threads of components) are
+        opened, workers drop components of the master.
+        SIGTERM/SIGINT are routed by lifecycle (after drain when it is
+        added): the master forwards the signal to workers and exits
+        after all of them are reaped, a worker exits. SIGHUP (reload)
+        is also forwarded, so reload() runs in master and in every
+        worker.
+        The PID file holds the master PID on the first line followed
+        by one line per worker PID.
+        Placement with per_worker pins each worker to its own CPU.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _RESPAWN_DELAY - Min lifetime before immediate respawn.
+                | _workers_count - Number of worker processes.
+                | _workers - Mapping of worker PID to (index, start time).
+                | _worker - Index of worker process | None (master).
+                | _running - Master supervision status.
+                | _verbose - Enable/Disable verbose option.
+            :methods:
+                | __init__ - Initials PreforkDaemon constructor.
+                | workers_count - Property method for getting pool size.
+                | workers - Property method for getting worker PIDs.
+                | bind_sockets - Opens sockets before fork (hook).
+                | run_daemon - Forks workers, then opens channels.
+                | run - Runs master process supervising workers.
+                | run_worker - Runs worker process (abstract method).
+                | _spawn - Forks one worker process.
+                | _shutdown - Stops master or worker on stop signal.
+                | _forward - Forwards signal to workers.
+                | _write_pids - Writes master and worker PIDs to PID file.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::PREFORK_DAEMON'
+    _RESPAWN_DELAY: float = 1.0
+
+    def __init__(
+        self, pid: str, workers: Optional[int] = None, verbose: bool = False
+    ) -> None:
+        '''
+            Initials PreforkDaemon constructor.
+
+            :param pid: PID file path
+            :type pid: <str>
+            :param workers: Number of workers | None (os.cpu_count())
+            :type workers: <Optional[int]>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        super().__init__(pid, verbose)
+        if workers is not None and workers < 1:
+            raise ATSValueError('workers must be positive')
+        self._workers_count: int = workers or cpu_count() or 1
+        self._workers: Dict[int, Tuple[int, float]] = {}
+        self._worker: Optional[int] = None
+        self._running: bool = False
+        self._verbose: bool = verbose
+        self._lifecycle.handle(SIGHUP, self._forward)
+        for signal_num in (SIGTERM, SIGINT):
+            self._lifecycle.handle(signal_num, self._shutdown, default=True)
+
+    @property
+    def workers_count(self) -> int:
+        '''
+            Property method for getting number of workers.
+
+            :return: Number of worker processes
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._workers_count
+
+    @property
+    def workers(self) -> List[int]:
+        '''
+            Property method for getting worker PIDs.
+
+            :return: Worker process IDs
+            :rtype: <List[int]>
+            :exceptions: None
+        '''
+        return list(self._workers)
+
+    def bind_sockets(self) -> None:
+        '''
+            Opens listening sockets before workers are forked.
+            Override this method and call listen() to share sockets,
+            workers find them in listen_sockets property.
+
+            :exceptions: None
+        '''
+
+    def run_daemon(self) -> None:
+        '''
+            Opens sockets and forks workers before channels are opened
+            (no thread of master holds a lock at fork), then runs master.
+
+            :exceptions: None
+        '''
+        self.bind_sockets()
+        self._running = True
+        for index in range(self._workers_count):
+            self._spawn(index)
+        self._write_pids()
+        super().run_daemon()
+
+    def run(self) -> None:
+        '''
+            Runs master process supervising workers forked by run_daemon.
+
+            :exceptions: None
+        '''
+        while self._workers:
+            try:
+                worker_pid, status = wait()
+            except ChildProcessError:
+                break
+            index, started = self._workers.pop(worker_pid, (-1, 0.0))
+            if self._running and index >= 0:
+                error_message([
+                    f'{self._P_VERBOSE} worker {worker_pid} exited', status
+                ])
+                if monotonic() - started < self._RESPAWN_DELAY:
+                    sleep(self._RESPAWN_DELAY)
+                if self._running:
+                    self._spawn(index)
+                    self._write_pids()
+        for listener in self.listen_sockets:
+            listener.close()
+
+    @abstractmethod
+    def run_worker(self, index: int) -> None:
+        '''
+            Runs worker process.
+            Override this method when subclass self.
+            Shared listening sockets are available in listen_sockets.
+
+            :param index: Worker index in range [0, workers_count)
+            :type index: <int>
+            :exceptions: None
+        '''
+
+    def _spawn(self, index: int) -> None:
+        '''
+            Forks one worker process.
+
+            :param index: Worker index
+            :type index: <int>
+            :exceptions: None
+        '''
+        worker_pid: int = fork()
+        if worker_pid == 0:
+            self._workers = {}
+            self._worker = index
+            self._lifecycle.after_fork()
+            if self._pid_lock is not None:
+                close(self._pid_lock)
+                self._pid_lock = None
+            signal(SIGUSR2, SIG_DFL)
+            if self._placement is not None:
+                self._placement.apply(index)
+            exit_code: int = 0
+            try:
+                self.run_worker(index)
+            except SystemExit as sys_exit:
+                exit_code = sys_exit.code if isinstance(
+                    sys_exit.code, int
+                ) else int(bool(sys_exit.code))
+            except Exception:  # pylint: disable=broad-exception-caught
+                print_exc()
+                exit_code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            _exit(exit_code)
+        verbose_message(
+            self._verbose, [f'{self._P_VERBOSE} worker', index, worker_pid]
+        )
+        self._workers[worker_pid] = (index, monotonic())
+        if not self._running:
+            kill(worker_pid, SIGTERM)
+
+    def _shutdown(self, signal_num: int) -> None:
+        '''
+            Forwards stop signal to workers and stops respawning
+            (default SIGTERM/SIGINT handler), worker exits.
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :exceptions: SystemExit (worker)
+        '''
+        if self._worker is not None:
+            sys.exit(0)
+        self._running = False
+        self._forward(signal_num)
+
+    def _forward(self, signal_num: int) -> None:
+        '''
+            Forwards signal to workers (SIGHUP is routed by lifecycle,
+            master reloads too).
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :exceptions: None
+        '''
+        for worker_pid in list(self._workers):
+            try:
+                kill(worker_pid, signal_num)
+            except ProcessLookupError:
+                pass
+
+    def _write_pids(self) -> None:
+        '''
+            Writes master and worker PIDs to PID file.
+
+            :exceptions: None
+        '''
+        self.write_pid_file([getpid()] + list(self._workers))
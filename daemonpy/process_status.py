@@ -0,0 +1,220 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    process_status.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ProcessStatus with attribute(s) and method(s).
+    Creates an API for reading daemon process status from /proc.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from json import dumps, load
+from os import listdir, sysconf
+from os.path import exists
+
+try:
+    from daemonpy.file_process_id import FileProcessId
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ProcessStatus:
+    '''
+        Defines class ProcessStatus with attribute(s) and method(s).
+        Creates an API for reading daemon process status from /proc.
+
+        Running state comes from PID file lock, process metrics are read
+        directly from /proc/<pid> (no ps/grep), so one probe costs only
+        a few small file reads.
+
+        It defines:
+
+            :attributes:
+                | RUNNING - LSB status code for running daemon (0).
+                | DEAD - LSB status code for dead daemon with PID file (1).
+                | NOT_RUNNING - LSB status code for stopped daemon (3).
+                | _CLK_TCK - Clock ticks per second.
+                | _PAGE_SIZE - Memory page size in bytes.
+                | _STATE - LSB status code names.
+                | exit_code - LSB status code.
+                | pid - Process ID | None.
+                | uptime - Process uptime in seconds | None.
+                | rss - Resident set size in bytes | None.
+                | cpu_time - User and system CPU time in seconds | None.
+                | threads - Number of threads | None.
+                | open_fds - Number of open file descriptors | None.
+                | supervisor - Supervisor statistics | None.
+            :methods:
+                | __init__ - Initials ProcessStatus constructor.
+                | __str__ - Human readable status.
+                | probe - Reads status of daemon owning PID file.
+                | read_proc - Reads process metrics from /proc/<pid>.
+                | read_stats - Reads supervisor statistics file.
+                | to_dict - Status as dictionary.
+                | to_json - Status as JSON document.
+    '''
+
+    RUNNING: int = 0
+    DEAD: int = 1
+    NOT_RUNNING: int = 3
+    _CLK_TCK: int = sysconf('SC_CLK_TCK')
+    _PAGE_SIZE: int = sysconf('SC_PAGE_SIZE')
+    _STATE: Dict[int, str] = {
+        RUNNING: 'running', DEAD: 'dead', NOT_RUNNING: 'not running'
+    }
+
+    def __init__(self, exit_code: int, pid: Optional[int] = None) -> None:
+        '''
+            Initials ProcessStatus constructor.
+
+            :param exit_code: LSB status code
+            :type exit_code: <int>
+            :param pid: Process ID | None
+            :type pid: <Optional[int]>
+            :exceptions: None
+        '''
+        self.exit_code: int = exit_code
+        self.pid: Optional[int] = pid
+        self.uptime: Optional[float] = None
+        self.rss: Optional[int] = None
+        self.cpu_time: Optional[float] = None
+        self.threads: Optional[int] = None
+        self.open_fds: Optional[int] = None
+        self.supervisor: Optional[Dict[str, Any]] = None
+
+    def __str__(self) -> str:
+        '''
+            Human readable status.
+
+            :return: Status lines
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return '\n'.join(
+            f'{key}: {value}' for key, value in self.to_dict().items()
+            if value is not None
+        )
+
+    @classmethod
+    def probe(cls, pid_path: str) -> 'ProcessStatus':
+        '''
+            Reads status of daemon owning PID file.
+
+            :param pid_path: PID file path
+            :type pid_path: <str>
+            :return: Process status
+            :rtype: <ProcessStatus>
+            :exceptions: None
+        '''
+        pid: Optional[int] = None
+        try:
+            with open(pid_path, 'rb') as pid_file:
+                content: List[bytes] = pid_file.read().split()
+            pid = int(content[0]) if content else None
+        except (OSError, ValueError):
+            pass
+        status: ProcessStatus = cls(cls.RUNNING, pid)
+        if not FileProcessId.is_running(pid_path):
+            status.exit_code = cls.DEAD if exists(
+                pid_path
+            ) else cls.NOT_RUNNING
+        elif pid is not None:
+            status.read_proc()
+        status.read_stats(FileProcessId.sibling_path(pid_path, '.stats'))
+        return status
+
+    def read_proc(self) -> bool:
+        '''
+            Reads process metrics from /proc/<pid>.
+
+            :return: True (metrics collected) | False (process missing)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        try:
+            with open(f'/proc/{self.pid}/stat', 'rb') as stat_file:
+                stat: List[bytes] = stat_file.read().rsplit(b')')[-1].split()
+            with open('/proc/uptime', 'rb') as uptime_file:
+                system_uptime: float = float(uptime_file.read().split()[0])
+        except (OSError, IndexError, ValueError):
+            return False
+        self.cpu_time = (int(stat[11]) + int(stat[12])) / self._CLK_TCK
+        self.threads = int(stat[17])
+        self.uptime = round(system_uptime - int(stat[19]) / self._CLK_TCK, 2)
+        self.rss = int(stat[21]) * self._PAGE_SIZE
+        try:
+            self.open_fds = len(listdir(f'/proc/{self.pid}/fd'))
+        except OSError:
+            self.open_fds = None
+        return True
+
+    def read_stats(self, stats_path: str) -> bool:
+        '''
+            Reads supervisor statistics file (kept after crash loop).
+
+            :param stats_path: Statistics file path
+            :type stats_path: <str>
+            :return: True (statistics loaded) | False (not supervised)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        try:
+            with open(stats_path, 'r', encoding='utf-8') as stats_file:
+                self.supervisor = load(stats_file)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        '''
+            Status as dictionary.
+
+            :return: Status fields
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        return {
+            'status': self._STATE.get(self.exit_code, 'unknown'),
+            'exit_code': self.exit_code,
+            'pid': self.pid,
+            'uptime': self.uptime,
+            'rss': self.rss,
+            'cpu_time': self.cpu_time,
+            'threads': self.threads,
+            'open_fds': self.open_fds,
+            'supervisor': self.supervisor
+        }
+
+    def to_json(self) -> str:
+        '''
+            Status as JSON document.
+
+            :return: JSON status
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return dumps(self.to_dict(), separators=(',', ':'))
@@ -0,0 +1,237 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    process_waiter.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ProcessWaiter with attribute(s) and method(s).
+    Creates an API for waiting on Unix Like OS process exit.
+'''
+
+from typing import Dict, List, Optional
+from os import close, kill, waitpid, WNOHANG
+from select import epoll, poll, EPOLLIN, POLLIN
+from time import monotonic, sleep
+
+try:
+    from os import pidfd_open
+except ImportError:  # pragma: no cover
+    pidfd_open = None  # pylint: disable=invalid-name
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ProcessWaiter:
+    '''
+        Defines class ProcessWaiter with attribute(s) and method(s).
+        Creates an API for waiting on Unix Like OS process exit.
+
+        Process exit is observed through a pidfd (Linux >= 5.3), which
+        becomes readable when the process terminates, so the waiter is
+        woken exactly once at the moment of exit. When pidfd is not
+        available the waiter falls back to probing with exponential backoff.
+
+        It defines:
+
+            :attributes:
+                | _BACKOFF_START - First probe delay for fallback (seconds).
+                | _BACKOFF_MAX - Upper bound of probe delay (seconds).
+                | _pidfd_support - Process file descriptor support status.
+            :methods:
+                | __init__ - Initials ProcessWaiter constructor.
+                | pidfd_support - Property method for getting pidfd status.
+                | is_alive - Checks is process alive.
+                | wait - Waits for process exit with optional timeout.
+                | wait_all - Waits for exit of many processes concurrently.
+    '''
+
+    _BACKOFF_START: float = 0.001
+    _BACKOFF_MAX: float = 0.1
+
+    def __init__(self) -> None:
+        '''
+            Initials ProcessWaiter constructor.
+
+            :exceptions: None
+        '''
+        self._pidfd_support: bool = pidfd_open is not None
+
+    @property
+    def pidfd_support(self) -> bool:
+        '''
+            Property method for getting pidfd support status.
+
+            :return: Process file descriptor support status
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._pidfd_support
+
+    @staticmethod
+    def is_alive(pid: int) -> bool:
+        '''
+            Checks is process alive (reaps it if it is our zombie child).
+
+            :param pid: Process ID
+            :type pid: <int>
+            :return: True (process exists) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        try:
+            if waitpid(pid, WNOHANG)[0] == pid:
+                return False
+        except ChildProcessError:
+            pass
+        try:
+            kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def wait(self, pid: int, timeout: Optional[float] = None) -> bool:
+        '''
+            Waits for process exit.
+
+            :param pid: Process ID
+            :type pid: <int>
+            :param timeout: Max time to wait in seconds | None (forever)
+            :type timeout: <Optional[float]>
+            :return: True (process exited) | False (timeout expired)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if self._pidfd_support:
+            try:
+                pidfd: int = pidfd_open(pid)  # type: ignore[misc]
+            except ProcessLookupError:
+                return True
+            except OSError:
+                self._pidfd_support = False
+            else:
+                try:
+                    poller = poll()
+                    poller.register(pidfd, POLLIN)
+                    wait_ms: Optional[float] = None
+                    if timeout is not None:
+                        wait_ms = max(timeout, 0.0) * 1000.0
+                    exited: bool = bool(poller.poll(wait_ms))
+                    if exited:
+                        self.is_alive(pid)
+                    return exited
+                finally:
+                    close(pidfd)
+        return self._wait_backoff(pid, timeout)
+
+    def wait_all(
+        self, pids: List[int], timeout: Optional[float] = None
+    ) -> Dict[int, float]:
+        '''
+            Waits for exit of many processes concurrently.
+            All pidfds are registered in one epoll set, so total wait
+            time is bounded by the slowest process, not the sum.
+
+            :param pids: Process IDs
+            :type pids: <List[int]>
+            :param timeout: Max time to wait in seconds | None (forever)
+            :type timeout: <Optional[float]>
+            :return: Mapping of exited PID to monotonic exit time
+            :rtype: <Dict[int, float]>
+            :exceptions: None
+        '''
+        deadline: Optional[float] = None
+        if timeout is not None:
+            deadline = monotonic() + max(timeout, 0.0)
+        exited: Dict[int, float] = {}
+        pending: Dict[int, int] = {}
+        if self._pidfd_support:
+            for pid in pids:
+                try:
+                    pending[pidfd_open(pid)] = pid  # type: ignore[misc]
+                except ProcessLookupError:
+                    exited[pid] = monotonic()
+                except OSError:
+                    break
+        unwatched: List[int] = [
+            pid for pid in pids
+            if pid not in exited and pid not in pending.values()
+        ]
+        delay: float = self._BACKOFF_START
+        poller = epoll()
+        try:
+            for pidfd in pending:
+                poller.register(pidfd, EPOLLIN)
+            while pending or unwatched:
+                wait_time: float = -1.0
+                if unwatched:
+                    wait_time = delay
+                    delay = min(delay * 2.0, self._BACKOFF_MAX)
+                if deadline is not None:
+                    remaining: float = max(deadline - monotonic(), 0.0)
+                    wait_time = remaining if wait_time < 0 else min(
+                        wait_time, remaining
+                    )
+                for pidfd, _ in poller.poll(wait_time):
+                    poller.unregister(pidfd)
+                    close(pidfd)
+                    pid = pending.pop(pidfd)
+                    self.is_alive(pid)
+                    exited[pid] = monotonic()
+                for pid in list(unwatched):
+                    if not self.is_alive(pid):
+                        unwatched.remove(pid)
+                        exited[pid] = monotonic()
+                if deadline is not None and monotonic() >= deadline:
+                    break
+        finally:
+            for pidfd in pending:
+                close(pidfd)
+            poller.close()
+        return exited
+
+    def _wait_backoff(self, pid: int, timeout: Optional[float]) -> bool:
+        '''
+            Waits for process exit by probing with exponential backoff.
+
+            :param pid: Process ID
+            :type pid: <int>
+            :param timeout: Max time to wait in seconds | None (forever)
+            :type timeout: <Optional[float]>
+            :return: True (process exited) | False (timeout expired)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        deadline: Optional[float] = None
+        if timeout is not None:
+            deadline = monotonic() + max(timeout, 0.0)
+        delay: float = self._BACKOFF_START
+        while self.is_alive(pid):
+            if deadline is not None:
+                remaining: float = deadline - monotonic()
+                if remaining <= 0.0:
+                    return False
+                delay = min(delay, remaining)
+            sleep(delay)
+            delay = min(delay * 2.0, self._BACKOFF_MAX)
+        return True
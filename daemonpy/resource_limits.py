@@ -0,0 +1,243 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    resource_limits.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ResourceLimits with attribute(s) and method(s).
+    Creates an API for resource limits and cgroup v2 placement of process.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Union
+from os import access, getpid, makedirs, W_OK
+from os.path import dirname, exists, isabs, join, normpath
+from resource import (
+    getrlimit, setrlimit, RLIM_INFINITY, RLIMIT_AS, RLIMIT_CORE,
+    RLIMIT_NOFILE
+)
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ResourceLimits:
+    '''
+        Defines class ResourceLimits with attribute(s) and method(s).
+        Creates an API for resource limits and cgroup v2 placement of process.
+
+        Soft limits are set by setrlimit (nofile 'max' raises it to the
+        hard limit), hard limits are kept so they can be raised again.
+        RSS is limited by cgroup memory.max (Linux ignores RLIMIT_RSS).
+        Cgroup (path under cgroup v2 mount) and its missing ancestors are
+        created, controllers are enabled from the delegation root (the
+        deepest existing ancestor) down, memory.max and cpu.max are set
+        and process is moved into it, when cgroup fs is writable.
+        Failed steps are reported, remaining are applied.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | CGROUP_ROOT - Cgroup v2 mount point.
+                | CPU_PERIOD - Cgroup cpu.max period (microseconds).
+                | _rlimits - Soft limits by resource.
+                | _cgroup - Cgroup path | None.
+                | _cgroup_files - Cgroup controller files with values.
+            :methods:
+                | __init__ - Initials ResourceLimits constructor.
+                | cgroup - Property method for getting cgroup path.
+                | apply - Applies limits to current process.
+                | _set_rlimit - Sets soft limit of resource.
+                | _join_cgroup - Creates cgroup and moves process in it.
+                | _write - Writes value to cgroup file.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::RESOURCE_LIMITS'
+    CGROUP_ROOT: str = '/sys/fs/cgroup'
+    CPU_PERIOD: int = 100000
+
+    def __init__(
+        self, nofile: Union[int, str, None] = None,
+        address_space: Optional[int] = None, core: Optional[int] = None,
+        cgroup: Optional[str] = None, memory_max: Optional[int] = None,
+        cpu_max: Optional[float] = None
+    ) -> None:
+        '''
+            Initials ResourceLimits constructor.
+
+            :param nofile: Max open files | 'max' (hard limit) | None
+            :type nofile: <Union[int, str, None]>
+            :param address_space: Max virtual memory (bytes) | None
+            :type address_space: <Optional[int]>
+            :param core: Max core dump size (bytes, 0 disables) | None
+            :type core: <Optional[int]>
+            :param cgroup: Cgroup path (relative to cgroup root) | None
+            :type cgroup: <Optional[str]>
+            :param memory_max: Cgroup memory limit (bytes) | None
+            :type memory_max: <Optional[int]>
+            :param cpu_max: Cgroup CPU limit (number of CPUs) | None
+            :type cpu_max: <Optional[float]>
+            :exceptions: ATSValueError
+        '''
+        if isinstance(nofile, str) and nofile != 'max':
+            raise ATSValueError(f'nofile must be number or max, not {nofile}')
+        values: List[Any] = [nofile, address_space, core, memory_max, cpu_max]
+        if any(
+            isinstance(value, (int, float)) and value < 0 for value in values
+        ):
+            raise ATSValueError('resource limits must be non-negative')
+        if cgroup is None and (memory_max is not None or cpu_max is not None):
+            raise ATSValueError('memory_max and cpu_max need cgroup')
+        self._rlimits: Dict[int, Union[int, str]] = {
+            resource: limit for resource, limit in (
+                (RLIMIT_NOFILE, nofile), (RLIMIT_AS, address_space),
+                (RLIMIT_CORE, core)
+            ) if limit is not None
+        }
+        self._cgroup: Optional[str] = None
+        if cgroup is not None:
+            self._cgroup = normpath(
+                cgroup if isabs(cgroup) else join(self.CGROUP_ROOT, cgroup)
+            )
+        self._cgroup_files: List[Tuple[str, str]] = []
+        if memory_max is not None:
+            self._cgroup_files.append(('memory.max', str(memory_max)))
+        if cpu_max is not None:
+            quota: int = int(cpu_max * self.CPU_PERIOD)
+            self._cgroup_files.append(
+                ('cpu.max', f'{quota} {self.CPU_PERIOD}')
+            )
+
+    @property
+    def cgroup(self) -> Optional[str]:
+        '''
+            Property method for getting cgroup path.
+
+            :return: Cgroup directory | None (not used)
+            :rtype: <Optional[str]>
+            :exceptions: None
+        '''
+        return self._cgroup
+
+    def apply(self) -> bool:
+        '''
+            Applies resource limits and cgroup to current process.
+
+            :return: True (all steps applied) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        status: bool = True
+        for resource, limit in self._rlimits.items():
+            status = self._set_rlimit(resource, limit) and status
+        if self._cgroup is not None:
+            status = self._join_cgroup(self._cgroup) and status
+        return status
+
+    def _set_rlimit(self, resource: int, limit: Union[int, str]) -> bool:
+        '''
+            Sets soft limit of resource (hard limit is kept).
+
+            :param resource: Resource (RLIMIT_*)
+            :type resource: <int>
+            :param limit: Soft limit | 'max' (hard limit)
+            :type limit: <Union[int, str]>
+            :return: True (limit set) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        hard: int = getrlimit(resource)[1]
+        soft: int = hard if limit == 'max' else int(limit)
+        if hard != RLIM_INFINITY and soft > hard:
+            error_message([
+                f'{self._P_VERBOSE} limit {soft} over hard limit {hard}'
+            ])
+            soft = hard
+        try:
+            setrlimit(resource, (soft, hard))
+        except (OSError, ValueError) as limit_error:
+            error_message([f'{self._P_VERBOSE} {limit_error}'])
+            return False
+        return soft == limit or limit == 'max'
+
+    def _join_cgroup(self, cgroup: str) -> bool:
+        '''
+            Creates cgroup (and missing ancestors) with limits and moves
+            current process in it.
+
+            :param cgroup: Cgroup directory
+            :type cgroup: <str>
+            :return: True (process moved to cgroup) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        parents: List[str] = [dirname(cgroup)]
+        while not exists(parents[-1]):
+            parents.append(dirname(parents[-1]))
+        if not access(parents[-1], W_OK):
+            error_message([f'{self._P_VERBOSE} cgroup fs is not writable'])
+            return False
+        try:
+            makedirs(cgroup, exist_ok=True)
+        except OSError as os_error:
+            error_message([f'{self._P_VERBOSE} {os_error}'])
+            return False
+        status: bool = True
+        controllers: str = ' '.join(
+            f'+{name.split(".")[0]}' for name, _ in self._cgroup_files
+        )
+        for parent in reversed(parents if controllers else []):
+            status = self._write(
+                join(parent, 'cgroup.subtree_control'), controllers
+            ) and status
+        for name, value in self._cgroup_files:
+            status = self._write(join(cgroup, name), value) and status
+        return self._write(join(cgroup, 'cgroup.procs'), str(getpid())) and (
+            status
+        )
+
+    def _write(self, path: str, value: str) -> bool:
+        '''
+            Writes value to cgroup file.
+
+            :param path: Cgroup file path
+            :type path: <str>
+            :param value: Value
+            :type value: <str>
+            :return: True (written) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        try:
+            with open(path, 'w', encoding='utf-8') as cgroup_file:
+                cgroup_file.write(value)
+        except OSError as os_error:
+            error_message([f'{self._P_VERBOSE} {os_error}'])
+            return False
+        return True
@@ -0,0 +1,244 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    sampling_profiler.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class SamplingProfiler with attribute(s) and method(s).
+    Creates an API for sampling stacks of running process.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from os import replace
+from os.path import basename
+from signal import setitimer, signal, ITIMER_PROF, SIGPROF
+from threading import enumerate as threads, get_ident, main_thread, RLock
+from threading import Timer
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class SamplingProfiler:
+    '''
+        Defines class SamplingProfiler with attribute(s) and method(s).
+        Creates an API for sampling stacks of running process.
+
+        ITIMER_PROF timer sends SIGPROF per interval of CPU time used
+        by process, handler (main thread) records stacks of main thread
+        (or of all threads) from sys._current_frames(). After duration
+        timer is stopped and stacks are written in collapsed format
+        (frame;frame;frame count) for flamegraph tools. When not
+        profiling there is no timer and the installed handler is idle.
+
+        It defines:
+
+            :attributes:
+                | _interval - Sampling interval (CPU seconds).
+                | _stacks - Sample count by collapsed stack.
+                | _all_threads - Sample all threads (else main thread).
+                | _output - Output file path | None.
+                | _timer - Timer which ends profiling | None.
+                | _lock - Guards start, stop and samples (reentrant).
+                | _sampling - Sample is being recorded on main thread.
+            :methods:
+                | __init__ - Initials SamplingProfiler constructor.
+                | active - Property method for getting profiling status.
+                | install - Installs SIGPROF handler (main thread).
+                | start - Starts sampling for duration.
+                | stop - Stops sampling, writes collapsed stacks.
+                | collapse - Formats stack as collapsed line.
+                | _sample - Records stacks on SIGPROF.
+                | _record - Adds one sample of stacks.
+    '''
+
+    def __init__(self, interval: float = 0.01) -> None:
+        '''
+            Initials SamplingProfiler constructor.
+
+            :param interval: Sampling interval (CPU seconds)
+            :type interval: <float>
+            :exceptions: ATSValueError
+        '''
+        if interval <= 0:
+            raise ATSValueError('sampling interval must be positive')
+        self._interval: float = interval
+        self._stacks: Dict[str, int] = {}
+        self._all_threads: bool = False
+        self._output: Optional[str] = None
+        self._timer: Optional[Timer] = None
+        self._lock: RLock = RLock()
+        self._sampling: bool = False
+
+    @property
+    def active(self) -> bool:
+        '''
+            Property method for getting profiling status.
+
+            :return: True (sampling) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._output is not None
+
+    def install(self) -> None:
+        '''
+            Installs SIGPROF handler, call on main thread.
+
+            :exceptions: ValueError (not main thread)
+        '''
+        signal(SIGPROF, self._sample)
+
+    def start(
+        self, duration: float, output: str, all_threads: bool = False
+    ) -> bool:
+        '''
+            Starts sampling for duration (any thread, after install).
+
+            :param duration: Profiling time (wall clock seconds)
+            :type duration: <float>
+            :param output: Collapsed stacks file path
+            :type output: <str>
+            :param all_threads: Sample all threads (else main thread)
+            :type all_threads: <bool>
+            :return: True (started) | False (already profiling)
+            :rtype: <bool>
+            :exceptions: ATSValueError
+        '''
+        if duration <= 0:
+            raise ATSValueError('profiling duration must be positive')
+        with self._lock:
+            if self._output is not None:
+                return False
+            self._stacks = {}
+            self._all_threads = all_threads
+            self._output = output
+            self._timer = Timer(duration, self.stop)
+            self._timer.daemon = True
+            self._timer.start()
+            setitimer(ITIMER_PROF, self._interval, self._interval)
+        return True
+
+    def stop(self) -> Optional[str]:
+        '''
+            Stops sampling, writes collapsed stacks (sorted by count).
+
+            :return: Output file path | None (not profiling)
+            :rtype: <Optional[str]>
+            :exceptions: OSError
+        '''
+        with self._lock:
+            output: Optional[str] = self._output
+            if output is None:
+                return None
+            setitimer(ITIMER_PROF, 0)
+            self._output = None
+            if self._timer is not None and self._timer.ident != get_ident():
+                self._timer.cancel()
+            self._timer = None
+            stacks: Dict[str, int] = self._stacks
+            self._stacks = {}
+        with open(f'{output}.tmp', 'w', encoding='utf-8') as output_file:
+            for stack, count in sorted(
+                stacks.items(), key=lambda item: -item[1]
+            ):
+                output_file.write(f'{stack} {count}\n')
+        replace(f'{output}.tmp', output)
+        return output
+
+    @staticmethod
+    def collapse(frame: Any, root: str) -> str:
+        '''
+            Formats stack as collapsed line (outermost frame first).
+
+            :param frame: Innermost frame
+            :type frame: <Any>
+            :param root: Root frame name (thread name)
+            :type root: <str>
+            :return: Frames joined by semicolon
+            :rtype: <str>
+            :exceptions: None
+        '''
+        frames: List[str] = []
+        while frame is not None:
+            code: Any = frame.f_code
+            name: str = getattr(code, 'co_qualname', code.co_name)
+            frames.append(
+                f'{name} '
+                f'({basename(code.co_filename)}:{frame.f_lineno})'
+            )
+            frame = frame.f_back
+        frames.append(root)
+        return ';'.join(reversed(frames))
+
+    def _sample(self, signal_num: int, frame: Any) -> None:
+        '''
+            Records stacks on SIGPROF (main thread).
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :param frame: Interrupted frame of main thread
+            :type frame: <Any>
+            :exceptions: None
+        '''
+        if not self._lock.acquire(blocking=False):
+            return  # start or stop in progress on other thread
+        try:
+            if self._output is None or self._sampling:
+                return  # not profiling (or re-entered while recording)
+            self._sampling = True
+            try:
+                self._record(frame)
+            finally:
+                self._sampling = False
+        finally:
+            self._lock.release()
+
+    def _record(self, frame: Any) -> None:
+        '''
+            Adds one sample of stacks (caller holds lock).
+
+            :param frame: Interrupted frame of main thread
+            :type frame: <Any>
+            :exceptions: None
+        '''
+        stacks: Dict[str, int] = self._stacks
+        main: Any = main_thread()
+        frames: Dict[int, Any] = {main.ident or 0: frame}
+        names: Dict[int, str] = {main.ident or 0: main.name}
+        if self._all_threads:
+            current: Dict[int, Any] = sys._current_frames()
+            for thread_id, thread_frame in current.items():
+                frames.setdefault(thread_id, thread_frame)
+            for thread in threads():
+                names.setdefault(thread.ident or 0, thread.name)
+        for thread_id, thread_frame in frames.items():
+            stack: str = self.collapse(
+                thread_frame, names.get(thread_id, str(thread_id))
+            )
+            stacks[stack] = stacks.get(stack, 0) + 1
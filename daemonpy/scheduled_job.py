@@ -0,0 +1,271 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    scheduled_job.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ScheduledJob with attribute(s) and method(s).
+    Creates an API for job of periodic task scheduler.
+'''
+
+import sys
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime
+from math import floor
+from random import uniform
+from threading import Lock
+from time import monotonic, perf_counter, time
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.cron import CronSchedule
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ScheduledJob:
+    '''
+        Defines class ScheduledJob with attribute(s) and method(s).
+        Creates an API for job of periodic task scheduler.
+
+        Interval jobs are due at fixed steps from the first due time
+        (no drift), missed steps are skipped instead of run in burst.
+        Cron jobs are due at next matching wall clock minute. One-shot
+        jobs are due once. Without overlap a job which is still running
+        when due again is skipped. Timing stats are in seconds.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _name - Job name.
+                | _func - Job callable.
+                | _interval - Interval (seconds) | None.
+                | _cron - Cron schedule | None.
+                | _jitter - Max random delay of each run (seconds).
+                | _overlap - Allow concurrent runs of job.
+                | _cancelled - Job is cancelled.
+                | _running - Number of running executions.
+                | _lock - Guards running counter and stats.
+                | _stats - Timing stats.
+            :methods:
+                | __init__ - Initials ScheduledJob constructor.
+                | name - Property method for getting job name.
+                | cancelled - Property method for getting cancel status.
+                | running - Property method for getting running count.
+                | stats - Property method for getting timing stats.
+                | cancel - Cancels job (no more runs).
+                | next_due - Computes next due time (monotonic).
+                | run_time - Adds random jitter to due time.
+                | admit - Admits execution (overlap prevention).
+                | execute - Executes job and records timing.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::SCHEDULED_JOB'
+
+    def __init__(
+        self,
+        func: Callable[[], Any],
+        name: Optional[str] = None,
+        interval: Optional[float] = None,
+        cron: Optional[CronSchedule] = None,
+        jitter: float = 0.0,
+        overlap: bool = False
+    ) -> None:
+        '''
+            Initials ScheduledJob constructor.
+
+            :param func: Job callable
+            :type func: <Callable[[], Any]>
+            :param name: Job name | None (callable name)
+            :type name: <Optional[str]>
+            :param interval: Interval (seconds) | None (cron or one-shot)
+            :type interval: <Optional[float]>
+            :param cron: Cron schedule | None
+            :type cron: <Optional[CronSchedule]>
+            :param jitter: Max random delay of each run (seconds)
+            :type jitter: <float>
+            :param overlap: Allow concurrent runs of job
+            :type overlap: <bool>
+            :exceptions: ATSValueError
+        '''
+        if not callable(func):
+            raise ATSValueError(f'job {func} is not callable')
+        if interval is not None and interval <= 0:
+            raise ATSValueError('job interval must be positive')
+        if jitter < 0:
+            raise ATSValueError('job jitter must be non-negative')
+        self._name: str = name or getattr(func, '__name__', 'job')
+        self._func: Callable[[], Any] = func
+        self._interval: Optional[float] = interval
+        self._cron: Optional[CronSchedule] = cron
+        self._jitter: float = jitter
+        self._overlap: bool = overlap
+        self._cancelled: bool = False
+        self._running: int = 0
+        self._lock: Lock = Lock()
+        self._stats: Dict[str, float] = {
+            'runs': 0, 'failures': 0, 'skipped': 0, 'last': 0.0,
+            'total': 0.0, 'max': 0.0, 'lateness': 0.0
+        }
+
+    @property
+    def name(self) -> str:
+        '''
+            Property method for getting job name.
+
+            :return: Job name
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return self._name
+
+    @property
+    def cancelled(self) -> bool:
+        '''
+            Property method for getting cancel status.
+
+            :return: True (cancelled) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._cancelled
+
+    @property
+    def running(self) -> int:
+        '''
+            Property method for getting number of running executions.
+
+            :return: Running executions
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._running
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        '''
+            Property method for getting timing stats (runs, failures,
+            skipped, last, mean, max duration, last lateness).
+
+            :return: Timing stats (seconds)
+            :rtype: <Dict[str, float]>
+            :exceptions: None
+        '''
+        with self._lock:
+            stats: Dict[str, float] = dict(self._stats)
+        total: float = stats.pop('total')
+        stats['mean'] = total / stats['runs'] if stats['runs'] else 0.0
+        return stats
+
+    def cancel(self) -> None:
+        '''
+            Cancels job, running execution is finished.
+
+            :exceptions: None
+        '''
+        self._cancelled = True
+
+    def next_due(
+        self, previous: Optional[float], now: float
+    ) -> Optional[float]:
+        '''
+            Computes next due time.
+
+            :param previous: Previous due time | None (first run)
+            :type previous: <Optional[float]>
+            :param now: Current time (monotonic)
+            :type now: <float>
+            :return: Due time (monotonic) | None (no more runs)
+            :rtype: <Optional[float]>
+            :exceptions: None
+        '''
+        if self._cancelled:
+            return None
+        if self._cron is not None:
+            wall: float = time()
+            return now + self._cron.next(
+                datetime.fromtimestamp(wall)
+            ).timestamp() - wall
+        if self._interval is None or previous is None:
+            return None
+        steps: int = max(floor((now - previous) / self._interval), 0) + 1
+        return previous + steps * self._interval
+
+    def run_time(self, due: float) -> float:
+        '''
+            Adds random jitter to due time (spreads load of jobs).
+
+            :param due: Due time (monotonic)
+            :type due: <float>
+            :return: Run time (monotonic)
+            :rtype: <float>
+            :exceptions: None
+        '''
+        return due + uniform(0.0, self._jitter) if self._jitter else due
+
+    def admit(self) -> bool:
+        '''
+            Admits execution, skips it when job is still running
+            (without overlap).
+
+            :return: True (admitted, call execute) | False (skipped)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        with self._lock:
+            if self._running and not self._overlap:
+                self._stats['skipped'] += 1
+                return False
+            self._running += 1
+            return True
+
+    def execute(self, due: float) -> None:
+        '''
+            Executes admitted job, records duration and lateness.
+            Exception of job is reported and counted as failure.
+
+            :param due: Due time (monotonic)
+            :type due: <float>
+            :exceptions: None
+        '''
+        lateness: float = max(monotonic() - due, 0.0)
+        start: float = perf_counter()
+        failed: bool = False
+        try:
+            self._func()
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            failed = True
+            error_message([f'{self._P_VERBOSE} {self._name}: {error}'])
+        duration: float = perf_counter() - start
+        with self._lock:
+            self._running -= 1
+            self._stats['runs'] += 1
+            self._stats['failures'] += int(failed)
+            self._stats['last'] = duration
+            self._stats['total'] += duration
+            self._stats['max'] = max(self._stats['max'], duration)
+            self._stats['lateness'] = lateness
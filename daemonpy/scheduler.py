@@ -0,0 +1,297 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    scheduler.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Scheduler with attribute(s) and method(s).
+    Creates an API for periodic task scheduler of daemon run loop.
+'''
+
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition
+from time import monotonic
+
+try:
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.cron import CronSchedule
+    from daemonpy.scheduled_job import ScheduledJob
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class Scheduler:
+    '''
+        Defines class Scheduler with attribute(s) and method(s).
+        Creates an API for periodic task scheduler of daemon run loop.
+
+        Jobs are kept in heap ordered by due time, run() (called from
+        Daemon.run) sleeps until the earliest job is due, so there are
+        no idle wakeups, and submits due jobs to thread pool. Adding or
+        cancelling job and stop() wake it up. run() returns on stop()
+        or exception (SystemExit from SIGTERM handler interrupts the
+        wait), after running jobs finish, queued executions are dropped.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _workers - Thread pool size.
+                | _verbose - Enable/Disable verbose option.
+                | _heap - Heap of (run time, sequence, job, due time).
+                | _sequence - Tie breaker of heap entries.
+                | _condition - Guards heap, wakes up timer.
+                | _jobs - Scheduled jobs by name.
+                | _stopping - Stop requested.
+                | _wakeups - Number of timer wakeups.
+            :methods:
+                | __init__ - Initials Scheduler constructor.
+                | wakeups - Property method for getting timer wakeups.
+                | every - Schedules interval job.
+                | cron - Schedules cron-like job.
+                | once - Schedules one-shot job.
+                | cancel - Cancels job.
+                | stats - Collects timing stats of jobs.
+                | stop - Stops scheduler.
+                | run - Runs scheduler until stopped.
+                | _add - Adds job with first due time.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::SCHEDULER'
+
+    def __init__(self, workers: int = 4, verbose: bool = False) -> None:
+        '''
+            Initials Scheduler constructor.
+
+            :param workers: Thread pool size (concurrent jobs)
+            :type workers: <int>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSValueError
+        '''
+        if workers < 1:
+            raise ATSValueError('scheduler needs at least one worker')
+        self._workers: int = workers
+        self._verbose: bool = verbose
+        self._heap: List[Tuple[float, int, ScheduledJob, float]] = []
+        self._sequence: Any = count()
+        self._condition: Condition = Condition()
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._stopping: bool = False
+        self._wakeups: int = 0
+
+    @property
+    def wakeups(self) -> int:
+        '''
+            Property method for getting number of timer wakeups.
+
+            :return: Timer wakeups
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._wakeups
+
+    def every(
+        self, interval: float, func: Callable[[], Any],
+        name: Optional[str] = None, jitter: float = 0.0,
+        overlap: bool = False, delay: Optional[float] = None
+    ) -> ScheduledJob:
+        '''
+            Schedules interval job.
+
+            :param interval: Interval (seconds)
+            :type interval: <float>
+            :param func: Job callable
+            :type func: <Callable[[], Any]>
+            :param name: Job name | None (callable name)
+            :type name: <Optional[str]>
+            :param jitter: Max random delay of each run (seconds)
+            :type jitter: <float>
+            :param overlap: Allow concurrent runs of job
+            :type overlap: <bool>
+            :param delay: First run delay | None (one interval)
+            :type delay: <Optional[float]>
+            :return: Scheduled job
+            :rtype: <ScheduledJob>
+            :exceptions: ATSValueError
+        '''
+        return self._add(
+            ScheduledJob(func, name, interval, None, jitter, overlap),
+            interval if delay is None else delay
+        )
+
+    def cron(
+        self, expression: str, func: Callable[[], Any],
+        name: Optional[str] = None, jitter: float = 0.0,
+        overlap: bool = False
+    ) -> ScheduledJob:
+        '''
+            Schedules cron-like job (local wall clock time).
+
+            :param expression: Cron expression (5 fields) | alias
+            :type expression: <str>
+            :param func: Job callable
+            :type func: <Callable[[], Any]>
+            :param name: Job name | None (callable name)
+            :type name: <Optional[str]>
+            :param jitter: Max random delay of each run (seconds)
+            :type jitter: <float>
+            :param overlap: Allow concurrent runs of job
+            :type overlap: <bool>
+            :return: Scheduled job
+            :rtype: <ScheduledJob>
+            :exceptions: ATSValueError
+        '''
+        return self._add(ScheduledJob(
+            func, name, None, CronSchedule(expression), jitter, overlap
+        ), None)
+
+    def once(
+        self, delay: float, func: Callable[[], Any],
+        name: Optional[str] = None
+    ) -> ScheduledJob:
+        '''
+            Schedules one-shot job.
+
+            :param delay: Run delay (seconds)
+            :type delay: <float>
+            :param func: Job callable
+            :type func: <Callable[[], Any]>
+            :param name: Job name | None (callable name)
+            :type name: <Optional[str]>
+            :return: Scheduled job
+            :rtype: <ScheduledJob>
+            :exceptions: ATSValueError
+        '''
+        return self._add(ScheduledJob(func, name), delay)
+
+    def cancel(self, name: str) -> bool:
+        '''
+            Cancels job, running execution is finished.
+
+            :param name: Job name
+            :type name: <str>
+            :return: True (cancelled) | False (no such job)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        with self._condition:
+            job: Optional[ScheduledJob] = self._jobs.pop(name, None)
+            if job is not None:
+                job.cancel()
+                self._condition.notify()
+        return job is not None
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        '''
+            Collects timing stats of scheduled jobs.
+
+            :return: Timing stats by job name
+            :rtype: <Dict[str, Dict[str, float]]>
+            :exceptions: None
+        '''
+        with self._condition:
+            jobs: List[ScheduledJob] = list(self._jobs.values())
+        return {job.name: job.stats for job in jobs}
+
+    def stop(self) -> None:
+        '''
+            Stops scheduler, run() returns after running jobs finish.
+
+            :exceptions: None
+        '''
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+
+    def run(self) -> None:
+        '''
+            Runs scheduler until stopped, sleeps until next job is due.
+
+            :exceptions: None
+        '''
+        verbose_message(self._verbose, [f'{self._P_VERBOSE} run'])
+        executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            self._workers, thread_name_prefix='daemonpy-scheduler'
+        )
+        try:
+            with self._condition:
+                while not self._stopping:
+                    now: float = monotonic()
+                    if not self._heap or self._heap[0][0] > now:
+                        self._condition.wait(
+                            self._heap[0][0] - now if self._heap else None
+                        )
+                        self._wakeups += 1
+                        continue
+                    run_at, _, job, due = heappop(self._heap)
+                    if job.cancelled:
+                        continue
+                    if job.admit():
+                        executor.submit(job.execute, run_at)
+                    following: Optional[float] = job.next_due(due, now)
+                    if following is not None:
+                        heappush(self._heap, (
+                            job.run_time(following), next(self._sequence),
+                            job, following
+                        ))
+                    elif self._jobs.get(job.name) is job:
+                        del self._jobs[job.name]
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            verbose_message(self._verbose, [f'{self._P_VERBOSE} stopped'])
+
+    def _add(self, job: ScheduledJob, delay: Optional[float]) -> ScheduledJob:
+        '''
+            Adds job with first due time.
+
+            :param job: Scheduled job
+            :type job: <ScheduledJob>
+            :param delay: First run delay | None (computed by job)
+            :type delay: <Optional[float]>
+            :return: Scheduled job
+            :rtype: <ScheduledJob>
+            :exceptions: ATSValueError
+        '''
+        if delay is not None and delay < 0:
+            raise ATSValueError('job delay must be non-negative')
+        now: float = monotonic()
+        with self._condition:
+            if job.name in self._jobs:
+                raise ATSValueError(f'job {job.name} already scheduled')
+            self._jobs[job.name] = job
+            due: float = now + delay if delay is not None else (
+                job.next_due(None, now) or now
+            )
+            heappush(
+                self._heap, (job.run_time(due), next(self._sequence), job, due)
+            )
+            self._condition.notify()
+        return job
@@ -0,0 +1,171 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    sd_notify.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class SdNotify with attribute(s) and method(s).
+    Creates an API for systemd service notification protocol.
+'''
+
+from typing import List, Optional
+from os import environ, getpid
+from socket import socket, AF_UNIX, SOCK_CLOEXEC, SOCK_DGRAM
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class SdNotify:
+    '''
+        Defines class SdNotify with attribute(s) and method(s).
+        Creates an API for systemd service notification protocol.
+
+        State lines (READY=1, WATCHDOG=1, STATUS=...) are sent as one
+        datagram to NOTIFY_SOCKET (path or @abstract name) set by
+        systemd for Type=notify services. Without it nothing is sent.
+        Sockets passed by socket activation (LISTEN_FDS, starting at
+        descriptor 3) are adopted once by listen_fds().
+
+        It defines:
+
+            :attributes:
+                | ENV_SOCKET - Environment variable with socket address.
+                | ENV_WATCHDOG_USEC - Environment watchdog interval.
+                | ENV_WATCHDOG_PID - Environment watchdog process ID.
+                | ENV_LISTEN - Environment variables of socket activation.
+                | LISTEN_FDS_START - First passed file descriptor.
+                | _address - Notification socket address | None.
+                | _socket - Datagram socket | None.
+            :methods:
+                | __init__ - Initials SdNotify constructor.
+                | enabled - Property method for getting notify status.
+                | notify - Sends state lines to systemd.
+                | watchdog_usec - Gets systemd watchdog interval.
+                | listen_fds - Adopts sockets passed by socket activation.
+                | close - Closes datagram socket.
+    '''
+
+    ENV_SOCKET: str = 'NOTIFY_SOCKET'
+    ENV_WATCHDOG_USEC: str = 'WATCHDOG_USEC'
+    ENV_WATCHDOG_PID: str = 'WATCHDOG_PID'
+    ENV_LISTEN: List[str] = ['LISTEN_PID', 'LISTEN_FDS', 'LISTEN_FDNAMES']
+    LISTEN_FDS_START: int = 3
+
+    def __init__(self) -> None:
+        '''
+            Initials SdNotify constructor (reads NOTIFY_SOCKET).
+
+            :exceptions: None
+        '''
+        address: str = environ.get(self.ENV_SOCKET, '')
+        if address.startswith('@'):
+            address = f'\0{address[1:]}'
+        self._address: Optional[str] = address or None
+        self._socket: Optional[socket] = None
+
+    @property
+    def enabled(self) -> bool:
+        '''
+            Property method for getting notification status.
+
+            :return: True (started by systemd with NOTIFY_SOCKET) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._address is not None
+
+    def notify(self, *states: str) -> bool:
+        '''
+            Sends state lines to systemd in one datagram.
+
+            :param states: State lines ('READY=1', 'STATUS=...')
+            :type states: <str>
+            :return: True (sent) | False (not enabled or failed)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        if self._address is None:
+            return False
+        try:
+            if self._socket is None:
+                self._socket = socket(AF_UNIX, SOCK_DGRAM | SOCK_CLOEXEC)
+            self._socket.sendto(
+                '\n'.join(states).encode('utf-8'), self._address
+            )
+        except OSError:
+            return False
+        return True
+
+    @classmethod
+    def watchdog_usec(cls) -> Optional[int]:
+        '''
+            Gets systemd watchdog interval for current process.
+
+            :return: Watchdog interval in microseconds | None (disabled)
+            :rtype: <Optional[int]>
+            :exceptions: None
+        '''
+        try:
+            usec: int = int(environ.get(cls.ENV_WATCHDOG_USEC, '0'))
+            pid: int = int(environ.get(cls.ENV_WATCHDOG_PID, '0'))
+        except ValueError:
+            return None
+        if usec <= 0 or pid not in (0, getpid()):
+            return None
+        return usec
+
+    @classmethod
+    def listen_fds(cls) -> List[socket]:
+        '''
+            Adopts sockets passed by socket activation to this process
+            (environment variables are removed, children don't see them).
+
+            :return: Passed sockets (close on exec) | empty list
+            :rtype: <List[socket]>
+            :exceptions: None
+        '''
+        listen: List[str] = [environ.pop(name, '') for name in cls.ENV_LISTEN]
+        sockets: List[socket] = []
+        try:
+            if int(listen[0]) != getpid():
+                return sockets
+            count: int = int(listen[1])
+        except ValueError:
+            return sockets
+        for fd in range(cls.LISTEN_FDS_START, cls.LISTEN_FDS_START + count):
+            try:
+                passed: socket = socket(fileno=fd)
+            except OSError:
+                continue
+            passed.set_inheritable(False)
+            sockets.append(passed)
+        return sockets
+
+    def close(self) -> None:
+        '''
+            Closes datagram socket.
+
+            :exceptions: None
+        '''
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
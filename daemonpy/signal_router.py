@@ -0,0 +1,237 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    signal_router.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class SignalRouter with attribute(s) and method(s).
+    Creates an API for routing signals to handlers on main thread.
+'''
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from asyncio import AbstractEventLoop
+from signal import default_int_handler, getsignal, pthread_kill, signal
+from threading import main_thread
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+SignalHandler = Callable[[int], Any]
+Entry = Tuple[SignalHandler, bool]
+
+
+class SignalRouter:
+    '''
+        Defines class SignalRouter with attribute(s) and method(s).
+        Creates an API for routing signals to handlers on main thread.
+
+        One dispatcher per signal is installed on open (signal module,
+        or event loop after use_loop), handlers run in order of
+        adding. Default handler (such as exit on SIGTERM) runs only
+        when signal has no other handler, then handler installed
+        before open (daemonize, code before start, but not SIGINT
+        KeyboardInterrupt) takes its place, else first default handler
+        runs. Listeners see every routed signal. Other threads route
+        signal by wake().
+
+        It defines:
+
+            :attributes:
+                | _handlers - (handler, default) by signal number.
+                | _saved - Handler replaced by dispatcher by signal.
+                | _listeners - Called with every routed signal.
+                | _loop - Event loop running dispatchers | None.
+                | _opened - Dispatchers are installed.
+            :methods:
+                | __init__ - Initials SignalRouter constructor.
+                | handle - Adds signal handler.
+                | listen - Adds listener of routed signals.
+                | use_loop - Runs dispatchers on event loop.
+                | open - Installs dispatchers (main thread).
+                | close - Removes dispatchers of event loop.
+                | wake - Routes signal on main thread.
+                | dispatch - Calls handlers of signal.
+                | fallback - Calls replaced or default handler.
+                | _install - Installs dispatcher of signal.
+    '''
+
+    def __init__(self) -> None:
+        '''
+            Initials SignalRouter constructor.
+
+            :exceptions: None
+        '''
+        self._handlers: Dict[int, List[Entry]] = {}
+        self._saved: Dict[int, Any] = {}
+        self._listeners: List[SignalHandler] = []
+        self._loop: Optional[AbstractEventLoop] = None
+        self._opened: bool = False
+
+    def handle(
+        self, signal_num: int, handler: SignalHandler, default: bool = False
+    ) -> None:
+        '''
+            Adds signal handler, called on main thread with signal.
+
+            :param signal_num: Signal number
+            :type signal_num: <int>
+            :param handler: Handler called with signal number
+            :type handler: <SignalHandler>
+            :param default: Runs only when signal has no other handler
+            :type default: <bool>
+            :exceptions: None
+        '''
+        self._handlers.setdefault(signal_num, []).append((handler, default))
+        if self._opened:
+            self._install(signal_num)
+
+    def listen(
+        self, listener: SignalHandler, signals: Iterable[int] = ()
+    ) -> None:
+        '''
+            Adds listener of routed signals (called before handlers).
+
+            :param listener: Listener called with signal number
+            :type listener: <SignalHandler>
+            :param signals: Signals routed also without handlers
+            :type signals: <Iterable[int]>
+            :exceptions: None
+        '''
+        self._listeners.append(listener)
+        for signal_num in signals:
+            self._handlers.setdefault(signal_num, [])
+
+    def use_loop(self, loop: Optional[AbstractEventLoop]) -> None:
+        '''
+            Runs dispatchers on event loop (call before open).
+
+            :param loop: Event loop | None (signal module)
+            :type loop: <Optional[AbstractEventLoop]>
+            :exceptions: None
+        '''
+        self._loop = loop
+
+    def open(self) -> None:
+        '''
+            Installs dispatchers of signals (call on main thread).
+
+            :exceptions: None
+        '''
+        self._opened = True
+        for signal_num in self._handlers:
+            self._install(signal_num)
+
+    def close(self) -> None:
+        '''
+            Removes dispatchers of event loop (signal module ones stay
+            until process exits).
+
+            :exceptions: None
+        '''
+        self._opened = False
+        if self._loop is not None:
+            for signal_num in self._saved:
+                self._loop.remove_signal_handler(signal_num)
+            self._saved = {}
+
+    def wake(self, signal_num: int) -> None:
+        '''
+            Routes signal on main thread (any thread), handlers are
+            called directly when dispatcher is not installed.
+
+            :param signal_num: Signal number
+            :type signal_num: <int>
+            :exceptions: None
+        '''
+        if self._loop is not None and signal_num in self._saved:
+            self._loop.call_soon_threadsafe(self.dispatch, signal_num)
+        elif getsignal(signal_num) == self.dispatch:
+            pthread_kill(main_thread().ident or 0, signal_num)
+        else:
+            self.dispatch(signal_num)
+
+    def dispatch(self, signal_num: int, frame: Any = None) -> None:
+        '''
+            Calls listeners, then handlers of signal (dispatcher).
+
+            :param signal_num: Signal number
+            :type signal_num: <int>
+            :param frame: Current stack frame | None
+            :type frame: <Any>
+            :exceptions: SystemExit (exit handler)
+        '''
+        for listener in self._listeners:
+            listener(signal_num)
+        handlers: List[SignalHandler] = [
+            handler for handler, default in self._handlers.get(
+                signal_num, []
+            ) if not default
+        ]
+        if not handlers:
+            self.fallback(signal_num, frame)
+        for handler in handlers:
+            handler(signal_num)
+
+    def fallback(self, signal_num: int, frame: Any = None) -> bool:
+        '''
+            Calls handler replaced by dispatcher, or first default
+            handler of signal (what happens without other handlers).
+
+            :param signal_num: Signal number
+            :type signal_num: <int>
+            :param frame: Current stack frame | None
+            :type frame: <Any>
+            :return: True (handler called) | False (none)
+            :rtype: <bool>
+            :exceptions: SystemExit (exit handler)
+        '''
+        saved: Any = self._saved.get(signal_num)
+        if callable(saved) and saved is not default_int_handler:
+            saved(signal_num, frame)
+            return True
+        for handler, default in self._handlers.get(signal_num, []):
+            if default:
+                handler(signal_num)
+                return True
+        return False
+
+    def _install(self, signal_num: int) -> None:
+        '''
+            Installs dispatcher of signal (keeps handler installed
+            before open), when signal has something to route.
+
+            :param signal_num: Signal number
+            :type signal_num: <int>
+            :exceptions: None
+        '''
+        current: Any = getsignal(signal_num)
+        if current == self.dispatch or (
+            self._loop is not None and signal_num in self._saved
+        ):
+            return
+        if callable(current) or self._handlers[signal_num]:
+            self._saved[signal_num] = current
+            if self._loop is not None:
+                self._loop.add_signal_handler(
+                    signal_num, self.dispatch, signal_num
+                )
+            else:
+                signal(signal_num, self.dispatch)
@@ -0,0 +1,300 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    status_page.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class StatusPage with attribute(s) and method(s).
+    Creates a shared memory status page updated by running daemon.
+'''
+
+import sys
+from typing import Dict, List, Optional, Tuple
+from contextlib import suppress
+from mmap import mmap, ACCESS_WRITE
+from operator import index
+from os import close, fchmod, ftruncate, getpid, replace, stat, unlink
+from os.path import dirname
+from struct import Struct
+from tempfile import mkstemp
+from threading import RLock
+from time import time
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class StatusPage:
+    '''
+        Defines class StatusPage with attribute(s) and method(s).
+        Creates a shared memory status page updated by running daemon.
+
+        Fixed binary layout (native byte order, no padding): header (magic,
+        version, slots, pid, state, seq, started, heartbeat), counter names
+        (slots * 32 bytes), counter values (slots * int64). Every update is a
+        seqlock write (seq odd while writing), so readers copy a consistent
+        snapshot without locks and never block the writer. Writer threads are
+        serialized by lock, write of signal handler nests in interrupted one.
+
+        It defines:
+
+            :attributes:
+                | MAGIC - Status page file signature.
+                | VERSION - Status page layout version.
+                | HEADER - Header layout.
+                | NAME - Counter name layout.
+                | STATE_OFFSET - Offset of state (seq, times follow).
+                | STATES - Daemon state names.
+                | _path - Status page file path.
+                | _names - Counter names.
+                | _index - Counter name to slot index.
+                | _map - Writable memory map | None.
+                | _state - State view | None.
+                | _seq - Sequence number view | None.
+                | _times - Started/heartbeat view | None.
+                | _values - Counter values view | None.
+                | _inode - Inode of created status page file.
+                | _lock - Serializes writers.
+                | _depth - Nesting of writes by lock owner.
+            :methods:
+                | __init__ - Initials StatusPage constructor.
+                | path - Property method for getting file path.
+                | create - Creates and maps status page file.
+                | heartbeat - Updates heartbeat timestamp.
+                | set_state - Updates daemon state.
+                | incr - Increments counter.
+                | set - Sets counter value.
+                | update - Sets many counter values at once.
+                | close - Unmaps and removes status page file.
+                | _begin - Starts seqlock write.
+                | _end - Ends seqlock write.
+    '''
+
+    MAGIC: bytes = b'DPST'
+    VERSION: int = 1
+    HEADER: Struct = Struct('=4sHHIIQdd')
+    NAME: Struct = Struct('=32s')
+    STATE_OFFSET: int = 12
+    STATES: List[str] = [
+        'starting', 'running', 'draining', 'stopping', 'stopped'
+    ]
+
+    def __init__(self, path: str, counters: List[str]) -> None:
+        '''
+            Initials StatusPage constructor (file is created by create).
+
+            :param path: Status page file path
+            :type path: <str>
+            :param counters: Counter names (up to 32 bytes each)
+            :type counters: <List[str]>
+            :exceptions: ATSValueError
+        '''
+        if not bool(path):
+            raise ATSValueError('missing status page path')
+        if len(set(counters)) != len(counters) or len(counters) > 0xffff:
+            raise ATSValueError('status page counters must be unique')
+        if any(len(name.encode()) > self.NAME.size for name in counters):
+            raise ATSValueError('status page counter name too long')
+        self._path: str = path
+        self._names: List[str] = list(counters)
+        self._index: Dict[str, int] = {n: i for i, n in enumerate(counters)}
+        self._map: Optional[mmap] = None
+        self._state: Optional[memoryview] = None
+        self._seq: Optional[memoryview] = None
+        self._times: Optional[memoryview] = None
+        self._values: Optional[memoryview] = None
+        self._inode: int = 0
+        self._lock: RLock = RLock()
+        self._depth: int = 0
+
+    @property
+    def path(self) -> str:
+        '''
+            Property method for getting status page file path.
+
+            :return: Status page file path
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return self._path
+
+    def create(self) -> None:
+        '''
+            Creates status page file (published atomically by rename,
+            readable by monitoring agents) and maps it for writing.
+
+            :exceptions: OSError
+        '''
+        names_end: int = self.HEADER.size + self.NAME.size * len(self._names)
+        size: int = names_end + 8 * len(self._names)
+        fd, temp_path = mkstemp(dir=dirname(self._path) or '.')
+        try:
+            fchmod(fd, 0o644)
+            ftruncate(fd, size)
+            self._map = mmap(fd, size, access=ACCESS_WRITE)
+            now: float = time()
+            self.HEADER.pack_into(
+                self._map, 0, self.MAGIC, self.VERSION, len(self._names),
+                getpid(), 0, 0, now, now
+            )
+            for slot, name in enumerate(self._names):
+                self.NAME.pack_into(
+                    self._map, self.HEADER.size + slot * self.NAME.size,
+                    name.encode('utf-8')
+                )
+            replace(temp_path, self._path)
+            self._inode = stat(self._path).st_ino
+        except OSError:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._inode == 0:
+                unlink(temp_path)
+            raise
+        finally:
+            close(fd)
+        view: memoryview = memoryview(self._map)
+        self._state = view[self.STATE_OFFSET:self.STATE_OFFSET + 4].cast('I')
+        seq: slice = slice(self.STATE_OFFSET + 4, self.STATE_OFFSET + 12)
+        self._seq = view[seq].cast('Q')
+        self._times = view[self.STATE_OFFSET + 12:self.HEADER.size].cast('d')
+        self._values = view[names_end:size].cast('q')
+
+    def heartbeat(self, now: Optional[float] = None) -> None:
+        '''
+            Updates heartbeat timestamp.
+
+            :param now: Timestamp | None (current time)
+            :type now: <Optional[float]>
+            :exceptions: None
+        '''
+        if self._begin():
+            self._times[1] = time() if now is None else now  # type: ignore
+            self._end()
+
+    def set_state(self, state: str) -> None:
+        '''
+            Updates daemon state.
+
+            :param state: State name (one of STATES)
+            :type state: <str>
+            :exceptions: ATSValueError
+        '''
+        if state not in self.STATES:
+            raise ATSValueError(f'wrong daemon state {state}')
+        if self._begin():
+            self._state[0] = self.STATES.index(state)  # type: ignore[index]
+            self._end()
+
+    def incr(self, name: str, value: int = 1) -> None:
+        '''
+            Increments counter.
+
+            :param name: Counter name
+            :type name: <str>
+            :param value: Increment
+            :type value: <int>
+            :exceptions: KeyError | TypeError
+        '''
+        slot, value = self._index[name], index(value)
+        if self._begin():
+            self._values[slot] += value  # type: ignore[index]
+            self._end()
+
+    def set(self, name: str, value: int) -> None:
+        '''
+            Sets counter value.
+
+            :param name: Counter name
+            :type name: <str>
+            :param value: Counter value
+            :type value: <int>
+            :exceptions: KeyError | TypeError
+        '''
+        self.update({name: value})
+
+    def update(self, values: Dict[str, int]) -> None:
+        '''
+            Sets many counter values in one consistent update.
+
+            :param values: Counter values by name
+            :type values: <Dict[str, int]>
+            :exceptions: KeyError | TypeError
+        '''
+        slots: List[Tuple[int, int]] = [
+            (self._index[name], index(value)) for name, value in values.items()
+        ]
+        if self._begin():
+            for slot, value in slots:
+                self._values[slot] = value  # type: ignore[index]
+            self._end()
+
+    def close(self) -> None:
+        '''
+            Unmaps status page, removes file unless it was replaced.
+
+            :exceptions: None
+        '''
+        with self._lock:
+            for view in (self._state, self._seq, self._times, self._values):
+                if view is not None:
+                    view.release()
+            self._state = self._seq = self._times = self._values = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+            with suppress(OSError):
+                if stat(self._path).st_ino == self._inode:
+                    unlink(self._path)
+
+    def _begin(self) -> bool:
+        '''
+            Takes lock, starts seqlock write (sequence becomes odd).
+
+            :return: True (write started) | False (page is closed)
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        self._lock.acquire()
+        if self._seq is None:
+            self._lock.release()
+            return False
+        if self._depth == 0:
+            self._seq[0] += 1  # type: ignore[index]
+        self._depth += 1
+        return True
+
+    def _end(self) -> None:
+        '''
+            Ends seqlock write (sequence becomes even), releases lock.
+
+            :exceptions: None
+        '''
+        self._depth -= 1
+        if self._depth == 0:
+            self._seq[0] += 1  # type: ignore[index]
+        self._lock.release()
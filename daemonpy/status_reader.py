@@ -0,0 +1,163 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    status_reader.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class StatusReader with attribute(s) and method(s).
+    Creates a read-only view of daemon shared memory status page.
+'''
+
+import sys
+from typing import Any, Dict, List, Optional
+from array import array
+from mmap import mmap, ACCESS_READ
+from os import close, open as open_fd, O_RDONLY
+from time import sleep, time
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.status_page import StatusPage
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class StatusReader:
+    '''
+        Defines class StatusReader with attribute(s) and method(s).
+        Creates a read-only view of daemon shared memory status page.
+
+        Page is mapped once; snapshot() copies it and retries while
+        daemon is in the middle of an update (seqlock), no system call
+        is made and daemon is never blocked. Map a new reader when
+        daemon is restarted (new generation publishes new file).
+
+        It defines:
+
+            :attributes:
+                | _SPINS - Snapshot attempts before giving up.
+                | _map - Read-only memory map | None.
+                | _names - Counter names.
+            :methods:
+                | __init__ - Initials StatusReader constructor.
+                | __enter__ - Returns reader (context manager).
+                | __exit__ - Unmaps status page.
+                | snapshot - Reads consistent status snapshot.
+                | close - Unmaps status page.
+    '''
+
+    _SPINS: int = 10000
+
+    def __init__(self, path: str) -> None:
+        '''
+            Initials StatusReader constructor, maps status page.
+
+            :param path: Status page file path
+            :type path: <str>
+            :exceptions: OSError | ATSValueError
+        '''
+        fd: int = open_fd(path, O_RDONLY)
+        try:
+            self._map: Optional[mmap] = mmap(fd, 0, access=ACCESS_READ)
+        finally:
+            close(fd)
+        header: Any = StatusPage.HEADER.unpack_from(self._map, 0)
+        if header[0] != StatusPage.MAGIC or header[1] != StatusPage.VERSION:
+            self.close()
+            raise ATSValueError(f'{path} is not a status page')
+        self._names: List[str] = [
+            StatusPage.NAME.unpack_from(
+                self._map,
+                StatusPage.HEADER.size + index * StatusPage.NAME.size
+            )[0].rstrip(b'\0').decode('utf-8')
+            for index in range(header[2])
+        ]
+
+    def __enter__(self) -> 'StatusReader':
+        '''
+            Returns reader (context manager).
+
+            :return: Status reader
+            :rtype: <StatusReader>
+            :exceptions: None
+        '''
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        '''
+            Unmaps status page.
+
+            :exceptions: None
+        '''
+        self.close()
+
+    def snapshot(self) -> Dict[str, Any]:
+        '''
+            Reads consistent status snapshot.
+
+            :return: pid, state, started, heartbeat, heartbeat_age, counters
+            :rtype: <Dict[str, Any]>
+            :exceptions: ATSValueError (closed) | TimeoutError
+        '''
+        if self._map is None:
+            raise ATSValueError('status page is closed')
+        seq_view: slice = slice(
+            StatusPage.STATE_OFFSET + 4, StatusPage.STATE_OFFSET + 12
+        )
+        data: bytes = b''
+        for spin in range(self._SPINS):
+            seq: bytes = self._map[seq_view]
+            if int.from_bytes(seq, sys.byteorder) % 2 == 0:
+                data = self._map[:]
+                if data[seq_view] == seq == self._map[seq_view]:
+                    break
+            if spin % 100 == 99:
+                sleep(0)
+        else:
+            raise TimeoutError('status page is updated without pause')
+        header: Any = StatusPage.HEADER.unpack_from(data, 0)
+        values: array = array('q', data[
+            StatusPage.HEADER.size + StatusPage.NAME.size * len(self._names):
+        ])
+        return {
+            'pid': header[3],
+            'state': StatusPage.STATES[header[4]] if header[4] < len(
+                StatusPage.STATES
+            ) else str(header[4]),
+            'started': header[6],
+            'heartbeat': header[7],
+            'heartbeat_age': round(time() - header[7], 6),
+            'counters': dict(zip(self._names, values))
+        }
+
+    def close(self) -> None:
+        '''
+            Unmaps status page.
+
+            :exceptions: None
+        '''
+        if self._map is not None:
+            self._map.close()
+            self._map = None
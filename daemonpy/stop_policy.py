@@ -0,0 +1,264 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    stop_policy.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines classes StopPolicy and StopResult with attribute(s) and method(s).
+    Creates an API for escalating stop of daemon process.
+'''
+
+import sys
+from typing import List, Optional, Tuple
+from signal import Signals, SIGTERM, SIGKILL
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.param_check import ParamCheck
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class StopPolicy:
+    '''
+        Defines class StopPolicy with attribute(s) and method(s).
+        Creates an API for escalating stop of daemon process.
+
+        Each signal from sequence is sent once, followed by waiting for
+        process exit up to timeout, then the next signal is sent.
+        Optional final SIGKILL bounds worst-case stop latency.
+
+        It defines:
+
+            :attributes:
+                | _signals - Sequence of signals to send.
+                | _timeout - Time to wait after each signal (seconds).
+                | _kill - Send final SIGKILL after the sequence.
+                | _process_group - Signal whole process group.
+            :methods:
+                | __init__ - Initials StopPolicy constructor.
+                | timeout - Property method for getting step timeout.
+                | kill - Property method for getting final SIGKILL flag.
+                | process_group - Property method for getting group flag.
+                | steps - Creates list of (signal, timeout) steps.
+    '''
+
+    @ParamCheck('bool:kill', 'bool:process_group')
+    def __init__(
+        self,
+        signals: Optional[List[int]] = None,
+        timeout: Optional[float] = 10.0,
+        kill: bool = True,
+        process_group: bool = False
+    ) -> None:
+        '''
+            Initials StopPolicy constructor.
+
+            :param signals: Sequence of signals | None (SIGTERM)
+            :type signals: <Optional[List[int]]>
+            :param timeout: Time to wait per step | None (forever)
+            :type timeout: <Optional[float]>
+            :param kill: Send final SIGKILL after the sequence
+            :type kill: <bool>
+            :param process_group: Signal whole process group
+            :type process_group: <bool>
+            :exceptions: ATSTypeError | ATSValueError
+        '''
+        if timeout is not None and timeout < 0:
+            raise ATSValueError('stop timeout must be positive')
+        self._signals: List[int] = [SIGTERM] if signals is None else list(
+            signals
+        )
+        if not self._signals and not kill:
+            raise ATSValueError('missing stop signals')
+        self._timeout: Optional[float] = timeout
+        self._kill: bool = kill
+        self._process_group: bool = process_group
+
+    @property
+    def timeout(self) -> Optional[float]:
+        '''
+            Property method for getting step timeout.
+
+            :return: Time to wait after each signal | None (forever)
+            :rtype: <Optional[float]>
+            :exceptions: None
+        '''
+        return self._timeout
+
+    @property
+    def kill(self) -> bool:
+        '''
+            Property method for getting final SIGKILL flag.
+
+            :return: True (send final SIGKILL) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._kill
+
+    @property
+    def process_group(self) -> bool:
+        '''
+            Property method for getting process group flag.
+
+            :return: True (signal process group) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._process_group
+
+    def steps(self) -> List[Tuple[int, Optional[float]]]:
+        '''
+            Creates list of stop steps.
+
+            :return: List of (signal, timeout) pairs
+            :rtype: <List[Tuple[int, Optional[float]]]>
+            :exceptions: None
+        '''
+        steps: List[Tuple[int, Optional[float]]] = [
+            (signal_num, self._timeout) for signal_num in self._signals
+        ]
+        if self._kill and SIGKILL not in self._signals:
+            steps.append((SIGKILL, self._timeout))
+        return steps
+
+
+class StopResult:
+    '''
+        Defines class StopResult with attribute(s) and method(s).
+        Creates a structured result of daemon stop operation.
+
+        It defines:
+
+            :attributes:
+                | _pid - Process ID.
+                | _phases - List of (signal name, duration, exited).
+            :methods:
+                | __init__ - Initials StopResult constructor.
+                | __bool__ - True if process was stopped.
+                | __repr__ - Representation of stop result.
+                | pid - Property method for getting process ID.
+                | phases - Property method for getting phases.
+                | stopped - Property method for getting stop status.
+                | duration - Property method for getting total duration.
+                | add_phase - Adds one stop phase.
+    '''
+
+    def __init__(self, pid: int) -> None:
+        '''
+            Initials StopResult constructor.
+
+            :param pid: Process ID
+            :type pid: <int>
+            :exceptions: None
+        '''
+        self._pid: int = pid
+        self._stopped: bool = False
+        self._phases: List[Tuple[str, float, bool]] = []
+
+    def __bool__(self) -> bool:
+        '''
+            True if process was stopped.
+
+            :return: Stop status
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._stopped
+
+    def __repr__(self) -> str:
+        '''
+            Representation of stop result.
+
+            :return: Stop result representation
+            :rtype: <str>
+            :exceptions: None
+        '''
+        return (
+            f'{self.__class__.__name__}(pid={self._pid}, '
+            f'stopped={self._stopped}, phases={self._phases})'
+        )
+
+    @property
+    def pid(self) -> int:
+        '''
+            Property method for getting process ID.
+
+            :return: Process ID
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._pid
+
+    @property
+    def phases(self) -> List[Tuple[str, float, bool]]:
+        '''
+            Property method for getting stop phases.
+
+            :return: List of (signal name, duration, exited)
+            :rtype: <List[Tuple[str, float, bool]]>
+            :exceptions: None
+        '''
+        return self._phases
+
+    @property
+    def stopped(self) -> bool:
+        '''
+            Property method for getting stop status.
+
+            :return: True (process exited) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return self._stopped
+
+    @property
+    def duration(self) -> float:
+        '''
+            Property method for getting total stop duration.
+
+            :return: Sum of phase durations in seconds
+            :rtype: <float>
+            :exceptions: None
+        '''
+        return sum(phase[1] for phase in self._phases)
+
+    def add_phase(
+        self, signal_num: int, duration: float, exited: bool
+    ) -> None:
+        '''
+            Adds one stop phase.
+
+            :param signal_num: Signal sent in phase
+            :type signal_num: <int>
+            :param duration: Time from signal to exit or timeout
+            :type duration: <float>
+            :param exited: Process exited during phase
+            :type exited: <bool>
+            :exceptions: None
+        '''
+        self._phases.append((Signals(signal_num).name, duration, exited))
+        self._stopped = self._stopped or exited
@@ -0,0 +1,300 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    supervisor.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Supervisor with attribute(s) and method(s).
+    Creates an API for restarting crashed daemon run() process.
+'''
+
+import sys
+from typing import Any, Callable, Dict, List, Optional
+from collections import deque
+from json import dump
+from os import (
+    fork, getpid, kill, remove, replace, waitpid, waitstatus_to_exitcode,
+    _exit
+)
+from signal import signal, SIGHUP, SIGINT, SIGTERM
+from time import monotonic, sleep, time
+from traceback import print_exc
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.console_io.verbose import verbose_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.watchdog import Watchdog
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class Supervisor:
+    '''
+        Defines class Supervisor with attribute(s) and method(s).
+        Creates an API for restarting crashed daemon run() process.
+
+        Daemon process (owner of PID file) forks a child which runs
+        run() and restarts it on abnormal exit after backoff delay that
+        doubles up to max_delay (reset after child ran for window), a
+        hung child (no watchdog heartbeat) is killed and restarted too.
+        max_failures abnormal exits within window seconds is a crash loop
+        and supervision gives up. Stop signals are forwarded to the child.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _FORWARD - Signals forwarded to child.
+                | _SLICE - Backoff sleep slice (stop request check).
+                | _initial_delay - First restart delay (seconds).
+                | _max_delay - Upper bound of restart delay (seconds).
+                | _max_failures - Failures within window for crash loop.
+                | _window - Crash loop window (seconds).
+                | _failures - Monotonic times of recent failures.
+                | _child - PID of supervised child | None.
+                | _handlers - Daemon signal handlers (restored in child).
+                | _stopping - Stop requested status.
+                | _stats - Supervision statistics.
+                | _verbose - Enable/Disable verbose option.
+            :methods:
+                | __init__ - Initials Supervisor constructor.
+                | stats - Property method for getting statistics.
+                | supervise - Runs target in child and restarts it.
+                | _spawn - Forks child running target.
+                | _forward - Forwards signal to child.
+                | _backoff - Sleeps restart delay unless stop requested.
+                | _write_stats - Writes statistics file atomically.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::SUPERVISOR'
+    _FORWARD: List[int] = [SIGTERM, SIGINT, SIGHUP]
+    _SLICE: float = 0.05
+
+    def __init__(
+        self,
+        initial_delay: float = 0.1,
+        max_delay: float = 30.0,
+        max_failures: int = 5,
+        window: float = 60.0,
+        verbose: bool = False
+    ) -> None:
+        '''
+            Initials Supervisor constructor.
+
+            :param initial_delay: First restart delay (seconds)
+            :type initial_delay: <float>
+            :param max_delay: Upper bound of restart delay (seconds)
+            :type max_delay: <float>
+            :param max_failures: Failures within window for crash loop
+            :type max_failures: <int>
+            :param window: Crash loop window (seconds)
+            :type window: <float>
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exceptions: ATSValueError
+        '''
+        if min(initial_delay, max_delay, window) < 0:
+            raise ATSValueError('supervisor delays must be positive')
+        if max_failures < 1:
+            raise ATSValueError('max failures must be positive')
+        self._initial_delay: float = initial_delay
+        self._max_delay: float = max(max_delay, initial_delay)
+        self._max_failures: int = max_failures
+        self._window: float = window
+        self._failures: deque[float] = deque()
+        self._child: Optional[int] = None
+        self._handlers: Dict[int, Any] = {}
+        self._stopping: bool = False
+        self._stats: Dict[str, Any] = {}
+        self._verbose: bool = verbose
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        '''
+            Property method for getting supervision statistics.
+
+            :return: Statistics (restarts, failures, last exit, ...)
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        return self._stats
+
+    def supervise(
+        self, target: Callable[[], None], stats_path: str,
+        watchdog: Optional[Watchdog] = None
+    ) -> int:
+        '''
+            Runs target in child process and restarts it on abnormal exit.
+
+            :param target: Daemon entry point (run_daemon)
+            :type target: <Callable[[], None]>
+            :param stats_path: Statistics file path
+            :type stats_path: <str>
+            :param watchdog: Heartbeat watchdog | None
+            :type watchdog: <Optional[Watchdog]>
+            :return: Exit code of last child (negative for signal)
+            :rtype: <int>
+            :exceptions: None
+        '''
+        self._stats = {
+            'supervisor_pid': getpid(), 'child_pid': None, 'restarts': 0,
+            'failures': 0, 'last_exit': None, 'last_exit_time': None,
+            'crash_loop': False, 'started': time()
+        }
+        self._stopping = False
+        self._handlers = {
+            signal_num: signal(signal_num, self._forward)
+            for signal_num in self._FORWARD
+        }
+        delay: float = self._initial_delay
+        exit_code: int = 0
+        try:
+            while not self._stopping:
+                started: float = monotonic()
+                self._child = self._spawn(target)
+                self._stats['child_pid'] = self._child
+                if self._stopping:
+                    kill(self._child, SIGTERM)
+                self._write_stats(stats_path)
+                exit_code = waitstatus_to_exitcode(
+                    waitpid(self._child, 0)[1] if watchdog is None
+                    else watchdog.wait(self._child)
+                )
+                self._child = None
+                self._stats.update(last_exit=exit_code, last_exit_time=time())
+                if self._stopping or exit_code == 0:
+                    break
+                now: float = monotonic()
+                if now - started >= self._window:
+                    delay = self._initial_delay
+                self._failures.append(now)
+                while now - self._failures[0] > self._window:
+                    self._failures.popleft()
+                self._stats['failures'] += 1
+                error_message([
+                    f'{self._P_VERBOSE} child exited with', exit_code
+                ])
+                if len(self._failures) >= self._max_failures:
+                    error_message([f'{self._P_VERBOSE} crash loop, give up'])
+                    self._stats['crash_loop'] = True
+                    break
+                self._backoff(delay)
+                delay = min(delay * 2.0, self._max_delay)
+                if not self._stopping:
+                    self._stats['restarts'] += 1
+        finally:
+            for signal_num, handler in self._handlers.items():
+                signal(signal_num, handler)
+            self._stats['child_pid'] = None
+            if self._stats['crash_loop']:
+                self._write_stats(stats_path)
+            else:
+                try:
+                    remove(stats_path)
+                except OSError:
+                    pass
+        return exit_code
+
+    def _spawn(self, target: Callable[[], None]) -> int:
+        '''
+            Forks child running target with daemon signal handlers.
+
+            :param target: Daemon entry point
+            :type target: <Callable[[], None]>
+            :return: Child process ID
+            :rtype: <int>
+            :exceptions: OSError
+        '''
+        child_pid: int = fork()
+        if child_pid == 0:
+            for signal_num, handler in self._handlers.items():
+                signal(signal_num, handler)
+            exit_code: int = 0
+            try:
+                target()
+            except SystemExit as sys_exit:
+                exit_code = sys_exit.code if isinstance(
+                    sys_exit.code, int
+                ) else int(bool(sys_exit.code))
+            except Exception:  # pylint: disable=broad-exception-caught
+                print_exc()
+                exit_code = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+            _exit(exit_code)
+        verbose_message(
+            self._verbose, [f'{self._P_VERBOSE} started child', child_pid]
+        )
+        return child_pid
+
+    def _forward(self, signal_num: int, frame: Any) -> None:
+        '''
+            Forwards signal to child, stop signals end supervision.
+            SIGHUP is also passed to daemon handler (log reopen).
+
+            :param signal_num: Received signal number
+            :type signal_num: <int>
+            :param frame: Current stack frame
+            :type frame: <Any>
+            :exceptions: None
+        '''
+        if signal_num != SIGHUP:
+            self._stopping = True
+        elif callable(self._handlers.get(SIGHUP)):
+            self._handlers[SIGHUP](signal_num, frame)
+        if self._child is not None:
+            try:
+                kill(self._child, signal_num)
+            except ProcessLookupError:
+                pass
+
+    def _backoff(self, delay: float) -> None:
+        '''
+            Sleeps restart delay unless stop is requested.
+
+            :param delay: Restart delay (seconds)
+            :type delay: <float>
+            :exceptions: None
+        '''
+        deadline: float = monotonic() + delay
+        while not self._stopping and monotonic() < deadline:
+            sleep(min(self._SLICE, max(deadline - monotonic(), 0.0)))
+
+    def _write_stats(self, stats_path: str) -> None:
+        '''
+            Writes statistics file atomically.
+
+            :param stats_path: Statistics file path
+            :type stats_path: <str>
+            :exceptions: None
+        '''
+        try:
+            with open(f'{stats_path}.tmp', 'w', encoding='utf-8') as stats:
+                dump(self._stats, stats)
+            replace(f'{stats_path}.tmp', stats_path)
+        except OSError as os_error:
+            error_message([f'{self._P_VERBOSE} {os_error}'])
@@ -22,17 +22,20 @@ Info
 
 import sys
 from typing import List, Optional
-from os import fork, kill, remove
+from os import (
+    chdir, dup2, fork, kill, killpg, getpgid, getpgrp, remove, setsid, umask
+)
 from os.path import exists
-from signal import SIGTERM
-from time import sleep
+from time import monotonic
 
 try:
-    from ats_utilities.checker import ATSChecker
     from ats_utilities.console_io.error import error_message
     from ats_utilities.console_io.verbose import verbose_message
-    from ats_utilities.exceptions.ats_type_error import ATSTypeError
     from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.file_descriptor import FileDescriptor
+    from daemonpy.process_waiter import ProcessWaiter
+    from daemonpy.stop_policy import StopPolicy, StopResult
+    from daemonpy.param_check import ParamCheck
 except ImportError as ats_error_message:  # pragma: no cover
     # Force exit python #######################################################
     sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
@@ -59,18 +62,20 @@ class UnixOperations:
                 | _OS_TARGET - List of supported operating systems.
                 | _NO_PROCESS - No such process message.
                 | _unix_status - Unix status (True for unix like OS).
+                | _waiter - Waits for process exit (pidfd or backoff).
             :methods:
                 | __init__ - Initials UnixOperations constructor.
                 | unix_status - Property methods for set/get operations.
                 | first_fork - Makes sure that process is not group leader.
                 | second_fork - Won't be started merely by opening a terminal.
-                | unix_kill - Kills unix like OS process.
+                | detach - Detaches process from terminal and session.
+                | unix_kill - Kills unix like OS process (stop policy).
+                | _send_signal - Sends signal to process or process group.
     '''
 
     _P_VERBOSE: str = 'DAEMONPY::UNIX_OPERATIONS'
     _OS_TARGET: List[str] = ['linux', 'linux2']
     _NO_PROCESS: str = 'No such process'
-    _SLEEP: float = 0.1
 
     def __init__(self, verbose: bool = False) -> None:
         '''
@@ -86,6 +91,7 @@ class UnixOperations:
         self._unix_status: bool = any(
             sys.platform == os_target for os_target in self._OS_TARGET
         )
+        self._waiter: ProcessWaiter = ProcessWaiter()
 
     @property
     def unix_status(self) -> bool:
@@ -137,11 +143,47 @@ class UnixOperations:
                 verbose_message(verbose, [f'{self._P_VERBOSE} second fork'])
                 sys.exit(0)
 
+    def detach(self, verbose: bool = False) -> None:
+        '''
+            Detaches process from terminal and session (double fork,
+            setsid) and points standard streams to /dev/null.
+
+            :param verbose: Enable/Disable verbose option
+            :type verbose: <bool>
+            :exit code: 0 (parent process) | 1 (failed fork)
+            :exceptions: None
+        '''
+        if self._unix_status:
+            try:
+                self.first_fork(verbose)
+                chdir('/')
+                setsid()
+                umask(0)
+                self.second_fork(verbose)
+            except OSError as os_error:
+                error_message([
+                    f'fork #1 failed: {os_error.errno} {os_error.strerror}\n'
+                ])
+                sys.exit(1)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for stream in (sys.stdin, sys.stdout, sys.stderr):
+                with FileDescriptor(
+                    '/dev/null', FileDescriptor.FORMAT[stream.fileno()]
+                ) as null_file:
+                    if bool(null_file):
+                        dup2(null_file.fileno(), stream.fileno())
+
+    @ParamCheck('int:pid', 'str:pid_path')
     def unix_kill(
-        self, pid: int, pid_path: str, verbose: bool = False
-    ) -> bool:
+        self,
+        pid: int,
+        pid_path: str,
+        verbose: bool = False,
+        policy: Optional[StopPolicy] = None
+    ) -> StopResult:
         '''
-            Kills Unix Like OS process.
+            Kills Unix Like OS process by escalating stop policy.
 
             :param pid: Process ID
             :type pid: <int>
@@ -149,47 +191,67 @@ class UnixOperations:
             :type pid_path: <str>
             :param verbose: Enable/Disable verbose option
             :type verbose: <bool>
-            :return: True (success operation) | False
-            :rtype: <bool>
+            :param policy: Stop policy | None (SIGTERM, 10s, SIGKILL)
+            :type policy: <Optional[StopPolicy]>
+            :return: Stop result (True for success operation) | False
+            :rtype: <StopResult>
             :exceptions: ATSTypeError | ATSValueError
         '''
-        error_msg: Optional[str] = None
-        error_id: Optional[int] = None
-        checker: ATSChecker = ATSChecker()
-        error_msg, error_id = checker.check_params([
-            ('int:pid', pid), ('str:pid_path', pid_path)
-        ])
-        if error_id == checker.TYPE_ERROR:
-            raise ATSTypeError(error_msg)
         if not bool(pid):
             raise ATSValueError('missing PID')
         if not bool(pid_path):
             raise ATSValueError('missing PID path')
-        status: bool = False
+        result: StopResult = StopResult(pid)
         if self._unix_status:
-            try:
+            if policy is None:
+                policy = StopPolicy()
+            verbose_message(
+                verbose, [f'{self._P_VERBOSE} kill process {pid}']
+            )
+            for signal_num, timeout in policy.steps():
+                start: float = monotonic()
+                try:
+                    self._send_signal(pid, signal_num, policy.process_group)
+                    exited: bool = self._waiter.wait(pid, timeout)
+                except ProcessLookupError:
+                    exited = True
+                except OSError as os_error:
+                    error_message([f'{self._P_VERBOSE} {os_error}'])
+                    break
+                result.add_phase(signal_num, monotonic() - start, exited)
+                if exited:
+                    break
+            if result.stopped and exists(pid_path):
                 verbose_message(
-                    verbose, [f'{self._P_VERBOSE} kill process {pid}']
+                    verbose,
+                    [
+                        f'{self._P_VERBOSE}',
+                        f'{self._NO_PROCESS}',
+                        f'with PID: {pid},',
+                        f'removing pid file {pid_path}'
+                    ]
                 )
-                while True:
-                    kill(pid, SIGTERM)
-                    sleep(self._SLEEP)
-                    status = True
-            except OSError as os_error:
-                os_error = str(os_error)
-                if os_error.find(self._NO_PROCESS) > 0:
-                    if exists(pid_path):
-                        verbose_message(
-                            verbose,
-                            [
-                                f'{self._P_VERBOSE}',
-                                f'{self._NO_PROCESS}',
-                                f'with PID: {pid},',
-                                f'removing pid file {pid_path}'
-                            ]
-                        )
-                        remove(pid_path)
-                        status = True
-                else:
-                    error_message([f'{self._P_VERBOSE} {os_error}'])
-        return status
+                remove(pid_path)
+            elif not result.stopped:
+                error_message([f'{self._P_VERBOSE} failed to stop {pid}'])
+        return result
+
+    @staticmethod
+    def _send_signal(pid: int, signal_num: int, process_group: bool) -> None:
+        '''
+            Sends signal to process or to its process group.
+
+            :param pid: Process ID
+            :type pid: <int>
+            :param signal_num: Signal number
+            :type signal_num: <int>
+            :param process_group: Signal whole process group
+            :type process_group: <bool>
+            :exceptions: OSError
+        '''
+        if process_group:
+            group_id: int = getpgid(pid)
+            if group_id != getpgrp():
+                killpg(group_id, signal_num)
+                return
+        kill(pid, signal_num)
@@ -0,0 +1,241 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    watchdog.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class Watchdog with attribute(s) and method(s).
+    Creates a heartbeat watchdog for detecting hung daemon process.
+'''
+
+import sys
+from typing import List, Optional, Tuple
+from mmap import mmap
+from os import close, getpid, kill, waitpid, WNOHANG
+from select import poll, POLLIN
+from signal import SIGKILL
+from time import monotonic, sleep
+
+try:
+    from ats_utilities.console_io.error import error_message
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.sd_notify import SdNotify
+except ImportError as ats_error_message:  # pragma: no cover
+    # Force exit python #######################################################
+    sys.exit(f'\n{__file__}\n{ats_error_message}\n')  # pragma: no cover
+
+try:
+    from os import pidfd_open
+except ImportError:  # pragma: no cover
+    pidfd_open = None  # pylint: disable=invalid-name
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class Watchdog:
+    '''
+        Defines class Watchdog with attribute(s) and method(s).
+        Creates a heartbeat watchdog for detecting hung daemon process.
+
+        heartbeat() only reads monotonic clock (vDSO, no system call)
+        until beat interval (timeout / 4) passed, then stores time of
+        beat in shared memory (inherited by forked child) and pings
+        systemd watchdog (WATCHDOG=1) when WATCHDOG_USEC is set.
+        Supervisor waits for child with wait() which kills child that
+        did not beat for timeout seconds, so it is restarted.
+
+        It defines:
+
+            :attributes:
+                | _P_VERBOSE - Console text indicator for process-phase.
+                | _SLICE - Check slice without pidfd support (seconds).
+                | _timeout - Max time without heartbeat (seconds).
+                | _interval - Beat interval (seconds).
+                | _next - Time of next beat (monotonic).
+                | _hangs - Number of killed hung processes.
+                | _notify - Systemd notification.
+                | _shared - Shared memory with time of last beat.
+                | _last - Time of last beat (monotonic) view.
+                | _usec - Cached (process ID, WATCHDOG_USEC | None).
+            :methods:
+                | __init__ - Initials Watchdog constructor.
+                | timeout - Property method for getting timeout.
+                | hangs - Property method for getting number of hangs.
+                | heartbeat - Signals that process is alive (cheap).
+                | reset - Starts new timeout period.
+                | expired - Checks is heartbeat overdue.
+                | wait - Waits for child, kills it when it hangs.
+                | close - Closes systemd notification socket.
+                | _beat - Stores beat and pings systemd watchdog.
+    '''
+
+    _P_VERBOSE: str = 'DAEMONPY::WATCHDOG'
+    _SLICE: float = 0.05
+
+    def __init__(self, timeout: float = 30.0) -> None:
+        '''
+            Initials Watchdog constructor.
+
+            :param timeout: Max time without heartbeat (seconds)
+            :type timeout: <float>
+            :exceptions: ATSValueError
+        '''
+        if timeout <= 0:
+            raise ATSValueError('watchdog timeout must be positive')
+        self._timeout: float = timeout
+        self._interval: float = timeout / 4.0
+        self._next: float = 0.0
+        self._hangs: int = 0
+        self._notify: SdNotify = SdNotify()
+        self._shared: mmap = mmap(-1, 8)
+        self._last: memoryview = memoryview(self._shared).cast('d')
+        self._last[0] = monotonic()
+        self._usec: Tuple[int, Optional[int]] = (0, None)
+
+    @property
+    def timeout(self) -> float:
+        '''
+            Property method for getting heartbeat timeout.
+
+            :return: Max time without heartbeat (seconds)
+            :rtype: <float>
+            :exceptions: None
+        '''
+        return self._timeout
+
+    @property
+    def hangs(self) -> int:
+        '''
+            Property method for getting number of killed hung processes.
+
+            :return: Number of hangs
+            :rtype: <int>
+            :exceptions: None
+        '''
+        return self._hangs
+
+    def heartbeat(self) -> None:
+        '''
+            Signals that process is alive, call it from request loop.
+
+            :exceptions: None
+        '''
+        now: float = monotonic()
+        if now >= self._next:
+            self._beat(now)
+
+    def reset(self) -> None:
+        '''
+            Starts new timeout period (on start of child process).
+
+            :exceptions: None
+        '''
+        self._last[0] = monotonic()
+        self._next = 0.0
+
+    def expired(self) -> bool:
+        '''
+            Checks is heartbeat overdue.
+
+            :return: True (no heartbeat for timeout seconds) | False
+            :rtype: <bool>
+            :exceptions: None
+        '''
+        return monotonic() - self._last[0] > self._timeout
+
+    def wait(self, pid: int) -> int:
+        '''
+            Waits for child process exit, kills it (SIGKILL) when
+            heartbeat is overdue (new timeout period starts on call).
+            Systemd watchdog of supervising process is pinged while
+            child is healthy.
+
+            :param pid: Child process ID
+            :type pid: <int>
+            :return: Wait status of child
+            :rtype: <int>
+            :exceptions: ChildProcessError
+        '''
+        self.reset()
+        pidfd: Optional[int] = None
+        try:
+            if pidfd_open is not None:
+                pidfd = pidfd_open(pid)
+        except OSError:
+            pidfd = None
+        try:
+            poller = poll()
+            if pidfd is not None:
+                poller.register(pidfd, POLLIN)
+            while True:
+                if pidfd is not None:
+                    poller.poll(self._interval * 1000.0)
+                else:
+                    sleep(min(self._SLICE, self._interval))
+                child_pid, status = waitpid(pid, WNOHANG)
+                if child_pid == pid:
+                    return status
+                if self.expired():
+                    break
+                self._beat(monotonic(), False)
+        finally:
+            if pidfd is not None:
+                close(pidfd)
+        self._hangs += 1
+        error_message([
+            f'{self._P_VERBOSE} no heartbeat for {self._timeout}s, kill', pid
+        ])
+        try:
+            kill(pid, SIGKILL)
+        except ProcessLookupError:
+            pass
+        return waitpid(pid, 0)[1]
+
+    def close(self) -> None:
+        '''
+            Closes systemd notification socket (on stop).
+
+            :exceptions: None
+        '''
+        self._notify.close()
+
+    def _beat(self, now: float, store: bool = True) -> None:
+        '''
+            Stores time of beat and pings systemd watchdog.
+
+            :param now: Current time (monotonic)
+            :type now: <float>
+            :param store: Store beat for supervising process
+            :type store: <bool>
+            :exceptions: None
+        '''
+        interval: float = self._interval
+        pid: int = getpid()
+        if self._usec[0] != pid:  # environment is checked once per process
+            self._usec = (pid, SdNotify.watchdog_usec())
+        usec: Optional[int] = self._usec[1]
+        if usec is not None:
+            interval = min(interval, usec / 2e6)
+            self._notify.notify('WATCHDOG=1')
+        if store:
+            self._last[0] = now
+        self._next = now + interval
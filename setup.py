@@ -59,6 +59,7 @@ setup(
     classifiers=PYP_CLASSIFIERS,
     packages=['daemonpy'],
     install_requires=['ats-utilities'],
+    extras_require={'uvloop': ['uvloop']},
     package_data={
         'daemonpy': [
             'py.typed'
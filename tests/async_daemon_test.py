@@ -0,0 +1,195 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    async_daemon_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class AsyncDaemonTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of AsyncDaemon.
+Execute
+    python3 -m unittest -v async_daemon_test
+'''
+
+import sys
+import unittest
+from typing import List, Optional
+from os.path import join
+from asyncio import Event, sleep
+from os import getpid, kill
+from signal import SIGHUP, SIGTERM
+from tempfile import mkdtemp
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.async_daemon import AsyncDaemon
+    from daemonpy.daemon_drain import DaemonDrain
+    from daemonpy.daemon_metrics import DaemonMetrics
+    from daemonpy.daemon_reload import DaemonReload
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class MyAsyncDaemon(AsyncDaemon):
+    '''
+        Defines class MyAsyncDaemon with attribute(s) and method(s).
+        Sets an operation for AsyncDaemon process.
+
+        It defines:
+
+            :attributes:
+                | events - Collected lifecycle events.
+                | stubborn - Ignore shutdown request in run().
+                | stopped - Set by on_shutdown() | None.
+            :methods:
+                | on_shutdown - Collects shutdown event, sets stopped.
+                | on_reload - Collects reload event.
+                | run - Runs AsyncDaemon process (defined coroutine).
+    '''
+
+    events: List[str] = []
+    stubborn: bool = False
+    stopped: Optional[Event] = None
+
+    async def on_shutdown(self) -> None:
+        '''Collects shutdown event, sets stopped.'''
+        self.events.append('shutdown')
+        if self.stopped is not None:
+            self.stopped.set()
+
+    async def on_reload(self) -> None:
+        '''Collects reload event.'''
+        self.events.append('reload')
+
+    async def run(self) -> None:
+        '''Runs AsyncDaemon process, signals itself with SIGHUP/SIGTERM.'''
+        self.stopped = Event()
+        kill(getpid(), SIGHUP)
+        await sleep(0.01)
+        kill(getpid(), SIGTERM)
+        await (Event() if self.stubborn else self.stopped).wait()
+        self.events.append('done')
+
+
+class MyDrainDaemon(MyAsyncDaemon):
+    '''
+        Defines class MyDrainDaemon with attribute(s) and method(s).
+        Sets an operation for draining AsyncDaemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs AsyncDaemon process (defined coroutine).
+    '''
+
+    async def run(self) -> None:
+        '''Runs AsyncDaemon process, stops itself during work.'''
+        self.stopped = Event()
+        state: DaemonDrain = self.lifecycle.get(DaemonDrain).state
+        with state:
+            kill(getpid(), SIGTERM)
+            await sleep(0.2)
+            self.events.append('work')
+        await self.stopped.wait()
+        self.events.append('done')
+
+
+class AsyncDaemonTestCase(unittest.TestCase):
+    '''
+        Defines class AsyncDaemonTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of AsyncDaemon.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_negative_timeout - Test negative shutdown timeout.
+                | test_graceful_shutdown - Test reload and shutdown hooks.
+                | test_cancel_on_timeout - Test cancel of stubborn run().
+                | test_drain - Test shutdown after drain.
+                | test_signal_metrics - Test counting of loop signals.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+        MyAsyncDaemon.events = []
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_negative_timeout(self) -> None:
+        '''Test negative shutdown timeout.'''
+        with self.assertRaises(ATSValueError):
+            MyAsyncDaemon(
+                join(mkdtemp(), 'async-daemon.pid'), shutdown_timeout=-1.0
+            )
+
+    def test_graceful_shutdown(self) -> None:
+        '''Test reload and shutdown hooks.'''
+        daemon: MyAsyncDaemon = MyAsyncDaemon(
+            join(mkdtemp(), 'async-daemon.pid')
+        )
+        daemon.run_daemon()
+        self.assertEqual(daemon.events, ['reload', 'shutdown', 'done'])
+        self.assertEqual(daemon.lifecycle.get(DaemonReload).reloads, 1)
+        self.assertIsNone(daemon.loop)
+
+    def test_cancel_on_timeout(self) -> None:
+        '''Test cancel of stubborn run().'''
+        daemon: MyAsyncDaemon = MyAsyncDaemon(
+            join(mkdtemp(), 'async-daemon.pid'), shutdown_timeout=0.05
+        )
+        daemon.stubborn = True
+        daemon.run_daemon()
+        self.assertEqual(daemon.events, ['reload', 'shutdown'])
+
+    def test_drain(self) -> None:
+        '''Test shutdown requested when in-flight work finished.'''
+        daemon: MyDrainDaemon = MyDrainDaemon(
+            join(mkdtemp(), 'async-daemon.pid')
+        )
+        daemon.lifecycle.add(DaemonDrain(5.0))
+        daemon.run_daemon()
+        self.assertEqual(daemon.events, ['work', 'shutdown', 'done'])
+
+    def test_signal_metrics(self) -> None:
+        '''Test signals routed on loop are counted by metrics.'''
+        daemon: MyAsyncDaemon = MyAsyncDaemon(
+            join(mkdtemp(), 'async-daemon.pid')
+        )
+        metrics: DaemonMetrics = daemon.lifecycle.add(DaemonMetrics())
+        daemon.run_daemon()
+        text: str = metrics.registry.expose()
+        self.assertIn('daemonpy_signals_total{signal="SIGHUP"} 1', text)
+        self.assertIn('daemonpy_signals_total{signal="SIGTERM"} 1', text)
+        self.assertIn('daemonpy_reloads_total 1', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
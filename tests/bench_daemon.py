@@ -0,0 +1,76 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    bench_daemon.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class BenchDaemon with attribute(s) and method(s).
+    Creates a daemon measured by lifecycle benchmark.
+Execute
+    python3 bench_daemon.py PID fast|slow fork|foreground OPERATION
+'''
+
+import sys
+from typing import List
+from signal import signal, SIGTERM
+from time import sleep
+
+try:
+    from daemonpy.daemon import Daemon
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+SHUTDOWN_DELAY: float = 0.2
+
+
+class BenchDaemon(Daemon):
+    '''
+        Defines class BenchDaemon with attribute(s) and method(s).
+        Creates a daemon measured by lifecycle benchmark.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (waits for stop signal).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (waits for stop signal).
+
+            :exceptions: None
+        '''
+        while True:
+            sleep(3600)
+
+
+if __name__ == '__main__':
+    if sys.argv[2] == 'slow':
+        signal(SIGTERM, lambda *_: sleep(SHUTDOWN_DELAY) or sys.exit(0))
+    DAEMON: BenchDaemon = BenchDaemon(sys.argv[1])
+    DAEMON.foreground = sys.argv[3] == 'foreground'
+    DAEMON.usage(sys.argv[4])
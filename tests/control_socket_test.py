@@ -0,0 +1,182 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    control_socket_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ControlSocketTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of ControlSocket.
+Execute
+    python3 -m unittest -v control_socket_test
+'''
+
+import sys
+import unittest
+from typing import Any, Dict, List
+from os import stat, umask
+from os.path import exists, join
+from socket import socket, AF_UNIX, SOCK_STREAM
+from stat import S_IMODE
+from tempfile import mkdtemp
+from time import sleep
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.control_socket import ControlSocket
+    from daemonpy.daemon import Daemon
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+class ControlSocketTestCase(unittest.TestCase):
+    '''
+        Defines class ControlSocketTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of ControlSocket.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_wrong_command - Test registering of wrong command.
+                | test_request - Test request, reply and deferred callback.
+                | test_daemon_commands - Test built-in daemon commands.
+                | test_owner_only - Test socket mode under cleared umask.
+                | test_stalled_client - Test stalled client blocks nobody.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_wrong_command(self) -> None:
+        '''Test registering of wrong command.'''
+        with self.assertRaises(ATSValueError):
+            ControlSocket('')
+        with self.assertRaises(ATSValueError):
+            ControlSocket('/tmp/x.sock').register('two words', len)
+
+    def test_request(self) -> None:
+        '''Test request, reply and deferred callback.'''
+        path: str = join(mkdtemp(), 'daemon.sock')
+        control: ControlSocket = ControlSocket(path)
+        done: List[str] = []
+        control.register('echo', lambda args: args)
+        control.register('later', lambda _: control.defer(
+            lambda: done.append('later')
+        ))
+        control.register('fail', lambda _: 1 / 0)
+        control.start()
+        self.assertEqual(control.request(path, 'ping')['result'], 'pong')
+        self.assertEqual(
+            control.request(path, 'echo', ['a', 'b'])['result'], ['a', 'b']
+        )
+        control.request(path, 'later')
+        for _ in range(100):
+            if done:
+                break
+            sleep(0.01)
+        self.assertEqual(done, ['later'])
+        failed: Dict[str, Any] = control.request(path, 'fail')
+        self.assertFalse(failed['ok'])
+        self.assertIn('ZeroDivisionError', failed['error'])
+        self.assertFalse(control.request(path, 'missing')['ok'])
+        control.close()
+        self.assertFalse(exists(path))
+        with self.assertRaises(OSError):
+            control.request(path, 'ping')
+
+    def test_daemon_commands(self) -> None:
+        '''Test built-in daemon commands through usage operations.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'daemon.pid'))
+        self.assertEqual(daemon.control('ping'), 1)
+        daemon.add_command('hello', lambda args: f'hello {" ".join(args)}')
+        self.assertTrue(daemon.control_socket is not None)
+        daemon.open_channels()
+        self.assertEqual(daemon.control('ping'), 0)
+        self.assertEqual(daemon.control('stats', json_output=True), 0)
+        self.assertEqual(daemon.control('hello', args=['world']), 0)
+        self.assertFalse(daemon.draining)
+        with self.assertRaises(SystemExit) as drained:
+            daemon.usage('drain')
+        self.assertEqual(drained.exception.code, 0)
+        self.assertTrue(daemon.draining)
+        daemon.close_channels()
+        self.assertEqual(daemon.control('reload'), 1)
+
+    def test_owner_only(self) -> None:
+        '''Test socket is owner only when bound under cleared umask.'''
+        path: str = join(mkdtemp(), 'daemon.sock')
+        control: ControlSocket = ControlSocket(path)
+        mask: int = umask(0)
+        try:
+            control.start()
+        finally:
+            umask(mask)
+        self.assertEqual(S_IMODE(stat(path).st_mode), 0o600)
+        self.assertEqual(umask(mask), mask)
+        control.close()
+
+    def test_stalled_client(self) -> None:
+        '''Test idle client connection does not block other clients.'''
+        path: str = join(mkdtemp(), 'daemon.sock')
+        control: ControlSocket = ControlSocket(path)
+        control.start()
+        with socket(AF_UNIX, SOCK_STREAM) as stalled:
+            stalled.connect(path)
+            reply: Dict[str, Any] = control.request(
+                path, 'ping', timeout=1.0
+            )
+            self.assertEqual(reply['result'], 'pong')
+        control.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
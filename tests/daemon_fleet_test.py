@@ -0,0 +1,166 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_fleet_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonFleetTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of DaemonFleet.
+Execute
+    python3 -m unittest -v daemon_fleet_test
+'''
+
+import sys
+import unittest
+from typing import Dict, List, Optional
+from os import link
+from os.path import abspath, dirname, exists, join
+from signal import SIGTERM
+from tempfile import mkdtemp
+from time import monotonic
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon_fleet import DaemonFleet
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.stop_policy import StopPolicy, StopResult
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+MEMBER: str = '''
+import sys
+from os import fork, getpid, setsid, _exit
+from signal import signal, SIGTERM, SIG_IGN
+from time import sleep
+sys.path.insert(0, sys.argv[2])
+from daemonpy.file_process_id import FileProcessId
+if fork() > 0:
+    _exit(0)
+setsid()
+def replace(*_):
+    FileProcessId.lock_write(sys.argv[1], '1\\n', True)
+    _exit(0)
+if sys.argv[1].endswith('stubborn.pid'):
+    signal(SIGTERM, SIG_IGN)
+if sys.argv[1].endswith('replaced.pid'):
+    signal(SIGTERM, replace)
+lock = FileProcessId.lock_write(sys.argv[1], f'{getpid()}\\n')
+sleep(60)
+'''
+
+
+class DaemonFleetTestCase(unittest.TestCase):
+    '''
+        Defines class DaemonFleetTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of DaemonFleet.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_empty_pid - Test creation with empty PID file path.
+                | test_fleet - Test start, status and stop of fleet.
+                | test_shared_pid - Test PID files naming same daemon.
+                | test_replaced_pid - Test PID file taken over is kept.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_empty_pid(self) -> None:
+        '''Test creation with empty PID file path.'''
+        with self.assertRaises(ATSValueError):
+            DaemonFleet(['/tmp/fleet.pid', ''])
+
+    def test_fleet(self) -> None:
+        '''Test start, status and stop of fleet.'''
+        directory: str = mkdtemp()
+        names: List[str] = [f'{index}.pid' for index in range(8)]
+        names.append('stubborn.pid')
+        commands: Dict[str, List[str]] = {
+            join(directory, name): [
+                sys.executable, '-c', MEMBER, join(directory, name),
+                dirname(dirname(abspath(__file__)))
+            ] for name in names
+        }
+        fleet: DaemonFleet = DaemonFleet(list(commands))
+        started: Dict[str, bool] = fleet.start(commands, 10.0)
+        self.assertTrue(all(started.values()))
+        fleet = DaemonFleet(directory)
+        self.assertEqual(len(fleet.pids), len(names))
+        self.assertTrue(all(
+            status.exit_code == 0 for status in fleet.status().values()
+        ))
+        start: float = monotonic()
+        results: Dict[str, Optional[StopResult]] = fleet.stop(
+            policy=StopPolicy([SIGTERM], 1.0)
+        )
+        self.assertLess(monotonic() - start, 5.0)
+        self.assertTrue(all(results.values()))
+        stubborn: Optional[StopResult] = results[join(directory, names[-1])]
+        self.assertEqual(len(stubborn.phases) if stubborn else 0, 2)
+        self.assertFalse(any(exists(pid_path) for pid_path in commands))
+        self.assertTrue(all(
+            status.exit_code == 3 for status in fleet.status().values()
+        ))
+
+    def test_shared_pid(self) -> None:
+        '''Test stop of PID files naming same daemon (shared result).'''
+        directory: str = mkdtemp()
+        pid_path: str = join(directory, 'daemon.pid')
+        alias: str = join(directory, 'alias.pid')
+        fleet: DaemonFleet = DaemonFleet([pid_path])
+        self.assertTrue(fleet.start({pid_path: [
+            sys.executable, '-c', MEMBER, pid_path,
+            dirname(dirname(abspath(__file__)))
+        ]})[pid_path])
+        link(pid_path, alias)
+        results: Dict[str, Optional[StopResult]] = DaemonFleet(
+            [pid_path, alias]
+        ).stop()
+        self.assertIsNotNone(results[alias])
+        self.assertIs(results[alias], results[pid_path])
+        self.assertFalse(exists(pid_path) or exists(alias))
+
+    def test_replaced_pid(self) -> None:
+        '''Test PID file taken over by other daemon is not removed.'''
+        pid_path: str = join(mkdtemp(), 'replaced.pid')
+        fleet: DaemonFleet = DaemonFleet([pid_path])
+        self.assertTrue(fleet.start({pid_path: [
+            sys.executable, '-c', MEMBER, pid_path,
+            dirname(dirname(abspath(__file__)))
+        ]})[pid_path])
+        self.assertTrue(fleet.stop()[pid_path])
+        self.assertEqual(FileProcessId.read_pid(pid_path), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
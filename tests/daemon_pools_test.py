@@ -0,0 +1,231 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_pools_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonPoolsTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of DaemonPools.
+Execute
+    python3 -m unittest -v daemon_pools_test
+'''
+
+import sys
+import unittest
+from typing import Any, Dict, List, Optional
+from os.path import abspath, dirname, exists, join
+from subprocess import Popen
+from tempfile import mkdtemp
+from threading import Event
+from time import monotonic, sleep
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon import Daemon
+    from daemonpy.daemon_pools import DaemonPools
+    from daemonpy.managed_pool import ManagedPool
+    from daemonpy.stop_policy import StopResult
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+WORKER: str = '''
+import sys
+from time import sleep
+from daemonpy.daemon import Daemon
+from daemonpy.daemon_pools import DaemonPools
+def task():
+    sleep(0.5)
+    with open(sys.argv[2], 'a', encoding='utf-8') as log:
+        log.write('done\\n')
+class Worker(Daemon):
+    def run(self):
+        self.lifecycle.get(DaemonPools).get('io').submit(task)
+        with open(sys.argv[2], 'a', encoding='utf-8') as log:
+            log.write('submitted\\n')
+        while True:
+            sleep(60)
+worker = Worker(sys.argv[1])
+worker.lifecycle.add(DaemonPools()).add('io', workers=2)
+worker.enable_control()
+worker.usage('start')
+'''
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+class DaemonPoolsTestCase(unittest.TestCase):
+    '''
+        Defines class DaemonPoolsTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of DaemonPools.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_wrong_pool - Test creation of wrong pools.
+                | test_metrics - Test queue depth and utilization.
+                | test_deadline - Test shutdown deadline.
+                | test_process_pool - Test process pool shutdown.
+                | test_stop_waits - Test stop waiting for pool tasks.
+                | test_add_pool - Test pool shortcuts of daemon.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_wrong_pool(self) -> None:
+        '''Test creation of wrong pools.'''
+        with self.assertRaises(ATSValueError):
+            ManagedPool('wrong', 'fiber')
+        with self.assertRaises(ATSValueError):
+            ManagedPool('wrong', workers=0)
+        with self.assertRaises(ATSValueError):
+            ManagedPool('closed').submit(print)
+        daemon: MyDaemon = MyDaemon('/tmp/pools.pid')
+        pools: DaemonPools = daemon.lifecycle.add(DaemonPools())
+        pools.add('io')
+        with self.assertRaises(ATSValueError):
+            pools.add('io')
+        with self.assertRaises(ATSValueError):
+            pools.get('cpu')
+        with self.assertRaises(ATSValueError):
+            pools.timeout = -1.0
+
+    def test_metrics(self) -> None:
+        '''Test queue depth and utilization.'''
+        pool: ManagedPool = ManagedPool('io', workers=2)
+        pool.open()
+        release: Event = Event()
+        for _ in range(5):
+            pool.submit(release.wait, 5.0)
+        failed: Any = pool.submit(lambda: 1 / 0)
+        metrics: Dict[str, Any] = pool.metrics()
+        self.assertEqual(metrics['queue_depth'], 4)
+        self.assertEqual(metrics['utilization'], 1.0)
+        release.set()
+        failed.exception(5.0)
+        self.assertTrue(pool.shutdown(5.0))
+        metrics = pool.metrics()
+        self.assertEqual(metrics['completed'], 5)
+        self.assertEqual(metrics['failed'], 1)
+        self.assertEqual(metrics['cancelled'], 0)
+        self.assertEqual(metrics['utilization'], 0.0)
+        self.assertIsNone(pool.executor)
+
+    def test_deadline(self) -> None:
+        '''Test shutdown deadline (queued tasks dropped).'''
+        pool: ManagedPool = ManagedPool('io', workers=1)
+        pool.open()
+        pool.submit(sleep, 0.5)
+        queued: Any = pool.submit(sleep, 0.5)
+        start: float = monotonic()
+        self.assertFalse(pool.shutdown(0.1))
+        self.assertLess(monotonic() - start, 0.4)
+        self.assertTrue(queued.cancelled())
+        self.assertEqual(pool.metrics()['cancelled'], 1)
+
+    def test_process_pool(self) -> None:
+        '''Test process pool shutdown (workers terminated).'''
+        pool: ManagedPool = ManagedPool('cpu', 'process', 1)
+        pool.open()
+        self.assertEqual(pool.submit(pow, 2, 10).result(30.0), 1024)
+        pool.submit(sleep, 30.0)
+        sleep(0.2)
+        start: float = monotonic()
+        self.assertFalse(pool.shutdown(0.2))
+        self.assertLess(monotonic() - start, 5.0)
+        workers: List[Any] = getattr(pool, '_processes')
+        self.assertEqual(len(workers), 1)
+        workers[0].join(5.0)
+        self.assertFalse(workers[0].is_alive())
+
+    def test_stop_waits(self) -> None:
+        '''Test stop waiting for pool tasks before exit.'''
+        directory: str = mkdtemp()
+        pid_path: str = join(directory, 'worker.pid')
+        log_path: str = join(directory, 'worker.log')
+        with Popen(
+            [sys.executable, '-c', WORKER, pid_path, log_path],
+            cwd=dirname(abspath(__file__))
+        ) as launcher:
+            launcher.wait(10.0)
+        for _ in range(500):
+            if exists(log_path):
+                break
+            sleep(0.01)
+        daemon: MyDaemon = MyDaemon(pid_path)
+        self.assertEqual(daemon.control('stats', json_output=True), 0)
+        result: Optional[StopResult] = daemon.stop()
+        self.assertTrue(result)
+        self.assertEqual(
+            [phase[0] for phase in getattr(result, 'phases')], ['SIGTERM']
+        )
+        with open(log_path, encoding='utf-8') as log:
+            self.assertEqual(log.read().split(), ['submitted', 'done'])
+        self.assertFalse(exists(pid_path))
+
+    def test_add_pool(self) -> None:
+        '''Test pool shortcuts add pools component once.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'pools.pid'))
+        with self.assertRaises(ATSValueError):
+            daemon.pool('io')
+        io_pool: ManagedPool = daemon.add_pool('io', workers=2)
+        cpu_pool: ManagedPool = daemon.add_pool('cpu', 'process', 1)
+        self.assertIs(daemon.pool('io'), io_pool)
+        self.assertIs(daemon.pool('cpu'), cpu_pool)
+        pools: Optional[DaemonPools] = daemon.lifecycle.get(DaemonPools)
+        self.assertIsNotNone(pools)
+        self.assertIs(getattr(pools, 'get')('io'), io_pool)
+        with self.assertRaises(ATSValueError):
+            daemon.add_pool('io')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    daemon_systemd_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DaemonSystemdTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of DaemonSystemd.
+Execute
+    python3 -m unittest -v daemon_systemd_test
+'''
+
+import sys
+import unittest
+from typing import Dict, List
+from os import environ
+from os.path import abspath, dirname, exists, join
+from socket import socket, AF_UNIX, SOCK_DGRAM
+from subprocess import PIPE, Popen
+from tempfile import mkdtemp
+
+try:
+    from daemonpy.daemon import Daemon
+    from daemonpy.sd_notify import SdNotify
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+SERVICE: str = '''
+import sys
+from daemonpy.daemon import Daemon
+class Service(Daemon):
+    def run(self):
+        listener = self.listen(self.listen_sockets[0].getsockname())
+        print(len(self.listen_sockets), listener.getsockname(), flush=True)
+daemon = Service(sys.argv[1])
+print(daemon.foreground, flush=True)
+daemon.usage('start')
+'''
+
+ACTIVATE: str = '''
+import sys
+from os import dup2, environ, execv, getpid
+dup2(int(sys.argv[1]), 3)
+environ.update(LISTEN_PID=str(getpid()), LISTEN_FDS='1')
+execv(sys.executable, [sys.executable, '-c'] + sys.argv[2:])
+'''
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+class DaemonSystemdTestCase(unittest.TestCase):
+    '''
+        Defines class DaemonSystemdTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of DaemonSystemd.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_not_systemd - Test daemon started without systemd.
+                | test_no_activation - Test sockets passed to other process.
+                | test_notify_service - Test foreground socket activated run.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_not_systemd(self) -> None:
+        '''Test daemon started without systemd.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'daemon.pid'))
+        self.assertFalse(daemon.foreground)
+        self.assertFalse(daemon.notify('READY=1'))
+        self.assertFalse(daemon.notify_status('running'))
+        daemon.foreground = True
+        self.assertTrue(daemon.foreground)
+
+    def test_no_activation(self) -> None:
+        '''Test sockets passed to other process are not adopted.'''
+        environ.update(LISTEN_PID='1', LISTEN_FDS='1')
+        self.assertEqual(SdNotify.listen_fds(), [])
+        self.assertNotIn('LISTEN_FDS', environ)
+
+    def test_notify_service(self) -> None:
+        '''Test foreground run with notification and socket activation.'''
+        directory: str = mkdtemp()
+        pid_path: str = join(directory, 'daemon.pid')
+        with socket(AF_UNIX, SOCK_DGRAM) as notify, socket() as listener:
+            notify.bind(join(directory, 'notify.sock'))
+            notify.settimeout(5.0)
+            listener.bind(('127.0.0.1', 0))
+            listener.listen()
+            env: Dict[str, str] = dict(
+                environ, NOTIFY_SOCKET=join(directory, 'notify.sock')
+            )
+            with Popen(
+                [
+                    sys.executable, '-c', ACTIVATE, str(listener.fileno()),
+                    SERVICE, pid_path
+                ],
+                cwd=dirname(abspath(__file__)), env=env, stdout=PIPE,
+                pass_fds=[listener.fileno()], text=True
+            ) as service:
+                output: str = service.communicate(timeout=10.0)[0]
+                self.assertEqual(service.returncode, 0)
+            self.assertEqual(output.splitlines(), [
+                'True', f'1 {listener.getsockname()}'
+            ])
+            datagrams: List[bytes] = [notify.recv(256) for _ in range(3)]
+        self.assertEqual(datagrams, [
+            f'MAINPID={service.pid}'.encode(),
+            f'READY=1\nSTATUS=running\nMAINPID={service.pid}'.encode(),
+            b'STOPPING=1\nSTATUS=stopping'
+        ])
+        self.assertFalse(exists(pid_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    drain_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class DrainTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of Drain.
+Execute
+    python3 -m unittest -v drain_test
+'''
+
+import sys
+import unittest
+from typing import List, Optional
+from os.path import abspath, dirname, exists, join
+from subprocess import Popen
+from tempfile import mkdtemp
+from time import sleep
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon import Daemon
+    from daemonpy.daemon_drain import DaemonDrain
+    from daemonpy.drain import Drain
+    from daemonpy.stop_policy import StopResult
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+WORKER: str = '''
+import sys
+from time import sleep
+from daemonpy.daemon import Daemon
+from daemonpy.daemon_drain import DaemonDrain
+class Worker(Daemon):
+    def on_drain(self):
+        self.log('drain')
+    def log(self, text):
+        with open(sys.argv[2], 'a', encoding='utf-8') as log:
+            log.write(f'{text}\\n')
+    def run(self):
+        state = self.lifecycle.get(DaemonDrain).state
+        while state.acquire():
+            try:
+                self.log('begin')
+                sleep(0.5)
+                self.log('end')
+            finally:
+                state.release()
+        sleep(60)
+worker = Worker(sys.argv[1])
+worker.lifecycle.add(DaemonDrain(5.0))
+worker.usage('start')
+'''
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+class DrainTestCase(unittest.TestCase):
+    '''
+        Defines class DrainTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of Drain.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_wrong_timeout - Test creation with wrong timeout.
+                | test_in_flight - Test admission and in-flight counter.
+                | test_timeout - Test drain deadline.
+                | test_stop_drains - Test stop waiting for in-flight work.
+                | test_enable_drain - Test drain shortcut of daemon.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_wrong_timeout(self) -> None:
+        '''Test creation with wrong timeout.'''
+        with self.assertRaises(ATSValueError):
+            Drain(-1.0)
+
+    def test_in_flight(self) -> None:
+        '''Test admission and in-flight counter.'''
+        drain: Drain = Drain(1.0)
+        self.assertTrue(drain.acquire())
+        with drain:
+            self.assertEqual(drain.in_flight, 2)
+        self.assertTrue(drain.start())
+        self.assertFalse(drain.start())
+        self.assertTrue(drain.event.is_set())
+        self.assertFalse(drain.acquire())
+        with self.assertRaises(ATSValueError):
+            with drain:
+                pass
+        drain.release()
+        self.assertTrue(drain.wait())
+        self.assertEqual(drain.in_flight, 0)
+
+    def test_timeout(self) -> None:
+        '''Test drain deadline with unfinished work.'''
+        drain: Drain = Drain(0.1)
+        drain.acquire()
+        drain.start()
+        self.assertFalse(drain.wait())
+        self.assertEqual(drain.in_flight, 1)
+
+    def test_stop_drains(self) -> None:
+        '''Test stop waiting for in-flight work (no SIGKILL).'''
+        directory: str = mkdtemp()
+        pid_path: str = join(directory, 'worker.pid')
+        log_path: str = join(directory, 'worker.log')
+        with Popen(
+            [sys.executable, '-c', WORKER, pid_path, log_path],
+            cwd=dirname(abspath(__file__))
+        ) as launcher:
+            launcher.wait(10.0)
+        for _ in range(500):
+            if exists(log_path):
+                break
+            sleep(0.01)
+        daemon: MyDaemon = MyDaemon(pid_path)
+        daemon.lifecycle.add(DaemonDrain(5.0))
+        result: Optional[StopResult] = daemon.stop()
+        self.assertIsNotNone(result)
+        self.assertTrue(result)
+        self.assertEqual(
+            [phase[0] for phase in getattr(result, 'phases')], ['SIGTERM']
+        )
+        with open(log_path, encoding='utf-8') as log:
+            lines: List[str] = log.read().split()
+        self.assertEqual(lines[-3:], ['begin', 'drain', 'end'])
+        self.assertFalse(exists(pid_path))
+
+    def test_enable_drain(self) -> None:
+        '''Test drain shortcut adds drain component once.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'daemon.pid'))
+        self.assertIsNone(daemon.drain_state)
+        state: Drain = daemon.enable_drain(1.0)
+        self.assertIs(daemon.drain_state, state)
+        self.assertIs(daemon.enable_drain(2.0), state)
+        self.assertEqual(state.timeout, 1.0)
+        component: Optional[DaemonDrain] = daemon.lifecycle.get(DaemonDrain)
+        self.assertIsNotNone(component)
+        self.assertIs(getattr(component, 'state'), state)
+
+
+if __name__ == '__main__':
+    unittest.main()
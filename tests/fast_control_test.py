@@ -0,0 +1,164 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    fast_control_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class FastControlTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of FastControl.
+Execute
+    python3 -m unittest -v fast_control_test
+'''
+
+import sys
+import unittest
+from typing import Dict, List
+from os.path import abspath, dirname, exists, join
+from signal import SIGKILL
+from subprocess import PIPE, Popen, run
+from tempfile import mkdtemp, mkstemp
+from time import monotonic, sleep
+
+try:
+    from daemonpy.fast_control import FastControl
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+HOLDER: str = '''
+import sys
+from os import getpid
+from time import sleep
+from signal import signal, SIGTERM, SIG_IGN
+from daemonpy.file_process_id import FileProcessId
+
+if sys.argv[2:] == ['ignore']:
+    signal(SIGTERM, SIG_IGN)
+FileProcessId.lock_write(sys.argv[1], f'{getpid()}\\n')
+while True:
+    sleep(1)
+'''
+
+
+def import_times(module: str) -> Dict[str, int]:
+    '''
+        Imports module in new interpreter with python -X importtime.
+
+        :param module: Module name
+        :type module: <str>
+        :return: Cumulative import time (us) for each imported module
+        :rtype: <Dict[str, int]>
+        :exceptions: None
+    '''
+    result = run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=dirname(abspath(__file__)), stderr=PIPE, text=True, check=True
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class FastControlTestCase(unittest.TestCase):
+    '''
+        Defines class FastControlTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of FastControl.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_import_time - Test imports of control path.
+                | test_not_running - Test status and stop without daemon.
+                | test_stop - Test status and stop of running daemon.
+                | test_kill - Test stop of daemon ignoring SIGTERM.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_import_time(self) -> None:
+        '''Test control path does not import heavy modules.'''
+        fast: Dict[str, int] = import_times('daemonpy.fast_control')
+        full: Dict[str, int] = import_times('daemonpy.daemon')
+        for module in ['daemonpy.daemon', 'inspect']:
+            self.assertNotIn(module, fast)
+        self.assertFalse([name for name in fast if 'ats_utilities' in name])
+        self.assertLess(
+            fast['daemonpy.fast_control'], full['daemonpy.daemon']
+        )
+
+    def test_not_running(self) -> None:
+        '''Test status and stop without running daemon.'''
+        pid_path: str = mkstemp(suffix='.pid')[1]
+        self.assertEqual(FastControl.status(pid_path), FastControl.DEAD)
+        self.assertEqual(FastControl.stop(pid_path), 0)
+        self.assertEqual(
+            FastControl.status('/tmp/missing_daemon.pid'),
+            FastControl.NOT_RUNNING
+        )
+        self.assertEqual(FastControl.main(['restart', pid_path]), 2)
+
+    def test_stop(self) -> None:
+        '''Test status and stop of running daemon.'''
+        pid_path: str = mkstemp(suffix='.pid')[1]
+        with Popen(
+            [sys.executable, '-c', HOLDER, pid_path],
+            cwd=dirname(abspath(__file__))
+        ) as holder:
+            deadline: float = monotonic() + 5.0
+            while not FastControl.is_running(pid_path):
+                self.assertLess(monotonic(), deadline)
+                sleep(0.01)
+            self.assertEqual(FastControl.read_pid(pid_path), holder.pid)
+            self.assertEqual(FastControl.main(['status', pid_path]), 0)
+            self.assertEqual(FastControl.main(['stop', pid_path]), 0)
+            self.assertIsNotNone(holder.wait(5.0))
+
+    def test_kill(self) -> None:
+        '''Test stop of daemon ignoring SIGTERM (PID file removed).'''
+        pid_path: str = join(mkdtemp(), 'holder.pid')
+        with Popen(
+            [sys.executable, '-c', HOLDER, pid_path, 'ignore'],
+            cwd=dirname(abspath(__file__))
+        ) as holder:
+            deadline: float = monotonic() + 5.0
+            while not FastControl.is_running(pid_path):
+                self.assertLess(monotonic(), deadline)
+                sleep(0.01)
+            self.assertEqual(FastControl.stop(pid_path, 0.2), 0)
+            self.assertEqual(holder.wait(5.0), -SIGKILL)
+        self.assertFalse(exists(pid_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
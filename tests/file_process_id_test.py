@@ -24,7 +24,10 @@ Execute
 
 import sys
 import unittest
-from typing import List
+from typing import List, Optional
+from os import close
+from os.path import exists, join
+from tempfile import TemporaryDirectory
 
 try:
     from ats_utilities.exceptions.ats_type_error import ATSTypeError
@@ -52,7 +55,7 @@ class FileProcessIdTestCase(unittest.TestCase):
         It defines:
 
             :attributes:
-                | None
+                | directory - Temporary directory of PID files.
             :methods:
                 | setUp - Call before test cases.
                 | tearDown - Call after test cases.
@@ -61,13 +64,17 @@ class FileProcessIdTestCase(unittest.TestCase):
                 | test_cration_empty_path - Test creation empty path.
                 | test_cration_none_mode - Test creation None mode.
                 | test_cration_empty_mode - Test creation empty mode.
+                | test_lock_write - Test locked write and running check.
+                | test_stale_lock_write - Test locked write over stale file.
     '''
 
     def setUp(self) -> None:
         '''Call before test case.'''
+        self.directory: TemporaryDirectory[str] = TemporaryDirectory()
 
     def tearDown(self) -> None:
         '''Call after test case.'''
+        self.directory.cleanup()
 
     def test_creation(self) -> None:
         '''Test creation.'''
@@ -101,6 +108,43 @@ class FileProcessIdTestCase(unittest.TestCase):
             with FileProcessId(null, ''):
                 print('Not reachable')
 
+    def test_lock_write(self) -> None:
+        '''Test locked write, running check and read of PID.'''
+        pid_path: str = join(self.directory.name, 'daemon.pid')
+        with open(pid_path, 'w', encoding='utf-8'):
+            pass
+        self.assertIsNone(FileProcessId.read_pid(pid_path))
+        self.assertFalse(FileProcessId.is_running(pid_path))
+        pid_lock: Optional[int] = FileProcessId.lock_write(
+            pid_path, '1234\n5678\n'
+        )
+        self.assertIsNotNone(pid_lock)
+        self.assertTrue(FileProcessId.is_running(pid_path))
+        self.assertEqual(FileProcessId.read_pid(pid_path), 1234)
+        self.assertIsNone(FileProcessId.lock_write(pid_path, '4321\n'))
+        new_lock: Optional[int] = FileProcessId.lock_write(
+            pid_path, '4321\n', True
+        )
+        self.assertEqual(FileProcessId.read_pid(pid_path), 4321)
+        for lock in (pid_lock, new_lock):
+            if lock is not None:
+                close(lock)
+        self.assertFalse(FileProcessId.is_running(pid_path))
+        self.assertFalse(FileProcessId.is_running(f'{pid_path}.missing'))
+        self.assertIsNone(FileProcessId.read_pid(f'{pid_path}.missing'))
+        self.assertFalse(exists(f'{pid_path}.missing'))
+
+    def test_stale_lock_write(self) -> None:
+        '''Test locked write over stale PID file.'''
+        pid_path: str = join(self.directory.name, 'daemon.pid')
+        with open(pid_path, 'w', encoding='utf-8') as pid_file:
+            pid_file.write('1\n')
+        pid_lock: Optional[int] = FileProcessId.lock_write(pid_path, '2\n')
+        self.assertIsNotNone(pid_lock)
+        self.assertEqual(FileProcessId.read_pid(pid_path), 2)
+        if pid_lock is not None:
+            close(pid_lock)
+
 
 if __name__ == '__main__':
     unittest.main()
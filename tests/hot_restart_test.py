@@ -0,0 +1,238 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    hot_restart_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class HotRestartTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of HotRestart.
+Execute
+    python3 -m unittest -v hot_restart_test
+'''
+
+import sys
+import unittest
+from typing import Callable, Dict, List, Optional
+from os import dup, environ, kill
+from os.path import abspath, dirname, exists, join
+from socket import create_connection, socket
+from subprocess import Popen
+from tempfile import mkdtemp
+from threading import Event, Thread
+from time import monotonic, sleep
+
+try:
+    from daemonpy.daemon import Daemon
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.hot_restart import HotRestart
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+SERVER: str = '''
+import sys
+from os import getpid
+from daemonpy.daemon import Daemon
+from daemonpy.daemon_component import DaemonComponent
+def log(text):
+    with open(f'{sys.argv[1]}.log', 'a', encoding='utf-8') as log_file:
+        log_file.write(f'{text} {getpid()}\\n')
+class Ready(DaemonComponent):
+    def open(self):
+        log('ready')
+class Server(Daemon):
+    def on_drain(self):
+        log('drained')
+    def run(self):
+        listener = self.listen(('127.0.0.1', int(sys.argv[2])))
+        while True:
+            connection, _ = listener.accept()
+            with connection:
+                connection.sendall(f'{getpid()}\\n'.encode())
+server = Server(sys.argv[1])
+server.lifecycle.add(Ready())
+server.usage(sys.argv[3])
+'''
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+def wait_for(check: Callable[[], bool], timeout: float = 10.0) -> bool:
+    '''
+        Waits until check passes.
+
+        :param check: Checked condition
+        :type check: <Callable[[], bool]>
+        :param timeout: Max wait time (seconds)
+        :type timeout: <float>
+        :return: True (check passed) | False (timeout)
+        :rtype: <bool>
+        :exceptions: None
+    '''
+    deadline: float = monotonic() + timeout
+    while monotonic() < deadline:
+        if check():
+            return True
+        sleep(0.01)
+    return False
+
+
+def alive(pid: int) -> bool:
+    '''
+        Checks is process running.
+
+        :param pid: Process ID
+        :type pid: <int>
+        :return: True (running) | False
+        :rtype: <bool>
+        :exceptions: None
+    '''
+    try:
+        kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class HotRestartTestCase(unittest.TestCase):
+    '''
+        Defines class HotRestartTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of HotRestart.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_cold_start - Test start without previous generation.
+                | test_adopt_inherited - Test adopting inherited socket.
+                | test_hot_restart - Test accepting across hot restart.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_cold_start(self) -> None:
+        '''Test start without previous generation.'''
+        hot_restart: HotRestart = HotRestart(['start', 'stop'])
+        self.assertIsNone(hot_restart.old_pid)
+        self.assertEqual(hot_restart.sockets, [])
+        listener: socket = hot_restart.listen(('127.0.0.1', 0))
+        self.assertEqual(hot_restart.sockets, [listener])
+        listener.close()
+
+    def test_adopt_inherited(self) -> None:
+        '''Test adopting inherited socket.'''
+        with socket() as old_listener:
+            old_listener.bind(('127.0.0.1', 0))
+            old_listener.listen()
+            port: int = old_listener.getsockname()[1]
+            environ[HotRestart.ENV_FDS] = str(dup(old_listener.fileno()))
+            environ[HotRestart.ENV_OLD_PID] = '1'
+            hot_restart: HotRestart = HotRestart(['start', 'stop'])
+            self.assertNotIn(HotRestart.ENV_FDS, environ)
+            self.assertEqual(hot_restart.old_pid, 1)
+            listener: socket = hot_restart.listen(('127.0.0.1', port))
+            self.assertEqual(listener.getsockname()[1], port)
+            self.assertEqual(hot_restart.sockets, [listener])
+            listener.close()
+
+    def test_hot_restart(self) -> None:
+        '''Test listening socket keeps accepting across hot restart.'''
+        directory: str = mkdtemp()
+        pid_path: str = join(directory, 'server.pid')
+        script: str = join(directory, 'server.py')
+        with open(script, 'w', encoding='utf-8') as script_file:
+            script_file.write(SERVER)
+        with socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            port: int = probe.getsockname()[1]
+        tests: str = dirname(abspath(__file__))
+        env: Dict[str, str] = dict(environ, PYTHONPATH=tests)
+        with Popen(
+            [sys.executable, script, pid_path, str(port), 'start'],
+            cwd=tests, env=env
+        ) as launcher:
+            launcher.wait(10.0)
+        self.assertTrue(wait_for(lambda: FileProcessId.is_running(pid_path)))
+        old_pid: Optional[int] = FileProcessId.read_pid(pid_path)
+        replies: List[str] = []
+        errors: List[OSError] = []
+        done: Event = Event()
+
+        def connect() -> None:
+            while not done.is_set():
+                try:
+                    with create_connection(('127.0.0.1', port), 5.0) as peer:
+                        replies.append(peer.recv(64).decode().strip())
+                except OSError as os_error:
+                    errors.append(os_error)
+        client: Thread = Thread(target=connect)
+        client.start()
+        daemon: MyDaemon = MyDaemon(pid_path)
+        try:
+            self.assertTrue(wait_for(lambda: str(old_pid) in replies))
+            self.assertTrue(daemon.hot_restart())
+            self.assertTrue(wait_for(lambda: not alive(int(str(old_pid)))))
+            new_pid: Optional[int] = FileProcessId.read_pid(pid_path)
+            self.assertTrue(wait_for(lambda: str(new_pid) in replies))
+        finally:
+            done.set()
+            client.join()
+            daemon.stop()
+        self.assertNotEqual(new_pid, old_pid)
+        self.assertEqual(errors, [])
+        with open(f'{pid_path}.log', encoding='utf-8') as log:
+            self.assertEqual(log.read().splitlines()[:3], [
+                f'ready {old_pid}', f'ready {new_pid}', f'drained {old_pid}'
+            ])
+        self.assertFalse(exists(pid_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,300 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    lifecycle_benchmark.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class LifecycleBenchmark with attribute(s) and method(s).
+    Measures latency of daemon lifecycle operations (JSON report).
+Execute
+    python3 lifecycle_benchmark.py [--runs N] [--output report.json]
+'''
+
+import sys
+from typing import Any, Callable, Dict, List, Optional
+from argparse import ArgumentParser, Namespace
+from json import dumps
+from os import close, environ, pidfd_open, unlink
+from os.path import abspath, dirname, join
+from platform import platform, python_version
+from select import select
+from socket import socket, AF_UNIX, SOCK_DGRAM
+from statistics import median, quantiles
+from subprocess import DEVNULL, PIPE, Popen, run
+from tempfile import mkdtemp
+from time import perf_counter, time
+
+try:
+    import daemonpy
+    from daemonpy.fast_control import FastControl
+    from daemonpy.file_process_id import FileProcessId
+    from bench_daemon import BenchDaemon, SHUTDOWN_DELAY
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class LifecycleBenchmark:
+    '''
+        Defines class LifecycleBenchmark with attribute(s) and method(s).
+        Measures latency of daemon lifecycle operations (JSON report).
+
+        Readiness is READY=1 received on notification socket (sent when
+        daemon opened its channels), so time-to-ready covers interpreter
+        start, daemonize and PID file publication.
+
+        It defines:
+
+            :attributes:
+                | _runs - Samples per measurement.
+                | _directory - Directory of PID and notification files.
+                | _pid_path - PID file path.
+                | _notify - Notification socket (READY=1 receiver).
+                | _env - Environment of benchmarked daemon.
+                | _results - Statistics by measurement name.
+            :methods:
+                | __init__ - Initials LifecycleBenchmark constructor.
+                | record - Records samples of measurement.
+                | launch - Runs benchmarked daemon operation.
+                | wait_ready - Waits for READY=1 of daemon.
+                | bench_import - Measures import time of modules.
+                | bench_pid_file - Measures PID file operations.
+                | bench_start_stop - Measures start and stop latency.
+                | bench_restart - Measures restart latency and gap.
+                | report - Runs all measurements.
+    '''
+
+    def __init__(self, runs: int) -> None:
+        '''
+            Initials LifecycleBenchmark constructor.
+
+            :param runs: Samples per measurement
+            :type runs: <int>
+            :exceptions: None
+        '''
+        self._runs: int = runs
+        self._directory: str = mkdtemp()
+        self._pid_path: str = join(self._directory, 'bench.pid')
+        self._notify: socket = socket(AF_UNIX, SOCK_DGRAM)
+        self._notify.bind(join(self._directory, 'notify.sock'))
+        self._notify.settimeout(10.0)
+        self._env: Dict[str, str] = dict(
+            environ, NOTIFY_SOCKET=join(self._directory, 'notify.sock')
+        )
+        self._results: Dict[str, Dict[str, float]] = {}
+
+    def record(self, name: str, samples: List[float]) -> None:
+        '''
+            Records samples of measurement (milliseconds).
+
+            :param name: Measurement name
+            :type name: <str>
+            :param samples: Durations (seconds)
+            :type samples: <List[float]>
+            :exceptions: None
+        '''
+        values: List[float] = sorted(sample * 1000.0 for sample in samples)
+        self._results[name] = {
+            'min': round(values[0], 3),
+            'median': round(median(values), 3),
+            'p95': round(quantiles(values, n=20, method='inclusive')[-1], 3)
+            if len(values) > 1 else round(values[0], 3),
+            'max': round(values[-1], 3),
+            'runs': len(values)
+        }
+
+    def launch(self, mode: str, operation: str, fork: bool = True) -> Popen:
+        '''
+            Runs benchmarked daemon operation.
+
+            :param mode: fast (dies on SIGTERM) | slow (delayed exit)
+            :type mode: <str>
+            :param operation: Daemon operation (start, restart)
+            :type operation: <str>
+            :param fork: Daemonize with double fork (else foreground)
+            :type fork: <bool>
+            :return: Launched process
+            :rtype: <Popen>
+            :exceptions: OSError
+        '''
+        return Popen(
+            [
+                sys.executable, 'bench_daemon.py', self._pid_path, mode,
+                'fork' if fork else 'foreground', operation
+            ],
+            cwd=dirname(abspath(__file__)), env=self._env,
+            stdout=DEVNULL, stderr=DEVNULL
+        )
+
+    def wait_ready(self) -> float:
+        '''
+            Waits for READY=1 of daemon.
+
+            :return: Time of readiness (perf_counter)
+            :rtype: <float>
+            :exceptions: TimeoutError
+        '''
+        while b'READY=1' not in self._notify.recv(4096):
+            continue
+        return perf_counter()
+
+    def bench_import(self) -> None:
+        '''
+            Measures cumulative import time of modules (-X importtime).
+
+            :exceptions: None
+        '''
+        for module in ('daemonpy.daemon', 'daemonpy.fast_control'):
+            samples: List[float] = []
+            for _ in range(self._runs):
+                stderr: str = run(
+                    [sys.executable, '-X', 'importtime', '-c',
+                     f'import {module}'],
+                    cwd=dirname(abspath(__file__)), stderr=PIPE,
+                    text=True, check=True
+                ).stderr
+                line: str = [
+                    row for row in stderr.splitlines()
+                    if row.rstrip().endswith(f'| {module}')
+                ][-1]
+                samples.append(int(line.split('|')[1]) / 1e6)
+            self.record(f'import.{module}', samples)
+
+    def bench_pid_file(self) -> None:
+        '''
+            Measures PID file publication, read and running check.
+
+            :exceptions: None
+        '''
+        path: str = join(self._directory, 'ops.pid')
+        publish: List[float] = []
+        for _ in range(self._runs * 10):
+            start: float = perf_counter()
+            fd: Optional[int] = FileProcessId.lock_write(path, '1\n')
+            publish.append(perf_counter() - start)
+            close(int(fd))
+            unlink(path)
+        self.record('pid_file.publish', publish)
+        fd = FileProcessId.lock_write(path, '1\n')
+        operations: Dict[str, Callable[[str], Any]] = {
+            'pid_file.read_pid': FileProcessId.read_pid,
+            'pid_file.is_running': FileProcessId.is_running,
+            'pid_file.fast_status': FastControl.status
+        }
+        for name, operation in operations.items():
+            samples: List[float] = []
+            for _ in range(self._runs * 10):
+                start = perf_counter()
+                operation(path)
+                samples.append(perf_counter() - start)
+            self.record(name, samples)
+        close(int(fd))
+
+    def bench_start_stop(self, mode: str, fork: bool) -> None:
+        '''
+            Measures time-to-ready after start and stop latency.
+
+            :param mode: fast (dies on SIGTERM) | slow (delayed exit)
+            :type mode: <str>
+            :param fork: Daemonize with double fork (else foreground)
+            :type fork: <bool>
+            :exceptions: OSError | TimeoutError
+        '''
+        name: str = 'fork' if fork else 'foreground'
+        ready: List[float] = []
+        stop: List[float] = []
+        probe: BenchDaemon = BenchDaemon(self._pid_path)
+        for _ in range(self._runs):
+            start: float = perf_counter()
+            process: Popen = self.launch(mode, 'start', fork)
+            ready.append(self.wait_ready() - start)
+            start = perf_counter()
+            probe.stop()
+            stop.append(perf_counter() - start)
+            process.wait(10.0)
+        if mode == 'fast':
+            self.record(f'start.{name}.time_to_ready', ready)
+        self.record(f'stop.{name}.{mode}', stop)
+
+    def bench_restart(self) -> None:
+        '''
+            Measures restart latency (command to READY=1) and gap
+            (old daemon exit to READY=1 of new one).
+
+            :exceptions: OSError | TimeoutError
+        '''
+        latency: List[float] = []
+        gap: List[float] = []
+        self.launch('fast', 'start').wait(10.0)
+        self.wait_ready()
+        for _ in range(self._runs):
+            pidfd: int = pidfd_open(FastControl.read_pid(self._pid_path))
+            start: float = perf_counter()
+            process: Popen = self.launch('fast', 'restart')
+            select([pidfd], [], [], 10.0)
+            exited: float = perf_counter()
+            close(pidfd)
+            ready: float = self.wait_ready()
+            latency.append(ready - start)
+            gap.append(ready - exited)
+            process.wait(10.0)
+        BenchDaemon(self._pid_path).stop()
+        self.record('restart.latency', latency)
+        self.record('restart.gap', gap)
+
+    def report(self) -> Dict[str, Any]:
+        '''
+            Runs all measurements.
+
+            :return: Report (environment and results in milliseconds)
+            :rtype: <Dict[str, Any]>
+            :exceptions: OSError | TimeoutError
+        '''
+        self.bench_import()
+        self.bench_pid_file()
+        for fork in (True, False):
+            for mode in ('fast', 'slow'):
+                self.bench_start_stop(mode, fork)
+        self.bench_restart()
+        return {
+            'timestamp': time(),
+            'daemonpy': daemonpy.__version__,
+            'python': python_version(),
+            'platform': platform(),
+            'runs': self._runs, 'unit': 'ms',
+            'shutdown_delay_ms': SHUTDOWN_DELAY * 1000.0,
+            'results': self._results
+        }
+
+
+if __name__ == '__main__':
+    PARSER: ArgumentParser = ArgumentParser(description=__doc__)
+    PARSER.add_argument('--runs', type=int, default=10)
+    PARSER.add_argument('--output', help='append JSON report to file')
+    ARGS: Namespace = PARSER.parse_args()
+    REPORT: str = dumps(LifecycleBenchmark(ARGS.runs).report())
+    if ARGS.output:
+        with open(ARGS.output, 'a', encoding='utf-8') as output:
+            output.write(f'{REPORT}\n')
+    print(REPORT)
@@ -0,0 +1,256 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    lifecycle_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class LifecycleTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of Lifecycle.
+Execute
+    python3 -m unittest -v lifecycle_test
+'''
+
+import sys
+import unittest
+from typing import Any, Dict, List, Optional
+from asyncio import new_event_loop, sleep
+from os import getpid, kill
+from os.path import abspath, dirname, join
+from signal import getsignal, signal, SIG_DFL, SIGUSR1
+from subprocess import run
+from tempfile import mkdtemp
+from threading import Thread
+
+try:
+    from daemonpy.daemon import Daemon
+    from daemonpy.daemon_component import DaemonComponent
+    from daemonpy.daemon_profiler import DaemonProfiler
+    from daemonpy.daemon_reload import DaemonReload
+    from daemonpy.lifecycle import Lifecycle
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+IMPORTS: str = '''
+import sys
+import daemonpy.daemon
+print(sorted(
+    name for name in sys.modules if name in (
+        'daemonpy.daemon_drain', 'daemonpy.daemon_metrics',
+        'daemonpy.daemon_pools', 'daemonpy.daemon_status_page'
+    )
+))
+'''
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+class Recorder(DaemonComponent):
+    '''
+        Defines class Recorder with attribute(s) and method(s).
+        Records lifecycle hooks of component.
+
+        It defines:
+
+            :attributes:
+                | _name - Component name.
+                | _log - Shared log of hooks.
+                | _timeout - Stop time | None.
+            :methods:
+                | __init__ - Initials Recorder constructor.
+                | commands - Gets command named by component.
+                | stats - Gets statistics named by component.
+                | stop_timeout - Gets stop time.
+                | open - Records open.
+                | close - Records close.
+    '''
+
+    def __init__(
+        self, name: str, log: List[str], timeout: Optional[float] = None
+    ) -> None:
+        '''
+            Initials Recorder constructor.
+
+            :param name: Component name
+            :type name: <str>
+            :param log: Shared log of hooks
+            :type log: <List[str]>
+            :param timeout: Stop time | None
+            :type timeout: <Optional[float]>
+            :exceptions: None
+        '''
+        super().__init__()
+        self._name: str = name
+        self._log: List[str] = log
+        self._timeout: Optional[float] = timeout
+
+    def commands(self) -> Dict[str, Any]:
+        '''Gets command named by component.'''
+        return {self._name: lambda _: self._name}
+
+    def stats(self) -> Dict[str, Any]:
+        '''Gets statistics named by component.'''
+        return {self._name: True}
+
+    def stop_timeout(self) -> Optional[float]:
+        '''Gets stop time.'''
+        return self._timeout
+
+    def open(self) -> None:
+        '''Records open.'''
+        self._log.append(f'open {self._name}')
+
+    def close(self) -> None:
+        '''Records close.'''
+        self._log.append(f'close {self._name}')
+
+
+class LifecycleTestCase(unittest.TestCase):
+    '''
+        Defines class LifecycleTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of Lifecycle.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_components - Test order and hooks of components.
+                | test_default_components - Test components of daemon.
+                | test_default_handler - Test default signal handler.
+                | test_saved_handler - Test handler installed before open.
+                | test_loop_handler - Test signals routed on event loop.
+                | test_lazy_imports - Test optional components not loaded.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+        self.saved: Any = signal(SIGUSR1, SIG_DFL)
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+        signal(SIGUSR1, self.saved)
+
+    def test_components(self) -> None:
+        '''Test order, commands, stats and stop time of components.'''
+        log: List[str] = []
+        lifecycle: Lifecycle = Lifecycle(None)
+        first: Recorder = lifecycle.add(Recorder('first', log, 3.0))
+        lifecycle.add(Recorder('second', log, 7.0))
+        lifecycle.open()
+        lifecycle.add(Recorder('third', log))
+        lifecycle.close()
+        self.assertEqual(log, [
+            'open first', 'open second', 'open third',
+            'close third', 'close second', 'close first'
+        ])
+        self.assertIs(lifecycle.get(Recorder), first)
+        self.assertIsNone(lifecycle.get(DaemonReload))
+        self.assertEqual(
+            sorted(lifecycle.commands()), ['first', 'second', 'third']
+        )
+        self.assertEqual(len(lifecycle.stats()), 3)
+        self.assertEqual(lifecycle.stop_timeout(), 7.0)
+
+    def test_default_components(self) -> None:
+        '''Test reload and profiler added to every daemon.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'daemon.pid'))
+        self.assertIsNotNone(daemon.lifecycle.get(DaemonReload))
+        self.assertIsNotNone(daemon.lifecycle.get(DaemonProfiler))
+        self.assertIsNone(daemon.lifecycle.stop_timeout())
+
+    def test_default_handler(self) -> None:
+        '''Test default handler replaced by other handler of signal.'''
+        calls: List[str] = []
+        lifecycle: Lifecycle = Lifecycle(None)
+        lifecycle.handle(SIGUSR1, lambda _: calls.append('default'), True)
+        lifecycle.listen(lambda _: calls.append('listener'))
+        lifecycle.open()
+        kill(getpid(), SIGUSR1)
+        lifecycle.handle(SIGUSR1, lambda _: calls.append('handler'))
+        lifecycle.wake(SIGUSR1)
+        self.assertEqual(
+            calls, ['listener', 'default', 'listener', 'handler']
+        )
+
+    def test_saved_handler(self) -> None:
+        '''Test handler installed before open replaces default one.'''
+        calls: List[str] = []
+        signal(SIGUSR1, lambda *_: calls.append('saved'))
+        lifecycle: Lifecycle = Lifecycle(None)
+        lifecycle.handle(SIGUSR1, lambda _: calls.append('default'), True)
+        lifecycle.open()
+        kill(getpid(), SIGUSR1)
+        self.assertEqual(calls, ['saved'])
+        self.assertEqual(getsignal(SIGUSR1), lifecycle.dispatch)
+
+    def test_loop_handler(self) -> None:
+        '''Test signals routed on event loop, also from other thread.'''
+        calls: List[str] = []
+        lifecycle: Lifecycle = Lifecycle(None)
+        self.assertFalse(lifecycle.fallback(SIGUSR1))
+        lifecycle.handle(SIGUSR1, lambda _: calls.append('default'), True)
+        loop: Any = new_event_loop()
+        lifecycle.use_loop(loop)
+        lifecycle.open()
+        kill(getpid(), SIGUSR1)
+        Thread(target=lifecycle.wake, args=(SIGUSR1,)).start()
+        loop.run_until_complete(sleep(0.1))
+        lifecycle.close()
+        loop.close()
+        self.assertEqual(calls, ['default', 'default'])
+        self.assertEqual(getsignal(SIGUSR1), SIG_DFL)
+
+    def test_lazy_imports(self) -> None:
+        '''Test optional components are not imported with Daemon.'''
+        imported = run(
+            [sys.executable, '-c', IMPORTS], capture_output=True,
+            text=True, check=True, cwd=dirname(abspath(__file__))
+        )
+        self.assertEqual(imported.stdout.strip(), '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
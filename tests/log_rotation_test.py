@@ -0,0 +1,100 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    log_rotation_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class LogRotationTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of LogRotation.
+Execute
+    python3 -m unittest -v log_rotation_test
+'''
+
+import sys
+import unittest
+from typing import List
+from os.path import exists, join
+from tempfile import mkdtemp
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.log_rotation import LogRotation
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class LogRotationTestCase(unittest.TestCase):
+    '''
+        Defines class LogRotationTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of LogRotation.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_negative_limit - Test creation with negative limit.
+                | test_due - Test size and age limits.
+                | test_rotate - Test shifting of rotated files.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_negative_limit(self) -> None:
+        '''Test creation with negative limit.'''
+        with self.assertRaises(ATSValueError):
+            LogRotation(-1)
+
+    def test_due(self) -> None:
+        '''Test size and age limits.'''
+        self.assertFalse(LogRotation().due(10 ** 9, 10 ** 9))
+        self.assertTrue(LogRotation(100).due(100, 0.0))
+        self.assertFalse(LogRotation(100).due(99, 10 ** 9))
+        self.assertTrue(LogRotation(0, 60.0).due(0, 60.0))
+
+    def test_rotate(self) -> None:
+        '''Test shifting of rotated files.'''
+        path: str = join(mkdtemp(), 'daemon.log')
+        rotation: LogRotation = LogRotation(backup_count=2)
+        for index in range(3):
+            with open(path, 'w', encoding='utf-8') as log_file:
+                log_file.write(f'{index}')
+            rotation.rotate(path)
+        self.assertFalse(exists(path))
+        with open(f'{path}.1', encoding='utf-8') as log_file:
+            self.assertEqual(log_file.read(), '2')
+        with open(f'{path}.2', encoding='utf-8') as log_file:
+            self.assertEqual(log_file.read(), '1')
+        self.assertFalse(exists(f'{path}.3'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    log_sink_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class LogSinkTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of LogSink.
+Execute
+    python3 -m unittest -v log_sink_test
+'''
+
+import sys
+import unittest
+from typing import Any, List
+from os import close, dup, dup2, rename, write
+from os.path import exists, join
+from tempfile import mkdtemp
+from time import sleep
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon_process import DaemonProcess
+    from daemonpy.log_rotation import LogRotation
+    from daemonpy.log_sink import LogSink
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+def read(path: str) -> str:
+    '''
+        Reads log file.
+
+        :param path: Log file path
+        :type path: <str>
+        :return: Log file content
+        :rtype: <str>
+        :exceptions: None
+    '''
+    with open(path, encoding='utf-8') as log_file:
+        return log_file.read()
+
+
+class LogSinkTestCase(unittest.TestCase):
+    '''
+        Defines class LogSinkTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of LogSink.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_empty_path - Test creation with empty path.
+                | test_buffered_write - Test buffered write and flush.
+                | test_rotation - Test size based rotation.
+                | test_reopen - Test reopen after external rename.
+                | test_flush_thread - Test background flush thread.
+                | test_stderr_line_buffered - Test stderr of daemon logs.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_empty_path(self) -> None:
+        '''Test creation with empty path.'''
+        with self.assertRaises(ATSValueError):
+            LogSink('')
+
+    def test_buffered_write(self) -> None:
+        '''Test buffered write and flush.'''
+        path: str = join(mkdtemp(), 'daemon.log')
+        sink: LogSink = LogSink(path, 64, flush_interval=60.0)
+        print('first line', file=sink)
+        self.assertEqual(read(path), '')
+        sink.write('x' * 64 + '\n')
+        self.assertEqual(read(path), f'first line\n{"x" * 64}\n')
+        print('last line', file=sink)
+        sink.flush()
+        self.assertTrue(read(path).endswith('last line\n'))
+        sink.close()
+        with self.assertRaises(ValueError):
+            sink.write('after close\n')
+        self.assertTrue(read(path).endswith('last line\n'))
+
+    def test_rotation(self) -> None:
+        '''Test size based rotation.'''
+        path: str = join(mkdtemp(), 'daemon.log')
+        sink: LogSink = LogSink(path, 0, LogRotation(100, 0.0, 2))
+        for index in range(8):
+            sink.write(f'{index}' * 60 + '\n')
+        sink.close()
+        self.assertTrue(exists(f'{path}.1'))
+        self.assertTrue(exists(f'{path}.2'))
+        self.assertFalse(exists(f'{path}.3'))
+        self.assertIn('7' * 60, read(path) + read(f'{path}.1'))
+
+    def test_reopen(self) -> None:
+        '''Test reopen after external rename (logrotate).'''
+        path: str = join(mkdtemp(), 'daemon.log')
+        sink: LogSink = LogSink(path, 1024, flush_interval=60.0)
+        saved: int = dup(2)
+        try:
+            sink.attach(2)
+            write(2, b'raw stderr\n')
+            sink.write('before\n')
+            sink.flush()
+            rename(path, f'{path}.old')
+            sink.request_reopen()
+            sink.write('after\n')
+            write(2, b'raw after\n')
+        finally:
+            dup2(saved, 2)
+            close(saved)
+        sink.close()
+        self.assertEqual(read(f'{path}.old'), 'raw stderr\nbefore\n')
+        self.assertEqual(read(path), 'after\nraw after\n')
+
+    def test_flush_thread(self) -> None:
+        '''Test background flush thread.'''
+        path: str = join(mkdtemp(), 'daemon.log')
+        sink: LogSink = LogSink(path, 1024, None, 0.05, True)
+        sink.open()
+        sink.write('flushed by thread\n')
+        for _ in range(100):
+            if read(path):
+                break
+            sleep(0.01)
+        self.assertEqual(read(path), 'flushed by thread\n')
+        sink.close()
+
+    def test_stderr_line_buffered(self) -> None:
+        '''Test stderr of daemon logs is written at end of line.'''
+        tmp: str = mkdtemp()
+        path: str = join(tmp, 'daemon.log')
+        daemon: DaemonProcess = DaemonProcess(join(tmp, 'daemon.pid'))
+        saved: List[int] = [dup(1), dup(2)]
+        streams: List[Any] = [sys.stdout, sys.stderr]
+        try:
+            daemon._open_logs(path, None)
+            print('buffered', file=sys.stdout)
+            print('Traceback', file=sys.stderr)
+            self.assertEqual(read(path), 'Traceback\n')
+        finally:
+            sys.stdout.flush()
+            sys.stdout, sys.stderr = streams
+            for fd, saved_fd in enumerate(saved, 1):
+                dup2(saved_fd, fd)
+                close(saved_fd)
+        self.assertEqual(read(path), 'Traceback\nbuffered\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,285 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    metrics_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class MetricsTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of metrics.
+Execute
+    python3 -m unittest -v metrics_test
+'''
+
+import sys
+import unittest
+from typing import List, Optional
+from os.path import abspath, dirname, exists, join
+from socket import socket, AF_UNIX
+from subprocess import Popen
+from tempfile import mkdtemp
+from threading import Thread
+from time import sleep
+from urllib.request import urlopen
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon import Daemon
+    from daemonpy.daemon_metrics import DaemonMetrics
+    from daemonpy.metrics_registry import MetricsRegistry
+    from daemonpy.metrics_server import MetricsServer
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+WORKER: str = '''
+import sys
+from time import sleep
+from daemonpy.daemon import Daemon
+from daemonpy.daemon_metrics import DaemonMetrics
+class Worker(Daemon):
+    def run(self):
+        metrics = self.lifecycle.get(DaemonMetrics)
+        jobs = metrics.registry.counter('jobs_total', 'Finished jobs.')
+        jobs.inc(3)
+        while True:
+            sleep(60)
+worker = Worker(sys.argv[1])
+worker.lifecycle.add(DaemonMetrics())
+worker.usage('start')
+'''
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+def scrape(path: str) -> str:
+    '''
+        Scrapes metrics over Unix socket.
+
+        :param path: Metrics socket path
+        :type path: <str>
+        :return: Response (headers and metrics document)
+        :rtype: <str>
+        :exceptions: OSError
+    '''
+    with socket(AF_UNIX) as client:
+        client.connect(path)
+        client.sendall(b'GET /metrics HTTP/1.0\r\n\r\n')
+        chunks: List[bytes] = []
+        while chunk := client.recv(65536):
+            chunks.append(chunk)
+    return b''.join(chunks).decode('utf-8')
+
+
+class MetricsTestCase(unittest.TestCase):
+    '''
+        Defines class MetricsTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of metrics.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_counter - Test counter updated from threads.
+                | test_gauge - Test gauge set, inc and function.
+                | test_histogram - Test histogram buckets exposition.
+                | test_registry - Test registry names and types.
+                | test_http - Test metrics served over TCP.
+                | test_unix - Test metrics served over Unix socket.
+                | test_daemon - Test metrics endpoint of daemon.
+                | test_enable_metrics - Test metrics shortcut of daemon.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_counter(self) -> None:
+        '''Test counter updated from threads (sharded), labels.'''
+        registry: MetricsRegistry = MetricsRegistry()
+        counter = registry.counter('hits_total', 'Hits.', labels=['path'])
+        threads: List[Thread] = [
+            Thread(target=lambda: [
+                counter.labels('/a').inc() for _ in range(10000)
+            ]) for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.labels('/b').inc(2.5)
+        self.assertEqual(counter.labels('/a').value, 40000)
+        self.assertEqual(getattr(counter.labels('/a'), '_shards'), [])
+        text: str = registry.expose()
+        self.assertIn('# TYPE hits_total counter', text)
+        self.assertIn('hits_total{path="/a"} 40000', text)
+        self.assertIn('hits_total{path="/b"} 2.5', text)
+        with self.assertRaises(ATSValueError):
+            counter.labels('/a').inc(-1)
+        with self.assertRaises(ATSValueError):
+            counter.labels('/a', 'extra')
+
+    def test_gauge(self) -> None:
+        '''Test gauge set, inc, dec and value function.'''
+        registry: MetricsRegistry = MetricsRegistry()
+        gauge = registry.gauge('queue_depth')
+        gauge.inc(5)
+        gauge.set(10)
+        gauge.dec(3)
+        self.assertEqual(gauge.value, 7)
+        registry.gauge('answer').set_function(lambda: 42)
+        registry.counter('cpu_total').set_function(lambda: 1.5)
+        text: str = registry.expose()
+        self.assertIn('queue_depth 7', text)
+        self.assertIn('answer 42', text)
+        self.assertIn('cpu_total 1.5', text)
+
+    def test_histogram(self) -> None:
+        '''Test histogram cumulative buckets, sum and count.'''
+        registry: MetricsRegistry = MetricsRegistry()
+        histogram = registry.histogram('latency_seconds', buckets=(0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        text: str = registry.expose()
+        self.assertIn('latency_seconds_bucket{le="0.1"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="1.0"} 3', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 4', text)
+        self.assertIn('latency_seconds_sum 3.65', text)
+        self.assertIn('latency_seconds_count 4', text)
+
+    def test_registry(self) -> None:
+        '''Test registry returns same metric, refuses type change.'''
+        registry: MetricsRegistry = MetricsRegistry()
+        self.assertIs(registry.counter('a_total'), registry.counter('a_total'))
+        with self.assertRaises(ATSValueError):
+            registry.gauge('a_total')
+        with self.assertRaises(ATSValueError):
+            registry.counter('bad name')
+
+    def test_http(self) -> None:
+        '''Test metrics served over TCP (loopback, random port).'''
+        registry: MetricsRegistry = MetricsRegistry()
+        registry.counter('requests_total').inc()
+        server: MetricsServer = MetricsServer(registry, 0)
+        server.start()
+        host, port = server.address
+        try:
+            with urlopen(f'http://{host}:{port}/metrics', timeout=5) as reply:
+                self.assertEqual(
+                    reply.headers['Content-Type'], registry.CONTENT_TYPE
+                )
+                self.assertIn('requests_total 1', reply.read().decode())
+        finally:
+            server.close()
+
+    def test_unix(self) -> None:
+        '''Test Unix socket, replaced socket file is kept on close.'''
+        path: str = join(mkdtemp(), 'daemon.metrics')
+        registry: MetricsRegistry = MetricsRegistry()
+        registry.counter('requests_total').inc()
+        server: MetricsServer = MetricsServer(registry, path)
+        server.start()
+        self.assertIn('requests_total 1', scrape(path))
+        replacement: MetricsServer = MetricsServer(registry, path)
+        replacement.start()
+        server.close()
+        self.assertIn('requests_total 1', scrape(path))
+        replacement.close()
+        self.assertFalse(exists(path))
+
+    def test_daemon(self) -> None:
+        '''Test metrics endpoint of daemon (built-in and run metrics).'''
+        directory: str = mkdtemp()
+        pid_path: str = join(directory, 'worker.pid')
+        metrics_path: str = join(directory, 'worker.metrics')
+        with Popen(
+            [sys.executable, '-c', WORKER, pid_path],
+            cwd=dirname(abspath(__file__))
+        ) as launcher:
+            launcher.wait(10.0)
+        daemon: MyDaemon = MyDaemon(pid_path)
+        text: str = ''
+        for _ in range(500):
+            if exists(metrics_path):
+                text = scrape(metrics_path)
+                if 'jobs_total 3' in text:
+                    break
+            sleep(0.01)
+        self.assertTrue(daemon.reload_daemon())
+        for _ in range(500):
+            text = scrape(metrics_path)
+            if 'daemonpy_reloads_total 1' in text:
+                break
+            sleep(0.01)
+        self.assertTrue(text.startswith('HTTP/1.0 200'))
+        self.assertIn('jobs_total 3', text)
+        self.assertIn('daemonpy_uptime_seconds ', text)
+        self.assertIn('daemonpy_resident_memory_bytes ', text)
+        self.assertIn('daemonpy_open_fds ', text)
+        self.assertIn('# TYPE daemonpy_cpu_seconds_total counter', text)
+        self.assertIn('daemonpy_restarts_total 0', text)
+        self.assertIn('daemonpy_signals_total{signal="SIGHUP"} 1', text)
+        self.assertIn('daemonpy_reloads_total 1', text)
+        self.assertTrue(daemon.stop())
+        self.assertFalse(exists(pid_path))
+
+    def test_enable_metrics(self) -> None:
+        '''Test metrics shortcut adds metrics component once.'''
+        pid_path: str = join(mkdtemp(), 'worker.pid')
+        daemon: MyDaemon = MyDaemon(pid_path)
+        server: MetricsServer = daemon.enable_metrics()
+        self.assertEqual(server.address, f'{pid_path[:-4]}.metrics')
+        self.assertIs(daemon.enable_metrics(8080), server)
+        metrics: Optional[DaemonMetrics] = daemon.lifecycle.get(
+            DaemonMetrics
+        )
+        self.assertIsNotNone(metrics)
+        self.assertIs(getattr(metrics, 'server'), server)
+
+
+if __name__ == '__main__':
+    unittest.main()
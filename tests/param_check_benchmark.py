@@ -0,0 +1,233 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    param_check_benchmark.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ParamCheckBenchmark with attribute(s) and method(s).
+    Measures per-call overhead of ParamCheck against ATSChecker.
+Execute
+    python3 param_check_benchmark.py [--runs N] [--output report.json]
+'''
+
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from argparse import ArgumentParser, Namespace
+from json import dumps
+from platform import platform, python_version
+from statistics import median
+from time import time
+from timeit import repeat
+
+try:
+    import daemonpy
+    from ats_utilities.checker import ATSChecker
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.param_check import ParamCheck
+    from daemonpy.stop_policy import StopPolicy
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+def ats_checked(
+    func: Callable[..., Any], specs: List[str]
+) -> Callable[..., Any]:
+    '''
+        Wraps function with per-call ATSChecker (previous approach).
+
+        :param func: Function checked on every call
+        :type func: <Callable[..., Any]>
+        :param specs: Parameter specs ('type:name') of positional args
+        :type specs: <List[str]>
+        :return: Checking wrapper
+        :rtype: <Callable[..., Any]>
+        :exceptions: None
+    '''
+    def wrapper(owner: Any, *args: Any) -> Any:
+        error_msg: Optional[str] = None
+        error_id: Optional[int] = None
+        checker: ATSChecker = ATSChecker()
+        error_msg, error_id = checker.check_params(list(zip(specs, args)))
+        if error_id == checker.TYPE_ERROR:
+            raise ATSTypeError(error_msg)
+        return func(owner, *args)
+    return wrapper
+
+
+def unix_kill(
+    owner: Any, pid: int, pid_path: str, verbose: bool = False,
+    policy: Optional[StopPolicy] = None
+) -> int:
+    '''
+        Stands in for UnixOperations.unix_kill (validation only).
+
+        :param owner: Instance (unused)
+        :type owner: <Any>
+        :param pid: Process ID
+        :type pid: <int>
+        :param pid_path: PID file path
+        :type pid_path: <str>
+        :param verbose: Enable/Disable verbose option
+        :type verbose: <bool>
+        :param policy: Stop policy | None
+        :type policy: <Optional[StopPolicy]>
+        :return: Process ID
+        :rtype: <int>
+        :exceptions: None
+    '''
+    return pid
+
+
+class ParamCheckBenchmark:
+    '''
+        Defines class ParamCheckBenchmark with attribute(s) and method(s).
+        Measures per-call overhead of ParamCheck against ATSChecker.
+
+        Overhead is time of checked call minus time of the same
+        undecorated call (best of runs, microseconds per call).
+
+        It defines:
+
+            :attributes:
+                | _runs - Repeats per measurement.
+                | _number - Calls per repeat.
+                | _results - Statistics by measurement name.
+            :methods:
+                | __init__ - Initials ParamCheckBenchmark constructor.
+                | per_call - Measures time of one call.
+                | bench - Measures overhead of checks of function.
+                | report - Runs all measurements.
+    '''
+
+    def __init__(self, runs: int, number: int) -> None:
+        '''
+            Initials ParamCheckBenchmark constructor.
+
+            :param runs: Repeats per measurement
+            :type runs: <int>
+            :param number: Calls per repeat
+            :type number: <int>
+            :exceptions: None
+        '''
+        self._runs: int = runs
+        self._number: int = number
+        self._results: Dict[str, Dict[str, float]] = {}
+
+    def per_call(self, call: Callable[[], Any]) -> Tuple[float, float]:
+        '''
+            Measures time of one call (microseconds).
+
+            :param call: Measured call
+            :type call: <Callable[[], Any]>
+            :return: Best and median time of call
+            :rtype: <Tuple[float, float]>
+            :exceptions: None
+        '''
+        samples: List[float] = [
+            sample * 1e6 / self._number for sample in repeat(
+                call, number=self._number, repeat=self._runs
+            )
+        ]
+        return min(samples), median(samples)
+
+    def bench(
+        self, name: str, func: Callable[..., Any], specs: List[str],
+        args: Tuple[Any, ...]
+    ) -> None:
+        '''
+            Measures overhead of ParamCheck and ATSChecker checks.
+
+            :param name: Measurement name
+            :type name: <str>
+            :param func: Undecorated function (first arg is instance)
+            :type func: <Callable[..., Any]>
+            :param specs: Parameter specs ('type:name')
+            :type specs: <List[str]>
+            :param args: Call arguments (first is instance)
+            :type args: <Tuple[Any, ...]>
+            :exceptions: None
+        '''
+        checks: Dict[str, Callable[..., Any]] = {
+            'param_check': ParamCheck(*specs)(func),
+            'ats_checker': ats_checked(func, specs)
+        }
+        plain, _ = self.per_call(lambda: func(*args))
+        for check, checked in checks.items():
+            best, middle = self.per_call(lambda: checked(*args))
+            self._results[f'{name}.{check}'] = {
+                'call': round(best, 3),
+                'overhead': round(best - plain, 3),
+                'median_overhead': round(middle - plain, 3)
+            }
+        self._results[f'{name}.speedup'] = {'ratio': round(
+            self._results[f'{name}.ats_checker']['overhead'] / max(
+                self._results[f'{name}.param_check']['overhead'], 1e-3
+            ), 1
+        )}
+
+    def report(self) -> Dict[str, Any]:
+        '''
+            Runs all measurements.
+
+            :return: Report (environment and results in microseconds)
+            :rtype: <Dict[str, Any]>
+            :exceptions: None
+        '''
+        init: Callable[..., Any] = getattr(
+            FileProcessId.__init__, '__wrapped__', FileProcessId.__init__
+        )
+        owner: FileProcessId = FileProcessId.__new__(FileProcessId)
+        self.bench(
+            'file_process_id.init', init, ['str:pid_path', 'str:pid_mode'],
+            (owner, '/tmp/bench.pid', 'r')
+        )
+        self.bench(
+            'unix_kill.validation', unix_kill, ['int:pid', 'str:pid_path'],
+            (None, 1, '/tmp/bench.pid')
+        )
+        return {
+            'timestamp': time(),
+            'daemonpy': daemonpy.__version__,
+            'python': python_version(),
+            'platform': platform(),
+            'benchmark': 'param_check',
+            'enabled': ParamCheck.ENABLED,
+            'runs': self._runs, 'number': self._number, 'unit': 'us',
+            'results': self._results
+        }
+
+
+if __name__ == '__main__':
+    PARSER: ArgumentParser = ArgumentParser(description=__doc__)
+    PARSER.add_argument('--runs', type=int, default=10)
+    PARSER.add_argument('--number', type=int, default=200)
+    PARSER.add_argument('--output', help='append JSON report to file')
+    ARGS: Namespace = PARSER.parse_args()
+    REPORT: str = dumps(ParamCheckBenchmark(ARGS.runs, ARGS.number).report())
+    if ARGS.output:
+        with open(ARGS.output, 'a', encoding='utf-8') as output:
+            output.write(f'{REPORT}\n')
+    print(REPORT)
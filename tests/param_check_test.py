@@ -0,0 +1,143 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    param_check_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ParamCheckTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of ParamCheck.
+Execute
+    python3 -m unittest -v param_check_test
+'''
+
+import sys
+import unittest
+from typing import List
+from os import environ
+from os.path import abspath, dirname
+from subprocess import run
+from unittest.mock import patch
+
+try:
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.param_check import ParamCheck
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+@ParamCheck('str:pid_path', 'int:pid')
+def checked(pid_path: str, pid: int = 0) -> int:
+    '''
+        Checks params with compiled checks.
+
+        :param pid_path: PID file path
+        :type pid_path: <str>
+        :param pid: Process ID
+        :type pid: <int>
+        :return: Process ID
+        :rtype: <int>
+        :exceptions: ATSTypeError
+    '''
+    return pid
+
+
+class ParamCheckTestCase(unittest.TestCase):
+    '''
+        Defines class ParamCheckTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of ParamCheck.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_wrong_spec - Test wrong and missing param spec.
+                | test_positional_and_keyword - Test args, kwargs, default.
+                | test_wrong_type - Test wrong param type.
+                | test_compiled_once - Test specs bound at decoration.
+                | test_disabled - Test checking removed when disabled.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_wrong_spec(self) -> None:
+        '''Test wrong and missing param spec.'''
+        with self.assertRaises(ATSValueError):
+            ParamCheck('pid')
+        if ParamCheck.ENABLED:
+            with self.assertRaises(ATSValueError):
+                ParamCheck('str:missing')(checked)
+
+    def test_positional_and_keyword(self) -> None:
+        '''Test positional, keyword and default params.'''
+        self.assertEqual(checked('/tmp/x.pid'), 0)
+        self.assertEqual(checked('/tmp/x.pid', 7), 7)
+        self.assertEqual(checked(pid=8, pid_path='/tmp/x.pid'), 8)
+
+    @unittest.skipUnless(ParamCheck.ENABLED, 'param checking disabled')
+    def test_wrong_type(self) -> None:
+        '''Test wrong param type.'''
+        with self.assertRaises(ATSTypeError):
+            checked(None)
+        with self.assertRaises(ATSTypeError):
+            checked('/tmp/x.pid', pid='7')
+        with self.assertRaises(ATSTypeError):
+            checked('/tmp/x.pid', True)
+
+    @unittest.skipUnless(ParamCheck.ENABLED, 'param checking disabled')
+    def test_compiled_once(self) -> None:
+        '''Test specs are bound at decoration (no signature per call).'''
+        self.assertTrue(hasattr(checked, '__wrapped__'))
+        with patch(
+            'daemonpy.param_check.signature', side_effect=AssertionError
+        ):
+            self.assertEqual(checked('/tmp/x.pid', 1), 1)
+
+    def test_disabled(self) -> None:
+        '''Test method is returned undecorated (-O or environment).'''
+        code: str = (
+            'from daemonpy.param_check import ParamCheck\n'
+            'func = lambda pid: pid\n'
+            'print(ParamCheck("int:pid")(func) is func)'
+        )
+        for option, check in [('-O', '1'), ('-B', '0')]:
+            output: str = run(
+                [sys.executable, option, '-c', code],
+                cwd=dirname(abspath(__file__)), capture_output=True,
+                text=True, check=True,
+                env=dict(environ, **{ParamCheck.ENV_CHECK: check})
+            ).stdout
+            self.assertEqual(output.strip(), 'True')
+
+
+if __name__ == '__main__':
+    unittest.main()
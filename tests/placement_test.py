@@ -0,0 +1,145 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    placement_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class PlacementTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of Placement.
+Execute
+    python3 -m unittest -v placement_test
+'''
+
+import sys
+import unittest
+from typing import List
+from os import (
+    fork, getpriority, sched_getaffinity, sched_getscheduler, waitpid,
+    waitstatus_to_exitcode, PRIO_PROCESS, SCHED_BATCH, _exit
+)
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.placement import Placement
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+def applied_in_child(placement: Placement, worker: int) -> int:
+    '''
+        Applies placement in child process and checks it.
+
+        :param placement: Placement
+        :type placement: <Placement>
+        :param worker: Worker index
+        :type worker: <int>
+        :return: Exit code of child (0 when applied as expected)
+        :rtype: <int>
+        :exceptions: None
+    '''
+    pid: int = fork()
+    if pid == 0:
+        ok: bool = placement.apply(worker) and all([
+            sched_getaffinity(0) == set(placement.cpus_for(worker)),
+            sched_getscheduler(0) == SCHED_BATCH,
+            getpriority(PRIO_PROCESS, 0) == 5
+        ])
+        _exit(0 if ok else 1)
+    return waitstatus_to_exitcode(waitpid(pid, 0)[1])
+
+
+class PlacementTestCase(unittest.TestCase):
+    '''
+        Defines class PlacementTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of Placement.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_wrong_spec - Test creation with wrong placement.
+                | test_topology - Test CPU list parsing and NUMA nodes.
+                | test_per_worker - Test round-robin worker CPUs.
+                | test_apply - Test placement applied to process.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_wrong_spec(self) -> None:
+        '''Test creation with wrong placement.'''
+        with self.assertRaises(ATSValueError):
+            Placement(cpus=[])
+        with self.assertRaises(ATSValueError):
+            Placement(policy='deadline')
+        with self.assertRaises(ATSValueError):
+            Placement(policy='fifo')
+        with self.assertRaises(ATSValueError):
+            Placement(policy='batch', priority=10)
+        with self.assertRaises(ATSValueError):
+            Placement(nice=20)
+        with self.assertRaises(ATSValueError):
+            Placement(io_class='be', io_level=8)
+        with self.assertRaises(ATSValueError):
+            Placement(numa_node=4096).cpus_for()
+
+    def test_topology(self) -> None:
+        '''Test CPU list parsing and NUMA nodes.'''
+        self.assertEqual(
+            Placement.parse_cpulist('0-2,8,10-11\n'), [0, 1, 2, 8, 10, 11]
+        )
+        for cpus in Placement.numa_nodes().values():
+            self.assertTrue(set(cpus) & sched_getaffinity(0) or cpus == [])
+
+    def test_per_worker(self) -> None:
+        '''Test round-robin worker CPUs.'''
+        placement: Placement = Placement([2, 0, 1], per_worker=True)
+        self.assertEqual(placement.cpus_for(), [0, 1, 2])
+        self.assertEqual(
+            [placement.cpus_for(index)[0] for index in range(5)],
+            [0, 1, 2, 0, 1]
+        )
+
+    def test_apply(self) -> None:
+        '''Test placement applied to process.'''
+        cpus: List[int] = sorted(sched_getaffinity(0))
+        placement: Placement = Placement(
+            cpus, per_worker=True, policy='batch', nice=5,
+            io_class='be', io_level=7
+        )
+        self.assertEqual(applied_in_child(placement, len(cpus) + 1), 0)
+        self.assertNotEqual(
+            applied_in_child(Placement([4095], policy='batch', nice=5), 0), 0
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
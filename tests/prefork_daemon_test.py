@@ -0,0 +1,188 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    prefork_daemon_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class PreforkDaemonTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of PreforkDaemon.
+Execute
+    python3 -m unittest -v prefork_daemon_test
+'''
+
+import sys
+import unittest
+from typing import List
+from os import kill, listdir, readlink
+from os.path import dirname, abspath, exists
+from signal import SIGKILL, SIGTERM
+from subprocess import Popen
+from tempfile import mkstemp
+from time import monotonic, sleep
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.prefork_daemon import PreforkDaemon
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+MASTER: str = '''
+import sys
+from os import rename
+from time import sleep
+from daemonpy.prefork_daemon import PreforkDaemon
+
+class MyPreforkDaemon(PreforkDaemon):
+    _RESPAWN_DELAY = 0.0
+
+    def open_channels(self):
+        with open(f'{sys.argv[1]}.tmp', 'w') as channels:
+            channels.write(f'{len(self.workers)}\\n')
+        rename(f'{sys.argv[1]}.tmp', f'{sys.argv[1]}.channels')
+        super().open_channels()
+
+    def run_worker(self, index):
+        while True:
+            sleep(1)
+
+MyPreforkDaemon(sys.argv[1], 2).run_daemon()
+'''
+
+
+class MyPreforkDaemon(PreforkDaemon):
+    '''
+        Defines class MyPreforkDaemon with attribute(s) and method(s).
+        Sets an operation for worker process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run_worker - Runs worker process (defined method).
+    '''
+
+    def run_worker(self, index: int) -> None:
+        '''
+            Runs worker process with time sleep example.
+
+            :param index: Worker index
+            :type index: <int>
+            :exceptions: None
+        '''
+        while True:
+            sleep(1)
+
+
+def read_pids(pid_path: str, count: int, gone: int = 0) -> List[int]:
+    '''
+        Reads PID file until it contains expected number of PIDs.
+
+        :param pid_path: PID file path
+        :type pid_path: <str>
+        :param count: Expected number of PIDs
+        :type count: <int>
+        :param gone: PID which must not be listed
+        :type gone: <int>
+        :return: PIDs from PID file
+        :rtype: <List[int]>
+        :exceptions: None
+    '''
+    deadline: float = monotonic() + 5.0
+    pids: List[int] = []
+    while monotonic() < deadline:
+        with open(pid_path, 'r', encoding='utf-8') as pid_file:
+            pids = [int(line) for line in pid_file.read().split()]
+        if len(pids) == count and gone not in pids:
+            break
+        sleep(0.01)
+    return pids
+
+
+class PreforkDaemonTestCase(unittest.TestCase):
+    '''
+        Defines class PreforkDaemonTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of PreforkDaemon.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_default_workers - Test default number of workers.
+                | test_zero_workers - Test zero number of workers.
+                | test_supervise_workers - Test respawn and stop of workers.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_default_workers(self) -> None:
+        '''Test default number of workers.'''
+        daemon: MyPreforkDaemon = MyPreforkDaemon('/tmp/prefork.pid')
+        self.assertGreaterEqual(daemon.workers_count, 1)
+
+    def test_zero_workers(self) -> None:
+        '''Test zero number of workers.'''
+        with self.assertRaises(ATSValueError):
+            MyPreforkDaemon('/tmp/prefork.pid', 0)
+
+    def test_supervise_workers(self) -> None:
+        '''Test respawn and stop of workers.'''
+        pid_path: str = mkstemp(suffix='.pid')[1]
+        with Popen(
+            [sys.executable, '-c', MASTER, pid_path],
+            cwd=dirname(abspath(__file__))
+        ) as master:
+            pids: List[int] = read_pids(pid_path, 3)
+            self.assertEqual(pids[0], master.pid)
+            channels_path: str = f'{pid_path}.channels'
+            for _ in range(500):
+                if exists(channels_path):
+                    break
+                sleep(0.01)
+            with open(channels_path, encoding='utf-8') as channels:
+                self.assertEqual(channels.read(), '2\n')
+            kill(pids[1], SIGKILL)
+            respawned: List[int] = read_pids(pid_path, 3, pids[1])
+            self.assertNotIn(pids[1], respawned)
+            self.assertIn(pids[2], respawned)
+            locked: List[str] = [  # PID file lock (temporary name)
+                fd for worker in respawned[1:]
+                for fd in listdir(f'/proc/{worker}/fd')
+                if '/.pid-' in readlink(f'/proc/{worker}/fd/{fd}')
+            ]
+            kill(master.pid, SIGTERM)
+            self.assertEqual(master.wait(5.0), 0)
+            self.assertEqual(locked, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    process_status_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ProcessStatusTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of ProcessStatus.
+Execute
+    python3 -m unittest -v process_status_test
+'''
+
+import sys
+import unittest
+from typing import Any, Dict, List, Optional
+from json import loads
+from os import close, getpid
+from tempfile import mkstemp
+
+try:
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.process_status import ProcessStatus
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ProcessStatusTestCase(unittest.TestCase):
+    '''
+        Defines class ProcessStatusTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of ProcessStatus.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_not_running - Test status without PID file.
+                | test_dead - Test status of crashed daemon.
+                | test_running - Test status of running process.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test cases.'''
+
+    def tearDown(self) -> None:
+        '''Call after test cases.'''
+
+    def test_not_running(self) -> None:
+        '''Test status without PID file.'''
+        status: ProcessStatus = ProcessStatus.probe('/tmp/missing_daemon.pid')
+        self.assertEqual(status.exit_code, ProcessStatus.NOT_RUNNING)
+        self.assertIsNone(status.pid)
+
+    def test_dead(self) -> None:
+        '''Test status of crashed daemon (stale PID, crash loop).'''
+        pid_path: str = mkstemp(suffix='.pid')[1]
+        with open(pid_path, 'w', encoding='utf-8') as pid_file:
+            pid_file.write('1\n')
+        stats_path: str = FileProcessId.sibling_path(pid_path, '.stats')
+        with open(stats_path, 'w', encoding='utf-8') as stats_file:
+            stats_file.write('{"crash_loop": true}')
+        status: ProcessStatus = ProcessStatus.probe(pid_path)
+        self.assertEqual(status.exit_code, ProcessStatus.DEAD)
+        self.assertEqual(status.pid, 1)
+        self.assertIsNone(status.rss)
+        self.assertEqual(status.supervisor, {'crash_loop': True})
+
+    def test_running(self) -> None:
+        '''Test status of running process.'''
+        pid_path: str = mkstemp(suffix='.pid')[1]
+        pid_lock: Optional[int] = FileProcessId.lock_write(
+            pid_path, f'{getpid()}\n'
+        )
+        status: ProcessStatus = ProcessStatus.probe(pid_path)
+        if pid_lock is not None:
+            close(pid_lock)
+        self.assertEqual(status.exit_code, ProcessStatus.RUNNING)
+        self.assertEqual(status.pid, getpid())
+        self.assertGreater(status.rss or 0, 0)
+        self.assertGreaterEqual(status.threads or 0, 1)
+        self.assertGreater(status.open_fds or 0, 0)
+        document: Dict[str, Any] = loads(status.to_json())
+        self.assertEqual(document['status'], 'running')
+        self.assertIn('uptime:', str(status))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    process_waiter_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ProcessWaiterTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of ProcessWaiter.
+Execute
+    python3 -m unittest -v process_waiter_test
+'''
+
+import sys
+import unittest
+from typing import Dict, List
+from subprocess import Popen
+
+try:
+    from daemonpy.process_waiter import ProcessWaiter
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class ProcessWaiterTestCase(unittest.TestCase):
+    '''
+        Defines class ProcessWaiterTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of ProcessWaiter.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_wait_exited - Test wait for exited process.
+                | test_wait_timeout - Test wait timeout for running process.
+                | test_wait_backoff - Test wait without pidfd support.
+                | test_wait_all - Test concurrent wait for many processes.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_wait_exited(self) -> None:
+        '''Test wait for exited process.'''
+        waiter: ProcessWaiter = ProcessWaiter()
+        with Popen(['true']) as process:
+            self.assertTrue(waiter.wait(process.pid, 5.0))
+            self.assertFalse(waiter.is_alive(process.pid))
+
+    def test_wait_timeout(self) -> None:
+        '''Test wait timeout for running process.'''
+        waiter: ProcessWaiter = ProcessWaiter()
+        with Popen(['sleep', '30']) as process:
+            self.assertFalse(waiter.wait(process.pid, 0.01))
+            process.kill()
+
+    def test_wait_backoff(self) -> None:
+        '''Test wait without pidfd support.'''
+        waiter: ProcessWaiter = ProcessWaiter()
+        waiter._pidfd_support = False  # pylint: disable=protected-access
+        with Popen(['sleep', '30']) as process:
+            self.assertFalse(waiter.wait(process.pid, 0.01))
+            process.kill()
+            self.assertTrue(waiter.wait(process.pid, 5.0))
+
+    def test_wait_all(self) -> None:
+        '''Test concurrent wait for many processes.'''
+        waiter: ProcessWaiter = ProcessWaiter()
+        with Popen(['true']) as short, Popen(['sleep', '30']) as long:
+            exited: Dict[int, float] = waiter.wait_all(
+                [short.pid, long.pid], 0.5
+            )
+            self.assertIn(short.pid, exited)
+            self.assertNotIn(long.pid, exited)
+            long.kill()
+            waiter._pidfd_support = False  # pylint: disable=protected-access
+            self.assertIn(long.pid, waiter.wait_all([long.pid], 5.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
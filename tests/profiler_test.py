@@ -0,0 +1,216 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    profiler_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ProfilerTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of profiler.
+Execute
+    python3 -m unittest -v profiler_test
+'''
+
+import sys
+import unittest
+from typing import List, Optional
+from os import kill, unlink
+from os.path import abspath, dirname, exists, join
+from signal import SIGPROF, SIGUSR1
+from subprocess import Popen
+from tempfile import mkdtemp
+from time import monotonic, sleep
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon import Daemon
+    from daemonpy.daemon_usage import DaemonUsage
+    from daemonpy.file_process_id import FileProcessId
+    from daemonpy.sampling_profiler import SamplingProfiler
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+WORKER: str = '''
+import sys
+from daemonpy.daemon import Daemon
+def spin():
+    return sum(range(10000))
+class Worker(Daemon):
+    def run(self):
+        while True:
+            spin()
+worker = Worker(sys.argv[1])
+worker.enable_control()
+worker.usage('start')
+'''
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+def busy(seconds: float) -> int:
+    '''
+        Burns CPU time.
+
+        :param seconds: Time to burn
+        :type seconds: <float>
+        :return: Number of loops
+        :rtype: <int>
+        :exceptions: None
+    '''
+    loops: int = 0
+    deadline: float = monotonic() + seconds
+    while monotonic() < deadline:
+        loops += 1
+    return loops
+
+
+def read_stacks(path: str) -> List[str]:
+    '''
+        Waits for collapsed stacks file and reads it.
+
+        :param path: Collapsed stacks file path
+        :type path: <str>
+        :return: Collapsed stack lines
+        :rtype: <List[str]>
+        :exceptions: None
+    '''
+    for _ in range(500):
+        if exists(path):
+            break
+        sleep(0.01)
+    with open(path, encoding='utf-8') as stacks:
+        return stacks.read().splitlines()
+
+
+class ProfilerTestCase(unittest.TestCase):
+    '''
+        Defines class ProfilerTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of profiler.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_values - Test profiler parameter checks.
+                | test_sampling - Test sampling of busy function.
+                | test_stop_in_sample - Test stop interrupting sample.
+                | test_daemon - Test profiler toggled on running daemon.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_values(self) -> None:
+        '''Test profiler parameter checks and idle stop.'''
+        with self.assertRaises(ATSValueError):
+            SamplingProfiler(0)
+        profiler: SamplingProfiler = SamplingProfiler()
+        with self.assertRaises(ATSValueError):
+            profiler.start(0, join(mkdtemp(), 'out.folded'))
+        self.assertIsNone(profiler.stop())
+        self.assertIn('profile', DaemonUsage.CONTROL_OPERATIONS)
+
+    def test_sampling(self) -> None:
+        '''Test sampling of busy function (collapsed stacks).'''
+        path: str = join(mkdtemp(), 'out.folded')
+        profiler: SamplingProfiler = SamplingProfiler(0.005)
+        profiler.install()
+        self.assertTrue(profiler.start(10.0, path))
+        self.assertFalse(profiler.start(10.0, path))
+        self.assertTrue(profiler.active)
+        busy(0.5)
+        self.assertEqual(profiler.stop(), path)
+        self.assertFalse(profiler.active)
+        lines: List[str] = read_stacks(path)
+        self.assertTrue(lines)
+        stack, count = lines[0].rsplit(' ', 1)
+        self.assertTrue(stack.startswith('MainThread;'))
+        self.assertIn('busy (profiler_test.py:', stack)
+        self.assertGreater(int(count), 10)
+
+    def test_stop_in_sample(self) -> None:
+        '''Test stop by signal handler interrupting sample (no deadlock).'''
+        path: str = join(mkdtemp(), 'out.folded')
+        profiler: SamplingProfiler = SamplingProfiler(10.0)
+        stopped: List[Optional[str]] = []
+        setattr(profiler, '_record', lambda _: stopped.append(profiler.stop()))
+        self.assertTrue(profiler.start(10.0, path))
+        getattr(profiler, '_sample')(SIGPROF, None)
+        self.assertEqual(stopped, [path])
+        self.assertFalse(profiler.active)
+
+    def test_daemon(self) -> None:
+        '''Test profiler toggled by command and SIGUSR1 on daemon.'''
+        directory: str = mkdtemp()
+        pid_path: str = join(directory, 'worker.pid')
+        folded_path: str = join(directory, 'worker.folded')
+        with Popen(
+            [sys.executable, '-c', WORKER, pid_path],
+            cwd=dirname(abspath(__file__))
+        ) as launcher:
+            launcher.wait(10.0)
+        daemon: MyDaemon = MyDaemon(pid_path)
+        for _ in range(500):
+            if daemon.control('ping') == 0:
+                break
+            sleep(0.01)
+        self.assertEqual(daemon.control('profile', args=['0.3']), 0)
+        lines: List[str] = read_stacks(folded_path)
+        self.assertTrue(any('spin (<string>:' in line for line in lines))
+        unlink(folded_path)
+        pid: int = int(FileProcessId.read_pid(pid_path) or 0)
+        kill(pid, SIGUSR1)
+        sleep(0.3)
+        kill(pid, SIGUSR1)
+        self.assertTrue(read_stacks(folded_path))
+        self.assertTrue(daemon.stop())
+
+
+if __name__ == '__main__':
+    unittest.main()
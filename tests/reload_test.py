@@ -0,0 +1,156 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    reload_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ReloadTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of DaemonReload.
+Execute
+    python3 -m unittest -v reload_test
+'''
+
+import sys
+import unittest
+from typing import List
+from os.path import abspath, dirname, exists, join
+from subprocess import Popen
+from tempfile import mkdtemp
+from time import sleep
+
+try:
+    from daemonpy.daemon import Daemon
+    from daemonpy.daemon_usage import DaemonUsage
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+WORKER: str = '''
+import sys
+from os import getpid
+from threading import current_thread, main_thread
+from time import sleep
+from daemonpy.daemon import Daemon
+class Worker(Daemon):
+    def reload(self):
+        with open(sys.argv[2], 'a', encoding='utf-8') as log:
+            log.write(f'{getpid()} {current_thread() is main_thread()}\\n')
+        return super().reload()
+    def run(self):
+        while True:
+            sleep(60)
+worker = Worker(sys.argv[1])
+worker.enable_control()
+worker.usage('start')
+'''
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+class ReloadTestCase(unittest.TestCase):
+    '''
+        Defines class ReloadTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of DaemonReload.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_operation - Test reload operation in usage.
+                | test_not_running - Test reload without running daemon.
+                | test_reload - Test reload keeping daemon process.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_operation(self) -> None:
+        '''Test reload operation in usage (signal, not control).'''
+        self.assertIn('reload', DaemonUsage.DAEMON_OPERATIONS)
+        self.assertNotIn('reload', DaemonUsage.CONTROL_OPERATIONS)
+
+    def test_not_running(self) -> None:
+        '''Test reload without running daemon.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'none.pid'))
+        self.assertFalse(daemon.reload_daemon())
+
+    def test_reload(self) -> None:
+        '''Test reload keeping daemon process (main thread).'''
+        directory: str = mkdtemp()
+        pid_path: str = join(directory, 'worker.pid')
+        log_path: str = join(directory, 'worker.log')
+        with Popen(
+            [sys.executable, '-c', WORKER, pid_path, log_path],
+            cwd=dirname(abspath(__file__))
+        ) as launcher:
+            launcher.wait(10.0)
+        daemon: MyDaemon = MyDaemon(pid_path)
+        for _ in range(500):
+            if daemon.control('ping') == 0:
+                break
+            sleep(0.01)
+        self.assertTrue(daemon.reload_daemon())
+        self.assertEqual(daemon.control('reload'), 0)
+        lines: List[str] = []
+        for _ in range(500):
+            if exists(log_path):
+                with open(log_path, encoding='utf-8') as log:
+                    lines = log.read().splitlines()
+            if len(lines) == 2:
+                break
+            sleep(0.01)
+        daemon.stop()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(len(set(lines)), 1)
+        self.assertTrue(lines[0].endswith(' True'))
+        self.assertFalse(exists(pid_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
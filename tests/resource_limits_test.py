@@ -0,0 +1,151 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    resource_limits_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class ResourceLimitsTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of ResourceLimits.
+Execute
+    python3 -m unittest -v resource_limits_test
+'''
+
+import sys
+import unittest
+from typing import List
+from os import fork, getpid, waitpid, waitstatus_to_exitcode, _exit
+from os.path import join
+from resource import getrlimit, RLIMIT_AS, RLIMIT_CORE, RLIMIT_NOFILE
+from tempfile import mkdtemp
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon import Daemon
+    from daemonpy.resource_limits import ResourceLimits
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+class ResourceLimitsTestCase(unittest.TestCase):
+    '''
+        Defines class ResourceLimitsTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of ResourceLimits.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_wrong_limits - Test creation with wrong limits.
+                | test_rlimits - Test soft limits set in child process.
+                | test_cgroup - Test cgroup files written on apply.
+                | test_daemon_limits - Test limits of daemon.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_wrong_limits(self) -> None:
+        '''Test creation with wrong limits.'''
+        with self.assertRaises(ATSValueError):
+            ResourceLimits(nofile='unlimited')
+        with self.assertRaises(ATSValueError):
+            ResourceLimits(core=-1)
+        with self.assertRaises(ATSValueError):
+            ResourceLimits(memory_max=1 << 30)
+
+    def test_rlimits(self) -> None:
+        '''Test soft limits set in child process.'''
+        pid: int = fork()
+        if pid == 0:
+            ok: bool = ResourceLimits(
+                nofile='max', address_space=1 << 40, core=0
+            ).apply() and all([
+                getrlimit(RLIMIT_NOFILE)[0] == getrlimit(RLIMIT_NOFILE)[1],
+                getrlimit(RLIMIT_AS)[0] == 1 << 40,
+                getrlimit(RLIMIT_CORE)[0] == 0
+            ])
+            _exit(0 if ok else 1)
+        self.assertEqual(waitstatus_to_exitcode(waitpid(pid, 0)[1]), 0)
+
+    def test_cgroup(self) -> None:
+        '''Test cgroup files written on apply (directory as cgroup fs).'''
+        root: str = mkdtemp()
+        cgroup: str = join(root, 'app', 'daemon')
+        limits: ResourceLimits = ResourceLimits(
+            cgroup=cgroup, memory_max=1 << 30, cpu_max=1.5
+        )
+        self.assertTrue(limits.apply())
+        expected: List[List[str]] = [
+            [join(root, 'cgroup.subtree_control'), '+memory +cpu'],
+            [join(root, 'app', 'cgroup.subtree_control'), '+memory +cpu'],
+            [join(cgroup, 'memory.max'), str(1 << 30)],
+            [join(cgroup, 'cpu.max'), '150000 100000'],
+            [join(cgroup, 'cgroup.procs'), str(getpid())]
+        ]
+        for path, value in expected:
+            with open(path, encoding='utf-8') as cgroup_file:
+                self.assertEqual(cgroup_file.read(), value)
+        self.assertFalse(
+            ResourceLimits(cgroup='/proc/daemonpy/daemon').apply()
+        )
+
+    def test_daemon_limits(self) -> None:
+        '''Test limits and placement of daemon.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'daemon.pid'))
+        self.assertIsNone(daemon.limits)
+        self.assertIsNone(daemon.placement)
+        daemon.limits = ResourceLimits(nofile='max')
+        self.assertIsNotNone(daemon.limits)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,14 @@
+#!/bin/bash
+#
+# @brief   daemonpy
+# @version v1.0.1
+# @date    Sat Aug 11 09:58:41 2020
+# @company None, free software to use 2020
+# @author  Vladimir Roncevic <elektron.ronca@gmail.com>
+#
+
+OUTPUT=${2:-${TMPDIR:-/tmp}/daemonpy_benchmark.jsonl}
+python3 lifecycle_benchmark.py --runs ${1:-10} --output ${OUTPUT}
+python3 param_check_benchmark.py --runs ${1:-10} --output ${OUTPUT}
+echo "Report appended to ${OUTPUT}"
+echo "Done"
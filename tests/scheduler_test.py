@@ -0,0 +1,165 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    scheduler_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class SchedulerTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of Scheduler.
+Execute
+    python3 -m unittest -v scheduler_test
+'''
+
+import sys
+import unittest
+from typing import Dict, List
+from datetime import datetime
+from threading import Thread
+from time import monotonic, sleep
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.cron import CronSchedule
+    from daemonpy.scheduled_job import ScheduledJob
+    from daemonpy.scheduler import Scheduler
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class SchedulerTestCase(unittest.TestCase):
+    '''
+        Defines class SchedulerTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of Scheduler.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_cron_next - Test next match of cron expressions.
+                | test_cron_wrong - Test wrong cron expressions.
+                | test_wrong_job - Test creation of wrong jobs.
+                | test_no_drift - Test interval due times.
+                | test_run - Test interval, overlap and one-shot jobs.
+                | test_stop_idle - Test prompt stop without due jobs.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_cron_next(self) -> None:
+        '''Test next match of cron expressions.'''
+        moment: datetime = datetime(2026, 10, 17, 13, 7, 30)
+        expected: Dict[str, datetime] = {
+            '*/15 * * * *': datetime(2026, 10, 17, 13, 15),
+            '0 9-17/2 * * 1-5': datetime(2026, 10, 19, 9, 0),
+            '@monthly': datetime(2026, 11, 1, 0, 0),
+            '30 4 1,15 * 5': datetime(2026, 10, 23, 4, 30),
+            '0 0 29 2 *': datetime(2028, 2, 29, 0, 0),
+            '5 * * * 7': datetime(2026, 10, 18, 0, 5)
+        }
+        for expression, following in expected.items():
+            cron: CronSchedule = CronSchedule(expression)
+            self.assertEqual(cron.next(moment), following)
+            self.assertTrue(cron.matches(following))
+
+    def test_cron_wrong(self) -> None:
+        '''Test wrong cron expressions.'''
+        for expression in [
+            '* * *', '61 * * * *', '*/0 * * * *', 'a * * * *', '5-2 * * * *'
+        ]:
+            with self.assertRaises(ATSValueError):
+                CronSchedule(expression)
+        with self.assertRaises(ATSValueError):
+            CronSchedule('0 0 31 2 *').next(datetime(2026, 1, 1))
+
+    def test_wrong_job(self) -> None:
+        '''Test creation of wrong jobs.'''
+        scheduler: Scheduler = Scheduler()
+        with self.assertRaises(ATSValueError):
+            scheduler.every(0, print)
+        with self.assertRaises(ATSValueError):
+            scheduler.every(1.0, print, jitter=-1.0)
+        with self.assertRaises(ATSValueError):
+            scheduler.once(-1.0, print)
+        scheduler.once(1.0, print)
+        with self.assertRaises(ATSValueError):
+            scheduler.once(1.0, print)
+        self.assertTrue(scheduler.cancel('print'))
+        self.assertFalse(scheduler.cancel('print'))
+        with self.assertRaises(ATSValueError):
+            Scheduler(0)
+
+    def test_no_drift(self) -> None:
+        '''Test interval due times (fixed steps, missed skipped).'''
+        job: ScheduledJob = ScheduledJob(print, interval=2.0)
+        self.assertEqual(job.next_due(10.0, 10.5), 12.0)
+        self.assertEqual(job.next_due(10.0, 15.0), 16.0)
+        self.assertIsNone(ScheduledJob(print).next_due(10.0, 10.5))
+        job.cancel()
+        self.assertIsNone(job.next_due(10.0, 10.5))
+
+    def test_run(self) -> None:
+        '''Test interval, overlap and one-shot jobs.'''
+        scheduler: Scheduler = Scheduler(2)
+        ticks: List[float] = []
+        scheduler.every(0.05, lambda: ticks.append(monotonic()), 'tick')
+        scheduler.every(0.02, lambda: sleep(0.1), 'slow')
+        failed: ScheduledJob = scheduler.once(0.01, lambda: 1 / 0, 'fail')
+        worker: Thread = Thread(target=scheduler.run)
+        worker.start()
+        sleep(0.52)
+        scheduler.stop()
+        worker.join(5.0)
+        self.assertFalse(worker.is_alive())
+        self.assertIn(len(ticks), range(9, 12))
+        self.assertLess(scheduler.wakeups, 100)
+        stats: Dict[str, Dict[str, float]] = scheduler.stats()
+        self.assertEqual(sorted(stats), ['slow', 'tick'])
+        self.assertGreater(stats['slow']['skipped'], 0)
+        self.assertGreaterEqual(stats['slow']['max'], 0.1)
+        self.assertEqual(failed.stats['failures'], 1)
+
+    def test_stop_idle(self) -> None:
+        '''Test prompt stop without due jobs.'''
+        scheduler: Scheduler = Scheduler()
+        scheduler.cron('@yearly', print)
+        worker: Thread = Thread(target=scheduler.run)
+        worker.start()
+        sleep(0.05)
+        start: float = monotonic()
+        scheduler.stop()
+        worker.join(5.0)
+        self.assertLess(monotonic() - start, 0.5)
+        self.assertLessEqual(scheduler.wakeups, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,210 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    status_page_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class StatusPageTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of StatusPage.
+Execute
+    python3 -m unittest -v status_page_test
+'''
+
+import sys
+import unittest
+from typing import Any, Dict, List, Optional
+from os import getpid
+from os.path import exists, join
+from tempfile import mkdtemp, mkstemp
+from threading import Event, Thread
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon import Daemon
+    from daemonpy.daemon_status_page import DaemonStatusPage
+    from daemonpy.status_page import StatusPage
+    from daemonpy.status_reader import StatusReader
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+class StatusPageTestCase(unittest.TestCase):
+    '''
+        Defines class StatusPageTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of StatusPage.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_wrong_counters - Test creation with wrong counters.
+                | test_not_status_page - Test mapping of other file.
+                | test_snapshot - Test counters, state and heartbeat.
+                | test_consistent - Test snapshots during updates.
+                | test_daemon_status_page - Test status page of daemon.
+                | test_enable_status_page - Test status page shortcut.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_wrong_counters(self) -> None:
+        '''Test creation with wrong counters.'''
+        with self.assertRaises(ATSValueError):
+            StatusPage('/tmp/x.status', ['a', 'a'])
+        with self.assertRaises(ATSValueError):
+            StatusPage('/tmp/x.status', ['a' * 33])
+        with self.assertRaises(ATSValueError):
+            StatusPage('/tmp/x.status', []).set_state('sleeping')
+
+    def test_not_status_page(self) -> None:
+        '''Test mapping of file which is not status page.'''
+        path: str = mkstemp()[1]
+        with open(path, 'wb') as other:
+            other.write(b'\0' * 64)
+        with self.assertRaises(ATSValueError):
+            StatusReader(path)
+
+    def test_snapshot(self) -> None:
+        '''Test counters, state and heartbeat.'''
+        path: str = join(mkdtemp(), 'daemon.status')
+        page: StatusPage = StatusPage(path, ['requests', 'errors'])
+        page.create()
+        page.incr('requests')
+        page.incr('requests', 2)
+        page.set('errors', 7)
+        page.set_state('running')
+        page.heartbeat(1000.0)
+        with StatusReader(path) as reader:
+            snapshot: Dict[str, Any] = reader.snapshot()
+        self.assertEqual(snapshot['pid'], getpid())
+        self.assertEqual(snapshot['state'], 'running')
+        self.assertEqual(snapshot['heartbeat'], 1000.0)
+        self.assertEqual(snapshot['counters'], {'requests': 3, 'errors': 7})
+        page.close()
+        self.assertFalse(exists(path))
+        page.incr('requests')
+        page.update({'errors': 1})
+        page.heartbeat()
+
+    def test_consistent(self) -> None:
+        '''Test snapshots taken while writers update counters.'''
+        path: str = join(mkdtemp(), 'daemon.status')
+        page: StatusPage = StatusPage(path, ['first', 'second'])
+        page.create()
+        stop: Event = Event()
+
+        def write(step: int) -> None:
+            value: int = 0
+            while not stop.is_set():
+                value += step
+                page.update({'first': value, 'second': -value})
+
+        writers: List[Thread] = [
+            Thread(target=write, args=(step,)) for step in (1, 7)
+        ]
+        for writer in writers:
+            writer.start()
+        try:
+            with StatusReader(path) as reader:
+                for _ in range(2000):
+                    counters: Dict[str, int] = reader.snapshot()['counters']
+                    self.assertEqual(counters['first'], -counters['second'])
+        finally:
+            stop.set()
+            for writer in writers:
+                writer.join()
+            page.close()
+
+    def test_daemon_status_page(self) -> None:
+        '''Test status page updated by lifecycle of daemon.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'daemon.pid'))
+        page: Optional[StatusPage] = daemon.lifecycle.add(
+            DaemonStatusPage(['jobs'])
+        ).page
+        assert page is not None
+        self.assertTrue(page.path.endswith('daemon.status'))
+        daemon.open_channels()
+        page.incr('jobs')
+        page.heartbeat(1000.0)
+        daemon.heartbeat()
+        with StatusReader(page.path) as reader:
+            self.assertGreater(reader.snapshot()['heartbeat'], 1000.0)
+            page.heartbeat(1000.0)
+            daemon.heartbeat()  # rate limited
+            daemon.drain()
+            snapshot: Dict[str, Any] = reader.snapshot()
+            self.assertEqual(snapshot['state'], 'draining')
+            self.assertEqual(snapshot['counters'], {'jobs': 1})
+            self.assertEqual(snapshot['heartbeat'], 1000.0)
+            daemon.close_channels()
+            self.assertFalse(exists(page.path))
+            self.assertEqual(reader.snapshot()['state'], 'stopped')
+
+    def test_enable_status_page(self) -> None:
+        '''Test enabling status page once on daemon.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'daemon.pid'))
+        self.assertIsNone(daemon.status_page)
+        page: StatusPage = daemon.enable_status_page(['jobs'])
+        self.assertIs(daemon.enable_status_page(['other']), page)
+        self.assertIs(daemon.status_page, page)
+        self.assertTrue(page.path.endswith('daemon.status'))
+        daemon.open_channels()
+        page.incr('jobs')
+        with StatusReader(page.path) as reader:
+            self.assertEqual(reader.snapshot()['counters'], {'jobs': 1})
+            daemon.close_channels()
+        self.assertFalse(exists(page.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
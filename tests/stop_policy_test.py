@@ -0,0 +1,113 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    stop_policy_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class StopPolicyTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of StopPolicy.
+Execute
+    python3 -m unittest -v stop_policy_test
+'''
+
+import sys
+import unittest
+from typing import List
+from signal import SIGINT, SIGKILL, SIGTERM
+
+try:
+    from ats_utilities.exceptions.ats_type_error import ATSTypeError
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.stop_policy import StopPolicy, StopResult
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class StopPolicyTestCase(unittest.TestCase):
+    '''
+        Defines class StopPolicyTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of StopPolicy.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_default_steps - Test default steps.
+                | test_custom_steps - Test custom signal sequence.
+                | test_kill_only - Test empty signal sequence.
+                | test_negative_timeout - Test negative timeout.
+                | test_none_kill - Test None kill flag.
+                | test_result - Test stop result phases.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_default_steps(self) -> None:
+        '''Test default steps.'''
+        policy: StopPolicy = StopPolicy()
+        self.assertEqual(policy.steps(), [(SIGTERM, 10.0), (SIGKILL, 10.0)])
+
+    def test_custom_steps(self) -> None:
+        '''Test custom signal sequence.'''
+        policy: StopPolicy = StopPolicy([SIGINT, SIGTERM], 1.0, False)
+        self.assertEqual(policy.steps(), [(SIGINT, 1.0), (SIGTERM, 1.0)])
+
+    def test_kill_only(self) -> None:
+        '''Test empty signal sequence (SIGKILL only).'''
+        policy: StopPolicy = StopPolicy([], 1.0)
+        self.assertEqual(policy.steps(), [(SIGKILL, 1.0)])
+        with self.assertRaises(ATSValueError):
+            StopPolicy([], kill=False)
+
+    def test_negative_timeout(self) -> None:
+        '''Test negative timeout.'''
+        with self.assertRaises(ATSValueError):
+            StopPolicy(timeout=-1.0)
+
+    def test_none_kill(self) -> None:
+        '''Test None kill flag.'''
+        with self.assertRaises(ATSTypeError):
+            StopPolicy(kill=None)  # type: ignore
+
+    def test_result(self) -> None:
+        '''Test stop result phases.'''
+        result: StopResult = StopResult(1)
+        self.assertFalse(result)
+        result.add_phase(SIGTERM, 0.5, False)
+        result.add_phase(SIGKILL, 0.25, True)
+        self.assertTrue(result)
+        self.assertEqual(result.duration, 0.75)
+        self.assertEqual(result.phases[1], ('SIGKILL', 0.25, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
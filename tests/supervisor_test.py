@@ -0,0 +1,152 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    supervisor_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class SupervisorTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of Supervisor.
+Execute
+    python3 -m unittest -v supervisor_test
+'''
+
+import sys
+import unittest
+from typing import Any, Dict, List
+from json import load
+from os import kill
+from os.path import abspath, dirname, exists, join
+from signal import SIGTERM
+from subprocess import Popen
+from tempfile import mkdtemp
+from time import monotonic, sleep
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.supervisor import Supervisor
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+SUPERVISED: str = '''
+import sys
+from time import sleep
+from daemonpy.supervisor import Supervisor
+sys.exit(Supervisor(0.01).supervise(lambda: sleep(60), sys.argv[1]) + 15)
+'''
+
+
+def crash_twice(counter_path: str) -> None:
+    '''
+        Exits with failure on first two runs.
+
+        :param counter_path: Run counter file path
+        :type counter_path: <str>
+        :exceptions: RuntimeError
+    '''
+    with open(counter_path, 'a+', encoding='utf-8') as counter:
+        counter.write('x')
+        counter.seek(0)
+        if len(counter.read()) <= 2:
+            raise RuntimeError('crash')
+
+
+class SupervisorTestCase(unittest.TestCase):
+    '''
+        Defines class SupervisorTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of Supervisor.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_negative_delay - Test creation with negative delay.
+                | test_restart - Test restart after crashes.
+                | test_crash_loop - Test crash loop detection.
+                | test_stop - Test stop signal forwarding.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+
+    def test_negative_delay(self) -> None:
+        '''Test creation with negative delay.'''
+        with self.assertRaises(ATSValueError):
+            Supervisor(-1.0)
+
+    def test_restart(self) -> None:
+        '''Test restart after crashes.'''
+        directory: str = mkdtemp()
+        supervisor: Supervisor = Supervisor(0.01, 0.05, 5)
+        start: float = monotonic()
+        exit_code: int = supervisor.supervise(
+            lambda: crash_twice(join(directory, 'runs')),
+            join(directory, 'daemon.stats')
+        )
+        self.assertLess(monotonic() - start, 2.0)
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(supervisor.stats['restarts'], 2)
+        self.assertEqual(supervisor.stats['failures'], 2)
+        self.assertFalse(exists(join(directory, 'daemon.stats')))
+
+    def test_crash_loop(self) -> None:
+        '''Test crash loop detection.'''
+        directory: str = mkdtemp()
+        supervisor: Supervisor = Supervisor(0.0, 0.0, 3, 60.0)
+        exit_code: int = supervisor.supervise(
+            lambda: sys.exit(3), join(directory, 'daemon.stats')
+        )
+        self.assertEqual(exit_code, 3)
+        with open(join(directory, 'daemon.stats'), encoding='utf-8') as stats:
+            document: Dict[str, Any] = load(stats)
+        self.assertTrue(document['crash_loop'])
+        self.assertEqual(document['failures'], 3)
+        self.assertEqual(document['last_exit'], 3)
+
+    def test_stop(self) -> None:
+        '''Test stop signal forwarding.'''
+        stats_path: str = join(mkdtemp(), 'daemon.stats')
+        with Popen(
+            [sys.executable, '-c', SUPERVISED, stats_path],
+            cwd=dirname(abspath(__file__))
+        ) as process:
+            for _ in range(500):
+                if exists(stats_path):
+                    break
+                sleep(0.01)
+            with open(stats_path, encoding='utf-8') as stats:
+                self.assertIsNotNone(load(stats)['child_pid'])
+            kill(process.pid, SIGTERM)
+            self.assertEqual(process.wait(5.0), 0)
+        self.assertFalse(exists(stats_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
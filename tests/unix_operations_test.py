@@ -25,9 +25,15 @@ Execute
 import sys
 import unittest
 from typing import List
+from os.path import exists
+from signal import SIGKILL, SIGTERM
+from subprocess import Popen, PIPE
+from tempfile import mkstemp
+from time import monotonic
 
 try:
     from daemonpy.unix_operations import UnixOperations
+    from daemonpy.stop_policy import StopPolicy, StopResult
 except ImportError as test_error_message:
     # Force close python test #################################################
     sys.exit(f'\n{__file__}\n{test_error_message}\n')
@@ -57,6 +63,8 @@ class UnixOperationsTestCase(unittest.TestCase):
                 | test_creation - Test creation.
                 | test_default_status - Test default status.
                 | test_change_status - Test change status.
+                | test_kill_process - Test kill process and remove PID file.
+                | test_kill_escalation - Test escalation to SIGKILL.
     '''
 
     def setUp(self) -> None:
@@ -81,6 +89,41 @@ class UnixOperationsTestCase(unittest.TestCase):
         unix_op.unix_status = False
         self.assertFalse(unix_op.unix_status)
 
+    def test_kill_process(self) -> None:
+        '''Test kill process and remove PID file.'''
+        unix_op: UnixOperations = UnixOperations()
+        pid_path: str = mkstemp(suffix='.pid')[1]
+        with Popen(['sleep', '30']) as process:
+            start: float = monotonic()
+            self.assertTrue(unix_op.unix_kill(process.pid, pid_path))
+            self.assertLess(monotonic() - start, 0.1)
+        self.assertFalse(exists(pid_path))
+
+    def test_kill_escalation(self) -> None:
+        '''Test escalation to SIGKILL.'''
+        unix_op: UnixOperations = UnixOperations()
+        pid_path: str = mkstemp(suffix='.pid')[1]
+        ignore_term: str = (
+            'import signal, sys, time;'
+            'signal.signal(signal.SIGTERM, signal.SIG_IGN);'
+            'print(flush=True); time.sleep(30)'
+        )
+        with Popen(
+            [sys.executable, '-c', ignore_term], stdout=PIPE
+        ) as process:
+            if process.stdout is not None:
+                process.stdout.readline()
+            result: StopResult = unix_op.unix_kill(
+                process.pid, pid_path, policy=StopPolicy(timeout=0.2)
+            )
+        self.assertTrue(result)
+        self.assertEqual([phase[0] for phase in result.phases], [
+            SIGTERM.name, SIGKILL.name
+        ])
+        self.assertFalse(result.phases[0][2])
+        self.assertGreaterEqual(result.duration, 0.2)
+        self.assertFalse(exists(pid_path))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,216 @@
+# -*- coding: UTF-8 -*-
+
+'''
+Module
+    watchdog_test.py
+Copyright
+    Copyright (C) 2020 - 2026 Vladimir Roncevic <elektron.ronca@gmail.com>
+    daemonpy is free software: you can redistribute it and/or modify it
+    under the terms of the GNU General Public License as published by the
+    Free Software Foundation, either version 3 of the License, or
+    (at your option) any later version.
+    daemonpy is distributed in the hope that it will be useful, but
+    WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+    See the GNU General Public License for more details.
+    You should have received a copy of the GNU General Public License along
+    with this program. If not, see <http://www.gnu.org/licenses/>.
+Info
+    Defines class WatchdogTestCase with attribute(s) and method(s).
+    Creates test cases for checking functionalities of Watchdog.
+Execute
+    python3 -m unittest -v watchdog_test
+'''
+
+import sys
+import unittest
+from typing import List
+from os import environ, fork, getpid, _exit
+from os.path import join
+from signal import SIGKILL
+from socket import socket, AF_UNIX, SOCK_DGRAM
+from tempfile import mkdtemp
+from time import monotonic, sleep
+
+try:
+    from ats_utilities.exceptions.ats_value_error import ATSValueError
+    from daemonpy.daemon import Daemon
+    from daemonpy.sd_notify import SdNotify
+    from daemonpy.supervisor import Supervisor
+    from daemonpy.watchdog import Watchdog
+except ImportError as test_error_message:
+    # Force close python test #################################################
+    sys.exit(f'\n{__file__}\n{test_error_message}\n')
+
+__author__: str = 'Vladimir Roncevic'
+__copyright__: str = '(C) 2026, https://vroncevic.github.io/daemonpy'
+__credits__: List[str] = ['Vladimir Roncevic', 'Python Software Foundation']
+__license__: str = 'https://github.com/vroncevic/daemonpy/blob/dev/LICENSE'
+__version__: str = '2.0.7'
+__maintainer__: str = 'Vladimir Roncevic'
+__email__: str = 'elektron.ronca@gmail.com'
+__status__: str = 'Updated'
+
+
+class MyDaemon(Daemon):
+    '''
+        Defines class MyDaemon with attribute(s) and method(s).
+        Sets an operation for daemon process.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | run - Runs daemon process (defined method).
+    '''
+
+    def run(self) -> None:
+        '''
+            Runs daemon process (nothing to do in test).
+
+            :exceptions: None
+        '''
+
+
+def hang_once(watchdog: Watchdog, counter_path: str) -> None:
+    '''
+        Hangs (no heartbeat) on first run, beats and exits on next run.
+
+        :param watchdog: Heartbeat watchdog
+        :type watchdog: <Watchdog>
+        :param counter_path: Run counter file path
+        :type counter_path: <str>
+        :exceptions: None
+    '''
+    with open(counter_path, 'a+', encoding='utf-8') as counter:
+        counter.write('x')
+        counter.seek(0)
+        runs: int = len(counter.read())
+    if runs == 1:
+        sleep(60)
+    end: float = monotonic() + watchdog.timeout * 2
+    while monotonic() < end:
+        watchdog.heartbeat()
+        sleep(0.01)
+
+
+class WatchdogTestCase(unittest.TestCase):
+    '''
+        Defines class WatchdogTestCase with attribute(s) and method(s).
+        Creates test cases for checking functionalities of Watchdog.
+
+        It defines:
+
+            :attributes:
+                | None
+            :methods:
+                | setUp - Call before test cases.
+                | tearDown - Call after test cases.
+                | test_wrong_timeout - Test creation with wrong timeout.
+                | test_heartbeat - Test heartbeat and expiry.
+                | test_kill_hung - Test killing of hung child process.
+                | test_sd_notify - Test systemd notification datagrams.
+                | test_supervisor - Test restart of hung daemon process.
+                | test_daemon_watchdog - Test watchdog of daemon.
+    '''
+
+    def setUp(self) -> None:
+        '''Call before test case.'''
+
+    def tearDown(self) -> None:
+        '''Call after test case.'''
+        for name in (SdNotify.ENV_SOCKET, SdNotify.ENV_WATCHDOG_USEC):
+            environ.pop(name, None)
+
+    def test_wrong_timeout(self) -> None:
+        '''Test creation with wrong timeout.'''
+        with self.assertRaises(ATSValueError):
+            Watchdog(0.0)
+
+    def test_heartbeat(self) -> None:
+        '''Test heartbeat and expiry.'''
+        watchdog: Watchdog = Watchdog(0.1)
+        watchdog.heartbeat()
+        self.assertFalse(watchdog.expired())
+        sleep(0.15)
+        self.assertTrue(watchdog.expired())
+        watchdog.heartbeat()
+        self.assertFalse(watchdog.expired())
+        start: float = monotonic()
+        for _ in range(100000):
+            watchdog.heartbeat()
+        self.assertLess(monotonic() - start, 1.0)
+
+    def test_kill_hung(self) -> None:
+        '''Test killing of hung child process.'''
+        watchdog: Watchdog = Watchdog(0.2)
+        pid: int = fork()
+        if pid == 0:
+            sleep(60)
+            _exit(0)
+        start: float = monotonic()
+        status: int = watchdog.wait(pid)
+        self.assertLess(monotonic() - start, 5.0)
+        self.assertEqual(status & 0x7f, SIGKILL)
+        self.assertEqual(watchdog.hangs, 1)
+        counter_path: str = join(mkdtemp(), 'runs')
+        with open(counter_path, 'w', encoding='utf-8') as counter:
+            counter.write('x')
+        pid = fork()
+        if pid == 0:
+            hang_once(watchdog, counter_path)
+            _exit(0)
+        self.assertEqual(watchdog.wait(pid), 0)
+        self.assertEqual(watchdog.hangs, 1)
+
+    def test_sd_notify(self) -> None:
+        '''Test systemd notification datagrams.'''
+        self.assertFalse(SdNotify().notify('READY=1'))
+        path: str = join(mkdtemp(), 'notify.sock')
+        with socket(AF_UNIX, SOCK_DGRAM) as server:
+            server.bind(path)
+            server.settimeout(5.0)
+            environ[SdNotify.ENV_SOCKET] = path
+            environ[SdNotify.ENV_WATCHDOG_USEC] = '2000000'
+            notify: SdNotify = SdNotify()
+            self.assertTrue(notify.enabled)
+            self.assertTrue(notify.notify('READY=1', 'STATUS=ok'))
+            self.assertEqual(server.recv(256), b'READY=1\nSTATUS=ok')
+            self.assertEqual(SdNotify.watchdog_usec(), 2000000)
+            environ[SdNotify.ENV_WATCHDOG_PID] = str(getpid() + 1)
+            self.assertIsNone(SdNotify.watchdog_usec())
+            environ.pop(SdNotify.ENV_WATCHDOG_PID)
+            watchdog: Watchdog = Watchdog(1.0)
+            watchdog.heartbeat()
+            self.assertEqual(server.recv(256), b'WATCHDOG=1')
+            watchdog.close()
+            notify.close()
+
+    def test_supervisor(self) -> None:
+        '''Test restart of hung daemon process.'''
+        directory: str = mkdtemp()
+        watchdog: Watchdog = Watchdog(0.2)
+        supervisor: Supervisor = Supervisor(0.01, 0.05, 5)
+        exit_code: int = supervisor.supervise(
+            lambda: hang_once(watchdog, join(directory, 'runs')),
+            join(directory, 'daemon.stats'), watchdog
+        )
+        self.assertEqual(exit_code, 0)
+        self.assertEqual(watchdog.hangs, 1)
+        self.assertEqual(supervisor.stats['restarts'], 1)
+        self.assertEqual(supervisor.stats['failures'], 1)
+
+    def test_daemon_watchdog(self) -> None:
+        '''Test watchdog of daemon.'''
+        daemon: MyDaemon = MyDaemon(join(mkdtemp(), 'daemon.pid'))
+        daemon.heartbeat()
+        self.assertIsNone(daemon.supervisor)
+        daemon.watchdog = Watchdog(5.0)
+        self.assertIsNotNone(daemon.supervisor)
+        daemon.heartbeat()
+        self.assertFalse(daemon.watchdog.expired())
+
+
+if __name__ == '__main__':
+    unittest.main()